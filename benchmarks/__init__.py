@@ -0,0 +1 @@
+"""Benchmarks of Poodle internals, run as scripts."""
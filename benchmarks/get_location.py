@@ -0,0 +1,91 @@
+"""Benchmark locating nodes of a large generated module, with and without the extent index.
+
+Without the index, get_location walks all child nodes of each mutated node,
+so nested expressions and decorated functions with long bodies take quadratic time.
+Locating every node shows the cost of get_location alone.
+Creating mutations with the built-in mutators shows the share of it in mutant generation,
+where unparsing the mutated nodes takes most of the time.
+
+Run from the repository root:
+
+    python benchmarks/get_location.py [functions] [statements] [depth]
+"""
+
+from __future__ import annotations
+
+import ast
+import sys
+import time
+from typing import TYPE_CHECKING
+from unittest import mock
+
+from poodle.data_types import Mutator
+from poodle.mutate import builtin_mutators
+from poodle.traverse import create_mutations
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def nested_expression(depth: int) -> str:
+    """Build expression with nested operations, calls, comparisons and subscripts."""
+    expression = "x"
+    for level in range(depth):
+        expression = ["({} + {})", "f({}, {})", "({} < {})", "d[{}][{}]"][level % 4].format(expression, level)
+    return expression
+
+
+def generate_module(functions: int, statements: int, depth: int) -> str:
+    """Build source of a module with decorated functions, each with statements of nested expressions."""
+    lines = []
+    for function in range(functions):
+        lines.extend(["@decorator(1)", "@other", f"def function_{function}(x, d):"])
+        lines.extend(f"    y_{statement} = {nested_expression(depth)}" for statement in range(statements))
+        lines.append("    return lambda: x")
+    return "\n".join(lines) + "\n"
+
+
+def locate_all_nodes(source: str, *, index: bool) -> tuple[float, int]:
+    """Get location of every node that has one.  Returns seconds taken and number of nodes located."""
+    parsed_ast = ast.parse(source)
+
+    start = time.perf_counter()
+    if index:
+        Mutator.add_extent_attr(parsed_ast)
+    locations = [Mutator.get_location(node) for node in ast.walk(parsed_ast) if hasattr(node, "lineno")]
+    return time.perf_counter() - start, len(locations)
+
+
+def create_all_mutations(source: str, *, index: bool) -> tuple[float, int]:
+    """Create mutations with all built-in mutators.  Returns seconds taken and number of mutations."""
+    config = mock.MagicMock(mutator_opts={})
+    mutators = [mutator(config=config, echo=print) for mutator in builtin_mutators.values()]  # type: ignore [abstract]
+    parsed_ast = ast.parse(source)
+
+    start = time.perf_counter()
+    if index:
+        Mutator.add_extent_attr(parsed_ast)
+    mutations = create_mutations(parsed_ast, mutators)
+    return time.perf_counter() - start, sum(len(mutator_mutations) for mutator_mutations in mutations)
+
+
+def compare(name: str, benchmark: Callable[..., tuple[float, int]], source: str) -> None:
+    """Run benchmark with and without the extent index, and print times."""
+    walk_seconds, count = benchmark(source, index=False)
+    index_seconds, _ = benchmark(source, index=True)
+    print(f"{name} ({count}):")  # noqa: T201
+    print(f"  walk child nodes {walk_seconds:.2f}s, extent index {index_seconds:.2f}s")  # noqa: T201
+    print(f"  speedup {walk_seconds / index_seconds:.1f}x")  # noqa: T201
+
+
+def main(functions: int = 50, statements: int = 40, depth: int = 40) -> None:
+    """Print times to locate nodes and to create mutations, with and without the extent index."""
+    source = generate_module(functions, statements, depth)
+    print(f"Module: {len(source.splitlines())} lines, {sum(1 for _ in ast.walk(ast.parse(source)))} nodes")  # noqa: T201
+
+    compare("Locate all nodes", locate_all_nodes, source)
+    compare("Create all mutations", create_all_mutations, source)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,89 @@
+"""Save the result of each Mutant Trial as it completes, so an interrupted run can be resumed.
+
+Results are appended to a JSON Lines file in the work folder, one MutantTrial per line.
+Each line is flushed as it is written, and the file is synced to disk in batches.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import IO, TYPE_CHECKING
+
+from .data_types import MutantTrial
+from .util import from_json, to_json
+
+if TYPE_CHECKING:
+    from .data_types import PoodleConfig
+
+logger = logging.getLogger(__name__)
+
+checkpoint_file_name = "checkpoint.jsonl"
+sync_batch_size = 50
+sync_interval = 2.0
+
+
+class Checkpoint:
+    """Checkpoint file of Mutant Trial results, keyed by mutant ID."""
+
+    def __init__(self, config: PoodleConfig) -> None:
+        """Init with checkpoint file in the work folder."""
+        self.file = config.work_folder / checkpoint_file_name
+        self.trials: dict[str, MutantTrial] = {}
+        self.out: IO[str] | None = None
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def load(self) -> None:
+        """Read trials saved by a previous run.
+
+        Lines that can't be read, e.g. from a crash while writing, are skipped.
+        """
+        if not self.file.is_file():
+            logger.info("No checkpoint file found: %s", self.file)
+            return
+
+        for lineno, line in enumerate(self.file.read_text("utf-8").splitlines(), start=1):
+            try:
+                trial: MutantTrial = from_json(line, MutantTrial)  # type: ignore [assignment]
+            except (ValueError, TypeError):
+                logger.warning("Skipping invalid line %s in checkpoint file %s", lineno, self.file)
+                continue
+            self.trials[trial.mutant.mutant_id] = trial
+        logger.info("Loaded %s trials from checkpoint file %s", len(self.trials), self.file)
+
+    def open(self) -> None:
+        """Create a new checkpoint file, starting with the loaded trials."""
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        self.out = self.file.open("w", encoding="utf-8")
+        for trial in self.trials.values():
+            self.out.write(to_json(trial) + "\n")
+        self.sync()
+
+    def write(self, trial: MutantTrial) -> None:
+        """Append the trial.  Sync to disk after sync_batch_size trials, or after sync_interval seconds."""
+        if self.out is None:
+            return
+        self.out.write(to_json(trial) + "\n")
+        self.out.flush()
+        self.unsynced += 1
+        if self.unsynced >= sync_batch_size or time.monotonic() - self.last_sync >= sync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """Flush and sync the checkpoint file to disk."""
+        if self.out is None:
+            return
+        self.out.flush()
+        os.fsync(self.out.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Sync and close the checkpoint file."""
+        if self.out is None:
+            return
+        self.sync()
+        self.out.close()
+        self.out = None
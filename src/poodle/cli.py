@@ -23,7 +23,22 @@ CONTEXT_SETTINGS = {
 }
 
 
-@click.command(context_settings=CONTEXT_SETTINGS)
+class PoodleGroup(click.Group):
+    """Run mutation testing with the 'run' command, unless the first argument is the name of another command."""
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        """Insert 'run' command name when no command was named."""
+        if not args or args[0] not in self.commands:
+            args = ["run", *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=PoodleGroup, context_settings=CONTEXT_SETTINGS)
+def cli() -> None:
+    """Poodle Mutation Test Tool."""
+
+
+@cli.command("run", context_settings=CONTEXT_SETTINGS, epilog="Use 'poodle merge --help' to merge results of shards.")
 @click.argument("sources", type=click.Path(exists=True, path_type=Path), nargs=-1)
 @click.option("-c", "config_file", help="Configuration File.", type=click.Path(exists=True, path_type=Path))
 @click.option("-q", "quiet", help="Quiet mode: q, qq, or qqq", count=True)
@@ -35,24 +50,55 @@ CONTEXT_SETTINGS = {
 @click.option("--html", help="Folder name to store HTML report in.", type=click.Path(path_type=Path))
 @click.option("--json", help="File to create with JSON report.", type=click.Path(path_type=Path))
 @click.option("--fail_under", help="Fail if mutation score is under this value.", type=float)
+@click.option("--clear-cache", "clear_cache", help="Remove all results from the result cache.", is_flag=True)
+@click.option("--diff-base", "diff_base", help="Only mutate lines changed since this git ref.", metavar="REF")
+@click.option("--shard", help="Only test shard i of n shards, e.g. 2/8.", metavar="i/n")
+@click.option("--resume", help="Resume an interrupted run from its checkpoint.", is_flag=True)
+@click.option("--sample", help="Only test a random sample of this many mutants.", type=int, metavar="N")
+@click.option("--sample-fraction", help="Only test this fraction of mutants.", type=float, metavar="p")
+@click.option("--early-stop", help="Stop testing once the fail_under result is decided.", is_flag=True)
 @click.version_option(version=__version__)
 def main(  # noqa: C901 -- too complex
-    sources: tuple[Path],
+    sources: tuple[Path, ...],
     config_file: Path | None,
     quiet: int,
     verbose: int,
     workers: int | None,
-    exclude: tuple[str],
-    only: tuple[str],
-    report: tuple[str],
+    exclude: tuple[str, ...],
+    only: tuple[str, ...],
+    report: tuple[str, ...],
     html: Path | None,
     json: Path | None,
     fail_under: float | None,
+    clear_cache: bool,
+    diff_base: str | None,
+    shard: str | None,
+    resume: bool,
+    sample: int | None,
+    sample_fraction: float | None,
+    early_stop: bool,
 ) -> None:
     """Poodle Mutation Test Tool."""
     try:
         config = build_config(
-            sources, config_file, quiet, verbose, workers, exclude, only, report, html, json, fail_under
+            sources,
+            config_file,
+            quiet,
+            verbose,
+            workers,
+            exclude,
+            only,
+            report,
+            html,
+            json,
+            fail_under,
+            clear_cache,
+            diff_base,
+            shard,
+            resume,
+            sample,
+            sample_fraction,
+            early_stop,
         )
     except PoodleInputError as err:
         for arg in err.args:
@@ -87,6 +133,60 @@ def main(  # noqa: C901 -- too complex
     sys.exit(0)
 
 
+@cli.command(context_settings=CONTEXT_SETTINGS)
+@click.argument("result_files", type=click.Path(exists=True, dir_okay=False, path_type=Path), nargs=-1, required=True)
+@click.option("-c", "config_file", help="Configuration File.", type=click.Path(exists=True, path_type=Path))
+@click.option("-q", "quiet", help="Quiet mode: q, qq, or qqq", count=True)
+@click.option("-v", "verbose", help="Verbose mode: v, vv, or vvv", count=True)
+@click.option("--report", help="Enable reporter by name. Multiple allowed.", multiple=True)
+@click.option("--html", help="Folder name to store HTML report in.", type=click.Path(path_type=Path))
+@click.option("--json", help="File to create with JSON report.", type=click.Path(path_type=Path))
+@click.option("--fail_under", help="Fail if mutation score is under this value.", type=float)
+def merge(
+    result_files: tuple[Path, ...],
+    config_file: Path | None,
+    quiet: int,
+    verbose: int,
+    report: tuple[str, ...],
+    html: Path | None,
+    json: Path | None,
+    fail_under: float | None,
+) -> None:
+    """Merge JSON reports from each shard, then run reporters on the merged results."""
+    try:
+        config = build_config(
+            (),
+            config_file,
+            quiet,
+            verbose,
+            None,
+            (),
+            (),
+            report,
+            html,
+            json,
+            fail_under,
+            cmd_clear_cache=False,
+            cmd_diff_base=None,
+            cmd_shard=None,
+            cmd_resume=False,
+            cmd_sample=None,
+            cmd_sample_fraction=None,
+            cmd_early_stop=False,
+            require_sources=False,
+        )
+        core.merge_process(config, list(result_files))
+    except PoodleTestingFailedError as err:
+        for arg in err.args:
+            click.secho(arg, fg="yellow")
+        sys.exit(1)
+    except PoodleInputError as err:
+        for arg in err.args:
+            click.secho(arg, fg="red")
+        sys.exit(4)
+    sys.exit(0)
+
+
 # nomut: start
 if __name__ == "__main__":
-    main()
+    cli()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
@@ -13,6 +14,7 @@ from wcmatch import glob
 
 from . import PoodleInputError, poodle_config, tomllib
 from .data_types import PoodleConfig
+from .workspace import builtin_workspaces
 
 default_source_folders = [Path("src"), Path("lib")]
 
@@ -24,6 +26,9 @@ default_file_filters = ["test_*.py", "*_test.py", "poodle_config.py", "setup.py"
 default_file_copy_flags = glob.GLOBSTAR | glob.NODIR
 default_file_copy_filters = ["__pycache__/**"]
 default_work_folder = Path(".poodle-temp")
+default_workspace = "zip"
+default_scheduler = "process_pool"
+builtin_schedulers = ["process_pool", "asyncio"]
 
 default_min_timeout = 10
 default_timeout_multiplier = 10
@@ -31,6 +36,17 @@ default_runner = "command_line"
 
 default_reporters = ["summary", "not_found"]
 
+default_result_cache_files = [
+    "tests/**/*.py",
+    "test/**/*.py",
+    "conftest.py",
+    "pyproject.toml",
+    "setup.cfg",
+    "setup.py",
+    "requirements*.txt",
+    "*.lock",
+]
+
 
 def default_max_workers() -> int:
     """Calculate Default for max_workers as one less than available processors."""
@@ -43,19 +59,31 @@ def default_max_workers() -> int:
 
 
 def build_config(  # noqa: PLR0913
-    cmd_sources: tuple[Path],
+    cmd_sources: tuple[Path, ...],
     cmd_config_file: Path | None,
     cmd_quiet: int,
     cmd_verbose: int,
     cmd_max_workers: int | None,
-    cmd_excludes: tuple[str],
-    cmd_only_files: tuple[str],
-    cmd_report: tuple[str],
+    cmd_excludes: tuple[str, ...],
+    cmd_only_files: tuple[str, ...],
+    cmd_report: tuple[str, ...],
     cmd_html: Path | None,
     cmd_json: Path | None,
     cmd_fail_under: float | None,
+    cmd_clear_cache: bool,
+    cmd_diff_base: str | None,
+    cmd_shard: str | None,
+    cmd_resume: bool,
+    cmd_sample: int | None,
+    cmd_sample_fraction: float | None,
+    cmd_early_stop: bool,
+    *,
+    require_sources: bool = True,
 ) -> PoodleConfig:
-    """Build PoodleConfig object."""
+    """Build PoodleConfig object.
+
+    If require_sources is False, source folders are not required, e.g. to merge results.
+    """
     config_file_path = get_config_file_path(cmd_config_file)
     config_file_data = get_config_file_data(config_file_path)
     project_name, project_version = get_project_info(config_file_path)
@@ -80,12 +108,27 @@ def build_config(  # noqa: PLR0913
     if cmd_json:
         merge(cmd_reporter_opts, {"json_report_file": cmd_json})
 
+    sample, sample_fraction = get_sample(config_file_data, cmd_sample, cmd_sample_fraction)
+
     return PoodleConfig(
         project_name=get_str_from_config("project_name", config_file_data, default=project_name),
         project_version=get_str_from_config("project_version", config_file_data, default=project_version),
         config_file=config_file_path,
-        source_folders=get_source_folders(cmd_sources, config_file_data),
+        source_folders=get_source_folders(cmd_sources, config_file_data, required=require_sources),
         only_files=get_str_list_from_config("only_files", config_file_data, default=[], command_line=cmd_only_files),
+        diff_base=get_str_from_config("diff_base", config_file_data, command_line=cmd_diff_base or "") or None,
+        shard=get_shard(config_file_data, cmd_shard),
+        resume=get_bool_from_config("resume", config_file_data, default=False, command_line=cmd_resume or None),
+        sample=sample,
+        sample_fraction=sample_fraction,
+        sample_seed=get_int_from_config("sample_seed", config_file_data) or 0,
+        skip_equivalent=get_bool_from_config("skip_equivalent", config_file_data, default=False),
+        early_stop=get_bool_from_config(
+            "early_stop",
+            config_file_data,
+            default=False,
+            command_line=cmd_early_stop or None,
+        ),
         file_flags=get_int_from_config("file_flags", config_file_data, default=default_file_flags),
         file_filters=file_filters,
         file_copy_flags=get_int_from_config("file_copy_flags", config_file_data, default=default_file_copy_flags),
@@ -95,12 +138,14 @@ def build_config(  # noqa: PLR0913
             default=default_file_copy_filters,
         ),
         work_folder=get_path_from_config("work_folder", config_file_data, default=default_work_folder),
+        workspace=get_workspace(config_file_data),
         max_workers=get_int_from_config(
             "max_workers",
             config_file_data,
             default=default_max_workers(),
             command_line=cmd_max_workers,
         ),
+        scheduler=get_scheduler(config_file_data),
         log_format=log_format,
         log_level=log_level,
         echo_enabled=get_bool_from_config(
@@ -117,6 +162,20 @@ def build_config(  # noqa: PLR0913
         timeout_multiplier=get_int_from_config("timeout_multiplier", config_file_data) or default_timeout_multiplier,
         runner=get_str_from_config("runner", config_file_data, default=default_runner),
         runner_opts=get_dict_from_config("runner_opts", config_file_data),
+        coverage_guided=get_bool_from_config("coverage_guided", config_file_data, default=False),
+        result_cache=get_bool_from_config("result_cache", config_file_data, default=False),
+        result_cache_files=get_str_list_from_config(
+            "result_cache_files",
+            config_file_data,
+            default=default_result_cache_files,
+        ),
+        clear_result_cache=get_bool_from_config(
+            "clear_result_cache",
+            config_file_data,
+            default=False,
+            command_line=cmd_clear_cache or None,
+        ),
+        mutant_cache=get_bool_from_config("mutant_cache", config_file_data, default=False),
         reporters=get_reporters(config_file_data, cmd_report, cmd_html, cmd_json),
         reporter_opts=get_dict_from_config("reporter_opts", config_file_data, command_line=cmd_reporter_opts),
         fail_under=get_float_from_config("fail_under", config_file_data, command_line=cmd_fail_under),
@@ -124,9 +183,66 @@ def build_config(  # noqa: PLR0913
     )
 
 
+def get_shard(config_file_data: dict, command_line: str | None) -> tuple[int, int] | None:
+    """Retrieve shard to test, in the form 'i/n', as a tuple of index and count.  Index starts from 1."""
+    shard = get_str_from_config("shard", config_file_data, command_line=command_line or "")
+    if not shard:
+        return None
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", shard)
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        msg = f"shard must be in the form 'i/n' with 1 <= i <= n, found: '{shard}'"
+        raise PoodleInputError(msg)
+    return int(match.group(1)), int(match.group(2))
+
+
+def get_sample(
+    config_file_data: dict,
+    cmd_sample: int | None,
+    cmd_sample_fraction: float | None,
+) -> tuple[int | None, float | None]:
+    """Retrieve number or fraction of mutants to sample.  Only one of them may be set."""
+    sample = get_int_from_config("sample", config_file_data, command_line=cmd_sample)
+    sample_fraction = get_float_from_config("sample_fraction", config_file_data, command_line=cmd_sample_fraction)
+    if sample is not None and sample_fraction is not None:
+        raise PoodleInputError("Only one of sample and sample_fraction can be set")
+    if sample is not None and sample < 1:
+        msg = f"sample must be at least 1, found: {sample}"
+        raise PoodleInputError(msg)
+    if sample_fraction is not None and not 0 < sample_fraction <= 1:
+        msg = f"sample_fraction must be greater than 0 and at most 1, found: {sample_fraction}"
+        raise PoodleInputError(msg)
+    return sample, sample_fraction
+
+
+def get_workspace(config_file_data: dict) -> str:
+    """Retrieve name of the workspace used to prepare run folders, and verify it is a builtin workspace."""
+    workspace = get_str_from_config("workspace", config_file_data, default=default_workspace)
+    if workspace not in builtin_workspaces:
+        msg = f"workspace must be one of {list(builtin_workspaces)}, found: '{workspace}'"
+        raise PoodleInputError(msg)
+    return workspace
+
+
+def get_scheduler(config_file_data: dict) -> str:
+    """Retrieve name of the scheduler that runs the trials, and verify it can be used with the runner and workspace."""
+    scheduler = get_str_from_config("scheduler", config_file_data, default=default_scheduler)
+    if scheduler not in builtin_schedulers:
+        msg = f"scheduler must be one of {builtin_schedulers}, found: '{scheduler}'"
+        raise PoodleInputError(msg)
+    if scheduler == "asyncio":
+        runner = get_str_from_config("runner", config_file_data, default=default_runner)
+        if runner != "command_line":
+            msg = f"scheduler 'asyncio' requires runner 'command_line', found: '{runner}'"
+            raise PoodleInputError(msg)
+        if get_str_from_config("workspace", config_file_data, default=default_workspace) == "pooled":
+            msg = "scheduler 'asyncio' can't be used with workspace 'pooled'"
+            raise PoodleInputError(msg)
+    return scheduler
+
+
 def get_reporters(
     config_file_data: dict,
-    cmd_report: tuple[str],
+    cmd_report: tuple[str, ...],
     cmd_html: Path | None,
     cmd_json: Path | None,
 ) -> list[str]:
@@ -251,10 +367,13 @@ def get_project_info_toml(config_file: Path) -> tuple[str, str]:
         return "", ""
 
 
-def get_source_folders(command_line_sources: tuple[Path], config_data: dict) -> list[Path]:
+def get_source_folders(
+    command_line_sources: tuple[Path, ...], config_data: dict, *, required: bool = True
+) -> list[Path]:
     """Retrieve list of source folders that contain files to mutate.
 
     Verifies that all returned values are existing directories.
+    If not required, returns only the existing directories, and may return an empty list.
     """
     source_folders = get_path_list_from_config(
         option_name="source_folders",
@@ -263,6 +382,9 @@ def get_source_folders(command_line_sources: tuple[Path], config_data: dict) ->
         default=[source for source in default_source_folders if source.is_dir()],
     )
 
+    if not required:
+        return [source for source in source_folders if source.is_dir()]
+
     if not source_folders:
         raise PoodleInputError("No source folder found to mutate.")
 
@@ -321,7 +443,7 @@ def get_path_list_from_config(
     option_name: str,
     config_data: dict,
     default: list[Path] | None = None,
-    command_line: tuple[Path] | None = None,
+    command_line: tuple[Path, ...] | None = None,
 ) -> list[Path]:
     """Retrieve Config Option that should be a List of Paths.
 
@@ -375,7 +497,7 @@ def get_any_list_from_config(
     option_name: str,
     config_data: dict,
     default: list[Any] | None = None,
-    command_line: tuple[Any] | None = None,
+    command_line: tuple[Any, ...] | None = None,
 ) -> list[Any]:
     """Retrieve Config Option that should be a List of any types.
 
@@ -469,7 +591,7 @@ def get_str_list_from_config(
     option_name: str,
     config_data: dict,
     default: list[str] | None = None,
-    command_line: str | tuple[str] | None = None,
+    command_line: str | tuple[str, ...] | None = None,
 ) -> list[str]:
     """Retrieve Config Option that should be a List of Strings.
 
@@ -3,13 +3,28 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from typing import TYPE_CHECKING, Any
 
 from . import PoodleNoMutantsFoundError, PoodleTestingFailedError, __version__
+from .checkpoint import Checkpoint
 from .data_types import PoodleConfig, PoodleWork
+from .equivalence import filter_equivalent
+from .mutant_cache import MutantCache
 from .mutate import create_mutants_for_all_mutators, initialize_mutators
 from .report import generate_reporters
+from .result_cache import ResultCache
 from .run import clean_run_each_source_folder, get_runner, run_mutant_trails
+from .sample import estimate_score, select_sample
+from .shard import merge_results, select_shard
 from .util import calc_timeout, create_temp_zips, create_unified_diff, delete_folder, display_percent, pprint_str
+from .workspace import uses_zip
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .data_types import Mutant, MutantTrial, TestingResults
 
 logger = logging.getLogger(__name__)
 
@@ -20,30 +35,126 @@ def main_process(config: PoodleConfig) -> None:
     print_header(work)
     logger.info("\n%s", pprint_str(config))
 
+    checkpoint = Checkpoint(config)
+    if config.resume:
+        checkpoint.load()
     delete_folder(config.work_folder, config)
-    create_temp_zips(work)
+    checkpoint.open()
+    work.checkpoint = checkpoint
+    try:
+        if uses_zip(config):
+            create_temp_zips(work)
+
+        work.mutators = initialize_mutators(work)
+        work.runner = get_runner(config)
+        work.reporters = list(generate_reporters(config))
+        if config.result_cache:
+            work.result_cache = ResultCache(config)
+
+        if config.workspace == "schemata":  # clean run loads the instrumented modules written with the mutants
+            population, mutants = prepare_mutants(config, work)
+            clean_run_results = clean_run_each_source_folder(work)
+        else:
+            population, mutants, clean_run_results = prepare_mutants_during_clean_run(config, work)
+        timeout = calc_timeout(config, clean_run_results)
+        try:
+            results = run_mutant_trails(work, mutants, timeout)
+        except KeyboardInterrupt:
+            work.echo(f"Completed trials were saved to {checkpoint.file}.  Use --resume to continue.")
+            raise
+    finally:
+        checkpoint.close()
+        if work.result_cache:
+            work.result_cache.close()
+    if config.sample or config.sample_fraction:
+        estimate_score(results.summary, population, results.mutant_trials)
 
-    work.mutators = initialize_mutators(work)
-    work.runner = get_runner(config)
-    work.reporters = list(generate_reporters(config))
+    for trial in results.mutant_trials:
+        trial.mutant.unified_diff = create_unified_diff(trial.mutant)
+
+    run_reporters(config, work, results)
+
+    delete_folder(config.work_folder, config)
+
+    check_fail_under(config, results)
 
+
+def prepare_mutants(config: PoodleConfig, work: PoodleWork) -> tuple[list[Mutant], list[Mutant]]:
+    """Create mutants, then skip equivalent mutants and select the ones to test.
+
+    Returns all mutants after skipping equivalent ones, and the mutants selected to test.
+    """
+    if config.mutant_cache:
+        work.mutant_cache = MutantCache(config)
     mutants = create_mutants_for_all_mutators(work)
+    if work.mutant_cache:
+        work.mutant_cache.close()
     if not mutants:
         raise PoodleNoMutantsFoundError("No mutants were found to test!")
     work.echo(f"Identified {len(mutants)} mutants")
+    if config.skip_equivalent:
+        mutants = filter_equivalent(work, mutants)
+    return mutants, select_mutants(config, work, mutants)
+
+
+def prepare_mutants_during_clean_run(
+    config: PoodleConfig,
+    work: PoodleWork,
+) -> tuple[list[Mutant], list[Mutant], dict[Path, MutantTrial]]:
+    """Prepare mutants in a thread while the clean run tests each source folder.
+
+    Messages from preparing mutants are held until the clean run completes, so they don't interrupt its output.
+    Trials start once all mutants are prepared, as sampling, sharding, skipping equivalent mutants
+    and ordering trials longest first each need the full list of mutants.
+    Returns all mutants after skipping equivalent ones, the mutants selected to test, and the clean run results.
+    """
+    messages: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+    prepare_work = copy(work)
+    prepare_work.echo = lambda *args, **kwargs: messages.append((args, kwargs))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(prepare_mutants, config, prepare_work)
+        clean_run_results = clean_run_each_source_folder(work)
+        try:
+            population, mutants = future.result()
+        finally:
+            for args, kwargs in messages:
+                work.echo(*args, **kwargs)
+    return population, mutants, clean_run_results
+
+
+def select_mutants(config: PoodleConfig, work: PoodleWork, mutants: list[Mutant]) -> list[Mutant]:
+    """Select the sample of mutants, then the shard of the sample, to test."""
+    if config.sample or config.sample_fraction:
+        sample = select_sample(mutants, config)
+        work.echo(f"Testing a sample of {len(sample)} of {len(mutants)} mutants")
+        mutants = sample
+    if config.shard:
+        mutants = select_shard(mutants, config.shard)
+        work.echo(f"Testing {len(mutants)} mutants in shard {config.shard[0]}/{config.shard[1]}")
+    return mutants
+
+
+def merge_process(config: PoodleConfig, result_files: list[Path]) -> None:
+    """Merge results from shards, then report on them as if testing ran in one process."""
+    work = PoodleWork(config)  # sets logging defaults
+    work.reporters = list(generate_reporters(config))
 
-    clean_run_results = clean_run_each_source_folder(work)
-    timeout = calc_timeout(config, clean_run_results)
-    results = run_mutant_trails(work, mutants, timeout)
+    results = merge_results(result_files)
+    work.echo(f"Merged {len(results.mutant_trials)} mutant trials from {len(result_files)} result files")
 
-    for trial in results.mutant_trials:
-        trial.mutant.unified_diff = create_unified_diff(trial.mutant)
+    run_reporters(config, work, results)
+    check_fail_under(config, results)
 
+
+def run_reporters(config: PoodleConfig, work: PoodleWork, results: TestingResults) -> None:
+    """Pass results to each reporter."""
     for reporter in work.reporters:
         reporter(config=config, echo=work.echo, testing_results=results)
 
-    delete_folder(config.work_folder, config)
 
+def check_fail_under(config: PoodleConfig, results: TestingResults) -> None:
+    """Raise error if mutation score is below fail_under goal."""
     if config.fail_under and results.summary.success_rate < config.fail_under / 100:
         display_fail_under = display_percent(config.fail_under / 100)
         msg = f"Mutation score {results.summary.coverage_display} is below goal of {display_fail_under}"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -37,13 +39,23 @@ class PoodleConfig:
     source_folders: list[Path]
 
     only_files: list[str]
+    diff_base: str | None
+    shard: tuple[int, int] | None
+    resume: bool | None
+    sample: int | None
+    sample_fraction: float | None
+    sample_seed: int
+    skip_equivalent: bool | None
+    early_stop: bool | None
     file_flags: int | None
     file_filters: list[str]
 
     file_copy_flags: int | None
     file_copy_filters: list[str]
     work_folder: Path
+    workspace: str
     max_workers: int | None
+    scheduler: str
 
     log_format: str
     log_level: int | str
@@ -58,6 +70,11 @@ class PoodleConfig:
     timeout_multiplier: int
     runner: str
     runner_opts: dict
+    coverage_guided: bool | None
+    result_cache: bool | None
+    result_cache_files: list[str]
+    clear_result_cache: bool | None
+    mutant_cache: bool | None
 
     reporters: list[str]
     reporter_opts: dict
@@ -86,6 +103,21 @@ class Mutant(FileMutation, PoodleSerialize):
     source_folder: Path
     source_file: Path | None
     unified_diff: str | None = None
+    schema_id: int | None = None
+
+    @property
+    def mutant_id(self) -> str:
+        """Stable ID for the mutant, from its file, location, mutator and replacement text."""
+        key_data = [
+            self.source_file.as_posix() if self.source_file else None,
+            self.lineno,
+            self.col_offset,
+            self.end_lineno,
+            self.end_col_offset,
+            self.mutator_name,
+            self.text,
+        ]
+        return hashlib.sha256(json.dumps(key_data).encode("utf-8")).hexdigest()
 
     @staticmethod
     def from_dict(d: dict[str, Any]) -> dict[str, Any]:
@@ -112,10 +144,13 @@ class MutantTrialResult(PoodleSerialize):
     found: bool
     reason_code: str
     reason_desc: str | None = None
+    orphans: int = 0
 
     RC_FOUND = "Mutant Found"
     RC_NOT_FOUND = "Mutant Not Found"
+    RC_NOT_COVERED = "Mutant Not Covered"
     RC_TIMEOUT = "Trial Exceeded Timeout"
+    RC_RESOURCE_LIMIT = "Resource Limit Exceeded"
     RC_INCOMPLETE = "Testing Incomplete"
     RC_OTHER = "Other, See Description"
 
@@ -153,8 +188,17 @@ class TestingSummary(PoodleSerialize):
     tested: int = 0
     found: int = 0
     not_found: int = 0
+    not_covered: int = 0
     timeout: int = 0
+    resource_limit: int = 0
     errors: int = 0
+    incomplete: int = 0
+    cached: int = 0
+    orphans: int = 0
+    sampled_from: int = 0
+    estimated_rate: float | None = None
+    estimate_low: float | None = None
+    estimate_high: float | None = None
 
     @property
     def success_rate(self) -> float:
@@ -170,16 +214,33 @@ class TestingSummary(PoodleSerialize):
         """Return a formatted string for the coverage percentage."""
         return util.display_percent(self.success_rate)
 
+    @property
+    def estimate_display(self) -> str:
+        """Return a formatted string for the estimated score of all mutants, and its confidence interval."""
+        if self.estimated_rate is None or self.estimate_low is None or self.estimate_high is None:
+            return ""
+        return (
+            f"{util.display_percent(self.estimated_rate)} "
+            f"({util.display_percent(self.estimate_low)} - {util.display_percent(self.estimate_high)})"
+        )
+
     def __iadd__(self, result: MutantTrialResult) -> Self:
         """Update Testing Summary with data from MutantTrialResult."""
         if isinstance(result, MutantTrialResult):
             self.tested += 1
+            self.orphans += result.orphans
             if result.found:
                 self.found += 1
             elif result.reason_code == MutantTrialResult.RC_NOT_FOUND:
                 self.not_found += 1
+            elif result.reason_code == MutantTrialResult.RC_NOT_COVERED:
+                self.not_covered += 1
             elif result.reason_code == MutantTrialResult.RC_TIMEOUT:
                 self.timeout += 1
+            elif result.reason_code == MutantTrialResult.RC_RESOURCE_LIMIT:
+                self.resource_limit += 1
+            elif result.reason_code == MutantTrialResult.RC_INCOMPLETE:
+                self.incomplete += 1
             else:
                 self.errors += 1
 
@@ -190,6 +251,7 @@ class TestingSummary(PoodleSerialize):
         """Correct fields in Dictionary for JSON deserialization."""
         d.pop("success_rate", None)
         d.pop("coverage_display", None)
+        d.pop("estimate_display", None)
         return d
 
     def to_dict(self) -> dict[str, Any]:
@@ -197,6 +259,7 @@ class TestingSummary(PoodleSerialize):
         d = asdict(self)
         d["success_rate"] = self.success_rate
         d["coverage_display"] = self.coverage_display
+        d["estimate_display"] = self.estimate_display
         return d
 
 
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
     else:
         from collections.abc import Callable
 
+Location = tuple[int, int, int, int]
+
 
 def create_mutations(  # type: ignore [empty-body]
     config: PoodleConfig,
@@ -65,7 +67,18 @@ class Mutator(ABC):
 
     @staticmethod
     def get_location(node: ast.AST) -> tuple[int, int, int, int]:
-        """Get location lines and columns that encompasses node and all child nodes."""
+        """Get location lines and columns that encompasses node and all child nodes.
+
+        Uses the node's extent when it was set by add_extent_attr, otherwise walks all child nodes.
+        """
+        extent = getattr(node, "extent", None)
+        if isinstance(extent, tuple):
+            return extent
+        return Mutator.walk_location(node)
+
+    @staticmethod
+    def walk_location(node: ast.AST) -> Location:
+        """Get location lines and columns that encompasses node and all child nodes, by walking all child nodes."""
         lineno = node.lineno
         col_offset = node.col_offset
         end_lineno = node.end_lineno or node.lineno
@@ -94,6 +107,51 @@ class Mutator(ABC):
 
         return (lineno, col_offset, end_lineno, end_col_offset)
 
+    @staticmethod
+    def merge_location(location: Location, other: Location) -> Location:
+        """Extend location to encompass other location, as get_location does for each child node."""
+        lineno, col_offset, end_lineno, end_col_offset = location
+
+        if other[0] < lineno:  # decorators
+            lineno = other[0]
+            col_offset = min(col_offset, other[1])
+        elif other[0] == lineno:
+            col_offset = min(col_offset, other[1])
+
+        if other[2] > end_lineno:
+            end_lineno = other[2]
+            end_col_offset = other[3] or end_col_offset
+        elif other[2] == end_lineno:
+            end_col_offset = max(end_col_offset, other[3])
+
+        return (lineno, col_offset, end_lineno, end_col_offset)
+
+    @classmethod
+    def add_extent_attr(cls, parsed_ast: ast.AST) -> None:
+        """Update all nodes in tree that have a location with extent field, the location returned by get_location.
+
+        Extents are merged bottom-up from the extents of child nodes, in one pass over the tree.
+        """
+        extents: dict[ast.AST, Location | None] = {}
+        # in breadth first order, child nodes come after their parent, so reversed they come before
+        for node in reversed(list(ast.walk(parsed_ast))):
+            extent: Location | None = None
+            if hasattr(node, "lineno"):
+                extent = (
+                    node.lineno,
+                    node.col_offset,
+                    node.end_lineno or node.lineno,
+                    node.end_col_offset or node.col_offset,
+                )
+            for child in ast.iter_child_nodes(node):
+                child_extent = extents[child]
+                if child_extent is None:
+                    continue
+                extent = child_extent if extent is None else cls.merge_location(extent, child_extent)
+            extents[node] = extent
+            if hasattr(node, "lineno"):
+                node.extent = extent  # type: ignore [attr-defined]
+
     @staticmethod
     def add_parent_attr(parsed_ast: ast.Module) -> None:
         """Update all child nodes in tree with parent field."""
@@ -15,6 +15,11 @@ if TYPE_CHECKING:
     from collections.abc import Generator
     from pathlib import Path
 
+    from poodle.checkpoint import Checkpoint
+    from poodle.line_coverage import CoverageIndex
+    from poodle.mutant_cache import MutantCache
+    from poodle.result_cache import ResultCache
+
     from .data import PoodleConfig
     from .interfaces import Mutator
 
@@ -34,6 +39,11 @@ class PoodleWork:
         self.mutators: list[Mutator | Callable] = []
         self.runner: Callable = lambda *_, **__: None
         self.reporters: list[Callable] = []
+        self.coverage: dict[Path, CoverageIndex] = {}
+        self.clean_run_durations: dict[Path, float] = {}
+        self.result_cache: ResultCache | None = None
+        self.mutant_cache: MutantCache | None = None
+        self.checkpoint: Checkpoint | None = None
 
         self._echo_wrapper = EchoWrapper(config.echo_enabled, config.echo_no_color)
         self.echo: Callable = self._echo_wrapper.echo
@@ -0,0 +1,124 @@
+"""Skip mutants that compile to the same code as the original file, or as another mutant of the file.
+
+This is Trivial Compiler Equivalence: when the compiler produces the same code for two versions of a module, no test
+can tell them apart, so the mutant can't be found, or would get the same result as the other mutant.
+Code objects are compared without line numbers and column offsets, which change when text is replaced.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import multiprocessing
+import warnings
+from types import CodeType
+from typing import TYPE_CHECKING, Any
+
+from .util import mutate_lines
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .data_types import Mutant, PoodleWork
+
+logger = logging.getLogger(__name__)
+
+code_attributes = (
+    "co_argcount",
+    "co_posonlyargcount",
+    "co_kwonlyargcount",
+    "co_flags",
+    "co_name",
+    "co_code",
+    "co_names",
+    "co_varnames",
+    "co_freevars",
+    "co_cellvars",
+)
+
+
+def const_fingerprint(value: Any) -> Any:  # noqa: ANN401
+    """Build comparable value for a constant, that tells apart equal values of different types, e.g. 1 and True."""
+    if isinstance(value, CodeType):
+        return code_fingerprint(value)
+    if isinstance(value, tuple):
+        return "tuple", tuple(const_fingerprint(item) for item in value)
+    if isinstance(value, frozenset):
+        return "frozenset", tuple(sorted(repr(const_fingerprint(item)) for item in value))
+    return type(value).__name__, repr(value)
+
+
+def code_fingerprint(code: CodeType) -> tuple:
+    """Build comparable value for a code object and the code objects in its constants, without source locations."""
+    return (
+        tuple(getattr(code, attribute) for attribute in code_attributes),
+        getattr(code, "co_exceptiontable", b""),
+        tuple(const_fingerprint(const) for const in code.co_consts),
+    )
+
+
+def compile_fingerprint(source: str, file: Path) -> tuple | None:
+    """Compile source and return its fingerprint.  None if it doesn't compile."""
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return code_fingerprint(compile(source, str(file), "exec", dont_inherit=True))
+    except (SyntaxError, ValueError):
+        return None
+
+
+def filter_equivalent_in_file(file: Path, mutants: list[Mutant]) -> tuple[list[Mutant], int, int]:
+    """Remove mutants that compile to the same code as the file, or as an earlier mutant of the file.
+
+    Returns the remaining mutants, the number equivalent to the file, and the number of duplicates.
+    Mutants that don't compile are kept, as they can't be compared.
+    """
+    file_lines = file.read_text("utf-8").splitlines(keepends=True)
+    original = compile_fingerprint("".join(file_lines), file)
+    seen: set[tuple] = set()
+    kept = []
+    equivalent = duplicate = 0
+    for mutant in mutants:
+        fingerprint = compile_fingerprint("".join(mutate_lines(mutant, file_lines)), file)
+        if fingerprint is None:
+            kept.append(mutant)
+        elif fingerprint == original:
+            logger.debug("Equivalent mutant: %s:%s %s", file, mutant.lineno, mutant.mutator_name)
+            equivalent += 1
+        elif fingerprint in seen:
+            logger.debug("Duplicate mutant: %s:%s %s", file, mutant.lineno, mutant.mutator_name)
+            duplicate += 1
+        else:
+            seen.add(fingerprint)
+            kept.append(mutant)
+    return kept, equivalent, duplicate
+
+
+def filter_equivalent(work: PoodleWork, mutants: list[Mutant]) -> list[Mutant]:
+    """Remove mutants that are equivalent to their file or to another mutant.  Files are compiled in parallel."""
+    by_file: dict[Path, list[Mutant]] = {}
+    no_file: list[Mutant] = []
+    for mutant in mutants:
+        if mutant.source_file:
+            by_file.setdefault(mutant.source_file, []).append(mutant)
+        else:
+            no_file.append(mutant)
+    files = list(by_file)
+
+    max_workers = min(work.config.max_workers or 1, len(files))
+    if max_workers > 1:
+        # Workers are spawned, not forked, as this may run in a thread alongside the clean run.
+        spawn = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=spawn) as executor:
+            results = list(executor.map(filter_equivalent_in_file, files, by_file.values()))
+    else:
+        results = [filter_equivalent_in_file(file, file_mutants) for file, file_mutants in by_file.items()]
+
+    kept = [mutant for file_mutants, _, _ in results for mutant in file_mutants] + no_file
+    equivalent = sum(result[1] for result in results)
+    duplicate = sum(result[2] for result in results)
+    if equivalent or duplicate:
+        work.echo(
+            f"Skipping {equivalent} mutant(s) equivalent to the original code, and {duplicate} duplicate mutant(s)"
+        )
+    return kept
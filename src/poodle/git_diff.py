@@ -0,0 +1,106 @@
+"""Find lines changed relative to a git ref, to limit mutation to new and changed code.
+
+Changed lines are parsed from the hunk headers of `git diff -U0 <ref>`, which compares the ref to the working tree.
+Files not tracked by git (and not ignored) are treated as entirely changed.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import re
+import subprocess
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import PoodleInputError
+
+if TYPE_CHECKING:
+    from .data_types import FileMutation
+
+logger = logging.getLogger(__name__)
+
+LineRange = tuple[int, int]
+
+diff_file_header = re.compile(r"^\+\+\+ (?:b/(?P<file>.*)|/dev/null)$")
+diff_hunk_header = re.compile(r"^@@ -\d+(?:,\d+)? \+(?P<start>\d+)(?:,(?P<count>\d+))? @@")
+
+
+class ChangedLines:
+    """Index of the line ranges changed in each file."""
+
+    def __init__(self, file_ranges: dict[Path, list[LineRange]], untracked: set[Path] | None = None) -> None:
+        """Init with changed line ranges for each file, and files that are entirely new.  File names are resolved."""
+        self.file_ranges: dict[Path, list[LineRange]] = {}
+        for file, ranges in file_ranges.items():
+            self.file_ranges.setdefault(file.resolve(), []).extend(ranges)
+        for ranges in self.file_ranges.values():
+            ranges.sort()
+        self.file_starts = {file: [start for start, _ in ranges] for file, ranges in self.file_ranges.items()}
+        self.untracked = {file.resolve() for file in untracked or set()}
+
+    @classmethod
+    def from_git(cls, diff_base: str) -> ChangedLines:
+        """Run git to find lines changed since diff_base, including uncommitted changes and untracked files."""
+        diff = run_git(
+            "diff",
+            "-U0",
+            "--no-color",
+            "--no-ext-diff",
+            "--relative",
+            "--src-prefix=a/",
+            "--dst-prefix=b/",
+            diff_base,
+            "--",
+        )
+        untracked = run_git("ls-files", "--others", "--exclude-standard")
+        return cls(parse_diff(diff), {Path(file) for file in untracked.splitlines() if file})
+
+    def has_changes(self, file: Path) -> bool:
+        """Check if any line in the file changed."""
+        file = file.resolve()
+        return file in self.untracked or bool(self.file_ranges.get(file))
+
+    def overlaps(self, file: Path, mutation: FileMutation) -> bool:
+        """Check if any line of the mutation changed."""
+        file = file.resolve()
+        if file in self.untracked:
+            return True
+        if file not in self.file_ranges:
+            return False
+
+        # ranges don't overlap, so only the last range starting on or before end_lineno can include a mutated line
+        index = bisect.bisect_right(self.file_starts[file], mutation.end_lineno) - 1
+        return index >= 0 and self.file_ranges[file][index][1] >= mutation.lineno
+
+
+def run_git(*args: str) -> str:
+    """Run git command in the current folder, and return its output."""
+    logger.debug("git %s", args)
+    try:
+        result = subprocess.run(["git", *args], capture_output=True, check=False, text=True)  # noqa: S603, S607
+    except FileNotFoundError as ex:
+        raise PoodleInputError("diff_base requires git, but git was not found") from ex
+    if result.returncode != 0:
+        msg = f"git {args[0]} failed: {result.stderr.strip()}"
+        raise PoodleInputError(msg)
+    return result.stdout
+
+
+def parse_diff(diff: str) -> dict[Path, list[LineRange]]:
+    """Parse the first and last line of each added or changed block from output of `git diff -U0`.
+
+    Blocks that only delete lines are skipped, as no mutant can be on a deleted line.
+    """
+    file_ranges: dict[Path, list[LineRange]] = {}
+    ranges: list[LineRange] | None = None
+    for line in diff.splitlines():
+        if file_match := diff_file_header.match(line):
+            file = file_match.group("file")
+            ranges = file_ranges.setdefault(Path(file), []) if file else None
+        elif (hunk_match := diff_hunk_header.match(line)) and ranges is not None:
+            start = int(hunk_match.group("start"))
+            count = int(hunk_match.group("count") or 1)
+            if count:
+                ranges.append((start, start + count - 1))
+    return file_ranges
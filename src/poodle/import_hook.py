@@ -0,0 +1,147 @@
+"""Import hook that serves mutated source code, so trials can run against the original source folder.
+
+When loaded as a pytest plugin, the hook is installed using the MUT_* environment variables set by the runner.
+When POODLE_SCHEMATA is set to a schema folder, the instrumented modules in that folder are served,
+and MUT_SCHEMA_ID selects the active mutant.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+import sys
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec, PathFinder, SourceFileLoader
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .data_types import FileMutation
+from .schemata import ACTIVE_MUTANT, schema_sources
+from .util import mutate_lines
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import CodeType, ModuleType
+
+logger = logging.getLogger(__name__)
+
+
+class MutantLoader(SourceFileLoader):
+    """Load module from mutated source instead of from file or bytecode cache."""
+
+    def __init__(self, fullname: str, path: str, source: str, active_mutant: int | None = None) -> None:
+        """Init with mutated source for module at path, and active mutant id if source is an instrumented module."""
+        super().__init__(fullname, path)
+        self.source = source
+        self.active_mutant = active_mutant
+
+    def get_source(self, fullname: str) -> str:  # noqa: ARG002
+        """Return the mutated source."""
+        return self.source
+
+    def get_code(self, fullname: str) -> CodeType:  # noqa: ARG002
+        """Compile the mutated source."""
+        return compile(self.source, self.path, "exec", dont_inherit=True)
+
+    def exec_module(self, module: ModuleType) -> None:
+        """Set the active mutant id of instrumented modules, then execute the module."""
+        if self.active_mutant is not None:
+            setattr(module, ACTIVE_MUTANT, self.active_mutant)
+        super().exec_module(module)
+
+
+class MutantFinder(MetaPathFinder):
+    """Find the mutated modules, and load them with MutantLoader."""
+
+    def __init__(self, sources: dict[Path, str], active_mutants: dict[Path, int] | None = None) -> None:
+        """Init with mutated source for each source file, and active mutant id for each instrumented module."""
+        self.sources = {file.resolve(): source for file, source in sources.items()}
+        self.active_mutants = {file.resolve(): mutant_id for file, mutant_id in (active_mutants or {}).items()}
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,  # noqa: ARG002
+    ) -> ModuleSpec | None:
+        """Return spec with MutantLoader if fullname is a mutated module, otherwise None."""
+        spec = PathFinder.find_spec(fullname, path)
+        if spec is None or not spec.has_location or not spec.origin:
+            return None
+
+        origin = Path(spec.origin).resolve()
+        if origin not in self.sources:
+            return None
+
+        spec.loader = MutantLoader(fullname, spec.origin, self.sources[origin], self.active_mutants.get(origin))
+        return spec
+
+
+def mutant_from_env() -> tuple[Path, FileMutation] | None:
+    """Read the source file and mutation from MUT_* environment variables.  None if no file was mutated."""
+    source_file = os.environ.get("MUT_SOURCE_FILE", "None")
+    if source_file == "None":
+        return None
+
+    return Path(source_file), FileMutation(
+        mutator_name="",
+        lineno=int(os.environ["MUT_LINENO"]),
+        col_offset=int(os.environ["MUT_COL_OFFSET"]),
+        end_lineno=int(os.environ["MUT_END_LINENO"]),
+        end_col_offset=int(os.environ["MUT_END_COL_OFFSET"]),
+        text=os.environ["MUT_TEXT"],
+    )
+
+
+def mutated_source(source_file: Path, mutation: FileMutation) -> str:
+    """Apply mutation to the text of source_file."""
+    file_lines = source_file.read_text("utf-8").splitlines(keepends=True)
+    return "".join(mutate_lines(mutation, file_lines))  # type: ignore [arg-type]
+
+
+def install(sources: dict[Path, str], active_mutants: dict[Path, int] | None = None) -> MutantFinder:
+    """Add MutantFinder to sys.meta_path.
+
+    If a module was already imported, e.g. by another plugin, it is reloaded with the mutated source.
+    """
+    finder = MutantFinder(sources, active_mutants)
+    sys.meta_path.insert(0, finder)
+    logger.debug("Installed MutantFinder for %s", list(finder.sources))
+
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and Path(module_file).resolve() in finder.sources:
+            importlib.reload(module)
+
+    return finder
+
+
+def install_from_env() -> MutantFinder | None:
+    """Install MutantFinder for the schema and mutation described by the environment variables."""
+    sources: dict[Path, str] = {}
+    active_mutants: dict[Path, int] = {}
+
+    schemata = os.environ.get("POODLE_SCHEMATA")
+    if schemata:
+        sources = schema_sources(Path(schemata))
+        active_mutants = dict.fromkeys(sources, 0)
+
+    mutant = mutant_from_env()
+    if mutant:
+        source_file = mutant[0].resolve()
+        schema_id = os.environ.get("MUT_SCHEMA_ID", "None")
+        if schema_id != "None" and source_file in sources:
+            active_mutants[source_file] = int(schema_id)
+        else:
+            sources[source_file] = mutated_source(*mutant)
+            active_mutants.pop(source_file, None)
+
+    if not sources:
+        return None
+    return install(sources, active_mutants)
+
+
+def pytest_load_initial_conftests() -> None:
+    """Pytest Hook: install MutantFinder before conftest files and test modules are imported."""
+    install_from_env()
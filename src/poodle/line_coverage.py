@@ -0,0 +1,205 @@
+"""Collect per-test line coverage in the clean run, and select the tests that cover each mutant.
+
+When loaded as a pytest plugin with POODLE_COVERAGE_FILE set, records which tests executed each line
+of the files in POODLE_COVERAGE_INCLUDE, and writes it to POODLE_COVERAGE_FILE as JSON.
+File names are written relative to POODLE_COVERAGE_ROOT.
+
+Lines executed outside of a test (e.g. while importing test modules) are recorded for the test id "".
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from types import CodeType
+
+    from .data_types import Mutant
+
+logger = logging.getLogger(__name__)
+
+LineTests = dict[str, dict[int, set[str]]]
+
+IMPORT_TIME = ""
+
+# sys.monitoring tool ids not reserved for debuggers, coverage, profilers or optimizers.
+UNRESERVED_TOOL_IDS = (3, 4)
+
+
+class MonitoringCollector:
+    """Collect lines executed by each test with sys.monitoring (Python 3.12+)."""
+
+    def __init__(self, include: list[str]) -> None:
+        """Start collecting lines from files in the include folders."""
+        self.include = tuple(include)
+        self.context = IMPORT_TIME
+        self.lines: LineTests = {}
+        self.monitoring: Any = sys.monitoring  # type: ignore [attr-defined]
+        self.tool_id = self.free_tool_id()
+        self.monitoring.use_tool_id(self.tool_id, "poodle")
+        self.monitoring.register_callback(self.tool_id, self.monitoring.events.LINE, self.line)
+        self.monitoring.set_events(self.tool_id, self.monitoring.events.LINE)
+
+    def free_tool_id(self) -> int:
+        """Find a tool id that is not reserved by Python or in use, so coverage.py and debuggers keep theirs.
+
+        Raises ValueError if all of them are in use.
+        """
+        for tool_id in UNRESERVED_TOOL_IDS:
+            if self.monitoring.get_tool(tool_id) is None:
+                return tool_id
+        raise ValueError("No free sys.monitoring tool id")
+
+    def line(self, code: CodeType, lineno: int) -> object:
+        """Record the line for the current test, then disable events for this line until the next test starts."""
+        if code.co_filename.startswith(self.include):
+            self.lines.setdefault(code.co_filename, {}).setdefault(lineno, set()).add(self.context)
+        return self.monitoring.DISABLE
+
+    def switch(self, context: str) -> None:
+        """Start recording lines for a new test."""
+        self.context = context
+        self.monitoring.restart_events()
+
+    def stop(self) -> LineTests:
+        """Stop collecting, and return lines executed by each test."""
+        self.monitoring.set_events(self.tool_id, 0)
+        self.monitoring.register_callback(self.tool_id, self.monitoring.events.LINE, None)
+        self.monitoring.free_tool_id(self.tool_id)
+        return self.lines
+
+
+class CoveragePyCollector:
+    """Collect lines executed by each test with coverage.py dynamic contexts."""
+
+    def __init__(self, include: list[str]) -> None:
+        """Start collecting lines from files in the include folders."""
+        import coverage  # noqa: PLC0415
+
+        self.cov = coverage.Coverage(data_file=None, include=[f"{folder}/*" for folder in include], config_file=False)
+        self.cov.start()
+        self.cov.switch_context(IMPORT_TIME)
+
+    def switch(self, context: str) -> None:
+        """Start recording lines for a new test."""
+        self.cov.switch_context(context)
+
+    def stop(self) -> LineTests:
+        """Stop collecting, and return lines executed by each test."""
+        self.cov.stop()
+        data = self.cov.get_data()
+        return {
+            file: {lineno: set(contexts) for lineno, contexts in data.contexts_by_lineno(file).items()}
+            for file in data.measured_files()
+        }
+
+
+def create_collector(include: list[str]) -> MonitoringCollector | CoveragePyCollector:
+    """Use sys.monitoring if available, otherwise coverage.py."""
+    if hasattr(sys, "monitoring"):
+        return MonitoringCollector(include)
+    return CoveragePyCollector(include)
+
+
+class CoveragePlugin:
+    """Pytest plugin that switches the coverage context for each test, and writes the results."""
+
+    def __init__(self, coverage_file: Path, root: Path, include: list[str]) -> None:
+        """Start collecting coverage."""
+        self.coverage_file = coverage_file
+        self.root = root
+        self.collector = create_collector(include)
+
+    def pytest_runtest_logstart(self, nodeid: str) -> None:
+        """Record lines for this test."""
+        self.collector.switch(nodeid)
+
+    def pytest_runtest_logfinish(self) -> None:
+        """Record lines between tests as import time lines."""
+        self.collector.switch(IMPORT_TIME)
+
+    def pytest_sessionfinish(self) -> None:
+        """Stop collecting, and write coverage file."""
+        write_coverage_file(self.coverage_file, self.root, self.collector.stop())
+
+
+def pytest_load_initial_conftests(early_config: Any) -> None:  # noqa: ANN401
+    """Pytest Hook: start collecting coverage before conftest files and test modules are imported."""
+    coverage_file = os.environ.get("POODLE_COVERAGE_FILE")
+    if coverage_file:
+        try:
+            plugin = CoveragePlugin(
+                coverage_file=Path(coverage_file),
+                root=Path(os.environ["POODLE_COVERAGE_ROOT"]),
+                include=os.environ["POODLE_COVERAGE_INCLUDE"].split(os.pathsep),
+            )
+        except ValueError:
+            # Without a coverage file, trials run all tests.
+            logger.warning("Coverage not collected, all sys.monitoring tool ids are in use", exc_info=True)
+            return
+        early_config.pluginmanager.register(plugin, "poodle_line_coverage")
+
+
+def write_coverage_file(coverage_file: Path, root: Path, line_tests: LineTests) -> None:
+    """Write lines executed by each test to coverage_file, with file names relative to root."""
+
+    def relative(file: str) -> str:
+        path = Path(file)
+        return str(path.relative_to(root)) if path.is_relative_to(root) else file
+
+    data = {
+        relative(file): {str(lineno): sorted(tests) for lineno, tests in lines.items()}
+        for file, lines in line_tests.items()
+    }
+    coverage_file.parent.mkdir(parents=True, exist_ok=True)
+    coverage_file.write_text(json.dumps(data), encoding="utf-8")
+
+
+class CoverageIndex:
+    """Index of the tests that executed each line of each file."""
+
+    def __init__(self, line_tests: LineTests | None = None) -> None:
+        """Init with lines executed by each test.  File names are resolved."""
+        self.line_tests: dict[Path, dict[int, set[str]]] = {}
+        for file, lines in (line_tests or {}).items():
+            file_lines = self.line_tests.setdefault(Path(file).resolve(), {})
+            for lineno, tests in lines.items():
+                file_lines.setdefault(lineno, set()).update(tests)
+
+    @classmethod
+    def from_file(cls, coverage_file: Path) -> CoverageIndex:
+        """Read coverage file written by the pytest plugin.  Relative file names are relative to current folder."""
+        data = json.loads(coverage_file.read_text("utf-8"))
+        return cls(
+            {file: {int(lineno): set(tests) for lineno, tests in lines.items()} for file, lines in data.items()},
+        )
+
+    def tests_for(self, mutant: Mutant) -> list[str] | None:
+        """List tests that executed any line of the mutant.
+
+        Returns None if any line was executed outside of a test, as any test may depend on it.
+        """
+        if not mutant.source_file:
+            return None
+
+        file_lines = self.line_tests.get(mutant.source_file.resolve(), {})
+        tests: set[str] = set()
+        for lineno in range(mutant.lineno, mutant.end_lineno + 1):
+            line_tests = file_lines.get(lineno, set())
+            if IMPORT_TIME in line_tests:
+                return None
+            tests.update(line_tests)
+        return sorted(tests)
+
+    @cached_property
+    def test_count(self) -> int:
+        """Count the tests that executed any line."""
+        return len(
+            {test for lines in self.line_tests.values() for tests in lines.values() for test in tests} - {IMPORT_TIME}
+        )
@@ -0,0 +1,119 @@
+r"""Find lines where comments block mutation, to skip those nodes while creating mutations.
+
+Only comment tokens are scanned, so text like "# nomut" in a string doesn't block mutation.
+
+Block all mutations:
+
+\# pragma: no mutate
+
+\# nomut
+
+\# nomut: start
+
+\# nomut: end
+
+Block only specific mutations:
+
+\# nomut: mutator,mutator
+"""
+
+from __future__ import annotations
+
+import bisect
+import io
+import logging
+import re
+import tokenize
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .data_types import FileMutation
+    from .git_diff import LineRange
+
+logger = logging.getLogger(__name__)
+
+filter_comment = re.compile(r"#\s*(?:pragma:\s*no mutate|nomut:?\s*(?P<mutators>[A-Za-z0-9,\s]*))")
+
+
+class LineFilters:
+    """Index of the line ranges where mutation is blocked, for all mutators and for each named mutator."""
+
+    def __init__(self, name_ranges: dict[str, list[LineRange]] | None = None) -> None:
+        """Init with line ranges blocked for each lower case mutator name, or "all".  Adjoining ranges are merged."""
+        self.name_ranges = {name: merge_ranges(ranges) for name, ranges in (name_ranges or {}).items()}
+        self.name_starts = {name: [start for start, _ in ranges] for name, ranges in self.name_ranges.items()}
+        self.any_ranges = merge_ranges([line_range for ranges in self.name_ranges.values() for line_range in ranges])
+        self.any_starts = [start for start, _ in self.any_ranges]
+
+    @classmethod
+    def from_source(cls, source: str) -> LineFilters:
+        """Parse comments of the source code for filters.  A region that is started and not ended runs to the end."""
+        name_ranges: dict[str, list[LineRange]] = {}
+        if "nomut" not in source and "no mutate" not in source:
+            return cls(name_ranges)
+
+        region_start: int | None = None
+        lineno = 0
+        for token in tokenize.generate_tokens(io.StringIO(source).readline):
+            lineno = token.start[0]
+            if token.type != tokenize.COMMENT:
+                continue
+
+            matches = list(filter_comment.finditer(token.string))
+            nomut = [match["mutators"] for match in matches if match["mutators"] is not None]
+            if nomut and nomut[0].strip().lower() in ("start", "on") and region_start is None:
+                region_start = lineno
+
+            if region_start is None:
+                names = {"all"} if len(nomut) < len(matches) else set()
+                names.update(name.strip().lower() or "all" for mutators in nomut for name in mutators.split(","))
+                for name in names:
+                    name_ranges.setdefault(name, []).append((lineno, lineno))
+
+            if nomut and nomut[0].strip().lower() in ("end", "off") and region_start is not None:
+                name_ranges.setdefault("all", []).append((region_start, lineno))
+                region_start = None
+
+        if region_start is not None:
+            name_ranges.setdefault("all", []).append((region_start, lineno))
+        return cls(name_ranges)
+
+    def is_blocked(self, name: str, lineno: int, end_lineno: int) -> bool:
+        """Check if any line from lineno to end_lineno is blocked for mutator name, or "all"."""
+        if name not in self.name_ranges:
+            return False
+        # ranges don't overlap, so only the last range starting on or before end_lineno can include a line
+        index = bisect.bisect_right(self.name_starts[name], end_lineno) - 1
+        return index >= 0 and self.name_ranges[name][index][1] >= lineno
+
+    def is_covered(self, name: str, lineno: int, end_lineno: int) -> bool:
+        """Check if every line from lineno to end_lineno is blocked for mutator name, or "all"."""
+        if name not in self.name_ranges:
+            return False
+        index = bisect.bisect_right(self.name_starts[name], lineno) - 1
+        return index >= 0 and self.name_ranges[name][index][1] >= end_lineno
+
+    def covering(self, lineno: int, end_lineno: int) -> set[str]:
+        """Names of the filters that block every line from lineno to end_lineno."""
+        # most nodes are on lines with no filters, so check the ranges blocked for any name first
+        index = bisect.bisect_right(self.any_starts, lineno) - 1
+        if index < 0 or self.any_ranges[index][1] < end_lineno:
+            return set()
+        return {name for name in self.name_ranges if self.is_covered(name, lineno, end_lineno)}
+
+    def overlaps(self, mutation: FileMutation) -> bool:
+        """Check if any line of the mutation is blocked for its mutator."""
+        return self.is_blocked("all", mutation.lineno, mutation.end_lineno) or self.is_blocked(
+            mutation.mutator_name.lower(), mutation.lineno, mutation.end_lineno
+        )
+
+
+def merge_ranges(ranges: list[LineRange]) -> list[LineRange]:
+    """Sort line ranges, and merge ranges that overlap or adjoin."""
+    merged: list[LineRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
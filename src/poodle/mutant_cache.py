@@ -0,0 +1,86 @@
+"""Cache of the mutations created by built-in mutators, reused by later runs while the file is unchanged.
+
+Mutations are stored in a SQLite database in the cache folder, as a JSON list for each file and mutator.
+Each list is keyed by a hash of the file, the mutator's name, the mutator_opts, the poodle version
+and the Python implementation and version, so changes to options or to the mutators in a new version take effect,
+and a cache shared by several Python versions doesn't mix up their ast positions and unparsed code.
+Only built-in mutators are cached, as their mutations depend on nothing else.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import sys
+from dataclasses import astuple
+from typing import TYPE_CHECKING
+
+from . import __version__
+from .data_types import FileMutation
+from .result_cache import cache_folder
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .data_types import Mutator, PoodleConfig
+
+logger = logging.getLogger(__name__)
+
+
+class MutantCache:
+    """Mutations created by built-in mutators in previous runs."""
+
+    def __init__(self, config: PoodleConfig, folder: Path = cache_folder) -> None:
+        """Open the cache database, creating it if needed.  Remove all mutations if clear_result_cache is set."""
+        folder.mkdir(parents=True, exist_ok=True)
+        self.db_file = folder / "mutants.db"
+        self.connection = sqlite3.connect(self.db_file, timeout=60)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS mutations (key TEXT PRIMARY KEY, mutations TEXT NOT NULL)")
+        if config.clear_result_cache:
+            logger.info("Clearing mutant cache: %s", self.db_file)
+            self.connection.execute("DELETE FROM mutations")
+        self.connection.commit()
+
+        self.options_hash = hashlib.sha256(
+            json.dumps(
+                [__version__, sys.implementation.name, sys.version_info[:2], config.mutator_opts],
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def key(self, file_hash: str, mutator: Mutator) -> str:
+        """Build the cache key for the mutator's mutations of the file."""
+        key_data = [self.options_hash, file_hash, mutator.mutator_name]
+        return hashlib.sha256(json.dumps(key_data).encode("utf-8")).hexdigest()
+
+    def get(self, file_hash: str, mutators: list[Mutator]) -> dict[int, list[FileMutation]]:
+        """Retrieve cached mutations of the file.  Map id of each mutator that has cached mutations to its mutations."""
+        cached = {}
+        for mutator in mutators:
+            key = self.key(file_hash, mutator)
+            row = self.connection.execute("SELECT mutations FROM mutations WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                cached[id(mutator)] = [FileMutation(*values) for values in json.loads(row[0])]
+        return cached
+
+    def put(self, file_hash: str, mutators: list[Mutator], mutations: dict[int, list[FileMutation]]) -> None:
+        """Save mutations of the file, for each of the mutators."""
+        rows = [
+            (self.key(file_hash, mutator), json.dumps([astuple(mutation) for mutation in mutations[id(mutator)]]))
+            for mutator in mutators
+        ]
+        self.connection.executemany("INSERT OR REPLACE INTO mutations (key, mutations) VALUES (?, ?)", rows)
+        self.connection.commit()
+        logger.debug("Saved mutations of %s mutator(s) to cache: %s", len(rows), self.db_file)
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self.connection.close()
+
+
+def file_hash(data: bytes) -> str:
+    """Hash content of a source file."""
+    return hashlib.sha256(data).hexdigest()
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import ast
+import concurrent.futures
 import logging
-import re
+import multiprocessing
+import pickle
 from copy import deepcopy
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from . import PoodleInputError
 from .data_types import FileMutation, Mutant, Mutator, PoodleWork
+from .git_diff import ChangedLines
+from .line_filters import LineFilters
+from .mutant_cache import MutantCache, file_hash
 from .mutators import (
     AugAssignMutator,
     BinaryOperationMutator,
@@ -24,12 +30,16 @@ from .mutators import (
     StringMutator,
     UnaryOperationMutator,
 )
+from .schemata import create_schema, write_schema
+from .traverse import create_mutations
 from .util import dynamic_import, files_list_for_folder
 
 if TYPE_CHECKING:
     import sys
     from pathlib import Path
 
+    from .data_types import PoodleConfig
+
     if sys.version_info < (3, 14):  # nomut
         from typing import Callable  # noqa: UP035  # pragma: no cover
     else:
@@ -94,19 +104,112 @@ def initialize_mutator(work: PoodleWork, mutator_def: Any) -> Callable | Mutator
     raise PoodleInputError(msg)
 
 
+def is_single_pass(mutator: Mutator) -> bool:
+    """Identify built-in mutators, which create their mutations together in one traversal of the ast.
+
+    Other mutators, including subclasses of built-in mutators, are called with their own copy of the ast.
+    """
+    return type(mutator) in builtin_mutators.values()
+
+
 def create_mutants_for_all_mutators(work: PoodleWork) -> list[Mutant]:
-    """Create consolidated, flattened list of all mutants to be tried."""
-    return [
-        mutant
+    """Create consolidated, flattened list of all mutants to be tried.
+
+    When diff_base is set, only mutants on lines changed since diff_base are created.
+    Files are mutated in parallel, when max_workers allows.
+    """
+    changed_lines = ChangedLines.from_git(work.config.diff_base) if work.config.diff_base else None
+    targets = [
+        (folder, file)
         for folder, files in get_target_files(work).items()
         for file in files
-        for mutant in create_mutants_for_file(
-            work,
-            folder,
-            file,
-        )
+        if changed_lines is None or changed_lines.has_changes(file)
     ]
 
+    max_workers = min(work.config.max_workers or 1, len(targets))
+    pool_mutators = get_pool_mutators(work) if max_workers > 1 else []
+    if pool_mutators:
+        return create_mutants_in_pool(work, targets, pool_mutators, changed_lines, max_workers)
+
+    return [mutant for folder, file in targets for mutant in create_mutants_for_file(work, folder, file, changed_lines)]
+
+
+def is_picklable(obj: object) -> bool:
+    """Identify if obj can be pickled, to pass it to a worker process."""
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+    return True
+
+
+def get_pool_mutators(work: PoodleWork) -> list[Callable | Mutator]:
+    """List mutators that can run in worker processes.  Other mutators run in the main process.
+
+    None can run in worker processes when config can't be pickled.
+    With the "schemata" workspace, all mutants of a file are needed to write its schema,
+    so either all mutators run in worker processes, or none do.
+    """
+    if not is_picklable(work.config):
+        logger.info("Config can't be pickled.  Creating mutants in main process.")
+        return []
+
+    pool_mutators = [mutator for mutator in work.mutators if is_picklable(mutator)]
+    if len(pool_mutators) < len(work.mutators):
+        logger.info("Mutators that can't be pickled: %s", [m for m in work.mutators if m not in pool_mutators])
+        if work.config.workspace == "schemata":
+            return []
+    return pool_mutators
+
+
+def create_mutants_in_worker(
+    config: PoodleConfig,
+    mutators: list[Callable | Mutator],
+    changed_lines: ChangedLines | None,
+    folder: Path,
+    file: Path,
+) -> list[Mutant]:
+    """Create mutants for file with the mutators, in a worker process."""
+    work = PoodleWork(config)
+    work.mutators = mutators
+    if config.mutant_cache:
+        work.mutant_cache = MutantCache(config)
+    try:
+        return create_mutants_for_file(work, folder, file, changed_lines)
+    finally:
+        if work.mutant_cache:
+            work.mutant_cache.close()
+
+
+def create_mutants_in_pool(
+    work: PoodleWork,
+    targets: list[tuple[Path, Path]],
+    pool_mutators: list[Callable | Mutator],
+    changed_lines: ChangedLines | None,
+    max_workers: int,
+) -> list[Mutant]:
+    """Create mutants for target files in a process pool.
+
+    Mutators that can't run in worker processes run in the main process, while the workers run.
+    Mutants are in order of target files.  For each file, mutants from worker processes come first.
+    """
+    main_mutators = [mutator for mutator in work.mutators if mutator not in pool_mutators]
+    worker = partial(create_mutants_in_worker, work.config, pool_mutators, changed_lines)
+
+    # Mutants may be created in a thread while the clean run is testing, and forking a threaded process may deadlock.
+    spawn = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=spawn) as executor:
+        pool_results = executor.map(worker, *zip(*targets, strict=True))
+        main_results = [
+            create_mutants_for_file(work, folder, file, changed_lines, main_mutators) if main_mutators else []
+            for folder, file in targets
+        ]
+        return [
+            mutant
+            for pool_mutants, main_mutants in zip(pool_results, main_results, strict=True)
+            for mutant in pool_mutants + main_mutants
+        ]
+
 
 def get_target_files(work: PoodleWork) -> dict[Path, list[Path]]:
     """Create mapping from each source folder to all mutable files in that folder."""
@@ -140,87 +243,86 @@ def get_target_files(work: PoodleWork) -> dict[Path, list[Path]]:
     }
 
 
-def create_mutants_for_file(work: PoodleWork, folder: Path, file: Path) -> list[Mutant]:
-    """Create all mutants for specified file.
-
-    * Parse ast from file.
-    * Pass file ast to all mutators.
-    * Apply Filters.
+def create_mutants_for_file(
+    work: PoodleWork,
+    folder: Path,
+    file: Path,
+    changed_lines: ChangedLines | None = None,
+    mutators: list[Callable | Mutator] | None = None,
+) -> list[Mutant]:
+    """Create all mutants for specified file, with mutators or else all mutators in work.
+
+    * Load mutations of built-in mutators from the mutant cache, when enabled.
+    * Parse ast from file, and index the extent of each node, unless all mutations were cached.
+    * Create mutations with the other mutators, and save those of built-in mutators to the mutant cache.
+    * Skip mutations on lines blocked by comments.
+    * Keep only mutants on changed lines, if changed_lines is provided.
     * Compile list of Mutants.
+    * Write instrumented module, when using the "schemata" workspace.
     """
     logger.debug("Create Mutants for file %s", file)
 
-    parsed_ast = ast.parse(file.read_bytes(), file)
-    file_lines = file.read_text("utf-8").splitlines()
-
-    def call_mutator(mutator: Callable | Mutator) -> list[FileMutation]:
-        if isinstance(mutator, Mutator):
-            return mutator.create_mutations(parsed_ast=deepcopy(parsed_ast), file_lines=deepcopy(file_lines))
-        return mutator(config=work.config, parsed_ast=deepcopy(parsed_ast), file_lines=deepcopy(file_lines))
-
-    mutant_nested_list = [call_mutator(mutator) for mutator in work.mutators]
-    file_mutants = [mutant for mutant_list in mutant_nested_list if mutant_list for mutant in mutant_list]
-
-    line_filters = parse_filters(file_lines)
-    file_mutants = [mut for mut in file_mutants if not is_filtered(line_filters, mut)]
-
-    return [Mutant(source_folder=folder, source_file=file, **vars(file_mutant)) for file_mutant in file_mutants]
-
-
-def parse_filters(file_lines: list[str]) -> dict[int, set[str]]:
-    r"""Parse text for comments to filter mutations.
-
-    Block all mutations:
-
-    \# pragma: no mutate
-
-    \# nomut
-
-    \# nomut: start
-
-    \# nomut: end
-
-    Block only specific mutations:
-
-    \# nomut: mutator,mutator
+    mutators = work.mutators if mutators is None else mutators
+    data = file.read_bytes()
+    source = file.read_text("utf-8")
+    file_lines = source.splitlines()
+    line_filters = LineFilters.from_source(source)
+
+    cache = work.mutant_cache
+    cached_mutators = [mutator for mutator in mutators if isinstance(mutator, Mutator) and is_single_pass(mutator)]
+    source_hash = file_hash(data) if cache else ""
+    mutations = cache.get(source_hash, cached_mutators) if cache else {}
+
+    parsed_ast = ast.parse(data, file) if work.config.workspace == "schemata" else None
+    uncached = [mutator for mutator in mutators if id(mutator) not in mutations]
+    if uncached:
+        if parsed_ast is None:
+            parsed_ast = ast.parse(data, file)
+        Mutator.add_extent_attr(parsed_ast)
+        new_mutations = create_file_mutations(work, parsed_ast, file_lines, uncached, line_filters)
+        if cache:
+            cache.put(source_hash, [mutator for mutator in cached_mutators if mutator in uncached], new_mutations)
+        mutations.update(new_mutations)
+
+    file_mutants = [mutant for mutator in mutators for mutant in mutations[id(mutator)] or []]
+
+    file_mutants = [mut for mut in file_mutants if not line_filters.overlaps(mut)]
+    if changed_lines:
+        file_mutants = [mut for mut in file_mutants if changed_lines.overlaps(file, mut)]
+
+    mutants = [Mutant(source_folder=folder, source_file=file, **vars(file_mutant)) for file_mutant in file_mutants]
+
+    if parsed_ast is not None and work.config.workspace == "schemata":
+        write_schema(work.config, file, create_schema(parsed_ast, source, mutants))
+
+    return mutants
+
+
+def create_file_mutations(
+    work: PoodleWork,
+    parsed_ast: ast.Module,
+    file_lines: list[str],
+    mutators: list[Callable | Mutator],
+    line_filters: LineFilters | None = None,
+) -> dict[int, list[FileMutation]]:
+    """Create mutations of the parsed file with each mutator.  Map id of each mutator to its mutations.
+
+    Built-in mutators traverse the ast once, together, skipping nodes on lines blocked by line_filters.
+    Each other mutator is passed a copy of the ast.
     """
-    line_filters: dict[int, set[str]] = {}
+    single_pass = [mutator for mutator in mutators if isinstance(mutator, Mutator) and is_single_pass(mutator)]
+    single_pass_mutations = create_mutations(parsed_ast, single_pass, line_filters)
+    mutations = dict(zip(map(id, single_pass), single_pass_mutations, strict=True))
 
-    no_mut_on = False
-
-    for lineno, line in enumerate(file_lines, start=1):
-        if re.search(r"#\s*pragma:\s*no mutate[\s#$]*", line):
-            add_line_filter(line_filters, lineno, "all")
-        no_mut_filter: list[str] = re.findall(r"#\s*nomut:?\s*([A-Za-z0-9,\s]*)[#$]*", line)
-
-        if no_mut_filter and no_mut_filter[0].strip().lower() in ("start", "on"):
-            no_mut_on = True
-
-        if no_mut_on:
-            add_line_filter(line_filters, lineno, "all")
+    for mutator in mutators:
+        if id(mutator) in mutations:
+            continue
+        if isinstance(mutator, Mutator):
+            mutations[id(mutator)] = mutator.create_mutations(
+                parsed_ast=deepcopy(parsed_ast), file_lines=deepcopy(file_lines)
+            )
         else:
-            for mutators in no_mut_filter:
-                for mutator in mutators.split(","):
-                    add_line_filter(line_filters, lineno, mutator.strip())
-
-        if no_mut_filter and no_mut_filter[0].strip().lower() in ("end", "off"):
-            no_mut_on = False
-
-    return line_filters
-
-
-def add_line_filter(line_filters: dict[int, set[str]], lineno: int, mutator: str) -> None:
-    """Add filter to line_filters dict."""
-    if lineno not in line_filters:
-        line_filters[lineno] = set()
-    line_filters[lineno].add("all" if mutator == "" else mutator.lower())
-
-
-def is_filtered(line_filters: dict[int, set[str]], file_mutant: FileMutation) -> bool:
-    """Identify if this mutant matches any filters."""
-    for lineno in range(file_mutant.lineno, file_mutant.end_lineno + 1):
-        if lineno in line_filters and (
-            "all" in line_filters[lineno] or file_mutant.mutator_name.lower() in line_filters[lineno]
-        ):
-            return True
-    return False
+            mutations[id(mutator)] = mutator(
+                config=work.config, parsed_ast=deepcopy(parsed_ast), file_lines=deepcopy(file_lines)
+            )
+    return mutations
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import ast
-from copy import deepcopy
+from copy import copy
 
 from poodle.data_types import FileMutation, Mutator
 
@@ -60,12 +60,12 @@ class LambdaReturnMutator(ast.NodeVisitor, Mutator):
 
     def visit_Lambda(self, node: ast.Lambda) -> None:
         """Replace body of Lambda with None or empty string."""
+        mut = copy(node)
         if isinstance(node.body, ast.Constant) and node.body.value is None:
-            node.body = ast.Constant("")
-            self.mutants.append(self.create_file_mutation(node, ast.unparse(node)))
+            mut.body = ast.Constant("")
         else:
-            node.body = ast.Constant(None)
-            self.mutants.append(self.create_file_mutation(node, ast.unparse(node)))
+            mut.body = ast.Constant(None)
+        self.mutants.append(self.create_file_mutation(node, ast.unparse(mut)))
 
 
 class ReturnMutator(ast.NodeVisitor, Mutator):
@@ -84,12 +84,12 @@ class ReturnMutator(ast.NodeVisitor, Mutator):
         """Replace return statements with return None or Return empty string."""
         if node.value is None:
             return
+        mut = copy(node)
         if isinstance(node.value, ast.Constant) and node.value.value is None:
-            node.value = ast.Constant("")
-            self.mutants.append(self.create_file_mutation(node, ast.unparse(node)))
+            mut.value = ast.Constant("")
         else:
-            node.value = ast.Constant(None)
-            self.mutants.append(self.create_file_mutation(node, ast.unparse(node)))
+            mut.value = ast.Constant(None)
+        self.mutants.append(self.create_file_mutation(node, ast.unparse(mut)))
 
 
 class DecoratorMutator(ast.NodeVisitor, Mutator):
@@ -108,6 +108,6 @@ class DecoratorMutator(ast.NodeVisitor, Mutator):
         """Remove Decorators on Function Definitions."""
         if node.decorator_list:
             for idx in range(len(node.decorator_list)):
-                new_node = deepcopy(node)
-                new_node.decorator_list.pop(idx)
+                new_node = copy(node)
+                new_node.decorator_list = node.decorator_list[:idx] + node.decorator_list[idx + 1 :]
                 self.mutants.append(self.create_file_mutation(node, self.unparse(new_node, new_node.col_offset)))
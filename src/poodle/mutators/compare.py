@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import ast
 import re
-from copy import deepcopy
+from copy import copy
 from typing import ClassVar
 
 from poodle.data_types import FileMutation, Mutator
@@ -72,8 +72,8 @@ class ComparisonMutator(ast.NodeVisitor, Mutator):
 
         for idx, op in enumerate(node.ops):
             for new_op in self.type_map[type(op)]:
-                mut = deepcopy(node)
-                mut.ops[idx] = new_op()
+                mut = copy(node)
+                mut.ops = [*node.ops[:idx], new_op(), *node.ops[idx + 1 :]]
                 self.mutants.append(self.create_file_mutation(node, ast.unparse(mut)))
 
     def visit_BoolOp(self, node: ast.BoolOp) -> None:
@@ -87,6 +87,6 @@ class ComparisonMutator(ast.NodeVisitor, Mutator):
                 return
 
         for new_op in self.type_map[type(node.op)]:
-            mut = deepcopy(node)
+            mut = copy(node)
             mut.op = new_op()
             self.mutants.append(self.create_file_mutation(node, ast.unparse(mut)))
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import ast
+from copy import copy
 
 from poodle.data_types import FileMutation, Mutator
 
@@ -61,8 +62,9 @@ class StringMutator(ast.NodeVisitor, Mutator):
             return
 
         if isinstance(node.value, str):
-            node.value = f"XX{node.value}XX"
-            self.mutants.append(self.create_file_mutation(node, ast.unparse(node)))
+            mut = copy(node)
+            mut.value = f"XX{node.value}XX"
+            self.mutants.append(self.create_file_mutation(node, ast.unparse(mut)))
 
 
 class KeywordMutator(ast.NodeVisitor, Mutator):
@@ -5,7 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from poodle.data_types import PoodleConfig, TestingResults
+from poodle.data_types import MutantTrialResult, PoodleConfig, TestingResults
+from poodle.sample import confidence_level
 from poodle.util import to_json
 
 if TYPE_CHECKING:
@@ -37,17 +38,33 @@ def report_summary(echo: Callable, testing_results: TestingResults, *_, **__) ->
 
     echo("*** Results Summary ***", fg="green")
     echo(f"Testing found {summary.success_rate:.1%} of Mutants.")
-    if summary.not_found:
-        echo(f" - {summary.not_found} mutant(s) were not found.")
-    if summary.timeout:
-        echo(f" - {summary.timeout} mutant(s) caused trial to timeout.")
-    if summary.errors:
-        echo(f" - {summary.errors} mutant(s) could not be tested due to an error.")
+    if summary.estimate_display:
+        echo(
+            f"Estimated mutation score of all {summary.sampled_from} mutants: {summary.estimate_display}"
+            f" at {confidence_level:.0%} confidence, from a sample of {summary.trials}."
+        )
+    details = [
+        (summary.not_found, "mutant(s) were not found."),
+        (summary.not_covered, "mutant(s) were not covered by any test."),
+        (summary.timeout, "mutant(s) caused trial to timeout."),
+        (summary.resource_limit, "mutant(s) caused trial to exceed a resource limit."),
+        (summary.errors, "mutant(s) could not be tested due to an error."),
+        (summary.incomplete, "mutant(s) were not tested, as the fail_under result was decided."),
+        (summary.cached, "result(s) were reused from the result cache."),
+        (summary.orphans, "orphan process(es) left running by trials were killed."),
+    ]
+    for count, description in details:
+        if count:
+            echo(f" - {count} {description}")
 
 
 def report_not_found(config: PoodleConfig, echo: Callable, testing_results: TestingResults, *_, **__) -> None:
-    """Echo information about Trials that did not pass."""
-    failed_trials = [trial for trial in testing_results.mutant_trials if not trial.result.found]
+    """Echo information about Trials that did not pass.  Mutants that were not tested due to early_stop are left out."""
+    failed_trials = [
+        trial
+        for trial in testing_results.mutant_trials
+        if not trial.result.found and trial.result.reason_code != MutantTrialResult.RC_INCOMPLETE
+    ]
     if not failed_trials:
         return
 
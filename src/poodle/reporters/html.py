@@ -13,6 +13,7 @@ from jinja2 import Environment, PackageLoader
 
 from poodle import __version__ as poodle_version
 from poodle.data_types import MutantTrial, PoodleConfig, TestingResults, TestingSummary
+from poodle.sample import confidence_level
 
 if TYPE_CHECKING:
     import sys
@@ -59,7 +60,12 @@ def report_html(config: PoodleConfig, echo: Callable, testing_results: TestingRe
     modules = module_data(testing_results, html_options)
 
     index_template = env.get_template("html-report-index.html.jinja")
-    index_page = index_template.render(total=testing_results.summary, modules=modules, **common_vars)
+    index_page = index_template.render(
+        total=testing_results.summary,
+        modules=modules,
+        confidence_level=f"{confidence_level:.0%}",
+        **common_vars,
+    )
     index_file = report_folder / "index.html"
     index_file.write_text(index_page.strip(), encoding="utf-8")
 
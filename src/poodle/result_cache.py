@@ -0,0 +1,137 @@
+"""Cache of Mutant Trial results, reused by later runs while the mutated file and tests are unchanged.
+
+Results are stored in a SQLite database in the cache folder.
+Each result is keyed by a hash of the mutated file, the mutant's location and text,
+and a hash of the test files, dependency files and runner options (result_cache_files and runner_opts).
+The duration of each trial is also saved, keyed by the mutant's file, location and text only,
+to estimate the duration of the trial in later runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from wcmatch import glob
+
+from .data_types import MutantTrialResult
+
+if TYPE_CHECKING:
+    from .data_types import Mutant, MutantTrial, PoodleConfig
+
+logger = logging.getLogger(__name__)
+
+cache_folder = Path(".poodle-cache")
+
+cacheable_reason_codes = (MutantTrialResult.RC_FOUND, MutantTrialResult.RC_NOT_FOUND)
+
+
+class ResultCache:
+    """Mutant Trial results from previous runs."""
+
+    def __init__(self, config: PoodleConfig, folder: Path = cache_folder) -> None:
+        """Open the cache database, creating it if needed.  Remove all results if clear_result_cache is set."""
+        folder.mkdir(parents=True, exist_ok=True)
+        self.db_file = folder / "results.db"
+        self.connection = sqlite3.connect(self.db_file)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL)")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS durations (key TEXT PRIMARY KEY, duration REAL NOT NULL)")
+        if config.clear_result_cache:
+            logger.info("Clearing result cache: %s", self.db_file)
+            self.connection.execute("DELETE FROM results")
+            self.connection.execute("DELETE FROM durations")
+        self.connection.commit()
+
+        self.context_hash = context_hash(config)
+        self.file_hashes: dict[Path, str] = {}
+
+    def key(self, mutant: Mutant) -> str | None:
+        """Build the cache key for the mutant.  None if the mutant doesn't mutate a file."""
+        if not mutant.source_file:
+            return None
+        if mutant.source_file not in self.file_hashes:
+            self.file_hashes[mutant.source_file] = hashlib.sha256(mutant.source_file.read_bytes()).hexdigest()
+        key_data = [
+            self.context_hash,
+            self.file_hashes[mutant.source_file],
+            mutant.source_file.as_posix(),
+            mutant.lineno,
+            mutant.col_offset,
+            mutant.end_lineno,
+            mutant.end_col_offset,
+            mutant.text,
+        ]
+        return hashlib.sha256(json.dumps(key_data).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def location_key(mutant: Mutant) -> str | None:
+        """Build the key for the mutant's file, location and text.  None if the mutant doesn't mutate a file."""
+        if not mutant.source_file:
+            return None
+        key_data = [
+            mutant.source_file.as_posix(),
+            mutant.lineno,
+            mutant.col_offset,
+            mutant.end_lineno,
+            mutant.end_col_offset,
+            mutant.text,
+        ]
+        return hashlib.sha256(json.dumps(key_data).encode("utf-8")).hexdigest()
+
+    def get(self, mutant: Mutant) -> MutantTrialResult | None:
+        """Retrieve cached result for the mutant, if any."""
+        key = self.key(mutant)
+        if key is None:
+            return None
+        row = self.connection.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return MutantTrialResult(**json.loads(row[0]))
+
+    def get_duration(self, mutant: Mutant) -> float | None:
+        """Retrieve duration of the mutant's trial in a previous run, if any."""
+        key = self.location_key(mutant)
+        if key is None:
+            return None
+        row = self.connection.execute("SELECT duration FROM durations WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def put_all(self, mutant_trials: list[MutantTrial]) -> None:
+        """Save results of the trials.  Only Found and Not Found results are saved, as other results may not repeat.
+
+        Orphan process counts are not saved, as no processes are run when a result is reused.
+        Durations of all trials that ran are saved.
+        """
+        rows = [
+            (key, json.dumps(replace(trial.result, orphans=0).to_dict()))
+            for trial in mutant_trials
+            if trial.result.reason_code in cacheable_reason_codes and (key := self.key(trial.mutant))
+        ]
+        self.connection.executemany("INSERT OR REPLACE INTO results (key, result) VALUES (?, ?)", rows)
+        durations = [
+            (key, trial.duration)
+            for trial in mutant_trials
+            if trial.result.reason_code != MutantTrialResult.RC_INCOMPLETE and (key := self.location_key(trial.mutant))
+        ]
+        self.connection.executemany("INSERT OR REPLACE INTO durations (key, duration) VALUES (?, ?)", durations)
+        self.connection.commit()
+        logger.info("Saved %s result(s) to cache: %s", len(rows), self.db_file)
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self.connection.close()
+
+
+def context_hash(config: PoodleConfig) -> str:
+    """Hash the files matching result_cache_files, and the runner options."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([config.runner, config.runner_opts], sort_keys=True, default=str).encode("utf-8"))
+    for file in sorted(glob.glob(config.result_cache_files, flags=glob.GLOBSTAR | glob.NODIR)):
+        digest.update(file.encode("utf-8"))
+        digest.update(Path(file).read_bytes())
+    return digest.hexdigest()
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures
+import itertools
 import logging
+import os
 import time
-from typing import TYPE_CHECKING
-from zipfile import ZipFile
+from typing import TYPE_CHECKING, Any
 
 from click import style
 
-from . import PoodleTrialRunError
+from . import PoodleInputError, PoodleTrialRunError
 from .data_types import Mutant, MutantTrial, MutantTrialResult, PoodleConfig, PoodleWork, TestingResults, TestingSummary
-from .runners import command_line
-from .util import delete_folder, dynamic_import, mutate_lines
+from .line_coverage import CoverageIndex
+from .runners import command_line, pytest_forkserver
+from .schedule import longest_first
+from .util import dynamic_import
+from .workspace import builtin_workspaces
 
 if TYPE_CHECKING:
     import sys
@@ -28,6 +33,11 @@ logger = logging.getLogger(__name__)
 
 builtin_runners = {
     "command_line": command_line.runner,
+    "pytest_forkserver": pytest_forkserver.runner,
+}
+
+builtin_async_runners = {
+    "command_line": command_line.async_runner,
 }
 
 
@@ -35,6 +45,9 @@ def get_runner(config: PoodleConfig) -> Callable:
     """Retrieve runner callable given internal runner name or external runner python name."""
     logger.debug("Runner: %s", config.runner)
 
+    if config.runner == "pytest_forkserver" and not hasattr(os, "fork"):
+        raise PoodleInputError("Runner 'pytest_forkserver' requires os.fork, which is not available on this platform")
+
     if config.runner in builtin_runners:
         return builtin_runners[config.runner]
 
@@ -47,13 +60,20 @@ def clean_run_each_source_folder(work: PoodleWork) -> dict[Path, MutantTrial]:
 
 
 def clean_run_trial(work: PoodleWork, folder: Path) -> MutantTrial:
-    """Run a trial with no mutation."""
+    """Run a trial with no mutation.
+
+    If coverage_guided is enabled, collect the tests that cover each line.
+    """
     start = time.time()
     work.echo(f"Testing clean run of folder '{folder}'...", nl=False)
+    run_id = work.next_num()
+    runner_kwargs: dict[str, Any] = {}
+    if work.config.coverage_guided:
+        runner_kwargs["coverage_file"] = work.config.work_folder / f"coverage-{run_id}.json"
     mutant_trial = run_mutant_trial(
         config=work.config,
         echo=work.echo,
-        folder_zip=work.folder_zips[folder],
+        folder_zip=work.folder_zips.get(folder),
         mutant=Mutant(
             mutator_name="",
             source_folder=folder,
@@ -64,87 +84,327 @@ def clean_run_trial(work: PoodleWork, folder: Path) -> MutantTrial:
             end_col_offset=0,
             text="",
         ),
-        run_id=work.next_num(),
+        run_id=run_id,
         runner=work.runner,
         timeout=None,
+        **runner_kwargs,
     )
     if mutant_trial.result.found:  # not expected
         work.echo(style("FAILED", fg="red"))
         raise PoodleTrialRunError("Clean Run Failed", mutant_trial.result.reason_desc)
+    if mutant_trial.result.reason_code == MutantTrialResult.RC_RESOURCE_LIMIT:
+        work.echo(style("FAILED", fg="red"))
+        raise PoodleTrialRunError("Clean Run Exceeded Resource Limit", mutant_trial.result.reason_desc)
 
     work.echo("PASSED")
+    work.clean_run_durations[folder] = mutant_trial.duration
+    if "coverage_file" in runner_kwargs:
+        load_coverage(work, folder, runner_kwargs["coverage_file"])
     logger.info("Elapsed Time %.2f s", time.time() - start)
 
     return mutant_trial
 
 
+def load_coverage(work: PoodleWork, folder: Path, coverage_file: Path) -> None:
+    """Add coverage collected in clean run of folder to work."""
+    if not coverage_file.is_file():
+        work.echo(f"Coverage was not collected for folder '{folder}', trials will run all tests.", fg="yellow")
+        return
+    work.coverage[folder] = CoverageIndex.from_file(coverage_file)
+
+
+def covering_tests(work: PoodleWork, mutant: Mutant) -> list[str] | None:
+    """List tests covering the mutant.  None if coverage was not collected, or all tests should run."""
+    if mutant.source_folder not in work.coverage:
+        return None
+    return work.coverage[mutant.source_folder].tests_for(mutant)
+
+
+def runner_kwargs_for(tests: list[str] | None) -> dict[str, Any]:
+    """Additional arguments for the runner.  Includes the tests covering the mutant, if known."""
+    if not tests:
+        return {}
+    return {"tests": tests}
+
+
+def not_covered_trial(mutant: Mutant) -> MutantTrial:
+    """Trial result for a mutant on lines that no test executed."""
+    return MutantTrial(
+        mutant=mutant,
+        result=MutantTrialResult(
+            found=False,
+            reason_code=MutantTrialResult.RC_NOT_COVERED,
+            reason_desc="No test executed the mutated lines in the clean run",
+        ),
+        duration=0.0,
+    )
+
+
+def incomplete_trial(mutant: Mutant) -> MutantTrial:
+    """Trial result for a mutant that was not tested, as the fail_under result was decided."""
+    return MutantTrial(
+        mutant=mutant,
+        result=MutantTrialResult(
+            found=False,
+            reason_code=MutantTrialResult.RC_INCOMPLETE,
+            reason_desc="Testing stopped when the fail_under result was decided",
+        ),
+        duration=0.0,
+    )
+
+
+def fail_under_decided(config: PoodleConfig, summary: TestingSummary) -> bool:
+    """Check if early_stop is enabled and the fail_under result can't change, whatever the untested mutants' results.
+
+    The goal is met once the found mutants reach it, and missed once it can't be reached if all untested are found.
+    """
+    if not config.early_stop or not config.fail_under or summary.trials < 1:
+        return False
+    goal = config.fail_under / 100
+    untested = summary.trials - summary.tested
+    return summary.found / summary.trials >= goal or (summary.found + untested) / summary.trials < goal
+
+
 def run_mutant_trails(work: PoodleWork, mutants: list[Mutant], timeout: float) -> TestingResults:
     """Run the Mutant Trials and collect results.
 
+    Results loaded from the checkpoint file, or found in the result cache, are reused without running a trial.
+    Mutants that no test covers are reported as not covered without running a trial.
+    Other mutants are tested longest first, and if any trials ran, the predicted and actual makespan are reported.
     Report status as execution proceeds.
     """
     start = time.time()
     work.echo("Testing mutants")
+
+    summary = TestingSummary()
+    summary.trials = len(mutants)
+    resumed: list[MutantTrial] = []
+    cached: list[MutantTrial] = []
+    not_covered: list[MutantTrial] = []
+    to_test: list[tuple[Mutant, list[str] | None]] = []
+    for mutant in mutants:
+        if work.checkpoint and (checkpoint_trial := work.checkpoint.trials.get(mutant.mutant_id)):
+            resumed.append(
+                MutantTrial(mutant=mutant, result=checkpoint_trial.result, duration=checkpoint_trial.duration)
+            )
+            summary += checkpoint_trial.result
+            continue
+        if work.result_cache and (cached_result := work.result_cache.get(mutant)):
+            cached.append(MutantTrial(mutant=mutant, result=cached_result, duration=0.0))
+            summary += cached_result
+            summary.cached += 1
+            continue
+        tests = covering_tests(work, mutant)
+        if tests == []:
+            not_covered.append(not_covered_trial(mutant))
+            summary += not_covered[-1].result
+        else:
+            to_test.append((mutant, tests))
+    if resumed:
+        work.echo(f"Resuming with {len(resumed)} result(s) from checkpoint")
+    if cached:
+        work.echo(f"Reusing {len(cached)} cached result(s)")
+    if not_covered:
+        work.echo(f"Skipping {len(not_covered)} mutant(s) not covered by any test")
+
+    to_test, predicted_makespan = longest_first(work, to_test, timeout)
+    trials_start = time.time()
+    mutant_trials = run_trials(work, to_test, timeout, summary)
+    if any(trial.result.reason_code != MutantTrialResult.RC_INCOMPLETE for trial in mutant_trials):
+        work.echo(f"Trial makespan: {time.time() - trials_start:.1f}s, predicted: {predicted_makespan:.1f}s")
+
+    if work.result_cache:
+        work.result_cache.put_all(mutant_trials)
+
+    logger.info("Elapsed Time %.2f s", time.time() - start)
+
+    return TestingResults(
+        mutant_trials=resumed + cached + not_covered + mutant_trials,
+        summary=summary,
+    )
+
+
+def run_trials(
+    work: PoodleWork,
+    to_test: list[tuple[Mutant, list[str] | None]],
+    timeout: float,
+    summary: TestingSummary,
+) -> list[MutantTrial]:
+    """Run the Mutant Trials with the configured scheduler.
+
+    With early_stop, mutants are not tested once the fail_under result is decided.
+    """
+    if fail_under_decided(work.config, summary):
+        return skip_remaining_trials(work, [mutant for mutant, _ in to_test], summary)
+    if work.config.scheduler == "asyncio":
+        try:
+            return asyncio.run(run_trials_async(work, to_test, timeout, summary))
+        except KeyboardInterrupt:
+            work.echo("Received Keyboard Interrupt.  Cancelling Remaining Trials.")
+            raise
+    return run_trials_process_pool(work, to_test, timeout, summary)
+
+
+def skip_remaining_trials(work: PoodleWork, mutants: list[Mutant], summary: TestingSummary) -> list[MutantTrial]:
+    """Report mutants as incomplete, as the fail_under result was decided."""
+    if mutants:
+        work.echo(f"Mutation score goal is decided.  Skipping {len(mutants)} remaining trial(s).")
+    mutant_trials = [incomplete_trial(mutant) for mutant in mutants]
+    for mutant_trial in mutant_trials:
+        summary += mutant_trial.result
+    return mutant_trials
+
+
+def record_trial(work: PoodleWork, summary: TestingSummary, mutant_trial: MutantTrial) -> None:
+    """Add trial result to summary, report status, and save it to the checkpoint."""
+    summary += mutant_trial.result
+    echo_progress(work, summary)
+    if work.checkpoint:
+        work.checkpoint.write(mutant_trial)
+
+
+def echo_progress(work: PoodleWork, summary: TestingSummary) -> None:
+    """Report status of testing."""
+    work.echo(
+        f"COMPLETED {summary.tested:>4}/{summary.trials:<4}"
+        f"\tFOUND {summary.found:>4}"
+        f"\tNOT FOUND {summary.not_found:>4}"
+        f"\tTIMEOUT {summary.timeout:>4}"
+        f"\tERRORS {summary.errors:>4}",
+    )
+
+
+def run_trials_process_pool(
+    work: PoodleWork,
+    to_test: list[tuple[Mutant, list[str] | None]],
+    timeout: float,
+    summary: TestingSummary,
+) -> list[MutantTrial]:
+    """Run the Mutant Trials in a pool of worker processes.
+
+    Mutants are taken from an iterator, with up to twice max_workers trials submitted at once.
+    More trials are submitted as trials complete, so memory use doesn't grow with the number of mutants.
+    When the fail_under result is decided, trials that haven't started are cancelled, and running trials complete.
+    """
+    window = 2 * (work.config.max_workers or os.cpu_count() or 1)
+    pending = iter(to_test)
+    in_flight: dict[concurrent.futures.Future, Mutant] = {}
+    mutant_trials: list[MutantTrial] = []
+    skipped: list[Mutant] = []
     with concurrent.futures.ProcessPoolExecutor(max_workers=work.config.max_workers) as executor:
         try:
-            futures = [
-                executor.submit(
-                    run_mutant_trial,
-                    work.config,
-                    work.echo,
-                    work.folder_zips[mutant.source_folder],
-                    mutant,
-                    work.next_num(),
-                    work.runner,
-                    timeout,
-                )
-                for mutant in mutants
-            ]
-
-            summary = TestingSummary()
-            summary.trials = len(mutants)
-            for future in concurrent.futures.as_completed(futures):
-                if future.cancelled():
-                    work.echo("Canceled")
-                else:
-                    mutant_trial: MutantTrial = future.result()
-                    summary += mutant_trial.result
-                    work.echo(
-                        f"COMPLETED {summary.tested:>4}/{summary.trials:<4}"
-                        f"\tFOUND {summary.found:>4}"
-                        f"\tNOT FOUND {summary.not_found:>4}"
-                        f"\tTIMEOUT {summary.timeout:>4}"
-                        f"\tERRORS {summary.errors:>4}",
-                    )
+            while True:
+                for mutant, tests in itertools.islice(pending, window - len(in_flight)):
+                    in_flight[submit_trial(work, executor, mutant, tests, timeout)] = mutant
+                if not in_flight:
+                    break
+                done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                collect_trials(work, summary, in_flight, done, mutant_trials, skipped)
+                if fail_under_decided(work.config, summary):
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    collect_trials(work, summary, in_flight, set(in_flight), mutant_trials, skipped)
+                    break
         except KeyboardInterrupt:
             work.echo("Received Keyboard Interrupt.  Cancelling Remaining Trials.")
             executor.shutdown(wait=True, cancel_futures=True)
             raise
 
-    logger.info("Elapsed Time %.2f s", time.time() - start)
+    skipped.extend(mutant for mutant, _ in pending)
+    return mutant_trials + skip_remaining_trials(work, skipped, summary)
 
-    return TestingResults(
-        mutant_trials=[future.result() for future in futures],
-        summary=summary,
+
+def submit_trial(
+    work: PoodleWork,
+    executor: concurrent.futures.Executor,
+    mutant: Mutant,
+    tests: list[str] | None,
+    timeout: float,
+) -> concurrent.futures.Future:
+    """Submit trial of the mutant to the executor."""
+    return executor.submit(
+        run_mutant_trial,
+        work.config,
+        work.echo,
+        work.folder_zips.get(mutant.source_folder),
+        mutant,
+        work.next_num(),
+        work.runner,
+        timeout,
+        **runner_kwargs_for(tests),
     )
 
 
+def collect_trials(  # noqa: PLR0913
+    work: PoodleWork,
+    summary: TestingSummary,
+    in_flight: dict[concurrent.futures.Future, Mutant],
+    done: set[concurrent.futures.Future],
+    mutant_trials: list[MutantTrial],
+    skipped: list[Mutant],
+) -> None:
+    """Remove done futures from in_flight, in order of submission.  Record their trials, or skip cancelled mutants."""
+    for future in [future for future in in_flight if future in done]:
+        mutant = in_flight.pop(future)
+        if future.cancelled():
+            skipped.append(mutant)
+        else:
+            mutant_trials.append(future.result())
+            record_trial(work, summary, mutant_trials[-1])
+
+
+async def run_trials_async(
+    work: PoodleWork,
+    to_test: list[tuple[Mutant, list[str] | None]],
+    timeout: float,
+    summary: TestingSummary,
+) -> list[MutantTrial]:
+    """Run the Mutant Trials as asyncio subprocesses in this process, with up to max_workers running at once.
+
+    Each of max_workers tasks takes mutants from a shared iterator, so no task is created per mutant.
+    When the fail_under result is decided, trials that haven't started are skipped, and running trials complete.
+    """
+    runner = builtin_async_runners[work.config.runner]
+    pending = iter(to_test)
+    mutant_trials: list[MutantTrial] = []
+    decided = False
+
+    async def run_trials_from_pending() -> None:
+        nonlocal decided
+        for mutant, tests in pending:
+            mutant_trial = await run_mutant_trial_async(
+                work.config,
+                work.folder_zips.get(mutant.source_folder),
+                mutant,
+                work.next_num(),
+                runner,
+                timeout,
+                **runner_kwargs_for(tests),
+            )
+            mutant_trials.append(mutant_trial)
+            record_trial(work, summary, mutant_trial)
+            decided = decided or fail_under_decided(work.config, summary)
+            if decided:
+                return
+
+    await asyncio.gather(*(run_trials_from_pending() for _ in range(work.config.max_workers or 1)))
+    return mutant_trials + skip_remaining_trials(work, [mutant for mutant, _ in pending], summary)
+
+
 def run_mutant_trial(  # noqa: PLR0913
     config: PoodleConfig,
     echo: Callable,
-    folder_zip: Path,
+    folder_zip: Path | None,
     mutant: Mutant,
     run_id: str,
     runner: Callable,
     timeout: float | None,
+    **runner_kwargs: Any,  # noqa: ANN401
 ) -> MutantTrial:
     """Run Trial for specified Mutant.
 
-    Create a Run Folder.
-    Unzip the zip file to the Run Folder.
-    Apply Mutation.
-    Call the Trial Runner.
-    Delete the Run Folder.
+    Prepare the Run Folder with the configured workspace.
+    Call the Trial Runner, with any additional runner_kwargs.
+    Clean up the Run Folder.
     Return MutantTrial with result data.
     """
     start = time.time()
@@ -159,29 +419,62 @@ def run_mutant_trial(  # noqa: PLR0913
         mutant.text,
     )
 
-    run_folder = config.work_folder / ("run-" + run_id)
-    run_folder.mkdir()
+    workspace = builtin_workspaces[config.workspace]
+    with workspace(config, folder_zip, mutant, run_id) as run_folder:
+        logger.debug("START: run_id=%s run_folder=%s", run_id, run_folder)
+
+        result: MutantTrialResult = runner(
+            config=config,
+            echo=echo,
+            run_folder=run_folder,
+            mutant=mutant,
+            timeout=timeout,
+            **runner_kwargs,
+        )
+
+    duration = time.time() - start
+    logger.debug("END: run_id=%s - Elapsed Time %.2f s", run_id, duration)
+
+    return MutantTrial(mutant=mutant, result=result, duration=duration)
 
-    with ZipFile(folder_zip, "r") as zip_file:
-        zip_file.extractall(run_folder)
 
-    if mutant.source_file:
-        target_file = run_folder / mutant.source_file
-        file_lines = target_file.read_text("utf-8").splitlines(keepends=True)
-        file_lines = mutate_lines(mutant, file_lines)
-        target_file.write_text(data="".join(file_lines), encoding="utf-8")
+async def run_mutant_trial_async(  # noqa: PLR0913
+    config: PoodleConfig,
+    folder_zip: Path | None,
+    mutant: Mutant,
+    run_id: str,
+    runner: Callable,
+    timeout: float | None,
+    **runner_kwargs: Any,  # noqa: ANN401
+) -> MutantTrial:
+    """Run Trial for specified Mutant with an asyncio runner.
 
-    logger.debug("START: run_id=%s run_folder=%s", run_id, run_folder)
+    The Run Folder is prepared and cleaned up in a thread, so file operations don't block other trials.
+    """
+    start = time.time()
 
-    result: MutantTrialResult = runner(
-        config=config,
-        echo=echo,
-        run_folder=run_folder,
-        mutant=mutant,
-        timeout=timeout,
+    logger.debug(
+        "SETUP: run_id=%s folder_zip=%s file=%s:%s text='%s'",
+        run_id,
+        folder_zip,
+        mutant.source_file,
+        mutant.lineno,
+        mutant.text,
     )
 
-    delete_folder(run_folder, config)
+    workspace = builtin_workspaces[config.workspace](config, folder_zip, mutant, run_id)
+    run_folder = await asyncio.to_thread(workspace.__enter__)
+    try:
+        logger.debug("START: run_id=%s run_folder=%s", run_id, run_folder)
+        result: MutantTrialResult = await runner(
+            config=config,
+            run_folder=run_folder,
+            mutant=mutant,
+            timeout=timeout,
+            **runner_kwargs,
+        )
+    finally:
+        await asyncio.to_thread(workspace.__exit__, None, None, None)
 
     duration = time.time() - start
     logger.debug("END: run_id=%s - Elapsed Time %.2f s", run_id, duration)
@@ -2,25 +2,245 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
 import shlex
+import signal
 import subprocess
+import sys
+from contextlib import suppress
 from pathlib import Path
 from subprocess import TimeoutExpired
+from typing import Any
 
 from poodle.data_types import Mutant, MutantTrialResult, PoodleConfig
+from poodle.schemata import schema_folder
 from poodle.util import pprint_str
 
+try:
+    import resource
+except ModuleNotFoundError:  # Windows
+    resource = None  # type: ignore [assignment]
+
 logger = logging.getLogger(__name__)
 
+ResourceLimits = dict[str, tuple[int, int]]
+
+# Sets the resource limits, then replaces itself with the trial command, so the limits apply to the command.
+LIMITS_WRAPPER = """\
+import json, os, resource, sys
+for name, soft_hard in json.loads(sys.argv[1]).items():
+    resource.setrlimit(getattr(resource, name), soft_hard)
+try:
+    os.execvp(sys.argv[2], sys.argv[2:])
+except OSError as err:
+    print(f"{sys.argv[2]}: {err}", file=sys.stderr)
+    sys.exit(127)
+"""
+
+# Below the 32767 character command line limit of Windows, and well below ARG_MAX elsewhere.
+MAX_TESTS_LENGTH = 30_000
+
+
+def runner(  # noqa: PLR0913
+    config: PoodleConfig,
+    run_folder: Path,
+    mutant: Mutant,
+    timeout: float | None,
+    *_,
+    tests: list[str] | None = None,
+    coverage_file: Path | None = None,
+    **__,
+) -> MutantTrialResult:
+    """Run test of mutant with command line command in subprocess.
+
+    The subprocess is started in a new session.
+    When the trial ends, any processes left in its process group are killed.
+    If the timeout is exceeded, or the trial is interrupted, the whole process group is killed.
+    If tests are provided, they are added to the end of the command.
+    If the tests would exceed MAX_TESTS_LENGTH characters, all tests are run instead.
+    If coverage_file is provided, poodle.line_coverage is loaded to collect coverage of each test.
+    If runner_opts.command_line_limits is set, the command is started with those resource limits.
+    """
+    logger.info("Running: run_folder=%s timeout=%s", run_folder, timeout)
+
+    args, run_cwd, run_env = prepare_command(config, run_folder, mutant, tests, coverage_file)
+    limits = resource_limits(config)
+
+    process = subprocess.Popen(  # noqa: S603
+        limits_command(limits, args),
+        cwd=run_cwd,
+        env=run_env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
+    )
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except TimeoutExpired as te:
+        result = MutantTrialResult(
+            found=False,
+            reason_code=MutantTrialResult.RC_TIMEOUT,
+            reason_desc=f"TimeoutExpired {te}",
+        )
+    else:
+        result = trial_result(process.returncode, stdout, stderr, limits)
+    finally:
+        orphans = reap_process_group(process, running=process.returncode is None)
+        if process.returncode is None:
+            process.communicate()
+
+    result.orphans = orphans
+    return result
+
 
-def runner(
-    config: PoodleConfig, run_folder: Path, mutant: Mutant, timeout: float | None, *_, **__
+async def async_runner(  # noqa: PLR0913
+    config: PoodleConfig,
+    run_folder: Path,
+    mutant: Mutant,
+    timeout: float | None,
+    *_,
+    tests: list[str] | None = None,
+    coverage_file: Path | None = None,
+    **__,
 ) -> MutantTrialResult:
-    """Run test of mutant with command line command in subprocess."""
+    """Run test of mutant with command line command in an asyncio subprocess.
+
+    The subprocess is started in a new session.
+    When the trial ends, any processes left in its process group are killed.
+    If the timeout is exceeded, or the trial is cancelled, the whole process group is killed.
+    """
     logger.info("Running: run_folder=%s timeout=%s", run_folder, timeout)
 
+    args, run_cwd, run_env = prepare_command(config, run_folder, mutant, tests, coverage_file)
+    limits = resource_limits(config)
+
+    process = await asyncio.create_subprocess_exec(
+        *limits_command(limits, args),
+        cwd=run_cwd,
+        env=run_env,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=True,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        result = MutantTrialResult(
+            found=False,
+            reason_code=MutantTrialResult.RC_TIMEOUT,
+            reason_desc=f"Trial exceeded timeout of {timeout} seconds",
+        )
+    else:
+        result = trial_result(process.returncode, stdout, stderr, limits)  # type: ignore [arg-type]
+    finally:
+        orphans = reap_process_group(process, running=process.returncode is None)
+        if process.returncode is None:
+            await process.wait()
+
+    result.orphans = orphans
+    return result
+
+
+def reap_process_group(process: subprocess.Popen | asyncio.subprocess.Process, *, running: bool) -> int:
+    """Kill the process group led by the process.  Returns the number of orphans: other processes in the group.
+
+    Orphans are counted on platforms with /proc.  Elsewhere, they are killed without being counted.
+    Without process groups (Windows), only the process is killed, and no orphans are reported.
+    """
+    if not hasattr(os, "killpg"):
+        if running:
+            with suppress(ProcessLookupError):
+                process.kill()
+        return 0
+
+    pid = process.pid
+    orphans = len(process_group_members(pid) - {pid})
+    if running:
+        kill_process_group(pid)
+    else:
+        with suppress(ProcessLookupError):
+            os.killpg(pid, signal.SIGKILL)
+    if orphans:
+        logger.info("Killed %s orphan process(es) in process group %s", orphans, pid)
+    return orphans
+
+
+def process_group_members(pgid: int) -> set[int]:
+    """Find the IDs of processes in the process group, from /proc.  Empty if /proc is not available."""
+    members = set()
+    for stat_file in Path("/proc").glob("[0-9]*/stat"):
+        with suppress(OSError, ValueError, IndexError):
+            stat = stat_file.read_text(encoding="utf-8")
+            # fields after the command name, which may contain spaces: state, ppid, pgrp, ...
+            fields = stat[stat.rindex(")") + 2 :].split()
+            if int(fields[2]) == pgid:
+                members.add(int(stat_file.parent.name))
+    return members
+
+
+def kill_process_group(pid: int) -> None:
+    """Kill process group led by pid, or just the process if the group is already gone."""
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        with suppress(ProcessLookupError):
+            os.kill(pid, signal.SIGKILL)
+
+
+def resource_limits(config: PoodleConfig) -> ResourceLimits:
+    """Read the (soft, hard) resource limits for trial subprocesses from runner_opts.command_line_limits.
+
+    Limits are capped at the hard limits of this process, as the subprocess can't raise them.
+    The CPU hard limit is one second above the soft limit, so the subprocess gets SIGXCPU before it is killed.
+    """
+    limits_opts: dict[str, Any] = config.runner_opts.get("command_line_limits") or {}
+    if not limits_opts:
+        return {}
+    if resource is None:
+        logger.warning("Resource limits are not supported on this platform: %s", limits_opts)
+        return {}
+
+    limits: ResourceLimits = {}
+    if "memory_mb" in limits_opts:
+        memory = int(limits_opts["memory_mb"]) * 1024 * 1024
+        limits["RLIMIT_AS"] = (memory, memory)
+    if "cpu_seconds" in limits_opts:
+        cpu = int(limits_opts["cpu_seconds"])
+        limits["RLIMIT_CPU"] = (cpu, cpu + 1)
+    if "open_files" in limits_opts:
+        files = int(limits_opts["open_files"])
+        limits["RLIMIT_NOFILE"] = (files, files)
+
+    for name, (soft, hard) in limits.items():
+        _, max_hard = resource.getrlimit(getattr(resource, name))
+        if max_hard != resource.RLIM_INFINITY:
+            limits[name] = (min(soft, max_hard), min(hard, max_hard))
+    logger.debug("resource limits: %s", limits)
+    return limits
+
+
+def limits_command(limits: ResourceLimits, args: list[str]) -> list[str]:
+    """Command that starts args with the resource limits.
+
+    The limits are set by a python process that then execs args,
+    as setting them in the forked child before exec (preexec_fn) is not safe when this process has threads.
+    """
+    if not limits:
+        return args
+    return [sys.executable, "-c", LIMITS_WRAPPER, json.dumps(limits), *args]
+
+
+def prepare_command(
+    config: PoodleConfig,
+    run_folder: Path,
+    mutant: Mutant,
+    tests: list[str] | None,
+    coverage_file: Path | None,
+) -> tuple[list[str], Path, dict[str, str]]:
+    """Build the command arguments, working folder and environment variables for a trial."""
     cwd = Path.cwd().resolve()
     run_cwd = run_folder.resolve() if mutant.source_folder.resolve() == cwd else cwd
     run_source_folder = run_folder.resolve() / mutant.source_folder
@@ -43,6 +263,19 @@ def runner(
         "MUT_END_COL_OFFSET": str(mutant.end_col_offset),
         "MUT_TEXT": str(mutant.text),
     }
+    plugins = [run_env.get("PYTEST_PLUGINS")]
+    if config.workspace in ("import_hook", "schemata"):
+        plugins.append("poodle.import_hook")
+    if config.workspace == "schemata":
+        update_env["POODLE_SCHEMATA"] = str(schema_folder(config).resolve())
+        update_env["MUT_SCHEMA_ID"] = str(mutant.schema_id)
+    if coverage_file:
+        plugins.append("poodle.line_coverage")
+        update_env["POODLE_COVERAGE_FILE"] = str(coverage_file.resolve())
+        update_env["POODLE_COVERAGE_ROOT"] = str(run_folder.resolve())
+        update_env["POODLE_COVERAGE_INCLUDE"] = str(run_source_folder)
+    if len(plugins) > 1:
+        update_env["PYTEST_PLUGINS"] = ",".join(filter(None, plugins))
     if "command_line_env" in config.runner_opts:
         update_env.update(config.runner_opts["command_line_env"])
     run_env.update(update_env)
@@ -53,25 +286,38 @@ def runner(
     cmd = cmd.format(PYTHONPATH=python_path)
     logger.debug("command: %s", cmd)
 
-    try:
-        result = subprocess.run(
-            shlex.split(cmd),  # noqa: S603
-            cwd=run_cwd,
-            env=run_env,
-            capture_output=True,
-            check=False,
-            timeout=timeout,
+    if tests and sum(len(test) + 1 for test in tests) > MAX_TESTS_LENGTH:
+        logger.info("Running all tests, %s covering tests exceed the command line length limit", len(tests))
+        tests = None
+
+    return shlex.split(cmd) + (tests or []), run_cwd, run_env
+
+
+def trial_result(
+    returncode: int,
+    stdout: bytes,
+    stderr: bytes,
+    limits: ResourceLimits | None = None,
+) -> MutantTrialResult:
+    """Identify the result of the trial from the return code of the test command.
+
+    Return code 1 means tests failed, so the mutant was found, even if a test raised MemoryError or OSError.
+    If that may have been caused by a resource limit, it is described in reason_desc.
+    """
+    exceeded = limit_exceeded(limits or {}, returncode, stdout + stderr)
+    if returncode == 1:
+        return MutantTrialResult(
+            found=True,
+            reason_code=MutantTrialResult.RC_FOUND,
+            reason_desc=f"Tests failed, possibly because: {exceeded}" if exceeded else None,
         )
-    except TimeoutExpired as te:
+    if exceeded:
         return MutantTrialResult(
             found=False,
-            reason_code=MutantTrialResult.RC_TIMEOUT,
-            reason_desc=f"TimeoutExpired {te}",
+            reason_code=MutantTrialResult.RC_RESOURCE_LIMIT,
+            reason_desc=exceeded,
         )
-
-    if result.returncode == 1:
-        return MutantTrialResult(found=True, reason_code=MutantTrialResult.RC_FOUND)
-    if result.returncode == 0:
+    if returncode == 0:
         return MutantTrialResult(
             found=False,
             reason_code=MutantTrialResult.RC_NOT_FOUND,
@@ -79,7 +325,24 @@ def runner(
     return MutantTrialResult(
         found=True,
         reason_code=MutantTrialResult.RC_OTHER,
-        reason_desc=result.stdout.decode("utf-8", errors="replace")  # nomut: String
+        reason_desc=stdout.decode("utf-8", errors="replace")  # nomut: String
         + "\n"
-        + result.stderr.decode("utf-8", errors="replace"),  # nomut: String
+        + stderr.decode("utf-8", errors="replace"),  # nomut: String
     )
+
+
+def limit_exceeded(limits: ResourceLimits, returncode: int, output: bytes) -> str | None:
+    """Describe the resource limit that stopped the trial.  None if no limit was exceeded.
+
+    The CPU limit stops the subprocess with SIGXCPU, or SIGKILL at the hard limit.
+    The memory and open files limits cause MemoryError and OSError "Too many open files" in the tests.
+    """
+    if returncode == 0:
+        return None
+    if "RLIMIT_CPU" in limits and returncode in (-signal.SIGXCPU, -signal.SIGKILL):
+        return f"Trial exceeded CPU limit of {limits['RLIMIT_CPU'][0]} seconds"
+    if "RLIMIT_AS" in limits and b"MemoryError" in output:
+        return f"Trial exceeded memory limit of {limits['RLIMIT_AS'][0] // (1024 * 1024)} MB"
+    if "RLIMIT_NOFILE" in limits and b"Too many open files" in output:
+        return f"Trial exceeded open files limit of {limits['RLIMIT_NOFILE'][0]}"
+    return None
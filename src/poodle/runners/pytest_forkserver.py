@@ -0,0 +1,252 @@
+"""Run mutation tests in forked children of a warm pytest process."""
+
+from __future__ import annotations
+
+import ast
+import atexit
+import json
+import logging
+import os
+import shlex
+import subprocess
+import sys
+from contextlib import suppress
+from dataclasses import replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from poodle.data_types import Mutant, MutantTrialResult, PoodleConfig
+from poodle.runners import command_line
+from poodle.schemata import schema_folder
+from poodle.util import pprint_str
+
+logger = logging.getLogger(__name__)
+
+default_pytest_args = "-x --assert=plain -o pythonpath='{PYTHONPATH}'"
+
+servers: dict[tuple[int, Path], ForkServer] = {}
+
+
+def runner(  # noqa: PLR0913
+    config: PoodleConfig,
+    run_folder: Path,
+    mutant: Mutant,
+    timeout: float | None,
+    *_,
+    tests: list[str] | None = None,
+    coverage_file: Path | None = None,
+    **__,
+) -> MutantTrialResult:
+    """Run test of mutant in a child forked from a pytest process that has already collected the tests.
+
+    If tests are provided, only those tests are run.
+    Runs that collect coverage use the command_line runner, so the tests are imported while coverage is collected.
+    Mutants that change module level values also use the command_line runner,
+    as modules that imported those values before the trial would keep the original values.
+    """
+    logger.info("Running: run_folder=%s timeout=%s", run_folder, timeout)
+
+    if coverage_file or rebinds_module_values(mutant):
+        return command_line.runner(
+            config=command_line_config(config),
+            run_folder=run_folder,
+            mutant=mutant,
+            timeout=timeout,
+            tests=tests,
+            coverage_file=coverage_file,
+        )
+
+    server = get_server(config, mutant.source_folder)
+    output_file = config.work_folder / f"forkserver-{os.getpid()}.out"
+
+    request = {
+        "mutant": mutant.to_dict(),
+        "output_file": str(output_file),
+        "timeout": timeout,
+        "tests": tests,
+    }
+    response = server.request(request)
+
+    if "returncode" not in response:
+        stop_server(mutant.source_folder)
+        return MutantTrialResult(
+            found=True,
+            reason_code=MutantTrialResult.RC_OTHER,
+            reason_desc=response.get("error", "Fork Server did not return a result"),
+        )
+
+    if response["returncode"] is None:
+        return MutantTrialResult(
+            found=False,
+            reason_code=MutantTrialResult.RC_TIMEOUT,
+            reason_desc=f"Trial exceeded timeout of {timeout} seconds",
+        )
+    if response["returncode"] == 1:
+        return MutantTrialResult(found=True, reason_code=MutantTrialResult.RC_FOUND)
+    if response["returncode"] == 0:
+        return MutantTrialResult(found=False, reason_code=MutantTrialResult.RC_NOT_FOUND)
+    return MutantTrialResult(
+        found=True,
+        reason_code=MutantTrialResult.RC_OTHER,
+        reason_desc=read_output(output_file, response["returncode"]),
+    )
+
+
+def command_line_config(config: PoodleConfig) -> PoodleConfig:
+    """Copy of config with command_line runner options that run pytest with the same args and environment."""
+    pytest_args: str = config.runner_opts.get("pytest_forkserver", default_pytest_args)
+    runner_opts = {
+        **config.runner_opts,
+        "command_line": f"{shlex.quote(sys.executable)} -m pytest {pytest_args}",
+        "command_line_env": config.runner_opts.get("pytest_forkserver_env", {}),
+    }
+    return replace(config, runner_opts=runner_opts)
+
+
+def rebinds_module_values(mutant: Mutant) -> bool:
+    """Return True if the mutation changes module level values other than the code of functions and classes.
+
+    The fork server can only update functions and classes in place.
+    Mutants outside of their definitions, or in their decorators or base classes, rebind other values.
+    """
+    if not mutant.source_file:
+        return False
+    try:
+        module = parse_source(mutant.source_file)
+    except (OSError, SyntaxError, ValueError):
+        logger.exception("Unable to parse %s", mutant.source_file)
+        return False
+
+    for node in module.body:
+        start = min([node.lineno] + [decorator.lineno for decorator in getattr(node, "decorator_list", [])])
+        if start <= mutant.lineno and mutant.end_lineno <= (node.end_lineno or node.lineno):
+            break
+    else:
+        return True
+
+    if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return True
+    values: list[ast.expr] = list(node.decorator_list)
+    if isinstance(node, ast.ClassDef):
+        values += node.bases + [keyword.value for keyword in node.keywords]
+    return any(overlaps(mutant, value) for value in values)
+
+
+@lru_cache
+def parse_source(source_file: Path) -> ast.Module:
+    """Parse the original source file."""
+    return ast.parse(source_file.read_bytes(), filename=str(source_file))
+
+
+def overlaps(mutant: Mutant, node: ast.expr) -> bool:
+    """Return True if the mutant's location overlaps the node's location."""
+    mutant_start, mutant_end = (mutant.lineno, mutant.col_offset), (mutant.end_lineno, mutant.end_col_offset)
+    node_start, node_end = (node.lineno, node.col_offset), (node.end_lineno or node.lineno, node.end_col_offset or 0)
+    return mutant_start < node_end and node_start < mutant_end
+
+
+def read_output(output_file: Path, returncode: int) -> str:
+    """Describe a trial that ended with an unexpected return code."""
+    desc = f"Trial ended with returncode {returncode}"
+    if output_file.is_file():
+        desc += "\n" + output_file.read_text("utf-8", errors="replace")
+    return desc
+
+
+def get_server(config: PoodleConfig, source_folder: Path) -> ForkServer:
+    """Retrieve the Fork Server for this worker process and source folder, starting it if needed."""
+    key = (os.getpid(), source_folder)
+    if key not in servers:
+        if not servers:
+            atexit.register(stop_all_servers)
+        servers[key] = ForkServer(config, source_folder)
+    return servers[key]
+
+
+def stop_server(source_folder: Path) -> None:
+    """Stop the Fork Server for this worker process and source folder."""
+    server = servers.pop((os.getpid(), source_folder), None)
+    if server:
+        logger.info("Stopping fork server: source_folder=%s log_file=%s", source_folder, server.log_file)
+        server.stop()
+
+
+def stop_all_servers() -> None:
+    """Stop all Fork Servers started by this process."""
+    for key in [key for key in servers if key[0] == os.getpid()]:
+        servers.pop(key).stop()
+
+
+class ForkServer:
+    """Warm pytest process that runs each trial in a forked child."""
+
+    def __init__(self, config: PoodleConfig, source_folder: Path) -> None:
+        """Start pytest in a subprocess, and wait for it to finish collecting tests."""
+        run_env = os.environ.copy()
+        python_path = os.pathsep.join(
+            [
+                str(source_folder.resolve()),
+                str(Path.cwd().resolve()),
+                run_env.get("PYTHONPATH", ""),
+            ],
+        )
+        update_env = {"PYTHONPATH": python_path}
+        if config.workspace == "schemata":
+            update_env["PYTEST_PLUGINS"] = ",".join(filter(None, [run_env.get("PYTEST_PLUGINS"), "poodle.import_hook"]))
+            update_env["POODLE_SCHEMATA"] = str(schema_folder(config).resolve())
+        if "pytest_forkserver_env" in config.runner_opts:
+            update_env.update(config.runner_opts["pytest_forkserver_env"])
+        run_env.update(update_env)
+
+        logger.debug("update_env=%s", pprint_str(update_env))
+
+        pytest_args: str = config.runner_opts.get("pytest_forkserver", default_pytest_args)
+        cmd = [sys.executable, "-m", "poodle.runners.pytest_forkserver_plugin"]
+        cmd += shlex.split(pytest_args.format(PYTHONPATH=python_path))
+        logger.debug("command: %s", cmd)
+
+        config.work_folder.mkdir(parents=True, exist_ok=True)
+        self.log_file = config.work_folder / f"forkserver-{os.getpid()}-{source_folder.name or 'root'}.log"
+        with self.log_file.open("a", encoding="utf-8") as log:
+            self.process = subprocess.Popen(  # noqa: S603
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=log,
+                env=run_env,
+                text=True,
+            )
+
+        self.status = self.receive()
+        logger.info("Fork server started: pid=%s status=%s", self.process.pid, self.status)
+
+    def request(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Send a request to the Fork Server, and wait for the response."""
+        if "ready" not in self.status:
+            return self.status
+
+        try:
+            self.process.stdin.write(json.dumps(data) + "\n")  # type: ignore [union-attr]
+            self.process.stdin.flush()  # type: ignore [union-attr]
+        except OSError:
+            logger.exception("Unable to send request to fork server")
+        return self.receive()
+
+    def receive(self) -> dict[str, Any]:
+        """Read the next response from the Fork Server."""
+        line = self.process.stdout.readline()  # type: ignore [union-attr]
+        if not line:
+            returncode = self.process.wait()
+            return {"error": f"Fork Server exited with returncode {returncode}.  See log: {self.log_file}"}
+        return json.loads(line)
+
+    def stop(self) -> None:
+        """Close the request pipe so the Fork Server can exit, and wait for it to finish."""
+        if self.process.stdin:
+            with suppress(OSError):
+                self.process.stdin.close()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
@@ -0,0 +1,233 @@
+"""Fork Server side of the pytest_forkserver runner.
+
+Run with: python -m poodle.runners.pytest_forkserver_plugin [pytest args]
+
+Pytest collects the tests once.  Then each request read from stdin is run in a forked child process,
+which applies the mutation to the already imported module, and runs the collected tests.
+One JSON response is written to stdout for each request.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import sys
+import time
+import traceback
+from pathlib import Path
+from types import FunctionType, GetSetDescriptorType, MemberDescriptorType, ModuleType
+from typing import IO, Any
+
+import pytest
+
+from poodle.data_types import Mutant
+from poodle.import_hook import mutated_source
+from poodle.schemata import ACTIVE_MUTANT
+
+MUT_ENV_FIELDS = {
+    "MUT_SOURCE_FILE": "source_file",
+    "MUT_LINENO": "lineno",
+    "MUT_END_LINENO": "end_lineno",
+    "MUT_COL_OFFSET": "col_offset",
+    "MUT_END_COL_OFFSET": "end_col_offset",
+    "MUT_TEXT": "text",
+}
+
+SLOT_DESCRIPTOR_TYPES = (MemberDescriptorType, GetSetDescriptorType)
+
+
+class ForkServerPlugin:
+    """Pytest plugin that replaces the test loop with the Fork Server request loop."""
+
+    def __init__(self, requests: IO[str], responses: IO[str]) -> None:
+        """Initialize with streams to read requests from and write responses to."""
+        self.requests = requests
+        self.responses = responses
+
+    def send(self, data: dict[str, Any]) -> None:
+        """Write one response."""
+        self.responses.write(json.dumps(data) + "\n")
+        self.responses.flush()
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session: pytest.Session) -> bool:
+        """Serve trial requests until stdin is closed."""
+        if session.testsfailed:
+            self.send({"error": f"{session.testsfailed} error(s) during collection"})
+            return True
+
+        self.send({"ready": len(session.items)})
+        for line in self.requests:
+            self.send({"returncode": run_trial(session, json.loads(line))})
+        return True
+
+
+def run_trial(session: pytest.Session, request: dict[str, Any]) -> int | None:
+    """Fork a child to run the trial.  Return child's exit code, or None if timeout was exceeded."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        os.setpgid(0, 0)
+        returncode = 3
+        try:
+            apply_mutation(request)
+            returncode = run_tests(session, request.get("tests"))
+        except BaseException:  # noqa: BLE001
+            Path(request["output_file"]).write_text(traceback.format_exc(), encoding="utf-8")
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(returncode)
+
+    return wait_for_child(pid, request["timeout"])
+
+
+def wait_for_child(pid: int, timeout: float | None) -> int | None:
+    """Wait for child to exit.  Kill the child's process group if timeout is exceeded."""
+    deadline = time.monotonic() + timeout if timeout else None
+    while True:
+        wait_pid, status = os.waitpid(pid, os.WNOHANG if deadline else 0)
+        if wait_pid:
+            return os.waitstatus_to_exitcode(status)
+        if deadline and time.monotonic() > deadline:
+            kill_process_group(pid)
+            os.waitpid(pid, 0)
+            return None
+        time.sleep(0.01)
+
+
+def kill_process_group(pid: int) -> None:
+    """Kill process group led by pid, or just the process if the group is already gone."""
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        os.kill(pid, signal.SIGKILL)
+
+
+def apply_mutation(request: dict[str, Any]) -> None:
+    """Set MUT_* environment variables, and apply the mutation to the target module.
+
+    Mutants included in a schema are activated by setting the module's active mutant id.
+    Otherwise, the mutated source is built from the original source file, so no copy of the source folder is needed.
+    """
+    mutant = request["mutant"]
+    os.environ.update({key: str(mutant[field]) for key, field in MUT_ENV_FIELDS.items()})
+
+    if mutant["source_file"]:
+        source_file = Path(mutant["source_file"])
+        module = find_module(Path(mutant["source_folder"]), source_file)
+        if mutant.get("schema_id") is not None and hasattr(module, ACTIVE_MUTANT):
+            setattr(module, ACTIVE_MUTANT, mutant["schema_id"])
+        else:
+            patch_module(module, mutated_source(source_file, Mutant(**Mutant.from_dict(dict(mutant)))))
+
+
+def find_module(source_folder: Path, source_file: Path) -> ModuleType:
+    """Find the module loaded from source_file, importing it if needed."""
+    target = source_file.resolve()
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and Path(module_file).resolve() == target:
+            return module
+
+    parts = list(source_file.relative_to(source_folder).with_suffix("").parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return __import__(".".join(parts), fromlist=["__name__"])
+
+
+def patch_module(module: ModuleType, source: str) -> None:
+    """Execute mutated source in the module's namespace.
+
+    Functions and classes that existed before are kept, with their code replaced,
+    so that references held elsewhere (e.g. 'from module import func') run the mutated code.
+    """
+    code = compile(source, module.__file__ or "<mutant>", "exec", dont_inherit=True)
+    original = dict(vars(module))
+    exec(code, vars(module))  # noqa: S102
+
+    for name, old_value in original.items():
+        new_value = vars(module).get(name)
+        if new_value is not old_value and transplant(old_value, new_value):
+            setattr(module, name, old_value)
+
+
+def transplant(old_value: Any, new_value: Any) -> bool:  # noqa: ANN401
+    """Copy mutated code from new_value into old_value.  Return True if old_value can replace new_value."""
+    if isinstance(old_value, FunctionType) and isinstance(new_value, FunctionType):
+        try:
+            old_value.__code__ = new_value.__code__
+        except ValueError:  # closures with different free variables
+            return False
+        old_value.__defaults__ = new_value.__defaults__
+        old_value.__kwdefaults__ = new_value.__kwdefaults__
+        transplant_closure(old_value, new_value)
+        return True
+
+    if isinstance(old_value, type) and isinstance(new_value, type):
+        for attr, new_attr in vars(new_value).items():
+            if attr in ("__dict__", "__weakref__") or isinstance(new_attr, SLOT_DESCRIPTOR_TYPES):
+                continue
+            old_attr = vars(old_value).get(attr)
+            if isinstance(old_attr, (staticmethod, classmethod)) and isinstance(new_attr, type(old_attr)):
+                if transplant(old_attr.__func__, new_attr.__func__):
+                    continue
+            elif old_attr is not None and transplant(old_attr, new_attr):
+                continue
+            try:
+                setattr(old_value, attr, new_attr)
+            except (AttributeError, TypeError):
+                return False
+        return True
+
+    return False
+
+
+def transplant_closure(old_func: FunctionType, new_func: FunctionType) -> None:
+    """Update closure cells of old_func with values from new_func, e.g. the function wrapped by a decorator.
+
+    Cells referencing a class (e.g. __class__ used by super()) keep the original class.
+    """
+    for old_cell, new_cell in zip(old_func.__closure__ or (), new_func.__closure__ or (), strict=False):
+        try:
+            old_contents, new_contents = old_cell.cell_contents, new_cell.cell_contents
+        except ValueError:  # empty cell
+            continue
+        if old_contents is new_contents or isinstance(old_contents, type):
+            continue
+        if not transplant(old_contents, new_contents):
+            old_cell.cell_contents = new_contents
+
+
+def run_tests(session: pytest.Session, tests: list[str] | None = None) -> int:
+    """Run the collected tests, or only the tests with the listed node ids.  Return 1 if any failed, else 0."""
+    items = session.items
+    if tests:
+        selected = set(tests)
+        items = [item for item in items if item.nodeid in selected]
+    for i, item in enumerate(items):
+        nextitem = items[i + 1] if i + 1 < len(items) else None
+        item.config.hook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+        if session.shouldfail or session.shouldstop:
+            break
+    return 1 if session.testsfailed else 0
+
+
+def main(args: list[str]) -> int:
+    """Run pytest with the Fork Server plugin.
+
+    Requests and responses use duplicates of the original stdin and stdout, as pytest's capturing replaces those.
+    Everything else pytest writes to stdout is sent to stderr.
+    """
+    requests = os.fdopen(os.dup(sys.stdin.fileno()), "r")
+    responses = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return pytest.main(args, plugins=[ForkServerPlugin(requests, responses)])
+
+
+# nomut: start
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,121 @@
+"""Test a random sample of mutants, and estimate the mutation score of all mutants from it.
+
+Mutants are grouped in strata by source file and mutator.  Each stratum gets a share of the sample in proportion
+to its size, so every file and mutator is represented.  The mutation score is estimated with the stratified
+estimator, with a normal approximation confidence interval that includes the finite population correction.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+from collections import defaultdict
+from statistics import NormalDist
+from typing import TYPE_CHECKING
+
+from .data_types import MutantTrialResult
+
+if TYPE_CHECKING:
+    from .data_types import Mutant, MutantTrial, PoodleConfig, TestingSummary
+
+logger = logging.getLogger(__name__)
+
+confidence_level = 0.95
+
+StratumKey = tuple[str, str]
+
+
+def stratum_key(mutant: Mutant) -> StratumKey:
+    """Stratum of the mutant: its source file and mutator."""
+    return str(mutant.source_file), mutant.mutator_name
+
+
+def group_strata(mutants: list[Mutant]) -> dict[StratumKey, list[Mutant]]:
+    """Group mutants by stratum, in sorted order of strata and mutant IDs."""
+    strata: dict[StratumKey, list[Mutant]] = defaultdict(list)
+    for mutant in sorted(mutants, key=lambda mutant: mutant.mutant_id):
+        strata[stratum_key(mutant)].append(mutant)
+    return dict(sorted(strata.items()))
+
+
+def sample_size(config: PoodleConfig, population: int) -> int:
+    """Calculate number of mutants to test from sample or sample_fraction."""
+    if config.sample is not None:
+        return min(config.sample, population)
+    if config.sample_fraction is not None:
+        return min(max(round(config.sample_fraction * population), 1), population)
+    return population
+
+
+def allocate(sizes: dict[StratumKey, int], size: int) -> dict[StratumKey, int]:
+    """Split sample size between strata in proportion to their sizes, by the largest remainder method.
+
+    When the sample has room, each stratum gets at least one mutant.
+    """
+    population = sum(sizes.values())
+    minimum = 1 if size >= len(sizes) else 0
+    shares = {key: stratum_size * size / population for key, stratum_size in sizes.items()}
+    counts = {key: min(max(math.floor(share), minimum), sizes[key]) for key, share in shares.items()}
+    remaining = size - sum(counts.values())
+    by_remainder = sorted(shares, key=lambda key: counts[key] - shares[key])
+    while remaining > 0:
+        for key in by_remainder:
+            if remaining and counts[key] < sizes[key]:
+                counts[key] += 1
+                remaining -= 1
+    while remaining < 0:
+        for key in reversed(by_remainder):
+            if remaining and counts[key] > minimum:
+                counts[key] -= 1
+                remaining += 1
+    return counts
+
+
+def select_sample(mutants: list[Mutant], config: PoodleConfig) -> list[Mutant]:
+    """Select a stratified random sample of the mutants.  The same seed and mutants always select the same sample."""
+    strata = group_strata(mutants)
+    counts = allocate({key: len(stratum) for key, stratum in strata.items()}, sample_size(config, len(mutants)))
+    rng = random.Random(config.sample_seed)  # noqa: S311
+    sample = []
+    for key, stratum in strata.items():
+        sample.extend(rng.sample(stratum, counts[key]))
+    logger.info("Selected %s of %s mutants from %s strata", len(sample), len(mutants), len(strata))
+    return sample
+
+
+def estimate_score(summary: TestingSummary, population: list[Mutant], mutant_trials: list[MutantTrial]) -> None:
+    """Estimate the mutation score of the population from the sampled trials, and update the summary.
+
+    Trials left untested by early_stop are not part of the sample.
+    """
+    sizes = {key: len(stratum) for key, stratum in group_strata(population).items()}
+    found: dict[StratumKey, list[bool]] = defaultdict(list)
+    for trial in mutant_trials:
+        if trial.result.reason_code == MutantTrialResult.RC_INCOMPLETE:
+            continue
+        found[stratum_key(trial.mutant)].append(trial.result.found)
+    sampled = {key: results for key, results in found.items() if key in sizes}
+    if not sampled:
+        return
+
+    # strata without trials (e.g. in a shard) are left out, and the weights of the others are scaled to match
+    total = sum(sizes[key] for key in sampled)
+    overall = sum(sum(results) for results in sampled.values()) / sum(len(results) for results in sampled.values())
+    estimate = sum(sizes[key] * sum(results) / len(results) for key, results in sampled.items()) / total
+    variance = 0.0
+    for key, results in sampled.items():
+        weight = sizes[key] / total
+        rate = sum(results) / len(results)
+        # a stratum with one trial has no variance of its own, so the variance of all trials is used instead
+        if len(results) > 1:
+            stratum_variance = rate * (1 - rate) * len(results) / (len(results) - 1)
+        else:
+            stratum_variance = overall * (1 - overall)
+        variance += weight**2 * (1 - len(results) / sizes[key]) * stratum_variance / len(results)
+
+    margin = NormalDist().inv_cdf((1 + confidence_level) / 2) * math.sqrt(variance)
+    summary.sampled_from = len(population)
+    summary.estimated_rate = estimate
+    summary.estimate_low = max(estimate - margin, 0.0)
+    summary.estimate_high = min(estimate + margin, 1.0)
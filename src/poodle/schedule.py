@@ -0,0 +1,54 @@
+"""Order trials longest first, to shorten the time until the last trial completes.
+
+Each trial's duration is estimated from the duration of the same mutant in a previous run, saved in the result cache.
+Otherwise, from the duration of the clean run of its source folder, scaled by the share of the tests that cover it.
+Dispatching the longest trials first (LPT scheduling) keeps slow trials from running alone at the end.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .data_types import Mutant, PoodleWork
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_duration(work: PoodleWork, mutant: Mutant, tests: list[str] | None, timeout: float) -> float:
+    """Estimate duration of the mutant's trial in seconds, up to the timeout."""
+    previous = work.result_cache.get_duration(mutant) if work.result_cache else None
+    if previous is not None:
+        return min(previous, timeout)
+
+    duration = work.clean_run_durations.get(mutant.source_folder, 0.0)
+    if tests and mutant.source_folder in work.coverage:
+        duration *= min(len(tests) / max(work.coverage[mutant.source_folder].test_count, 1), 1.0)
+    return min(duration, timeout)
+
+
+def predict_makespan(durations: list[float], workers: int) -> float:
+    """Predict the time for the workers to run trials of the durations, started in order as workers are free."""
+    finish_times = [0.0] * max(min(workers, len(durations)), 1)
+    for duration in durations:
+        heapq.heappush(finish_times, heapq.heappop(finish_times) + duration)
+    return max(finish_times)
+
+
+def longest_first(
+    work: PoodleWork,
+    to_test: list[tuple[Mutant, list[str] | None]],
+    timeout: float,
+) -> tuple[list[tuple[Mutant, list[str] | None]], float]:
+    """Sort mutants to test by estimated duration, longest first.  Returns them with the predicted makespan."""
+    estimates = [estimate_duration(work, mutant, tests, timeout) for mutant, tests in to_test]
+    order = sorted(range(len(to_test)), key=lambda index: estimates[index], reverse=True)
+    makespan = predict_makespan(
+        [estimates[index] for index in order],
+        work.config.max_workers or os.cpu_count() or 1,
+    )
+    logger.info("Predicted makespan of %s trials: %.2f s", len(to_test), makespan)
+    return [to_test[index] for index in order], makespan
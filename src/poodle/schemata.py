@@ -0,0 +1,227 @@
+"""Mutant Schemata: compile all mutants of a file into one module that switches between them at runtime.
+
+Each mutated expression is wrapped in a chain of conditional expressions,
+one branch for each mutant, selected by the module global named by ACTIVE_MUTANT.
+The original expression is used when no mutant of the module is active (ACTIVE_MUTANT = 0).
+
+Only expressions evaluated when a function runs are instrumented.
+Mutants of expressions evaluated on import (e.g. module constants, decorators, default values)
+or of statements are not part of the schema, and are applied to the source as usual.
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .data_types import Mutant, PoodleConfig
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_MUTANT = "__poodle_mutant__"
+
+
+@dataclass
+class SchemaNode:
+    """Expression that is replaced with a chain of mutant branches."""
+
+    start: tuple[int, int]
+    end: tuple[int, int]
+    mutants: list[Mutant] = field(default_factory=list)
+    children: list[SchemaNode] = field(default_factory=list)
+
+
+def schema_folder(config: PoodleConfig) -> Path:
+    """Folder where instrumented modules are written."""
+    return config.work_folder / "schemata"
+
+
+def schema_file(folder: Path, source_file: Path) -> Path:
+    """Location in the schema folder of the instrumented version of source_file."""
+    return folder.joinpath(*source_file.resolve().parts[1:])
+
+
+def schema_sources(folder: Path) -> dict[Path, str]:
+    """Read all instrumented modules in folder.  Map the original source file to the instrumented source."""
+    return {
+        Path(Path.cwd().anchor, file.relative_to(folder)): file.read_text("utf-8")
+        for file in folder.rglob("*.py")
+        if file.is_file()
+    }
+
+
+def write_schema(config: PoodleConfig, source_file: Path, source: str) -> None:
+    """Write instrumented source of source_file to the schema folder."""
+    target_file = schema_file(schema_folder(config), source_file)
+    target_file.parent.mkdir(parents=True, exist_ok=True)
+    target_file.write_text(source, encoding="utf-8")
+
+
+def create_schema(parsed_ast: ast.Module, source: str, mutants: list[Mutant]) -> str:
+    """Build the instrumented source for all mutants of one file.
+
+    Sets schema_id of each Mutant included in the schema.
+    Mutants that can't be included keep schema_id None.
+    """
+    nodes = assign_schema_ids(parsed_ast, mutants)
+    if not nodes:
+        return source
+
+    instrumented = SchemaWriter(source).render_file(nest_nodes(nodes))
+
+    try:
+        compile(instrumented, "<schema>", "exec", dont_inherit=True)
+    except SyntaxError:
+        logger.exception("Unable to compile schema, mutants will be applied individually")
+        for mutant in mutants:
+            mutant.schema_id = None
+        return source
+
+    return instrumented
+
+
+def assign_schema_ids(parsed_ast: ast.Module, mutants: list[Mutant]) -> list[SchemaNode]:
+    """Group mutants by the expression that will be replaced, and number them in order."""
+    expressions = {get_span(node): node for node in runtime_expressions(parsed_ast)}
+    nodes: dict[tuple[tuple[int, int], tuple[int, int]], SchemaNode] = {}
+    schema_id = 0
+    for mutant in mutants:
+        start, end = (mutant.lineno, mutant.col_offset), (mutant.end_lineno, mutant.end_col_offset)
+        span = find_expression_span(expressions, start, end)
+        if span is None:
+            continue
+        schema_id += 1
+        mutant.schema_id = schema_id
+        nodes.setdefault(span, SchemaNode(*span)).mutants.append(mutant)
+    return list(nodes.values())
+
+
+class SchemaWriter:
+    """Render source with each SchemaNode replaced by its chain of mutant branches."""
+
+    def __init__(self, source: str) -> None:
+        """Init with original source, and the offset where each line starts."""
+        self.source = source
+        self.line_offsets = [0]
+        for line in source.splitlines(keepends=True):
+            self.line_offsets.append(self.line_offsets[-1] + len(line))
+
+    def text(self, start: tuple[int, int], end: tuple[int, int]) -> str:
+        """Original source from start to end."""
+        return self.source[self.line_offsets[start[0] - 1] + start[1] : self.line_offsets[end[0] - 1] + end[1]]
+
+    def render_file(self, nodes: list[SchemaNode]) -> str:
+        """Render the whole file."""
+        return self.render((1, 0), (len(self.line_offsets), 0), nodes)
+
+    def render(self, start: tuple[int, int], end: tuple[int, int], nodes: list[SchemaNode]) -> str:
+        """Render source from start to end, replacing the nodes within."""
+        out = []
+        pos = start
+        for node in nodes:
+            out.extend([self.text(pos, node.start), self.render_node(node)])
+            pos = node.end
+        out.append(self.text(pos, end))
+        return "".join(out)
+
+    def render_node(self, node: SchemaNode) -> str:
+        """Render the chain of mutant branches for node.
+
+        The original branch includes the branches of child nodes.
+        If the chain is not a valid expression, the node's mutants are removed from the schema.
+        """
+        original = self.render(node.start, node.end, node.children)
+        branches = [
+            f"({self.text(node.start, (m.lineno, m.col_offset))}{m.text}"
+            f"{self.text((m.end_lineno, m.end_col_offset), node.end)})"
+            f" if {ACTIVE_MUTANT} == {m.schema_id} else "
+            for m in node.mutants
+        ]
+        chain = f"({''.join(branches)}({original}))"
+        try:
+            ast.parse(chain, mode="eval")
+        except SyntaxError:
+            logger.warning("Unable to add mutants at %s:%s to schema", *node.start)
+            for mutant in node.mutants:
+                mutant.schema_id = None
+            return original
+        return chain
+
+
+def runtime_expressions(node: ast.AST, runtime: bool = False) -> Iterator[ast.expr]:
+    """Yield expressions evaluated each time a function runs, that can be replaced with a conditional expression."""
+    if isinstance(node, ast.expr) and runtime and is_replaceable(node):
+        yield node
+
+    if isinstance(node, (ast.JoinedStr, ast.pattern)):
+        return
+
+    for name, value in ast.iter_fields(node):
+        child_runtime = runtime or (
+            (isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and name == "body")
+            or (isinstance(node, ast.Lambda) and name == "body")
+        )
+        children = value if isinstance(value, list) else [value]
+        if name == "body" and is_docstring(node, children):
+            children = children[1:]
+        for child in children:
+            if isinstance(child, ast.AST):
+                yield from runtime_expressions(child, child_runtime)
+
+
+def is_replaceable(node: ast.expr) -> bool:
+    """Identify if the expression can be replaced with a conditional expression."""
+    if isinstance(node, (ast.Starred, ast.Slice)):
+        return False
+    return not isinstance(getattr(node, "ctx", None), (ast.Store, ast.Del))
+
+
+def is_docstring(node: ast.AST, body: list) -> bool:
+    """Identify if the first statement in body is a docstring."""
+    return (
+        isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+        and bool(body)
+        and isinstance(body[0], ast.Expr)
+        and isinstance(body[0].value, ast.Constant)
+        and isinstance(body[0].value.value, str)
+    )
+
+
+def get_span(node: ast.expr) -> tuple[tuple[int, int], tuple[int, int]]:
+    """Start and end position of the node."""
+    return (node.lineno, node.col_offset), (node.end_lineno or node.lineno, node.end_col_offset or node.col_offset)
+
+
+def find_expression_span(
+    expressions: dict[tuple[tuple[int, int], tuple[int, int]], ast.expr],
+    start: tuple[int, int],
+    end: tuple[int, int],
+) -> tuple[tuple[int, int], tuple[int, int]] | None:
+    """Find span of the smallest expression that contains the range from start to end."""
+    if (start, end) in expressions:
+        return start, end
+
+    containing = [
+        (expr_start, expr_end) for expr_start, expr_end in expressions if expr_start <= start and end <= expr_end
+    ]
+    if not containing:
+        return None
+    return max(containing, key=lambda span: (span[0], (-span[1][0], -span[1][1])))
+
+
+def nest_nodes(nodes: list[SchemaNode]) -> list[SchemaNode]:
+    """Arrange nodes in a tree, where each node contains its children.  Return the top level nodes."""
+    top: list[SchemaNode] = []
+    stack: list[SchemaNode] = []
+    for node in sorted(nodes, key=lambda n: (n.start, (-n.end[0], -n.end[1]))):
+        while stack and stack[-1].end <= node.start:
+            stack.pop()
+        (stack[-1].children if stack else top).append(node)
+        stack.append(node)
+    return top
@@ -0,0 +1,82 @@
+"""Split mutants across shards run on separate machines, and merge the results of each shard.
+
+Each shard selects its mutants from the full list, sorted by the stable mutant ID,
+so all shards agree on the split while they mutate the same source files.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from . import PoodleInputError
+from .data_types import MutantTrial, TestingResults, TestingSummary
+from .util import from_json
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .data_types import Mutant
+
+logger = logging.getLogger(__name__)
+
+
+def select_shard(mutants: list[Mutant], shard: tuple[int, int]) -> list[Mutant]:
+    """Select every n-th mutant, sorted by mutant ID, starting from the i-th."""
+    index, count = shard
+    return sorted(mutants, key=lambda mutant: mutant.mutant_id)[index - 1 :: count]
+
+
+def merge_results(result_files: list[Path]) -> TestingResults:
+    """Combine JSON reports created by report_json on each shard.
+
+    Summary statistics are added from the summary of each report,
+    or calculated from the trials in the report when the summary was excluded.
+    """
+    if len({result_file.resolve() for result_file in result_files}) < len(result_files):
+        raise PoodleInputError("Each result file can only be merged once.")
+
+    mutant_trials: dict[str, MutantTrial] = {}
+    summary = TestingSummary()
+
+    for result_file in result_files:
+        logger.info("Merging results from %s", result_file)
+        try:
+            results: TestingResults = from_json(result_file.read_text("utf-8"), TestingResults)  # type: ignore [assignment]
+        except (ValueError, TypeError) as ex:
+            msg = f"Unable to read results from '{result_file}': {ex}"
+            raise PoodleInputError(msg) from ex
+
+        for trial in results.mutant_trials:
+            mutant_id = trial.mutant.mutant_id
+            if mutant_id in mutant_trials:
+                msg = f"Mutant {mutant_id} was found in more than one result file, last in '{result_file}'"
+                raise PoodleInputError(msg)
+            mutant_trials[mutant_id] = trial
+
+        add_summary(summary, results.summary or summary_for_trials(results.mutant_trials))
+
+    return TestingResults(mutant_trials=list(mutant_trials.values()), summary=summary)
+
+
+def summary_for_trials(mutant_trials: list[MutantTrial]) -> TestingSummary:
+    """Calculate summary statistics from trial results."""
+    summary = TestingSummary(trials=len(mutant_trials))
+    for trial in mutant_trials:
+        summary += trial.result
+    return summary
+
+
+def add_summary(summary: TestingSummary, other: TestingSummary) -> None:
+    """Add the counts of other summary to summary."""
+    summary.trials += other.trials
+    summary.tested += other.tested
+    summary.found += other.found
+    summary.not_found += other.not_found
+    summary.not_covered += other.not_covered
+    summary.timeout += other.timeout
+    summary.resource_limit += other.resource_limit
+    summary.errors += other.errors
+    summary.incomplete += other.incomplete
+    summary.cached += other.cached
+    summary.orphans += other.orphans
@@ -0,0 +1,121 @@
+"""Create mutations for many mutators in a single traversal of a module's ast.
+
+Each node is dispatched to the visit methods of every mutator that handles its type.
+Like ast.NodeVisitor, a mutator doesn't visit the children of a node it handled,
+so the mutations are the same as from each mutator's own traversal.
+The parent of each node is assigned as the traversal reaches it, in place of add_parent_attr.
+Nodes with an extent entirely on lines blocked by comments are skipped, with their children,
+for all mutators or only the mutators named in the comments.
+
+The tree is shared by all mutators, so mutators must not modify it.
+Mutators that need a modified node to unparse change a shallow copy of the node instead (copy on write).
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sys
+
+    from .data_types import FileMutation, Mutator
+    from .line_filters import LineFilters
+
+    if sys.version_info < (3, 14):  # nomut
+        from typing import Callable  # noqa: UP035  # pragma: no cover
+    else:
+        from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+Dispatch = dict[str, list[tuple[int, "Callable"]]]
+
+
+def visit_methods(mutator: Mutator) -> dict[str, Callable]:
+    """Map names of node types to the mutator's visit methods.  Methods inherited from ast.NodeVisitor are left out."""
+    return {
+        name.removeprefix("visit_"): getattr(mutator, name)
+        for name in dir(type(mutator))
+        if name.startswith("visit_") and getattr(type(mutator), name) is not getattr(ast.NodeVisitor, name, None)
+    }
+
+
+def build_dispatch(mutators: list[Mutator]) -> Dispatch:
+    """Map names of node types to the index and visit method of each mutator that handles them."""
+    dispatch: Dispatch = defaultdict(list)
+    for index, mutator in enumerate(mutators):
+        for name, method in visit_methods(mutator).items():
+            dispatch[name].append((index, method))
+    return dict(dispatch)
+
+
+def unblocked(
+    node: ast.AST, active: frozenset[int], line_filters: LineFilters, names: tuple[str, ...]
+) -> frozenset[int]:
+    """Leave out the active mutators that are blocked on every line of the node's extent."""
+    extent = getattr(node, "extent", None)
+    if extent is None:
+        return active
+    blocked = line_filters.covering(extent[0], extent[2])
+    if not blocked:
+        return active
+    if "all" in blocked:
+        return frozenset()
+    return frozenset(index for index in active if names[index] not in blocked)
+
+
+def visit(
+    node: ast.AST,
+    dispatch: Dispatch,
+    active: frozenset[int],
+    line_filters: LineFilters | None = None,
+    names: tuple[str, ...] = (),
+) -> None:
+    """Dispatch node to the active mutators, then visit its children with the mutators that didn't handle it.
+
+    If line_filters has filters, mutators blocked on every line of the node's extent don't visit it or its children.
+    names are the lower case mutator names, by index.
+    """
+    if line_filters is not None:
+        active = unblocked(node, active, line_filters, names)
+        if not active:
+            return
+
+    visitors = dispatch.get(node.__class__.__name__)
+    if visitors:
+        handled = set()
+        for index, method in visitors:
+            if index in active:
+                method(node)
+                handled.add(index)
+        if handled:
+            active = active - handled
+            if not active:
+                return
+
+    for child in ast.iter_child_nodes(node):
+        child.parent = node  # type: ignore [attr-defined]
+        visit(child, dispatch, active, line_filters, names)
+
+
+def create_mutations(
+    parsed_ast: ast.Module,
+    mutators: list[Mutator],
+    line_filters: LineFilters | None = None,
+) -> list[list[FileMutation]]:
+    """Visit all nodes of parsed_ast once with all mutators.  Returns the mutations of each mutator, in order.
+
+    Nodes on lines blocked by line_filters are skipped, when the extent of each node was indexed with add_extent_attr.
+    """
+    for mutator in mutators:
+        mutator.mutants = []  # type: ignore [attr-defined]
+    if line_filters is not None and not line_filters.name_ranges:
+        line_filters = None
+    if mutators:
+        names = tuple(mutator.mutator_name.lower() for mutator in mutators)
+        visit(parsed_ast, build_dispatch(mutators), frozenset(range(len(mutators))), line_filters, names)
+    logger.debug("Traversed ast with %s mutators", len(mutators))
+    return [mutator.mutants for mutator in mutators]  # type: ignore [attr-defined]
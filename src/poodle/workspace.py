@@ -0,0 +1,184 @@
+"""Prepare the folder a Mutant Trial runs in."""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+from zipfile import ZipFile
+
+from .util import delete_folder, mutate_lines
+
+if TYPE_CHECKING:
+    import sys
+    from collections.abc import Generator
+    from contextlib import AbstractContextManager
+
+    from .data_types import Mutant, PoodleConfig
+
+    if sys.version_info < (3, 14):  # nomut
+        from typing import Callable  # noqa: UP035  # pragma: no cover
+    else:
+        from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+pool_folders: dict[tuple[int, Path], Path] = {}
+
+
+@contextmanager
+def zip_workspace(
+    config: PoodleConfig,
+    folder_zip: Path | None,
+    mutant: Mutant,
+    run_id: str,
+) -> Generator[Path, None, None]:
+    """Create a Run Folder, unzip the source folder to it, and apply the mutation.
+
+    Run Folder is deleted on exit.
+    """
+    run_folder = config.work_folder / ("run-" + run_id)
+    run_folder.mkdir()
+
+    with ZipFile(required_zip(folder_zip), "r") as zip_file:
+        zip_file.extractall(run_folder)
+
+    if mutant.source_file:
+        target_file = run_folder / mutant.source_file
+        file_lines = target_file.read_text("utf-8").splitlines(keepends=True)
+        file_lines = mutate_lines(mutant, file_lines)
+        target_file.write_text(data="".join(file_lines), encoding="utf-8")
+
+    try:
+        yield run_folder
+    finally:
+        delete_folder(run_folder, config)
+
+
+def required_zip(folder_zip: Path | None) -> Path:
+    """Zip file of the source folder, for workspaces that are built from it."""
+    if folder_zip is None:
+        raise ValueError("Workspace requires a zip file of the source folder")
+    return folder_zip
+
+
+@contextmanager
+def hardlink_workspace(
+    config: PoodleConfig,
+    folder_zip: Path | None,
+    mutant: Mutant,
+    run_id: str,
+) -> Generator[Path, None, None]:
+    """Create a Run Folder of hard links to the files in the source folder zip, and apply the mutation.
+
+    The mutated file is written as a new file, so the original file is not changed.
+    Files are copied if they can't be linked, e.g. when work_folder is on another file system.
+    Run Folder is deleted on exit.
+    """
+    run_folder = config.work_folder / ("run-" + run_id)
+    run_folder.mkdir()
+
+    with ZipFile(required_zip(folder_zip), "r") as zip_file:
+        for name in zip_file.namelist():
+            link_file(Path(name), run_folder / name)
+
+    if mutant.source_file:
+        target_file = run_folder / mutant.source_file
+        file_lines = target_file.read_text("utf-8").splitlines(keepends=True)
+        file_lines = mutate_lines(mutant, file_lines)
+        target_file.unlink()
+        target_file.write_text(data="".join(file_lines), encoding="utf-8")
+
+    try:
+        yield run_folder
+    finally:
+        delete_folder(run_folder, config)
+
+
+def link_file(source_file: Path, target_file: Path) -> None:
+    """Create a hard link to source_file, or copy it if a link can't be created."""
+    target_file.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        target_file.hardlink_to(source_file)
+    except OSError:
+        shutil.copy2(source_file, target_file)
+
+
+@contextmanager
+def pooled_workspace(
+    config: PoodleConfig,
+    folder_zip: Path | None,
+    mutant: Mutant,
+    run_id: str,  # noqa: ARG001
+) -> Generator[Path, None, None]:
+    """Reuse a Run Folder for all trials in this worker process, and apply the mutation to it.
+
+    The source folder is extracted only on the first trial of each worker process.
+    The mutated file is restored on exit, also when the trial raised an error or timed out.
+    """
+    run_folder = get_pool_folder(config, required_zip(folder_zip))
+
+    if not mutant.source_file:
+        yield run_folder
+        return
+
+    target_file = run_folder / mutant.source_file
+    original = target_file.read_bytes()
+    file_lines = original.decode("utf-8").splitlines(keepends=True)
+    target_file.write_text(data="".join(mutate_lines(mutant, file_lines)), encoding="utf-8")
+    try:
+        yield run_folder
+    finally:
+        target_file.write_bytes(original)
+        remove_bytecode(target_file)
+
+
+def get_pool_folder(config: PoodleConfig, folder_zip: Path) -> Path:
+    """Retrieve the Run Folder for this worker process and zip file, extracting the zip file if needed."""
+    key = (os.getpid(), folder_zip)
+    if key not in pool_folders:
+        run_folder = config.work_folder / f"pool-{os.getpid()}-{folder_zip.stem}"
+        logger.info("Creating pooled run folder: %s", run_folder)
+        run_folder.mkdir(parents=True, exist_ok=True)
+        with ZipFile(folder_zip, "r") as zip_file:
+            zip_file.extractall(run_folder)
+        pool_folders[key] = run_folder
+    return pool_folders[key]
+
+
+def remove_bytecode(source_file: Path) -> None:
+    """Remove cached bytecode of source_file, which may have been compiled from the mutated source."""
+    for cached_file in (source_file.parent / "__pycache__").glob(f"{source_file.stem}.*.pyc"):
+        cached_file.unlink(missing_ok=True)
+
+
+@contextmanager
+def import_hook_workspace(
+    config: PoodleConfig,  # noqa: ARG001
+    folder_zip: Path | None,  # noqa: ARG001
+    mutant: Mutant,  # noqa: ARG001
+    run_id: str,  # noqa: ARG001
+) -> Generator[Path, None, None]:
+    """Use the current folder, without copying or changing any files.
+
+    The runner delivers the mutation to the test process with poodle.import_hook.
+    Also used by the "schemata" workspace, where the import hook serves the instrumented modules.
+    """
+    yield Path.cwd()
+
+
+builtin_workspaces: dict[str, Callable[..., AbstractContextManager[Path]]] = {
+    "zip": zip_workspace,
+    "pooled": pooled_workspace,
+    "hardlink": hardlink_workspace,
+    "import_hook": import_hook_workspace,
+    "schemata": import_hook_workspace,
+}
+
+
+def uses_zip(config: PoodleConfig) -> bool:
+    """Identify if the selected workspace needs zip files of the source folders."""
+    return config.workspace not in ("import_hook", "schemata")
@@ -26,14 +26,24 @@ class PoodleConfigStub(PoodleConfig):
     source_folders: list[Path] = None  # type: ignore [assignment]
 
     only_files: list[str] = None  # type: ignore [assignment]
+    diff_base: str | None = None
+    shard: tuple[int, int] | None = None
+    resume: bool = False
+    sample: int | None = None
+    sample_fraction: float | None = None
+    sample_seed: int = 0
+    skip_equivalent: bool = False
+    early_stop: bool = False
     file_flags: int = None  # type: ignore [assignment]
     file_filters: list[str] = None  # type: ignore [assignment]
 
     file_copy_flags: int = None  # type: ignore [assignment]
     file_copy_filters: list[str] = None  # type: ignore [assignment]
     work_folder: Path = None  # type: ignore [assignment]
+    workspace: str = "zip"
 
     max_workers: int | None = None
+    scheduler: str = "process_pool"
 
     log_format: str = None  # type: ignore [assignment]
     log_level: int | str = None  # type: ignore [assignment]
@@ -48,6 +58,11 @@ class PoodleConfigStub(PoodleConfig):
     timeout_multiplier: int = None  # type: ignore [assignment]
     runner: str = None  # type: ignore [assignment]
     runner_opts: dict = None  # type: ignore [assignment]
+    coverage_guided: bool = False
+    result_cache: bool = False
+    result_cache_files: list[str] = None  # type: ignore [assignment]
+    clear_result_cache: bool = False
+    mutant_cache: bool = False
 
     reporters: list[str] = None  # type: ignore [assignment]
     reporter_opts: dict = None  # type: ignore [assignment]
@@ -57,6 +72,29 @@ class PoodleConfigStub(PoodleConfig):
     skip_delete_folder: bool = False
 
 
+def create_mutant(
+    source_file: Path | None = Path("src/example.py"),
+    *,
+    lineno: int = 1,
+    col_offset: int = 0,
+    end_lineno: int | None = None,
+    end_col_offset: int = 1,
+    text: str = "",
+    mutator_name: str = "Test",
+    source_folder: Path = Path("src"),
+) -> Mutant:
+    return Mutant(
+        mutator_name=mutator_name,
+        source_folder=source_folder,
+        source_file=source_file,
+        lineno=lineno,
+        col_offset=col_offset,
+        end_lineno=end_lineno or lineno,
+        end_col_offset=end_col_offset,
+        text=text,
+    )
+
+
 class TestPoodleConfig:
     @staticmethod
     def create_poodle_config():
@@ -66,12 +104,22 @@ class TestPoodleConfig:
             config_file=Path("filename.toml"),
             source_folders=[Path("src")],
             only_files=["example.py"],
+            diff_base="main",
+            shard=(2, 8),
+            resume=True,
+            sample=100,
+            sample_fraction=0.1,
+            sample_seed=7,
+            skip_equivalent=True,
+            early_stop=True,
             file_flags=4,
             file_filters=["test_"],
             file_copy_flags=5,
             file_copy_filters=["skip"],
             work_folder=Path(".poodle"),
+            workspace="zip",
             max_workers=3,
+            scheduler="asyncio",
             log_format="$(message)s",
             log_level=0,
             echo_enabled=True,
@@ -83,6 +131,11 @@ class TestPoodleConfig:
             timeout_multiplier=10,
             runner="command_line",
             runner_opts={"command_line": "pytest tests"},
+            coverage_guided=True,
+            result_cache=True,
+            result_cache_files=["tests/*.py"],
+            clear_result_cache=False,
+            mutant_cache=True,
             reporters=["summary"],
             reporter_opts={"summary": "value"},
             fail_under=95.0,
@@ -99,14 +152,24 @@ class TestPoodleConfig:
         assert config.source_folders == [Path("src")]
 
         assert config.only_files == ["example.py"]
+        assert config.diff_base == "main"
+        assert config.shard == (2, 8)
+        assert config.resume is True
+        assert config.sample == 100
+        assert config.sample_fraction == 0.1
+        assert config.sample_seed == 7
+        assert config.skip_equivalent is True
+        assert config.early_stop is True
         assert config.file_flags == 4
         assert config.file_filters == ["test_"]
 
         assert config.file_copy_flags == 5
         assert config.file_copy_filters == ["skip"]
         assert config.work_folder == Path(".poodle")
+        assert config.workspace == "zip"
 
         assert config.max_workers == 3
+        assert config.scheduler == "asyncio"
 
         assert config.log_format == "$(message)s"
         assert config.log_level == 0
@@ -121,6 +184,11 @@ class TestPoodleConfig:
         assert config.timeout_multiplier == 10
         assert config.runner == "command_line"
         assert config.runner_opts == {"command_line": "pytest tests"}
+        assert config.coverage_guided is True
+        assert config.result_cache is True
+        assert config.result_cache_files == ["tests/*.py"]
+        assert config.clear_result_cache is False
+        assert config.mutant_cache is True
 
         assert config.reporters == ["summary"]
         assert config.reporter_opts == {"summary": "value"}
@@ -186,6 +254,29 @@ class TestMutant:
         assert poodle_mutant.end_lineno == 0
         assert poodle_mutant.end_col_offset == 0
         assert poodle_mutant.text == ""
+        assert poodle_mutant.unified_diff is None
+        assert poodle_mutant.schema_id is None
+
+    def test_mutant_id(self):
+        def create_mutant(**kwargs):
+            mutant_args = {
+                "source_folder": Path("src"),
+                "source_file": Path("src/test.py"),
+                **vars(TestFileMutation.create_file_mutation()),
+            }
+            return Mutant(**{**mutant_args, **kwargs})
+
+        mutant_id = create_mutant().mutant_id
+        assert len(mutant_id) == 64
+        assert mutant_id == create_mutant(unified_diff="diff", schema_id=3, source_folder=Path("other")).mutant_id
+        assert mutant_id != create_mutant(source_file=Path("src/other.py")).mutant_id
+        assert mutant_id != create_mutant(source_file=None).mutant_id
+        assert mutant_id != create_mutant(lineno=5).mutant_id
+        assert mutant_id != create_mutant(col_offset=5).mutant_id
+        assert mutant_id != create_mutant(end_lineno=5).mutant_id
+        assert mutant_id != create_mutant(end_col_offset=5).mutant_id
+        assert mutant_id != create_mutant(mutator_name="other").mutant_id
+        assert mutant_id != create_mutant(text="other").mutant_id
 
     def mutant_object(self):
         return Mutant(
@@ -198,6 +289,7 @@ class TestMutant:
             source_folder=Path("src"),
             source_file=Path("test.py"),
             unified_diff="diff",
+            schema_id=5,
         )
 
     def mutant_dict(self):
@@ -211,6 +303,7 @@ class TestMutant:
             "source_folder": "src",
             "source_file": "test.py",
             "unified_diff": "diff",
+            "schema_id": 5,
         }
 
     def test_serialize(self):
@@ -232,9 +325,11 @@ class TestMutantTrialResult:
         assert result.found is True
         assert result.reason_code == "test"
         assert result.reason_desc == "it worked"
+        assert result.orphans == 0
         assert result.RC_FOUND == "Mutant Found"
         assert result.RC_NOT_FOUND == "Mutant Not Found"
         assert result.RC_TIMEOUT == "Trial Exceeded Timeout"
+        assert result.RC_RESOURCE_LIMIT == "Resource Limit Exceeded"
         assert result.RC_INCOMPLETE == "Testing Incomplete"
         assert result.RC_OTHER == "Other, See Description"
 
@@ -260,6 +355,7 @@ class TestMutantTrialResult:
             "found": True,
             "reason_code": MutantTrialResult.RC_FOUND,
             "reason_desc": "it worked",
+            "orphans": 0,
         }
 
     def test_serialize(self):
@@ -317,7 +413,15 @@ class TestTestingSummary:
             found=3,
             not_found=4,
             timeout=5,
+            resource_limit=10,
             errors=6,
+            not_covered=7,
+            incomplete=9,
+            cached=8,
+            sampled_from=100,
+            estimated_rate=0.5,
+            estimate_low=0.4,
+            estimate_high=0.6,
         )
 
         assert testing_summary.trials == 1
@@ -325,7 +429,15 @@ class TestTestingSummary:
         assert testing_summary.found == 3
         assert testing_summary.not_found == 4
         assert testing_summary.timeout == 5
+        assert testing_summary.resource_limit == 10
         assert testing_summary.errors == 6
+        assert testing_summary.not_covered == 7
+        assert testing_summary.incomplete == 9
+        assert testing_summary.cached == 8
+        assert testing_summary.sampled_from == 100
+        assert testing_summary.estimated_rate == 0.5
+        assert testing_summary.estimate_low == 0.4
+        assert testing_summary.estimate_high == 0.6
 
     def test_testing_summary_defaults(self):
         testing_summary = TestingSummary()
@@ -334,8 +446,16 @@ class TestTestingSummary:
         assert testing_summary.tested == 0
         assert testing_summary.found == 0
         assert testing_summary.not_found == 0
+        assert testing_summary.not_covered == 0
         assert testing_summary.timeout == 0
+        assert testing_summary.resource_limit == 0
         assert testing_summary.errors == 0
+        assert testing_summary.incomplete == 0
+        assert testing_summary.cached == 0
+        assert testing_summary.sampled_from == 0
+        assert testing_summary.estimated_rate is None
+        assert testing_summary.estimate_low is None
+        assert testing_summary.estimate_high is None
 
     def test_success_rate_trials(self):
         summary = TestingSummary(trials=9, found=6)
@@ -353,6 +473,14 @@ class TestTestingSummary:
         summary = TestingSummary(trials=9, found=6)
         assert summary.coverage_display == "66.6%"
 
+    def test_estimate_display(self):
+        summary = TestingSummary(trials=9, found=6, estimated_rate=0.7, estimate_low=0.65, estimate_high=0.75)
+        assert summary.estimate_display == "70% (65% - 75%)"
+
+    def test_estimate_display_not_sampled(self):
+        summary = TestingSummary(trials=9, found=6)
+        assert summary.estimate_display == ""
+
     def test_iadd(self):
         summary = TestingSummary(trials=10)
         expected = TestingSummary(trials=10)
@@ -370,6 +498,11 @@ class TestTestingSummary:
         expected.not_found += 1
         assert summary == expected
 
+        summary += MutantTrialResult(False, MutantTrialResult.RC_NOT_COVERED)
+        expected.tested += 1
+        expected.not_covered += 1
+        assert summary == expected
+
         summary += MutantTrialResult(False, MutantTrialResult.RC_TIMEOUT)
         expected.tested += 1
         expected.timeout += 1
@@ -380,6 +513,16 @@ class TestTestingSummary:
         expected.errors += 1
         assert summary == expected
 
+        summary += MutantTrialResult(False, MutantTrialResult.RC_INCOMPLETE)
+        expected.tested += 1
+        expected.incomplete += 1
+        assert summary == expected
+
+        summary += MutantTrialResult(False, MutantTrialResult.RC_RESOURCE_LIMIT)
+        expected.tested += 1
+        expected.resource_limit += 1
+        assert summary == expected
+
         summary += MutantTrialResult(True, MutantTrialResult.RC_FOUND)
         expected.tested += 1
         expected.found += 1
@@ -400,6 +543,14 @@ class TestTestingSummary:
         expected.errors += 1
         assert summary == expected
 
+    def test_iadd_orphans(self):
+        summary = TestingSummary()
+
+        summary += MutantTrialResult(True, MutantTrialResult.RC_FOUND, orphans=2)
+        summary += MutantTrialResult(False, MutantTrialResult.RC_TIMEOUT, orphans=1)
+
+        assert summary == TestingSummary(tested=2, found=1, timeout=1, orphans=3)
+
     def test_iadd_one_trial(self):
         summary = TestingSummary()
         summary = TestingSummary(trials=1)
@@ -428,8 +579,10 @@ class TestTestingSummary:
             tested=9,
             found=8,
             not_found=7,
+            not_covered=1,
             timeout=6,
             errors=5,
+            cached=4,
         )
 
     def summary_dict(self):
@@ -438,10 +591,20 @@ class TestTestingSummary:
             "tested": 9,
             "found": 8,
             "not_found": 7,
+            "not_covered": 1,
             "timeout": 6,
+            "resource_limit": 0,
             "errors": 5,
+            "incomplete": 0,
+            "cached": 4,
+            "orphans": 0,
+            "sampled_from": 0,
+            "estimated_rate": None,
+            "estimate_low": None,
+            "estimate_high": None,
             "success_rate": 0.8,
             "coverage_display": "80%",
+            "estimate_display": "",
         }
 
     def test_serialize(self):
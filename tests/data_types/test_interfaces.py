@@ -147,6 +147,54 @@ class TestMutator:
         ]
         assert Mutator.get_location(node) == (5, 8, 5, 12)
 
+    def test_get_location_extent(self):
+        node = ast.parse("x + 1", mode="eval").body
+        node.extent = (1, 2, 3, 4)
+        assert Mutator.get_location(node) == (1, 2, 3, 4)
+
+    @pytest.mark.parametrize(
+        ("other", "expected"),
+        [
+            ((4, 8, 5, 8), (4, 8, 5, 12)),  # lt lineno eq col
+            ((4, 9, 5, 8), (4, 8, 5, 12)),  # lt lineno gt col
+            ((4, 7, 5, 8), (4, 7, 5, 12)),  # lt lineno lt col
+            ((5, 1, 5, 8), (5, 1, 5, 12)),  # eq lineno lt col
+            ((5, 10, 5, 8), (5, 8, 5, 12)),  # eq lineno gt col
+            ((6, 1, 6, 8), (5, 8, 6, 8)),  # gt end_lineno lt end_col
+            ((6, 1, 6, 0), (5, 8, 6, 12)),  # gt end_lineno no end_col
+            ((5, 13, 5, 15), (5, 8, 5, 15)),  # eq end_lineno gt end_col
+            ((5, 13, 5, 11), (5, 8, 5, 12)),  # eq end_lineno lt end_col
+        ],
+    )
+    def test_merge_location(self, other, expected):
+        assert Mutator.merge_location((5, 8, 5, 12), other) == expected
+
+    def test_add_extent_attr(self):
+        module = "\n".join(  # noqa: FLY002
+            [
+                "@dec1",
+                "@dec2(x=lambda a=(1,",
+                "  2): a)",
+                "def example(y, z={'a': [1, 2]}):",
+                "    if y:",
+                "        return [i * 2 for i in y]",
+                "    return z['a'][0] + 1",
+            ],
+        )
+        parsed_ast = ast.parse(module)
+
+        Mutator.add_extent_attr(parsed_ast)
+
+        assert parsed_ast.body[0].extent == (1, 0, 7, 24)
+        assert not hasattr(parsed_ast, "extent")
+        assert not hasattr(parsed_ast.body[0].args, "extent")
+        for node in ast.walk(parsed_ast):
+            if hasattr(node, "lineno"):
+                extent = node.extent
+                del node.extent
+                assert Mutator.get_location(node) == extent
+                node.extent = extent
+
     def test_add_parent_attr(self):
         parsed_ast = ast.parse("x+1", mode="eval")
         Mutator.add_parent_attr(parsed_ast)
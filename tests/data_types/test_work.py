@@ -18,6 +18,8 @@ class TestPoodleWork:
         assert work.mutators == []
         assert work.runner() is None
         assert work.reporters == []
+        assert work.coverage == {}
+        assert work.clean_run_durations == {}
         assert work._echo_wrapper.echo_enabled is True
         assert work._echo_wrapper.echo_no_color is True
 
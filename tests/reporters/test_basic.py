@@ -145,6 +145,22 @@ class TestReportSummary:
             ]
         )
 
+    def test_resource_limit(self, mock_echo: mock.MagicMock):
+        results = TestingResults(
+            mutant_trials=[],
+            summary=TestingSummary(trials=9, found=3, resource_limit=2),
+        )
+        report_summary(mock_echo, results)
+
+        mock_echo.assert_has_calls(
+            [
+                mock.call(""),
+                mock.call("*** Results Summary ***", fg="green"),
+                mock.call("Testing found 33.3% of Mutants."),
+                mock.call(" - 2 mutant(s) caused trial to exceed a resource limit."),
+            ]
+        )
+
     def test_errors(self, mock_echo: mock.MagicMock):
         results = TestingResults(
             mutant_trials=[],
@@ -164,7 +180,18 @@ class TestReportSummary:
     def test_all(self, mock_echo: mock.MagicMock):
         results = TestingResults(
             mutant_trials=[],
-            summary=TestingSummary(trials=10, found=4, not_found=2, timeout=2, errors=2),
+            summary=TestingSummary(
+                trials=16,
+                found=4,
+                not_found=2,
+                not_covered=2,
+                timeout=2,
+                resource_limit=2,
+                errors=2,
+                incomplete=2,
+                cached=3,
+                orphans=5,
+            ),
         )
         report_summary(mock_echo, results)
 
@@ -172,10 +199,41 @@ class TestReportSummary:
             [
                 mock.call(""),
                 mock.call("*** Results Summary ***", fg="green"),
-                mock.call("Testing found 40.0% of Mutants."),
+                mock.call("Testing found 25.0% of Mutants."),
                 mock.call(" - 2 mutant(s) were not found."),
+                mock.call(" - 2 mutant(s) were not covered by any test."),
                 mock.call(" - 2 mutant(s) caused trial to timeout."),
+                mock.call(" - 2 mutant(s) caused trial to exceed a resource limit."),
                 mock.call(" - 2 mutant(s) could not be tested due to an error."),
+                mock.call(" - 2 mutant(s) were not tested, as the fail_under result was decided."),
+                mock.call(" - 3 result(s) were reused from the result cache."),
+                mock.call(" - 5 orphan process(es) left running by trials were killed."),
+            ]
+        )
+
+    def test_sample(self, mock_echo: mock.MagicMock):
+        results = TestingResults(
+            mutant_trials=[],
+            summary=TestingSummary(
+                trials=100,
+                found=70,
+                not_found=30,
+                sampled_from=1000,
+                estimated_rate=0.7,
+                estimate_low=0.65,
+                estimate_high=0.75,
+            ),
+        )
+        report_summary(mock_echo, results)
+
+        mock_echo.assert_has_calls(
+            [
+                mock.call("Testing found 70.0% of Mutants."),
+                mock.call(
+                    "Estimated mutation score of all 1000 mutants: 70% (65% - 75%) at 95% confidence,"
+                    " from a sample of 100."
+                ),
+                mock.call(" - 30 mutant(s) were not found."),
             ]
         )
 
@@ -193,6 +251,17 @@ class TestReportNotFound:
         report_not_found(config=PoodleConfigStub(), echo=mock_echo, testing_results=results)
         mock_echo.assert_not_called()
 
+    def test_incomplete(self, mock_echo: mock.MagicMock):
+        results = TestingResults(
+            mutant_trials=[
+                create_trial(passed=True),
+                create_trial(reason_code=MutantTrialResult.RC_INCOMPLETE),
+            ],
+            summary=TestingSummary(),
+        )
+        report_not_found(config=PoodleConfigStub(), echo=mock_echo, testing_results=results)
+        mock_echo.assert_not_called()
+
     @pytest.mark.parametrize(
         ("reporter_opts", "file"),
         [
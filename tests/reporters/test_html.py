@@ -368,7 +368,12 @@ class TestReportHtml:
         env.get_template.assert_has_calls(
             [
                 mock.call("html-report-index.html.jinja"),
-                mock.call().render(total=testing_results.summary, modules=modules, **common_vars),
+                mock.call().render(
+                    total=testing_results.summary,
+                    modules=modules,
+                    confidence_level="95%",
+                    **common_vars,
+                ),
                 mock.call().render().strip(),
                 mock.call("html-report-module.html.jinja"),
                 mock.call().render(source_file=source_file, module=module, **common_vars),
@@ -418,6 +423,29 @@ class TestReportHtml:
             assert page_str.startswith("<!DOCTYPE html>")
             assert page_str.endswith("</html>")
 
+    @pytest.mark.usefixtures("copy_static_files")
+    def test_report_html_estimate(self, mock_path: mock.MagicMock, testing_results):
+        config = PoodleConfigStub(project_name="Example Project", project_version="0.0.1", reporter_opts={"html": {}})
+        testing_results.summary.sampled_from = 1000
+        testing_results.summary.estimated_rate = 0.7
+        testing_results.summary.estimate_low = 0.65
+        testing_results.summary.estimate_high = 0.75
+
+        html.report_html(config, mock.MagicMock(), testing_results)
+
+        index_page = mock_path.return_value.__truediv__.return_value.write_text.call_args_list[0].args[0]
+        assert '<span class="label">Estimated Score:</span> 70% (65% - 75%) at 95% confidence' in index_page
+        assert f"from a sample of {testing_results.summary.trials} of 1000 mutants" in index_page
+
+    @pytest.mark.usefixtures("copy_static_files")
+    def test_report_html_no_estimate(self, mock_path: mock.MagicMock, testing_results):
+        config = PoodleConfigStub(project_name="Example Project", project_version="0.0.1", reporter_opts={"html": {}})
+
+        html.report_html(config, mock.MagicMock(), testing_results)
+
+        index_page = mock_path.return_value.__truediv__.return_value.write_text.call_args_list[0].args[0]
+        assert "Estimated Score" not in index_page
+
 
 class TestCopyStaticFiles:
     @pytest.fixture()
@@ -1,6 +1,10 @@
+import asyncio
 import os
+import signal
+import subprocess
+import sys
 from pathlib import Path
-from subprocess import CompletedProcess, TimeoutExpired
+from subprocess import TimeoutExpired
 from unittest import mock
 
 import pytest
@@ -11,9 +15,19 @@ from poodle.util import pprint_str
 
 
 @pytest.fixture()
-def subprocess_run():
-    with mock.patch("subprocess.run") as subprocess_run:
-        yield subprocess_run
+def subprocess_popen():
+    with (
+        mock.patch("subprocess.Popen") as subprocess_popen,
+        mock.patch("poodle.runners.command_line.reap_process_group", return_value=0),
+    ):
+        yield subprocess_popen
+
+
+def completed_process(returncode, stdout, stderr):
+    process = mock.MagicMock()
+    process.returncode = returncode
+    process.communicate.return_value = (stdout, stderr)
+    return process
 
 
 @pytest.fixture()
@@ -27,14 +41,9 @@ def test_logger():
 
 
 class TestCommandLineRunner:
-    def test_runner(self, subprocess_run, logger_mock):
+    def test_runner(self, subprocess_popen, logger_mock):
         with mock.patch.dict("os.environ", {"PYTHONPATH": "/project/src"}, clear=True):
-            subprocess_run.return_value = CompletedProcess(
-                args="",
-                returncode=1,
-                stdout=b"output",
-                stderr=b"error",
-            )
+            subprocess_popen.return_value = completed_process(1, b"output", b"error")
 
             config = mock.MagicMock()
             config.runner_opts = {
@@ -82,14 +91,15 @@ class TestCommandLineRunner:
                 "CUSTOM_FIELD": "VALUE1",
             }
 
-            subprocess_run.assert_called_with(
+            subprocess_popen.assert_called_with(
                 ["pytest", "-x", "--assert=plain", "-o", f"pythonpath={python_path}"],
                 cwd=Path.cwd().resolve(),
                 env=update_env,
-                capture_output=True,
-                check=False,
-                timeout=1,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
             )
+            subprocess_popen.return_value.communicate.assert_called_once_with(timeout=1)
 
             logger_mock.debug.assert_any_call("update_env=%s", pprint_str(update_env))
 
@@ -99,15 +109,168 @@ class TestCommandLineRunner:
             assert out.reason_code == out.RC_FOUND
             assert out.reason_desc is None
 
-    def test_runner_src_is_cwd(self, subprocess_run, logger_mock):
-        with mock.patch.dict("os.environ", {"PYTHONPATH": "/project/src"}, clear=True):
-            subprocess_run.return_value = CompletedProcess(
-                args="",
-                returncode=1,
-                stdout=b"output",
-                stderr=b"error",
+    @pytest.mark.parametrize(
+        ("environ", "expected"),
+        [
+            ({}, "poodle.import_hook"),
+            ({"PYTEST_PLUGINS": "my_plugin"}, "my_plugin,poodle.import_hook"),
+        ],
+    )
+    def test_runner_import_hook(self, subprocess_popen, environ, expected):
+        with mock.patch.dict("os.environ", environ, clear=True):
+            subprocess_popen.return_value = completed_process(0, b"", b"")
+
+            config = mock.MagicMock()
+            config.workspace = "import_hook"
+            config.runner_opts = {}
+
+            mutant = Mutant(
+                mutator_name="test",
+                source_folder=Path("src"),
+                source_file=Path("src/target.py"),
+                lineno=1,
+                col_offset=2,
+                end_lineno=3,
+                end_col_offset=4,
+                text="Changed Line",
+            )
+
+            command_line.runner(config=config, run_folder=Path.cwd(), mutant=mutant, timeout=1)
+
+            assert subprocess_popen.call_args.kwargs["env"]["PYTEST_PLUGINS"] == expected
+
+    def test_runner_schemata(self, subprocess_popen):
+        with mock.patch.dict("os.environ", {}, clear=True):
+            subprocess_popen.return_value = completed_process(0, b"", b"")
+
+            config = mock.MagicMock()
+            config.workspace = "schemata"
+            config.work_folder = Path(".poodle-temp")
+            config.runner_opts = {}
+
+            mutant = Mutant(
+                mutator_name="test",
+                source_folder=Path("src"),
+                source_file=Path("src/target.py"),
+                lineno=1,
+                col_offset=2,
+                end_lineno=3,
+                end_col_offset=4,
+                text="Changed Line",
+                schema_id=7,
+            )
+
+            command_line.runner(config=config, run_folder=Path.cwd(), mutant=mutant, timeout=1)
+
+            env = subprocess_popen.call_args.kwargs["env"]
+            assert env["PYTEST_PLUGINS"] == "poodle.import_hook"
+            assert env["POODLE_SCHEMATA"] == str(Path(".poodle-temp/schemata").resolve())
+            assert env["MUT_SCHEMA_ID"] == "7"
+
+    def test_runner_coverage(self, subprocess_popen):
+        with mock.patch.dict("os.environ", {}, clear=True):
+            subprocess_popen.return_value = completed_process(0, b"", b"")
+
+            config = mock.MagicMock()
+            config.workspace = "import_hook"
+            config.runner_opts = {"command_line": "pytest"}
+
+            mutant = Mutant(
+                mutator_name="",
+                source_folder=Path("src"),
+                source_file=None,
+                lineno=0,
+                col_offset=0,
+                end_lineno=0,
+                end_col_offset=0,
+                text="",
+            )
+
+            command_line.runner(
+                config=config,
+                run_folder=Path("run-1"),
+                mutant=mutant,
+                timeout=1,
+                coverage_file=Path("coverage-1.json"),
+            )
+
+            env = subprocess_popen.call_args.kwargs["env"]
+            assert env["PYTEST_PLUGINS"] == "poodle.import_hook,poodle.line_coverage"
+            assert env["POODLE_COVERAGE_FILE"] == str(Path("coverage-1.json").resolve())
+            assert env["POODLE_COVERAGE_ROOT"] == str(Path("run-1").resolve())
+            assert env["POODLE_COVERAGE_INCLUDE"] == str(Path("run-1").resolve() / "src")
+            assert subprocess_popen.call_args.args[0] == ["pytest"]
+
+    def test_runner_tests(self, subprocess_popen):
+        with mock.patch.dict("os.environ", {}, clear=True):
+            subprocess_popen.return_value = completed_process(0, b"", b"")
+
+            config = mock.MagicMock()
+            config.runner_opts = {"command_line": "pytest -x"}
+
+            mutant = Mutant(
+                mutator_name="test",
+                source_folder=Path("src"),
+                source_file=Path("src/target.py"),
+                lineno=1,
+                col_offset=2,
+                end_lineno=3,
+                end_col_offset=4,
+                text="Changed Line",
             )
 
+            command_line.runner(
+                config=config,
+                run_folder=Path("run-1"),
+                mutant=mutant,
+                timeout=1,
+                tests=["tests/test_a.py::test_1", "tests/test_b.py::test_2"],
+            )
+
+            assert subprocess_popen.call_args.args[0] == [
+                "pytest",
+                "-x",
+                "tests/test_a.py::test_1",
+                "tests/test_b.py::test_2",
+            ]
+            assert "PYTEST_PLUGINS" not in subprocess_popen.call_args.kwargs["env"]
+
+    def test_runner_tests_too_long(self, subprocess_popen, logger_mock):
+        with mock.patch.dict("os.environ", {}, clear=True):
+            subprocess_popen.return_value = completed_process(0, b"", b"")
+
+            config = mock.MagicMock()
+            config.runner_opts = {"command_line": "pytest -x"}
+
+            mutant = Mutant(
+                mutator_name="test",
+                source_folder=Path("src"),
+                source_file=Path("src/target.py"),
+                lineno=1,
+                col_offset=2,
+                end_lineno=3,
+                end_col_offset=4,
+                text="Changed Line",
+            )
+            tests = [f"tests/test_a.py::test_param[{i}]" for i in range(25000)]
+
+            command_line.runner(
+                config=config,
+                run_folder=Path("run-1"),
+                mutant=mutant,
+                timeout=1,
+                tests=tests,
+            )
+
+            assert subprocess_popen.call_args.args[0] == ["pytest", "-x"]
+            logger_mock.info.assert_any_call(
+                "Running all tests, %s covering tests exceed the command line length limit", 25000
+            )
+
+    def test_runner_src_is_cwd(self, subprocess_popen, logger_mock):
+        with mock.patch.dict("os.environ", {"PYTHONPATH": "/project/src"}, clear=True):
+            subprocess_popen.return_value = completed_process(1, b"output", b"error")
+
             config = mock.MagicMock()
             config.runner_opts = {
                 "command_line_env": {"CUSTOM_FIELD": "VALUE1"},
@@ -154,14 +317,15 @@ class TestCommandLineRunner:
                 "CUSTOM_FIELD": "VALUE1",
             }
 
-            subprocess_run.assert_called_with(
+            subprocess_popen.assert_called_with(
                 ["pytest", "-x", "--assert=plain", "-o", f"pythonpath={python_path}"],
                 cwd=Path("poodle-run-folder").resolve(),
                 env=update_env,
-                capture_output=True,
-                check=False,
-                timeout=1,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
             )
+            subprocess_popen.return_value.communicate.assert_called_once_with(timeout=1)
 
             logger_mock.debug.assert_any_call("update_env=%s", pprint_str(update_env))
 
@@ -171,14 +335,9 @@ class TestCommandLineRunner:
             assert out.reason_code == out.RC_FOUND
             assert out.reason_desc is None
 
-    def test_unset_path(self, subprocess_run):
+    def test_unset_path(self, subprocess_popen):
         with mock.patch.dict("os.environ", {}, clear=True):
-            subprocess_run.return_value = CompletedProcess(
-                args="",
-                returncode=1,
-                stdout=b"output",
-                stderr=b"error",
-            )
+            subprocess_popen.return_value = completed_process(1, b"output", b"error")
 
             config = mock.MagicMock()
             config.runner_opts = {"command_line": "pytest tests"}
@@ -209,7 +368,7 @@ class TestCommandLineRunner:
                 timeout=1,
             )
 
-            subprocess_run.assert_called_with(
+            subprocess_popen.assert_called_with(
                 ["pytest", "tests"],
                 cwd=Path.cwd().resolve(),
                 env={
@@ -222,23 +381,19 @@ class TestCommandLineRunner:
                     "MUT_END_COL_OFFSET": "4",
                     "MUT_TEXT": "Changed Line",
                 },
-                capture_output=True,
-                check=False,
-                timeout=1,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
             )
+            subprocess_popen.return_value.communicate.assert_called_once_with(timeout=1)
 
             assert out.found is True
             assert out.reason_code == out.RC_FOUND
             assert out.reason_desc is None
 
-    def test_rc_0(self, subprocess_run):
+    def test_rc_0(self, subprocess_popen):
         with mock.patch.dict("os.environ", {}, clear=True):
-            subprocess_run.return_value = CompletedProcess(
-                args="",
-                returncode=0,
-                stdout=b"output",
-                stderr=b"error",
-            )
+            subprocess_popen.return_value = completed_process(0, b"output", b"error")
 
             config = mock.MagicMock()
             config.runner_opts = {"command_line": "pytest tests"}
@@ -269,7 +424,7 @@ class TestCommandLineRunner:
                 timeout=1,
             )
 
-            subprocess_run.assert_called_with(
+            subprocess_popen.assert_called_with(
                 ["pytest", "tests"],
                 cwd=Path.cwd().resolve(),
                 env={
@@ -282,23 +437,19 @@ class TestCommandLineRunner:
                     "MUT_END_COL_OFFSET": "4",
                     "MUT_TEXT": "Changed Line",
                 },
-                capture_output=True,
-                check=False,
-                timeout=1,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
             )
+            subprocess_popen.return_value.communicate.assert_called_once_with(timeout=1)
 
             assert out.found is False
             assert out.reason_code == out.RC_NOT_FOUND
             assert out.reason_desc is None
 
-    def test_rc_2(self, subprocess_run):
+    def test_rc_2(self, subprocess_popen):
         with mock.patch.dict("os.environ", {}, clear=True):
-            subprocess_run.return_value = CompletedProcess(
-                args="",
-                returncode=2,
-                stdout=b"output",
-                stderr=b"error",
-            )
+            subprocess_popen.return_value = completed_process(2, b"output", b"error")
 
             config = mock.MagicMock()
             config.runner_opts = {"command_line": "pytest tests"}
@@ -329,7 +480,7 @@ class TestCommandLineRunner:
                 timeout=1,
             )
 
-            subprocess_run.assert_called_with(
+            subprocess_popen.assert_called_with(
                 ["pytest", "tests"],
                 cwd=Path.cwd().resolve(),
                 env={
@@ -342,18 +493,62 @@ class TestCommandLineRunner:
                     "MUT_END_COL_OFFSET": "4",
                     "MUT_TEXT": "Changed Line",
                 },
-                capture_output=True,
-                check=False,
-                timeout=1,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
             )
+            subprocess_popen.return_value.communicate.assert_called_once_with(timeout=1)
 
             assert out.found is True
             assert out.reason_code == out.RC_OTHER
             assert out.reason_desc == "output\nerror"
 
-    def test_timeout(self, subprocess_run):
+    def test_resource_limits(self, subprocess_popen):
+        subprocess_popen.return_value = completed_process(-signal.SIGXCPU, b"", b"")
+
+        config = mock.MagicMock()
+        config.runner_opts = {"command_line": "pytest tests", "command_line_limits": {"cpu_seconds": 10}}
+
+        mutant = Mutant(
+            mutator_name="test",
+            source_folder=Path("src"),
+            source_file=Path("target.py"),
+            lineno=1,
+            col_offset=2,
+            end_lineno=3,
+            end_col_offset=4,
+            text="Changed Line",
+        )
+
+        with mock.patch("poodle.runners.command_line.resource_limits") as resource_limits:
+            resource_limits.return_value = {"RLIMIT_CPU": (10, 11)}
+            out = command_line.runner(config=config, run_folder=Path("poodle-run-folder"), mutant=mutant, timeout=1)
+
+        resource_limits.assert_called_once_with(config)
+        assert subprocess_popen.call_args.args[0] == [
+            sys.executable,
+            "-c",
+            command_line.LIMITS_WRAPPER,
+            '{"RLIMIT_CPU": [10, 11]}',
+            "pytest",
+            "tests",
+        ]
+        assert "preexec_fn" not in subprocess_popen.call_args.kwargs
+
+        assert out == MutantTrialResult(
+            found=False,
+            reason_code=MutantTrialResult.RC_RESOURCE_LIMIT,
+            reason_desc="Trial exceeded CPU limit of 10 seconds",
+        )
+
+    def test_timeout(self, subprocess_popen):
         with mock.patch.dict("os.environ", {}, clear=True):
-            subprocess_run.side_effect = TimeoutExpired(cmd="pytest tests", timeout=10.0, output="running pytest")
+            process = subprocess_popen.return_value
+            process.returncode = None
+            process.communicate.side_effect = [
+                TimeoutExpired(cmd="pytest tests", timeout=10.0, output="running pytest"),
+                (b"", b""),
+            ]
 
             config = mock.MagicMock()
             config.runner_opts = {"command_line": "pytest tests"}
@@ -379,3 +574,354 @@ class TestCommandLineRunner:
             assert out.found is False
             assert out.reason_code == MutantTrialResult.RC_TIMEOUT
             assert out.reason_desc == "TimeoutExpired Command 'pytest tests' timed out after 10.0 seconds"
+            command_line.reap_process_group.assert_called_once_with(process, running=True)
+            assert process.communicate.call_args_list == [mock.call(timeout=10.0), mock.call()]
+
+    def test_orphans(self, subprocess_popen):
+        subprocess_popen.return_value = completed_process(0, b"", b"")
+        command_line.reap_process_group.return_value = 2
+
+        config = mock.MagicMock()
+        config.runner_opts = {"command_line": "pytest tests"}
+        mutant = Mutant(
+            mutator_name="test",
+            source_folder=Path("src"),
+            source_file=Path("target.py"),
+            lineno=1,
+            col_offset=2,
+            end_lineno=3,
+            end_col_offset=4,
+            text="Changed Line",
+        )
+
+        out = command_line.runner(config=config, run_folder=Path("poodle-run-folder"), mutant=mutant, timeout=1)
+
+        assert out == MutantTrialResult(found=False, reason_code=MutantTrialResult.RC_NOT_FOUND, orphans=2)
+        command_line.reap_process_group.assert_called_once_with(subprocess_popen.return_value, running=False)
+        subprocess_popen.return_value.communicate.assert_called_once_with(timeout=1)
+
+
+# starts a grandchild in the trial's process group, that keeps running after the command exits
+SPAWN_ORPHAN = (
+    "import subprocess, sys; "
+    "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'], "
+    "stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)"
+)
+
+
+def orphan_config(command):
+    config = mock.MagicMock()
+    config.workspace = "zip"
+    config.runner_opts = {"command_line": command, "command_line_limits": None}
+    return config
+
+
+orphan_mutant = Mutant(
+    mutator_name="test",
+    source_folder=Path("src"),
+    source_file=Path("src/target.py"),
+    lineno=1,
+    col_offset=2,
+    end_lineno=3,
+    end_col_offset=4,
+    text="Changed Line",
+)
+
+
+@pytest.mark.skipif(not Path("/proc/self/stat").is_file(), reason="Counting orphans requires /proc")
+class TestOrphans:
+    def test_runner(self):
+        config = orphan_config(f'{sys.executable} -c "{SPAWN_ORPHAN}"')
+        out = command_line.runner(config=config, run_folder=Path("run-1"), mutant=orphan_mutant, timeout=5)
+        assert out == MutantTrialResult(found=False, reason_code=MutantTrialResult.RC_NOT_FOUND, orphans=1)
+
+    def test_runner_timeout(self):
+        config = orphan_config(f'{sys.executable} -c "{SPAWN_ORPHAN}; import time; time.sleep(30)"')
+        out = command_line.runner(config=config, run_folder=Path("run-1"), mutant=orphan_mutant, timeout=0.5)
+        assert out.reason_code == MutantTrialResult.RC_TIMEOUT
+        assert out.orphans == 1
+
+    def test_async_runner(self):
+        config = orphan_config(f'{sys.executable} -c "{SPAWN_ORPHAN}"')
+        out = asyncio.run(
+            command_line.async_runner(config=config, run_folder=Path("run-1"), mutant=orphan_mutant, timeout=5)
+        )
+        assert out == MutantTrialResult(found=False, reason_code=MutantTrialResult.RC_NOT_FOUND, orphans=1)
+
+    def test_process_group_members(self):
+        assert os.getpid() in command_line.process_group_members(os.getpgid(0))
+
+
+class TestAsyncRunner:
+    def run(self, command, timeout=5, limits=None):
+        config = mock.MagicMock()
+        config.workspace = "zip"
+        config.runner_opts = {"command_line": command, "command_line_limits": limits}
+        mutant = Mutant(
+            mutator_name="test",
+            source_folder=Path("src"),
+            source_file=Path("src/target.py"),
+            lineno=1,
+            col_offset=2,
+            end_lineno=3,
+            end_col_offset=4,
+            text="Changed Line",
+        )
+        return command_line.async_runner(config=config, run_folder=Path("run-1"), mutant=mutant, timeout=timeout)
+
+    @pytest.mark.parametrize(
+        ("code", "expected"),
+        [
+            ("1", MutantTrialResult(found=True, reason_code=MutantTrialResult.RC_FOUND)),
+            ("0", MutantTrialResult(found=False, reason_code=MutantTrialResult.RC_NOT_FOUND)),
+        ],
+    )
+    def test_result(self, code, expected):
+        assert asyncio.run(self.run(f"{sys.executable} -c 'import sys; sys.exit({code})'")) == expected
+
+    def test_other(self):
+        out = asyncio.run(self.run(f"{sys.executable} -c 'import sys; print(\"out\"); sys.exit(3)'"))
+        assert out.found is True
+        assert out.reason_code == MutantTrialResult.RC_OTHER
+        assert out.reason_desc.splitlines()[0] == "out"
+
+    @pytest.mark.skipif(command_line.resource is None, reason="Resource limits require the resource module")
+    def test_cpu_limit(self):
+        out = asyncio.run(
+            self.run(f"{sys.executable} -c 'while True: pass'", limits={"cpu_seconds": 1}),
+        )
+        assert out == MutantTrialResult(
+            found=False,
+            reason_code=MutantTrialResult.RC_RESOURCE_LIMIT,
+            reason_desc="Trial exceeded CPU limit of 1 seconds",
+        )
+
+    @pytest.mark.skipif(command_line.resource is None, reason="Resource limits require the resource module")
+    def test_memory_limit(self):
+        out = asyncio.run(
+            self.run(f"{sys.executable} -c 'x = bytearray(1024**3)'", limits={"memory_mb": 512}),
+        )
+        # the uncaught MemoryError exits with 1, the same as failed tests
+        assert out == MutantTrialResult(
+            found=True,
+            reason_code=MutantTrialResult.RC_FOUND,
+            reason_desc="Tests failed, possibly because: Trial exceeded memory limit of 512 MB",
+        )
+
+    @mock.patch("poodle.runners.command_line.kill_process_group", wraps=command_line.kill_process_group)
+    def test_timeout(self, kill_process_group):
+        out = asyncio.run(self.run(f"{sys.executable} -c 'import time; time.sleep(30)'", timeout=0.5))
+        assert out == MutantTrialResult(
+            found=False,
+            reason_code=MutantTrialResult.RC_TIMEOUT,
+            reason_desc="Trial exceeded timeout of 0.5 seconds",
+        )
+        kill_process_group.assert_called_once()
+
+    @mock.patch("poodle.runners.command_line.kill_process_group", wraps=command_line.kill_process_group)
+    def test_cancel(self, kill_process_group):
+        async def cancel_trial():
+            task = asyncio.create_task(self.run(f"{sys.executable} -c 'import time; time.sleep(30)'", timeout=None))
+            await asyncio.sleep(0.5)
+            task.cancel()
+            await task
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(cancel_trial())
+        kill_process_group.assert_called_once()
+
+
+@mock.patch("poodle.runners.command_line.resource")
+class TestResourceLimits:
+    def test_limits(self, mock_resource):
+        mock_resource.getrlimit.return_value = (1024, mock_resource.RLIM_INFINITY)
+        config = mock.MagicMock()
+        config.runner_opts = {"command_line_limits": {"memory_mb": 512, "cpu_seconds": 60, "open_files": 256}}
+
+        assert command_line.resource_limits(config) == {
+            "RLIMIT_AS": (512 * 1024 * 1024, 512 * 1024 * 1024),
+            "RLIMIT_CPU": (60, 61),
+            "RLIMIT_NOFILE": (256, 256),
+        }
+
+    def test_capped_at_hard_limit(self, mock_resource):
+        mock_resource.getrlimit.return_value = (30, 60)
+        config = mock.MagicMock()
+        config.runner_opts = {"command_line_limits": {"cpu_seconds": 60}}
+
+        assert command_line.resource_limits(config) == {"RLIMIT_CPU": (60, 60)}
+        mock_resource.getrlimit.assert_called_once_with(mock_resource.RLIMIT_CPU)
+
+    @pytest.mark.parametrize("runner_opts", [{}, {"command_line_limits": {}}])
+    def test_no_limits(self, mock_resource, runner_opts):
+        config = mock.MagicMock()
+        config.runner_opts = runner_opts
+
+        assert command_line.resource_limits(config) == {}
+        mock_resource.getrlimit.assert_not_called()
+
+    def test_unsupported(self, mock_resource):
+        config = mock.MagicMock()
+        config.runner_opts = {"command_line_limits": {"cpu_seconds": 60}}
+
+        with (
+            mock.patch("poodle.runners.command_line.resource", None),
+            mock.patch("poodle.runners.command_line.logger") as logger_mock,
+        ):
+            assert command_line.resource_limits(config) == {}
+
+        logger_mock.warning.assert_called_once_with(
+            "Resource limits are not supported on this platform: %s", {"cpu_seconds": 60}
+        )
+        mock_resource.getrlimit.assert_not_called()
+
+
+class TestLimitsCommand:
+    def test_limits_command(self):
+        assert command_line.limits_command({}, ["pytest", "tests"]) == ["pytest", "tests"]
+        assert command_line.limits_command({"RLIMIT_CPU": (1, 2)}, ["pytest", "tests"]) == [
+            sys.executable,
+            "-c",
+            command_line.LIMITS_WRAPPER,
+            '{"RLIMIT_CPU": [1, 2]}',
+            "pytest",
+            "tests",
+        ]
+
+    @pytest.mark.skipif(command_line.resource is None, reason="requires resource module")
+    def test_limits_wrapper(self):
+        limits = {"RLIMIT_NOFILE": (64, 64)}
+        code = "import resource; print(resource.getrlimit(resource.RLIMIT_NOFILE))"
+        process = subprocess.run(  # noqa: S603
+            command_line.limits_command(limits, [sys.executable, "-c", code]),
+            capture_output=True,
+            check=False,
+        )
+        assert (process.returncode, process.stdout) == (0, b"(64, 64)\n")
+
+    @pytest.mark.skipif(command_line.resource is None, reason="requires resource module")
+    def test_limits_wrapper_not_found(self):
+        process = subprocess.run(  # noqa: S603
+            command_line.limits_command({"RLIMIT_NOFILE": (64, 64)}, ["poodle-command-not-found"]),
+            capture_output=True,
+            check=False,
+        )
+        assert process.returncode == 127
+        assert process.stderr.startswith(b"poodle-command-not-found: ")
+
+
+LIMITS = {"RLIMIT_AS": (1024 * 1024 * 100, 1024 * 1024 * 100), "RLIMIT_CPU": (5, 6), "RLIMIT_NOFILE": (64, 64)}
+
+
+class TestLimitExceeded:
+    @pytest.mark.parametrize(
+        ("returncode", "output", "expected"),
+        [
+            (-signal.SIGXCPU, b"", "Trial exceeded CPU limit of 5 seconds"),
+            (-signal.SIGKILL, b"", "Trial exceeded CPU limit of 5 seconds"),
+            (1, b"E   MemoryError", "Trial exceeded memory limit of 100 MB"),
+            (1, b"OSError: [Errno 24] Too many open files", "Trial exceeded open files limit of 64"),
+            (1, b"AssertionError", None),
+            (0, b"MemoryError", None),
+        ],
+    )
+    def test_limit_exceeded(self, returncode, output, expected):
+        assert command_line.limit_exceeded(LIMITS, returncode, output) == expected
+
+    @pytest.mark.parametrize("returncode", [-signal.SIGXCPU, 1])
+    def test_no_limits(self, returncode):
+        assert command_line.limit_exceeded({}, returncode, b"MemoryError Too many open files") is None
+
+    def test_trial_result(self):
+        assert command_line.trial_result(3, b"MemoryError", b"", LIMITS) == MutantTrialResult(
+            found=False,
+            reason_code=MutantTrialResult.RC_RESOURCE_LIMIT,
+            reason_desc="Trial exceeded memory limit of 100 MB",
+        )
+        assert command_line.trial_result(-signal.SIGXCPU, b"", b"", LIMITS) == MutantTrialResult(
+            found=False,
+            reason_code=MutantTrialResult.RC_RESOURCE_LIMIT,
+            reason_desc="Trial exceeded CPU limit of 5 seconds",
+        )
+
+    def test_trial_result_tests_failed(self):
+        assert command_line.trial_result(1, b"E   MemoryError", b"", LIMITS) == MutantTrialResult(
+            found=True,
+            reason_code=MutantTrialResult.RC_FOUND,
+            reason_desc="Tests failed, possibly because: Trial exceeded memory limit of 100 MB",
+        )
+        assert command_line.trial_result(1, b"MemoryError", b"") == MutantTrialResult(
+            found=True,
+            reason_code=MutantTrialResult.RC_FOUND,
+        )
+
+
+@mock.patch("poodle.runners.command_line.kill_process_group")
+@mock.patch("poodle.runners.command_line.os")
+@mock.patch("poodle.runners.command_line.process_group_members")
+class TestReapProcessGroup:
+    def test_running(self, process_group_members, mock_os, kill_process_group):
+        process_group_members.return_value = {1234, 1235, 1236}
+        assert command_line.reap_process_group(mock.MagicMock(pid=1234), running=True) == 2
+        kill_process_group.assert_called_once_with(1234)
+        mock_os.killpg.assert_not_called()
+
+    def test_exited(self, process_group_members, mock_os, kill_process_group):
+        process_group_members.return_value = {1235}
+        assert command_line.reap_process_group(mock.MagicMock(pid=1234), running=False) == 1
+        mock_os.killpg.assert_called_once_with(1234, signal.SIGKILL)
+        kill_process_group.assert_not_called()
+
+    def test_group_gone(self, process_group_members, mock_os, kill_process_group):
+        process_group_members.return_value = set()
+        mock_os.killpg.side_effect = ProcessLookupError
+        assert command_line.reap_process_group(mock.MagicMock(pid=1234), running=False) == 0
+        kill_process_group.assert_not_called()
+
+
+class TestNoProcessGroups:
+    @pytest.fixture(autouse=True)
+    def _no_killpg(self, monkeypatch):
+        monkeypatch.delattr(os, "killpg", raising=False)
+
+    def test_reap_running(self):
+        process = mock.MagicMock()
+        assert command_line.reap_process_group(process, running=True) == 0
+        process.kill.assert_called_once_with()
+
+    def test_reap_exited(self):
+        process = mock.MagicMock()
+        assert command_line.reap_process_group(process, running=False) == 0
+        process.kill.assert_not_called()
+
+    def test_runner(self):
+        config = orphan_config(f"{sys.executable} -c 'import sys; sys.exit(1)'")
+        out = command_line.runner(config=config, run_folder=Path("run-1"), mutant=orphan_mutant, timeout=5)
+        assert out == MutantTrialResult(found=True, reason_code=MutantTrialResult.RC_FOUND)
+
+    def test_runner_timeout(self):
+        config = orphan_config(f"{sys.executable} -c 'import time; time.sleep(30)'")
+        out = command_line.runner(config=config, run_folder=Path("run-1"), mutant=orphan_mutant, timeout=0.5)
+        assert out.reason_code == MutantTrialResult.RC_TIMEOUT
+        assert out.orphans == 0
+
+    def test_async_runner_timeout(self):
+        config = orphan_config(f"{sys.executable} -c 'import time; time.sleep(30)'")
+        out = asyncio.run(
+            command_line.async_runner(config=config, run_folder=Path("run-1"), mutant=orphan_mutant, timeout=0.5)
+        )
+        assert out.reason_code == MutantTrialResult.RC_TIMEOUT
+
+
+@mock.patch("poodle.runners.command_line.os")
+class TestKillProcessGroup:
+    def test_kill_group(self, mock_os):
+        command_line.kill_process_group(1234)
+        mock_os.killpg.assert_called_once_with(1234, signal.SIGKILL)
+        mock_os.kill.assert_not_called()
+
+    def test_group_gone(self, mock_os):
+        mock_os.killpg.side_effect = ProcessLookupError
+        mock_os.kill.side_effect = ProcessLookupError
+        command_line.kill_process_group(1234)
+        mock_os.kill.assert_called_once_with(1234, signal.SIGKILL)
@@ -0,0 +1,369 @@
+import io
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from poodle.data_types import MutantTrialResult
+from poodle.runners import pytest_forkserver
+from tests.data_types.test_data import PoodleConfigStub, create_mutant
+
+
+@pytest.fixture()
+def logger_mock():
+    with mock.patch("poodle.runners.pytest_forkserver.logger") as logger_mock:
+        yield logger_mock
+
+
+@pytest.fixture()
+def get_server():
+    with mock.patch("poodle.runners.pytest_forkserver.get_server") as get_server:
+        yield get_server
+
+
+@pytest.fixture(autouse=True)
+def _clear_servers():
+    pytest_forkserver.servers.clear()
+    yield
+    pytest_forkserver.servers.clear()
+
+
+def test_logger():
+    assert pytest_forkserver.logger.name == "poodle.runners.pytest_forkserver"
+
+
+class TestRunner:
+    @pytest.fixture(autouse=True)
+    def rebinds_module_values(self):
+        with mock.patch("poodle.runners.pytest_forkserver.rebinds_module_values", return_value=False) as rebinds:
+            yield rebinds
+
+    def run(self, get_server, response, tmp_path, mutant=None):
+        get_server.return_value.request.return_value = response
+        config = PoodleConfigStub(work_folder=tmp_path, runner_opts={})
+        mutant = mutant or create_mutant()
+        out = pytest_forkserver.runner(
+            config=config,
+            run_folder=Path("run-1"),
+            mutant=mutant,
+            timeout=5,
+            other="value",
+        )
+        get_server.assert_called_once_with(config, mutant.source_folder)
+        return out
+
+    def test_request(self, get_server, logger_mock, tmp_path):
+        mutant = create_mutant()
+        self.run(get_server, {"returncode": 0}, tmp_path, mutant)
+
+        get_server.return_value.request.assert_called_once_with(
+            {
+                "mutant": mutant.to_dict(),
+                "output_file": str(tmp_path / f"forkserver-{os.getpid()}.out"),
+                "timeout": 5,
+                "tests": None,
+            }
+        )
+        logger_mock.info.assert_any_call("Running: run_folder=%s timeout=%s", Path("run-1"), 5)
+
+    def test_request_clean_run(self, get_server, tmp_path):
+        self.run(get_server, {"returncode": 0}, tmp_path, create_mutant(source_file=None))
+        assert get_server.return_value.request.call_args.args[0]["mutant"]["source_file"] is None
+
+    def test_request_tests(self, get_server, tmp_path):
+        get_server.return_value.request.return_value = {"returncode": 0}
+        config = PoodleConfigStub(work_folder=tmp_path, runner_opts={})
+        pytest_forkserver.runner(
+            config=config,
+            run_folder=Path("run-1"),
+            mutant=create_mutant(),
+            timeout=5,
+            tests=["tests/test_a.py::test_1"],
+        )
+        assert get_server.return_value.request.call_args.args[0]["tests"] == ["tests/test_a.py::test_1"]
+
+    @mock.patch("poodle.runners.command_line.runner")
+    def test_coverage(self, command_line_runner, get_server, tmp_path):
+        config = PoodleConfigStub(
+            work_folder=tmp_path,
+            runner_opts={"pytest_forkserver": "-x tests", "pytest_forkserver_env": {"CUSTOM": "VALUE"}},
+        )
+        mutant = create_mutant(source_file=None)
+        out = pytest_forkserver.runner(
+            config=config,
+            run_folder=Path("run-1"),
+            mutant=mutant,
+            timeout=5,
+            coverage_file=tmp_path / "coverage-1.json",
+        )
+
+        assert out == command_line_runner.return_value
+        get_server.assert_not_called()
+        kwargs = command_line_runner.call_args.kwargs
+        assert kwargs["config"].runner_opts["command_line"] == f"{sys.executable} -m pytest -x tests"
+        assert kwargs["config"].runner_opts["command_line_env"] == {"CUSTOM": "VALUE"}
+        assert kwargs["run_folder"] == Path("run-1")
+        assert kwargs["mutant"] == mutant
+        assert kwargs["timeout"] == 5
+        assert kwargs["coverage_file"] == tmp_path / "coverage-1.json"
+
+    @mock.patch("poodle.runners.command_line.runner")
+    def test_rebinds_module_values(self, command_line_runner, get_server, rebinds_module_values, tmp_path):
+        rebinds_module_values.return_value = True
+        config = PoodleConfigStub(work_folder=tmp_path, runner_opts={"pytest_forkserver": "-x tests"})
+        mutant = create_mutant()
+        out = pytest_forkserver.runner(
+            config=config,
+            run_folder=Path("run-1"),
+            mutant=mutant,
+            timeout=5,
+            tests=["tests/test_a.py::test_1"],
+        )
+
+        assert out == command_line_runner.return_value
+        rebinds_module_values.assert_called_once_with(mutant)
+        get_server.assert_not_called()
+        kwargs = command_line_runner.call_args.kwargs
+        assert kwargs["config"].runner_opts["command_line"] == f"{sys.executable} -m pytest -x tests"
+        assert kwargs["mutant"] == mutant
+        assert kwargs["timeout"] == 5
+        assert kwargs["tests"] == ["tests/test_a.py::test_1"]
+        assert kwargs["coverage_file"] is None
+
+    def test_found(self, get_server, tmp_path):
+        out = self.run(get_server, {"returncode": 1}, tmp_path)
+        assert out == MutantTrialResult(found=True, reason_code=MutantTrialResult.RC_FOUND)
+
+    def test_not_found(self, get_server, tmp_path):
+        out = self.run(get_server, {"returncode": 0}, tmp_path)
+        assert out == MutantTrialResult(found=False, reason_code=MutantTrialResult.RC_NOT_FOUND)
+
+    def test_timeout(self, get_server, tmp_path):
+        out = self.run(get_server, {"returncode": None}, tmp_path)
+        assert out == MutantTrialResult(
+            found=False,
+            reason_code=MutantTrialResult.RC_TIMEOUT,
+            reason_desc="Trial exceeded timeout of 5 seconds",
+        )
+
+    def test_other(self, get_server, tmp_path):
+        (tmp_path / f"forkserver-{os.getpid()}.out").write_text("Traceback")
+        out = self.run(get_server, {"returncode": 3}, tmp_path)
+        assert out == MutantTrialResult(
+            found=True,
+            reason_code=MutantTrialResult.RC_OTHER,
+            reason_desc="Trial ended with returncode 3\nTraceback",
+        )
+
+    @mock.patch("poodle.runners.pytest_forkserver.stop_server")
+    def test_server_error(self, stop_server, get_server, tmp_path):
+        out = self.run(get_server, {"error": "Server Failed"}, tmp_path)
+        assert out == MutantTrialResult(
+            found=True,
+            reason_code=MutantTrialResult.RC_OTHER,
+            reason_desc="Server Failed",
+        )
+        stop_server.assert_called_once()
+
+
+TARGET_SOURCE = """\
+import functools
+
+LIMIT = 10
+
+
+@functools.lru_cache(maxsize=16)
+def calc(value=1):
+    return min(value, LIMIT)
+
+
+class Calc(Base, metaclass=Meta):
+    scale = 2
+
+    def run(self):
+        return self.scale * 2
+"""
+
+
+class TestRebindsModuleValues:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        pytest_forkserver.parse_source.cache_clear()
+        yield
+        pytest_forkserver.parse_source.cache_clear()
+
+    @pytest.fixture()
+    def source_file(self, tmp_path):
+        source_file = tmp_path / "target.py"
+        source_file.write_text(TARGET_SOURCE)
+        return source_file
+
+    def mutant(self, source_file, lineno, col_offset, end_lineno, end_col_offset):
+        return create_mutant(
+            source_file,
+            lineno=lineno,
+            col_offset=col_offset,
+            end_lineno=end_lineno,
+            end_col_offset=end_col_offset,
+            source_folder=source_file.parent,
+        )
+
+    @pytest.mark.parametrize(
+        ("location", "expected"),
+        [
+            pytest.param((3, 8, 3, 10), True, id="module_constant"),
+            pytest.param((6, 29, 6, 31), True, id="decorator"),
+            pytest.param((7, 15, 7, 16), False, id="function_default"),
+            pytest.param((8, 11, 8, 29), False, id="function_body"),
+            pytest.param((11, 11, 11, 15), True, id="class_base"),
+            pytest.param((11, 27, 11, 31), True, id="class_keyword"),
+            pytest.param((12, 12, 12, 13), False, id="class_attribute"),
+            pytest.param((15, 15, 15, 29), False, id="method_body"),
+        ],
+    )
+    def test_location(self, source_file, location, expected):
+        assert pytest_forkserver.rebinds_module_values(self.mutant(source_file, *location)) is expected
+
+    def test_no_source_file(self):
+        assert pytest_forkserver.rebinds_module_values(create_mutant(source_file=None)) is False
+
+    def test_parse_error(self, logger_mock, tmp_path):
+        source_file = tmp_path / "target.py"
+        source_file.write_text("def (")
+        assert pytest_forkserver.rebinds_module_values(self.mutant(source_file, 1, 0, 1, 1)) is False
+        logger_mock.exception.assert_called_once_with("Unable to parse %s", source_file)
+
+    def test_parse_cached(self, source_file):
+        pytest_forkserver.rebinds_module_values(self.mutant(source_file, 3, 8, 3, 10))
+        source_file.write_text("")
+        assert pytest_forkserver.rebinds_module_values(self.mutant(source_file, 3, 8, 3, 10)) is True
+
+
+class TestReadOutput:
+    def test_no_file(self, tmp_path):
+        assert pytest_forkserver.read_output(tmp_path / "missing.out", -9) == "Trial ended with returncode -9"
+
+    def test_file(self, tmp_path):
+        (tmp_path / "trial.out").write_text("output")
+        assert pytest_forkserver.read_output(tmp_path / "trial.out", 2) == "Trial ended with returncode 2\noutput"
+
+
+@pytest.fixture()
+def fork_server():
+    with mock.patch("poodle.runners.pytest_forkserver.ForkServer") as fork_server:
+        yield fork_server
+
+
+class TestServers:
+    @mock.patch("poodle.runners.pytest_forkserver.atexit")
+    def test_get_server(self, atexit, fork_server):
+        config = PoodleConfigStub()
+        server = pytest_forkserver.get_server(config, Path("src"))
+        assert server == fork_server.return_value
+        assert pytest_forkserver.get_server(config, Path("src")) == server
+        fork_server.assert_called_once_with(config, Path("src"))
+        atexit.register.assert_called_once_with(pytest_forkserver.stop_all_servers)
+
+    def test_get_server_per_process(self, fork_server):
+        pytest_forkserver.servers[(-1, Path("src"))] = mock.MagicMock()
+        config = PoodleConfigStub()
+        assert pytest_forkserver.get_server(config, Path("src")) == fork_server.return_value
+
+    @pytest.mark.usefixtures("fork_server")
+    def test_stop_server(self):
+        server = mock.MagicMock()
+        pytest_forkserver.servers[(os.getpid(), Path("src"))] = server
+        pytest_forkserver.stop_server(Path("src"))
+        server.stop.assert_called_once_with()
+        assert pytest_forkserver.servers == {}
+
+    @pytest.mark.usefixtures("fork_server")
+    def test_stop_all_servers(self):
+        server1 = mock.MagicMock()
+        server2 = mock.MagicMock()
+        pytest_forkserver.servers[(os.getpid(), Path("src"))] = server1
+        pytest_forkserver.servers[(-1, Path("src"))] = server2
+        pytest_forkserver.stop_all_servers()
+        server1.stop.assert_called_once_with()
+        server2.stop.assert_not_called()
+        assert list(pytest_forkserver.servers) == [(-1, Path("src"))]
+
+
+@mock.patch("poodle.runners.pytest_forkserver.subprocess.Popen")
+class TestForkServer:
+    def create_server(self, popen, tmp_path, stdout='{"ready": 5}\n', runner_opts=None):
+        popen.return_value.stdout = io.StringIO(stdout)
+        popen.return_value.stdin = io.StringIO()
+        config = PoodleConfigStub(work_folder=tmp_path / "work", runner_opts=runner_opts or {})
+        with mock.patch.dict("os.environ", {"PYTHONPATH": "/project/src"}, clear=True):
+            return pytest_forkserver.ForkServer(config, Path("src"))
+
+    def test_start(self, popen, tmp_path):
+        server = self.create_server(popen, tmp_path, runner_opts={"pytest_forkserver_env": {"CUSTOM": "VALUE"}})
+
+        python_path = os.pathsep.join([str(Path("src").resolve()), str(Path.cwd().resolve()), "/project/src"])
+        popen.assert_called_once_with(
+            [
+                sys.executable,
+                "-m",
+                "poodle.runners.pytest_forkserver_plugin",
+                "-x",
+                "--assert=plain",
+                "-o",
+                f"pythonpath={python_path}",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=mock.ANY,
+            env={"PYTHONPATH": python_path, "CUSTOM": "VALUE"},
+            text=True,
+        )
+        assert server.status == {"ready": 5}
+        assert server.log_file == tmp_path / "work" / f"forkserver-{os.getpid()}-src.log"
+        assert server.log_file.is_file()
+
+    def test_start_schemata(self, popen, tmp_path):
+        popen.return_value.stdout = io.StringIO('{"ready": 5}\n')
+        config = PoodleConfigStub(work_folder=tmp_path, workspace="schemata", runner_opts={})
+        with mock.patch.dict("os.environ", {"PYTEST_PLUGINS": "my_plugin"}, clear=True):
+            pytest_forkserver.ForkServer(config, Path("src"))
+
+        env = popen.call_args.kwargs["env"]
+        assert env["PYTEST_PLUGINS"] == "my_plugin,poodle.import_hook"
+        assert env["POODLE_SCHEMATA"] == str((tmp_path / "schemata").resolve())
+
+    def test_start_pytest_args(self, popen, tmp_path):
+        self.create_server(popen, tmp_path, runner_opts={"pytest_forkserver": "-x tests"})
+        assert popen.call_args.args[0][3:] == ["-x", "tests"]
+
+    def test_request(self, popen, tmp_path):
+        server = self.create_server(popen, tmp_path, stdout='{"ready": 5}\n{"returncode": 1}\n')
+        assert server.request({"timeout": 1}) == {"returncode": 1}
+        assert server.process.stdin.getvalue() == json.dumps({"timeout": 1}) + "\n"
+
+    def test_request_not_ready(self, popen, tmp_path):
+        server = self.create_server(popen, tmp_path, stdout='{"error": "1 error(s) during collection"}\n')
+        assert server.request({"timeout": 1}) == {"error": "1 error(s) during collection"}
+        assert server.process.stdin.getvalue() == ""
+
+    def test_server_exited(self, popen, tmp_path):
+        popen.return_value.wait.return_value = 4
+        server = self.create_server(popen, tmp_path, stdout="")
+        assert server.status == {"error": f"Fork Server exited with returncode 4.  See log: {server.log_file}"}
+
+    def test_stop(self, popen, tmp_path):
+        server = self.create_server(popen, tmp_path)
+        server.stop()
+        assert server.process.stdin.closed
+        server.process.wait.assert_called_once_with(timeout=10)
+        server.process.kill.assert_not_called()
+
+    def test_stop_kill(self, popen, tmp_path):
+        server = self.create_server(popen, tmp_path)
+        server.process.wait.side_effect = subprocess.TimeoutExpired("cmd", 10)
+        server.stop()
+        server.process.kill.assert_called_once_with()
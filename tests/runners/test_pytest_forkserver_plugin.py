@@ -0,0 +1,274 @@
+import io
+import os
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from poodle.data_types import Mutant
+from poodle.runners import pytest_forkserver_plugin
+
+
+@pytest.fixture()
+def session():
+    session = mock.MagicMock(testsfailed=0, shouldfail=False, shouldstop=False)
+    session.items = [mock.MagicMock(name="item1"), mock.MagicMock(name="item2")]
+    return session
+
+
+class TestForkServerPlugin:
+    @mock.patch("poodle.runners.pytest_forkserver_plugin.run_trial")
+    def test_runtestloop(self, run_trial, session):
+        run_trial.side_effect = [1, None]
+        requests = io.StringIO('{"timeout": 1}\n{"timeout": 2}\n')
+        responses = io.StringIO()
+        plugin = pytest_forkserver_plugin.ForkServerPlugin(requests, responses)
+
+        assert plugin.pytest_runtestloop(session) is True
+
+        assert responses.getvalue().splitlines() == [
+            '{"ready": 2}',
+            '{"returncode": 1}',
+            '{"returncode": null}',
+        ]
+        run_trial.assert_has_calls([mock.call(session, {"timeout": 1}), mock.call(session, {"timeout": 2})])
+
+    @mock.patch("poodle.runners.pytest_forkserver_plugin.run_trial")
+    def test_runtestloop_collection_error(self, run_trial, session):
+        session.testsfailed = 2
+        responses = io.StringIO()
+        plugin = pytest_forkserver_plugin.ForkServerPlugin(io.StringIO('{"timeout": 1}\n'), responses)
+
+        assert plugin.pytest_runtestloop(session) is True
+
+        assert responses.getvalue() == '{"error": "2 error(s) during collection"}\n'
+        run_trial.assert_not_called()
+
+
+@mock.patch("poodle.runners.pytest_forkserver_plugin.wait_for_child")
+@mock.patch("poodle.runners.pytest_forkserver_plugin.os.fork")
+def test_run_trial_parent(fork, wait_for_child, session):
+    fork.return_value = 1234
+    assert pytest_forkserver_plugin.run_trial(session, {"timeout": 5}) == wait_for_child.return_value
+    wait_for_child.assert_called_once_with(1234, 5)
+
+
+@mock.patch("poodle.runners.pytest_forkserver_plugin.os")
+class TestWaitForChild:
+    def test_exit(self, mock_os):
+        mock_os.waitpid.return_value = (1234, 256)
+        mock_os.waitstatus_to_exitcode.return_value = 1
+        assert pytest_forkserver_plugin.wait_for_child(1234, None) == 1
+        mock_os.waitpid.assert_called_once_with(1234, 0)
+
+    @mock.patch("poodle.runners.pytest_forkserver_plugin.time")
+    def test_timeout(self, mock_time, mock_os):
+        mock_time.monotonic.side_effect = [0, 1, 6]
+        mock_os.waitpid.return_value = (0, 0)
+        assert pytest_forkserver_plugin.wait_for_child(1234, 5) is None
+        mock_os.waitpid.assert_has_calls([mock.call(1234, mock_os.WNOHANG), mock.call(1234, 0)])
+        mock_os.killpg.assert_called_once()
+
+
+class TestApplyMutation:
+    def test_env(self):
+        mutant = {
+            "source_folder": "src",
+            "source_file": None,
+            "lineno": 1,
+            "end_lineno": 2,
+            "col_offset": 3,
+            "end_col_offset": 4,
+            "text": "None",
+        }
+        with mock.patch.dict("os.environ", {}, clear=True):
+            pytest_forkserver_plugin.apply_mutation({"mutant": mutant})
+            assert dict(os.environ) == {
+                "MUT_SOURCE_FILE": "None",
+                "MUT_LINENO": "1",
+                "MUT_END_LINENO": "2",
+                "MUT_COL_OFFSET": "3",
+                "MUT_END_COL_OFFSET": "4",
+                "MUT_TEXT": "None",
+            }
+
+    @mock.patch("poodle.runners.pytest_forkserver_plugin.patch_module")
+    @mock.patch("poodle.runners.pytest_forkserver_plugin.find_module")
+    def test_patch(self, find_module, patch_module, tmp_path):
+        (tmp_path / "target.py").write_text("x = 1\n")
+        mutant = Mutant(
+            mutator_name="test",
+            source_folder=tmp_path,
+            source_file=tmp_path / "target.py",
+            lineno=1,
+            col_offset=4,
+            end_lineno=1,
+            end_col_offset=5,
+            text="2",
+        ).to_dict()
+        with mock.patch.dict("os.environ", {}, clear=True):
+            pytest_forkserver_plugin.apply_mutation({"mutant": mutant})
+        find_module.assert_called_once_with(tmp_path, tmp_path / "target.py")
+        patch_module.assert_called_once_with(find_module.return_value, "x = 2\n")
+
+    @mock.patch("poodle.runners.pytest_forkserver_plugin.patch_module")
+    @mock.patch("poodle.runners.pytest_forkserver_plugin.find_module")
+    def test_schema(self, find_module, patch_module):
+        find_module.return_value = types.ModuleType("target")
+        find_module.return_value.__poodle_mutant__ = 0
+        mutant = dict.fromkeys(["lineno", "end_lineno", "col_offset", "end_col_offset", "text"], 0)
+        mutant.update(source_folder="src", source_file="src/target.py", schema_id=4)
+        with mock.patch.dict("os.environ", {}, clear=True):
+            pytest_forkserver_plugin.apply_mutation({"mutant": mutant})
+        assert find_module.return_value.__poodle_mutant__ == 4
+        patch_module.assert_not_called()
+
+
+class TestFindModule:
+    def test_loaded(self):
+        source_file = Path(pytest_forkserver_plugin.__file__)
+        assert pytest_forkserver_plugin.find_module(source_file.parent, source_file) is pytest_forkserver_plugin
+
+    def test_import(self, tmp_path):
+        package = tmp_path / "fs_test_package"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "fs_test_module.py").write_text("value = 1\n")
+        sys.path.insert(0, str(tmp_path))
+        try:
+            module = pytest_forkserver_plugin.find_module(tmp_path, package / "fs_test_module.py")
+            assert module.__name__ == "fs_test_package.fs_test_module"
+            assert pytest_forkserver_plugin.find_module(tmp_path, package / "__init__.py").__name__ == "fs_test_package"
+        finally:
+            sys.path.remove(str(tmp_path))
+            sys.modules.pop("fs_test_package.fs_test_module", None)
+            sys.modules.pop("fs_test_package", None)
+
+
+ORIGINAL_SOURCE = """
+import functools
+
+def decorate(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    return wrapper
+
+VALUE = 1
+
+def add(a, b=1):
+    return a + b
+
+class Calc:
+    @staticmethod
+    def mul(a, b):
+        return a * b
+
+    @decorate
+    def four(self):
+        return 4
+
+class Child(Calc):
+    def four(self):
+        return super().four()
+"""
+
+
+class TestPatchModule:
+    @pytest.fixture()
+    def module(self):
+        module = types.ModuleType("fs_patch_test")
+        module.__file__ = "fs_patch_test.py"
+        exec(compile(ORIGINAL_SOURCE, module.__file__, "exec"), vars(module))  # noqa: S102
+        return module
+
+    def test_function(self, module):
+        add = module.add
+        pytest_forkserver_plugin.patch_module(module, ORIGINAL_SOURCE.replace("a + b", "a - b"))
+        assert module.add is add
+        assert add(5) == 4
+
+    def test_defaults(self, module):
+        add = module.add
+        pytest_forkserver_plugin.patch_module(module, ORIGINAL_SOURCE.replace("b=1", "b=2"))
+        assert add(5) == 7
+
+    def test_value(self, module):
+        pytest_forkserver_plugin.patch_module(module, ORIGINAL_SOURCE.replace("VALUE = 1", "VALUE = 2"))
+        assert module.VALUE == 2
+
+    def test_class(self, module):
+        calc = module.Calc
+        child = module.Child()
+        pytest_forkserver_plugin.patch_module(module, ORIGINAL_SOURCE.replace("a * b", "a / b"))
+        assert module.Calc is calc
+        assert calc.mul(6, 3) == 2
+        assert child.four() == 4
+
+    def test_decorated_method(self, module):
+        instance = module.Calc()
+        pytest_forkserver_plugin.patch_module(module, ORIGINAL_SOURCE.replace("return 4", "return 5"))
+        assert instance.four() == 5
+        assert module.Child().four() == 5
+
+    def test_removed_decorator(self, module):
+        instance = module.Calc()
+        pytest_forkserver_plugin.patch_module(module, ORIGINAL_SOURCE.replace("    @decorate\n", ""))
+        assert instance.four() == 4
+
+
+class TestTransplant:
+    def test_not_same_type(self):
+        assert pytest_forkserver_plugin.transplant(1, 2) is False
+
+    def test_closure_mismatch(self):
+        value = 1
+
+        def with_closure():
+            return value
+
+        def without_closure():
+            return 2
+
+        assert pytest_forkserver_plugin.transplant(without_closure, with_closure) is False
+
+
+class TestRunTests:
+    def test_pass(self, session):
+        assert pytest_forkserver_plugin.run_tests(session) == 0
+        item1, item2 = session.items
+        item1.config.hook.pytest_runtest_protocol.assert_called_once_with(item=item1, nextitem=item2)
+        item2.config.hook.pytest_runtest_protocol.assert_called_once_with(item=item2, nextitem=None)
+
+    def test_selected_tests(self, session):
+        item1, item2 = session.items
+        item1.nodeid = "tests/test_a.py::test_1"
+        item2.nodeid = "tests/test_a.py::test_2"
+        assert pytest_forkserver_plugin.run_tests(session, ["tests/test_a.py::test_2"]) == 0
+        item1.config.hook.pytest_runtest_protocol.assert_not_called()
+        item2.config.hook.pytest_runtest_protocol.assert_called_once_with(item=item2, nextitem=None)
+
+    def test_fail_stop(self, session):
+        def fail(*_, **__):
+            session.testsfailed = 1
+            session.shouldfail = "stopping after 1 failures"
+
+        item1, item2 = session.items
+        item1.config.hook.pytest_runtest_protocol.side_effect = fail
+
+        assert pytest_forkserver_plugin.run_tests(session) == 1
+        item2.config.hook.pytest_runtest_protocol.assert_not_called()
+
+
+@mock.patch("poodle.runners.pytest_forkserver_plugin.pytest.main")
+@mock.patch("poodle.runners.pytest_forkserver_plugin.os")
+def test_main(mock_os, pytest_main):
+    with mock.patch.object(sys, "stdin"), mock.patch.object(sys, "stdout"), mock.patch.object(sys, "stderr"):
+        assert pytest_forkserver_plugin.main(["-x"]) == pytest_main.return_value
+        mock_os.dup2.assert_called_once_with(sys.stderr.fileno(), sys.stdout.fileno())
+    plugin = pytest_main.call_args.kwargs["plugins"][0]
+    assert isinstance(plugin, pytest_forkserver_plugin.ForkServerPlugin)
+    assert plugin.requests == mock_os.fdopen.return_value
+    assert plugin.responses == mock_os.fdopen.return_value
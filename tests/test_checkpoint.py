@@ -0,0 +1,122 @@
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from poodle import checkpoint
+from poodle.data_types import Mutant, MutantTrial, MutantTrialResult
+from poodle.util import to_json
+from tests.data_types.test_data import PoodleConfigStub
+
+
+def create_trial(lineno, found=True):
+    return MutantTrial(
+        mutant=Mutant(
+            mutator_name="Test",
+            source_folder=Path("src"),
+            source_file=Path("src/example.py"),
+            lineno=lineno,
+            col_offset=0,
+            end_lineno=lineno,
+            end_col_offset=1,
+            text="x",
+        ),
+        result=MutantTrialResult(
+            found=found,
+            reason_code=MutantTrialResult.RC_FOUND if found else MutantTrialResult.RC_NOT_FOUND,
+        ),
+        duration=1.5,
+    )
+
+
+@pytest.fixture()
+def config(tmp_path):
+    return PoodleConfigStub(work_folder=tmp_path / ".poodle-temp")
+
+
+def test_logger():
+    assert checkpoint.logger.name == "poodle.checkpoint"
+
+
+class TestCheckpoint:
+    def test_init(self, config):
+        cp = checkpoint.Checkpoint(config)
+        assert cp.file == config.work_folder / "checkpoint.jsonl"
+        assert cp.trials == {}
+        assert cp.out is None
+
+    def test_write_load(self, config):
+        trials = [create_trial(1), create_trial(2, found=False)]
+        cp = checkpoint.Checkpoint(config)
+        cp.open()
+        for trial in trials:
+            cp.write(trial)
+        cp.close()
+
+        loaded = checkpoint.Checkpoint(config)
+        loaded.load()
+        assert loaded.trials == {trial.mutant.mutant_id: trial for trial in trials}
+
+    def test_load_no_file(self, config):
+        cp = checkpoint.Checkpoint(config)
+        cp.load()
+        assert cp.trials == {}
+
+    def test_load_invalid_line(self, config):
+        config.work_folder.mkdir()
+        trial = create_trial(1)
+        (config.work_folder / "checkpoint.jsonl").write_text(to_json(trial) + '\n{"mutant": {"mutator_na')
+
+        cp = checkpoint.Checkpoint(config)
+        with mock.patch("poodle.checkpoint.logger") as logger:
+            cp.load()
+
+        assert cp.trials == {trial.mutant.mutant_id: trial}
+        logger.warning.assert_called_once_with("Skipping invalid line %s in checkpoint file %s", 2, cp.file)
+
+    def test_open_keeps_loaded(self, config):
+        trial = create_trial(1)
+        cp = checkpoint.Checkpoint(config)
+        cp.trials = {trial.mutant.mutant_id: trial}
+        cp.open()
+        cp.close()
+
+        assert cp.file.read_text() == to_json(trial) + "\n"
+
+    @mock.patch("poodle.checkpoint.os.fsync")
+    def test_write_sync_batch(self, fsync, config, monkeypatch):
+        monkeypatch.setattr(checkpoint, "sync_batch_size", 2)
+        monkeypatch.setattr(checkpoint, "sync_interval", 1000)
+        cp = checkpoint.Checkpoint(config)
+        cp.open()
+        assert fsync.call_count == 1
+
+        cp.write(create_trial(1))
+        assert fsync.call_count == 1
+        assert cp.unsynced == 1
+        assert cp.file.read_text() == to_json(create_trial(1)) + "\n", "written lines are flushed"
+
+        cp.write(create_trial(2))
+        assert fsync.call_count == 2
+        assert cp.unsynced == 0
+        cp.close()
+
+    @mock.patch("poodle.checkpoint.os.fsync")
+    @mock.patch("poodle.checkpoint.time")
+    def test_write_sync_interval(self, mock_time, fsync, config):
+        mock_time.monotonic.side_effect = [0.0, 0.0, 1.0, 2.5, 2.5, 3.0]
+        cp = checkpoint.Checkpoint(config)
+        cp.open()
+
+        cp.write(create_trial(1))
+        assert fsync.call_count == 1
+        cp.write(create_trial(2))
+        assert fsync.call_count == 2
+        cp.close()
+
+    def test_write_not_open(self, config):
+        cp = checkpoint.Checkpoint(config)
+        cp.write(create_trial(1))
+        cp.sync()
+        cp.close()
+        assert not cp.file.exists()
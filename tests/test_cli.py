@@ -48,11 +48,10 @@ class TestCliHelp:
         build_config.assert_not_called()
         main_process.assert_not_called()
 
-    def test_cli_help_max_content_width(self, runner: CliRunner):
-        with mock.patch("poodle.cli.click.command") as command:
-            importlib.reload(cli)
-            runner.invoke(cli.main, ["--help"])
-        command.assert_called_with(context_settings={"max_content_width": 120})
+    def test_cli_help_max_content_width(self):
+        assert cli.cli.context_settings == {"max_content_width": 120}
+        assert cli.main.context_settings == {"max_content_width": 120}
+        assert cli.merge.context_settings == {"max_content_width": 120}
 
     def test_cli_help_config_file(self, runner: CliRunner):
         result = runner.invoke(cli.main, ["--help"])
@@ -153,6 +152,62 @@ class TestCliHelp:
             is not None
         )
 
+    def test_cli_help_clear_cache(self, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--help"])
+        assert result.exit_code == 0
+        assert (
+            re.match(
+                r".*--clear-cache\s+Remove all results from the result cache\..*",
+                result.output,
+                flags=re.DOTALL,
+            )
+            is not None
+        )
+
+    def test_cli_help_diff_base(self, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--help"])
+        assert result.exit_code == 0
+        assert (
+            re.match(
+                r".*--diff-base REF\s+Only mutate lines changed since this git ref\..*",
+                result.output,
+                flags=re.DOTALL,
+            )
+            is not None
+        )
+
+    def test_cli_help_shard(self, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--help"])
+        assert result.exit_code == 0
+        assert re.match(r".*--shard i/n\s+Only test shard i of n shards, e\.g\. 2/8\..*", result.output, re.DOTALL)
+
+    def test_cli_help_resume(self, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--help"])
+        assert result.exit_code == 0
+        assert re.match(r".*--resume\s+Resume an interrupted run from its checkpoint\..*", result.output, re.DOTALL)
+
+    def test_cli_help_sample(self, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--help"])
+        assert result.exit_code == 0
+        assert re.match(r".*--sample N\s+Only test a random sample of this many mutants\..*", result.output, re.DOTALL)
+
+    def test_cli_help_sample_fraction(self, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--help"])
+        assert result.exit_code == 0
+        assert re.match(r".*--sample-fraction p\s+Only test this fraction of mutants\..*", result.output, re.DOTALL)
+
+    def test_cli_help_early_stop(self, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--help"])
+        assert result.exit_code == 0
+        assert re.match(
+            r".*--early-stop\s+Stop testing once the fail_under result is decided\..*", result.output, re.DOTALL
+        )
+
+    def test_cli_help_merge(self, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--help"])
+        assert result.exit_code == 0
+        assert "Use 'poodle merge --help' to merge results of shards." in result.output
+
 
 class TestInputs:
     def assert_build_config_called_with(
@@ -169,6 +224,13 @@ class TestInputs:
         html: Path | None = None,
         json: Path | None = None,
         fail_under: float | None = None,
+        clear_cache: bool = False,
+        diff_base: str | None = None,
+        shard: str | None = None,
+        resume: bool = False,
+        sample: int | None = None,
+        sample_fraction: float | None = None,
+        early_stop: bool = False,
     ):
         build_config.assert_called_with(
             sources,
@@ -182,6 +244,13 @@ class TestInputs:
             html,
             json,
             fail_under,
+            clear_cache,
+            diff_base,
+            shard,
+            resume,
+            sample,
+            sample_fraction,
+            early_stop,
         )
 
     def test_cli(self, main_process: mock.MagicMock, build_config: mock.MagicMock, runner: CliRunner):
@@ -290,6 +359,152 @@ class TestInputs:
         self.assert_build_config_called_with(build_config, fail_under=80)
         main_process.assert_called_with(build_config.return_value)
 
+    def test_main_clear_cache(self, main_process: mock.MagicMock, build_config: mock.MagicMock, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--clear-cache"])
+        assert result.exit_code == 0
+        self.assert_build_config_called_with(build_config, clear_cache=True)
+        main_process.assert_called_with(build_config.return_value)
+
+    def test_main_diff_base(self, main_process: mock.MagicMock, build_config: mock.MagicMock, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--diff-base", "main"])
+        assert result.exit_code == 0
+        self.assert_build_config_called_with(build_config, diff_base="main")
+        main_process.assert_called_with(build_config.return_value)
+
+    def test_main_shard(self, main_process: mock.MagicMock, build_config: mock.MagicMock, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--shard", "2/8"])
+        assert result.exit_code == 0
+        self.assert_build_config_called_with(build_config, shard="2/8")
+        main_process.assert_called_with(build_config.return_value)
+
+    def test_main_resume(self, main_process: mock.MagicMock, build_config: mock.MagicMock, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--resume"])
+        assert result.exit_code == 0
+        self.assert_build_config_called_with(build_config, resume=True)
+        main_process.assert_called_with(build_config.return_value)
+
+    def test_main_sample(self, main_process: mock.MagicMock, build_config: mock.MagicMock, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--sample", "500"])
+        assert result.exit_code == 0
+        self.assert_build_config_called_with(build_config, sample=500)
+        main_process.assert_called_with(build_config.return_value)
+
+    def test_main_sample_fraction(self, main_process: mock.MagicMock, build_config: mock.MagicMock, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--sample-fraction", "0.05"])
+        assert result.exit_code == 0
+        self.assert_build_config_called_with(build_config, sample_fraction=0.05)
+        main_process.assert_called_with(build_config.return_value)
+
+    def test_main_early_stop(self, main_process: mock.MagicMock, build_config: mock.MagicMock, runner: CliRunner):
+        result = runner.invoke(cli.main, ["--early-stop"])
+        assert result.exit_code == 0
+        self.assert_build_config_called_with(build_config, early_stop=True)
+        main_process.assert_called_with(build_config.return_value)
+
+
+class TestGroup:
+    def test_default_run(self, main_process: mock.MagicMock, build_config: mock.MagicMock, runner: CliRunner):
+        result = runner.invoke(cli.cli, ["-w", "2"])
+        assert result.exit_code == 0
+        build_config.assert_called_once()
+        assert build_config.call_args.args[4] == 2
+        main_process.assert_called_with(build_config.return_value)
+
+    def test_default_run_no_args(self, main_process: mock.MagicMock, build_config: mock.MagicMock, runner: CliRunner):
+        result = runner.invoke(cli.cli, [])
+        assert result.exit_code == 0
+        main_process.assert_called_with(build_config.return_value)
+
+    def test_run(self, main_process: mock.MagicMock, build_config: mock.MagicMock, runner: CliRunner):
+        result = runner.invoke(cli.cli, ["run"])
+        assert result.exit_code == 0
+        main_process.assert_called_with(build_config.return_value)
+
+    def test_help(self, runner: CliRunner):
+        result = runner.invoke(cli.cli, ["--help"])
+        assert result.exit_code == 0
+        assert "--diff-base REF" in result.output
+
+    @mock.patch("poodle.cli.core.merge_process")
+    def test_merge(self, merge_process: mock.MagicMock, build_config: mock.MagicMock, runner: CliRunner):
+        result = runner.invoke(cli.cli, ["merge", "pyproject.toml"])
+        assert result.exit_code == 0
+        merge_process.assert_called_once_with(build_config.return_value, [Path("pyproject.toml")])
+
+
+class TestMerge:
+    @pytest.fixture()
+    def merge_process(self):
+        with mock.patch("poodle.cli.core.merge_process") as merge_process:
+            yield merge_process
+
+    @pytest.fixture(autouse=True)
+    def _result_files(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        for name in ("shard-1.json", "shard-2.json", "pyproject.toml"):
+            Path(name).touch()
+
+    def test_merge(self, merge_process: mock.MagicMock, build_config: mock.MagicMock, runner: CliRunner):
+        result = runner.invoke(
+            cli.merge,
+            ["shard-1.json", "shard-2.json", "-c", "pyproject.toml", "--json", "merged.json", "--fail_under", "80"],
+        )
+        assert result.exit_code == 0
+        build_config.assert_called_once_with(
+            (),
+            Path("pyproject.toml"),
+            0,
+            0,
+            None,
+            (),
+            (),
+            (),
+            None,
+            Path("merged.json"),
+            80,
+            cmd_clear_cache=False,
+            cmd_diff_base=None,
+            cmd_shard=None,
+            cmd_resume=False,
+            cmd_sample=None,
+            cmd_sample_fraction=None,
+            cmd_early_stop=False,
+            require_sources=False,
+        )
+        merge_process.assert_called_once_with(
+            build_config.return_value,
+            [Path("shard-1.json"), Path("shard-2.json")],
+        )
+
+    def test_merge_no_files(self, merge_process: mock.MagicMock, runner: CliRunner):
+        result = runner.invoke(cli.merge, [])
+        assert result.exit_code == 2
+        merge_process.assert_not_called()
+
+    def test_merge_input_error(
+        self,
+        merge_process: mock.MagicMock,
+        secho: mock.MagicMock,
+        build_config: mock.MagicMock,  # noqa: ARG002
+        runner: CliRunner,
+    ):
+        merge_process.side_effect = PoodleInputError("bad input")
+        result = runner.invoke(cli.merge, ["shard-1.json"])
+        assert result.exit_code == 4
+        secho.assert_called_with("bad input", fg="red")
+
+    def test_merge_testing_failed(
+        self,
+        merge_process: mock.MagicMock,
+        secho: mock.MagicMock,
+        build_config: mock.MagicMock,  # noqa: ARG002
+        runner: CliRunner,
+    ):
+        merge_process.side_effect = PoodleTestingFailedError("score too low")
+        result = runner.invoke(cli.merge, ["shard-1.json"])
+        assert result.exit_code == 1
+        secho.assert_called_with("score too low", fg="yellow")
+
 
 class TestErrors:
     def test_main_build_config_input_error(
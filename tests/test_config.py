@@ -46,6 +46,7 @@ def test_defaults():
     assert config.default_file_copy_flags == glob.GLOBSTAR | glob.NODIR
     assert config.default_file_copy_filters == ["__pycache__/**"]
     assert config.default_work_folder == Path(".poodle-temp")
+    assert config.default_workspace == "zip"
 
     assert config.default_min_timeout == 10
     assert config.default_timeout_multiplier == 10
@@ -96,6 +97,27 @@ class TestBuildConfig:
         with mock.patch("poodle.config.get_reporters") as get_reporters:
             yield get_reporters
 
+    @pytest.fixture()
+    def get_workspace(self):
+        with mock.patch("poodle.config.get_workspace") as get_workspace:
+            yield get_workspace
+
+    @pytest.fixture()
+    def get_scheduler(self):
+        with mock.patch("poodle.config.get_scheduler") as get_scheduler:
+            yield get_scheduler
+
+    @pytest.fixture()
+    def get_shard(self):
+        with mock.patch("poodle.config.get_shard") as get_shard:
+            yield get_shard
+
+    @pytest.fixture()
+    def get_sample(self):
+        with mock.patch("poodle.config.get_sample") as get_sample:
+            get_sample.return_value = (None, None)
+            yield get_sample
+
     @pytest.fixture()
     def get_config_file_path(self):
         with mock.patch("poodle.config.get_config_file_path") as get_config_file_path:
@@ -195,6 +217,10 @@ class TestBuildConfig:
         get_config_file_data: mock.MagicMock,
         get_config_file_path: mock.MagicMock,
         get_reporters: mock.MagicMock,
+        get_workspace: mock.MagicMock,
+        get_scheduler: mock.MagicMock,
+        get_shard: mock.MagicMock,
+        get_sample: mock.MagicMock,
         mock_os: mock.MagicMock,
         mock_logging: mock.MagicMock,
     ):
@@ -213,6 +239,10 @@ class TestBuildConfig:
         get_config_file_data.reset_mock()
         get_config_file_path.reset_mock()
         get_reporters.reset_mock()
+        get_workspace.reset_mock()
+        get_scheduler.reset_mock()
+        get_shard.reset_mock()
+        get_sample.reset_mock()
         mock_os.reset_mock()
         mock_logging.reset_mock()
 
@@ -229,6 +259,13 @@ class TestBuildConfig:
         cmd_html: Path | None = None,
         cmd_json: Path | None = None,
         cmd_fail_under: float | None = None,
+        cmd_clear_cache: bool = False,
+        cmd_diff_base: str | None = None,
+        cmd_shard: str | None = None,
+        cmd_resume: bool = False,
+        cmd_sample: int | None = None,
+        cmd_sample_fraction: float | None = None,
+        cmd_early_stop: bool = False,
     ):
         return config.build_config(
             cmd_sources,
@@ -242,6 +279,13 @@ class TestBuildConfig:
             cmd_html,
             cmd_json,
             cmd_fail_under,
+            cmd_clear_cache,
+            cmd_diff_base,
+            cmd_shard,
+            cmd_resume,
+            cmd_sample,
+            cmd_sample_fraction,
+            cmd_early_stop,
         )
 
     def test_build_config_project_info(self, get_project_info: mock.MagicMock):
@@ -262,7 +306,33 @@ class TestBuildConfig:
         config_file_data = get_config_file_data.return_value
         config_data = self.build_config_with(cmd_sources=(Path("source"),))
         assert config_data.source_folders == get_source_folders.return_value
-        get_source_folders.assert_called_with((Path("source"),), config_file_data)
+        get_source_folders.assert_called_with((Path("source"),), config_file_data, required=True)
+
+    @pytest.mark.usefixtures("_setup_build_config_mocks")
+    def test_build_config_source_folders_not_required(self, get_source_folders, get_config_file_data):
+        config_file_data = get_config_file_data.return_value
+        config.build_config(
+            (),
+            None,
+            0,
+            0,
+            None,
+            (),
+            (),
+            (),
+            None,
+            None,
+            None,
+            cmd_clear_cache=False,
+            cmd_diff_base=None,
+            cmd_shard=None,
+            cmd_resume=False,
+            cmd_sample=None,
+            cmd_sample_fraction=None,
+            cmd_early_stop=False,
+            require_sources=False,
+        )
+        get_source_folders.assert_called_with((), config_file_data, required=False)
 
     @pytest.mark.usefixtures("_setup_build_config_mocks")
     def test_build_config_only_files(self, get_str_list_from_config, get_config_file_data):
@@ -314,6 +384,20 @@ class TestBuildConfig:
         assert config_data.work_folder == get_path_from_config.return_value
         get_path_from_config.assert_any_call("work_folder", config_file_data, default=config.default_work_folder)
 
+    @pytest.mark.usefixtures("_setup_build_config_mocks")
+    def test_build_config_workspace(self, get_workspace, get_config_file_data):
+        config_file_data = get_config_file_data.return_value
+        config_data = self.build_config_with()
+        assert config_data.workspace == get_workspace.return_value
+        get_workspace.assert_called_once_with(config_file_data)
+
+    @pytest.mark.usefixtures("_setup_build_config_mocks")
+    def test_build_config_scheduler(self, get_scheduler, get_config_file_data):
+        config_file_data = get_config_file_data.return_value
+        config_data = self.build_config_with()
+        assert config_data.scheduler == get_scheduler.return_value
+        get_scheduler.assert_called_once_with(config_file_data)
+
     @pytest.mark.usefixtures("_setup_build_config_mocks")
     def test_build_config_max_workers(self, get_int_from_config, default_max_workers, get_config_file_data):
         config_file_data = get_config_file_data.return_value
@@ -460,6 +544,101 @@ class TestBuildConfig:
         assert config_data.fail_under == get_float_from_config.return_value
         get_float_from_config.assert_any_call("fail_under", config_file_data, command_line=50)
 
+    @pytest.mark.usefixtures("_setup_build_config_mocks")
+    def test_build_config_coverage_guided(self, get_bool_from_config, get_config_file_data):
+        config_file_data = get_config_file_data.return_value
+        config_data = self.build_config_with()
+        assert config_data.coverage_guided == get_bool_from_config.return_value
+        get_bool_from_config.assert_any_call("coverage_guided", config_file_data, default=False)
+
+    @pytest.mark.usefixtures("_setup_build_config_mocks")
+    def test_build_config_result_cache(self, get_bool_from_config, get_str_list_from_config, get_config_file_data):
+        config_file_data = get_config_file_data.return_value
+        config_data = self.build_config_with(cmd_clear_cache=True)
+        assert config_data.result_cache == get_bool_from_config.return_value
+        assert config_data.result_cache_files == get_str_list_from_config.return_value
+        assert config_data.clear_result_cache == get_bool_from_config.return_value
+        get_bool_from_config.assert_any_call("result_cache", config_file_data, default=False)
+        get_str_list_from_config.assert_any_call(
+            "result_cache_files",
+            config_file_data,
+            default=config.default_result_cache_files,
+        )
+        get_bool_from_config.assert_any_call(
+            "clear_result_cache",
+            config_file_data,
+            default=False,
+            command_line=True,
+        )
+
+    @mock.patch("poodle.config.get_config_file_data")
+    @mock.patch("poodle.config.get_project_info")
+    @pytest.mark.parametrize(
+        ("config_file_data", "cmd_diff_base", "expected"),
+        [
+            ({}, None, None),
+            ({"diff_base": "main"}, None, "main"),
+            ({"diff_base": "main"}, "HEAD~1", "HEAD~1"),
+        ],
+    )
+    def test_build_config_diff_base(
+        self,
+        get_project_info,
+        get_config_file_data,
+        config_file_data,
+        cmd_diff_base,
+        expected,
+    ):
+        get_config_file_data.return_value = config_file_data
+        get_project_info.return_value = (None, None)
+        assert self.build_config_with(cmd_diff_base=cmd_diff_base).diff_base == expected
+
+    @pytest.mark.usefixtures("_setup_build_config_mocks")
+    def test_build_config_shard(self, get_shard, get_config_file_data):
+        config_data = self.build_config_with(cmd_shard="2/8")
+        assert config_data.shard == get_shard.return_value
+        get_shard.assert_called_once_with(get_config_file_data.return_value, "2/8")
+
+    @pytest.mark.usefixtures("_setup_build_config_mocks")
+    def test_build_config_resume(self, get_bool_from_config, get_config_file_data):
+        config_file_data = get_config_file_data.return_value
+        config_data = self.build_config_with(cmd_resume=True)
+        assert config_data.resume == get_bool_from_config.return_value
+        get_bool_from_config.assert_any_call("resume", config_file_data, default=False, command_line=True)
+
+    @pytest.mark.usefixtures("_setup_build_config_mocks")
+    def test_build_config_sample(self, get_sample, get_int_from_config, get_config_file_data):
+        config_file_data = get_config_file_data.return_value
+        get_sample.return_value = (100, None)
+        config_data = self.build_config_with(cmd_sample=100)
+        assert config_data.sample == 100
+        assert config_data.sample_fraction is None
+        assert config_data.sample_seed == get_int_from_config.return_value
+        get_sample.assert_called_once_with(config_file_data, 100, None)
+        get_int_from_config.assert_any_call("sample_seed", config_file_data)
+
+    @pytest.mark.usefixtures("_setup_build_config_mocks")
+    def test_build_config_sample_fraction(self, get_sample, get_config_file_data):
+        get_sample.return_value = (None, 0.1)
+        config_data = self.build_config_with(cmd_sample_fraction=0.1)
+        assert config_data.sample is None
+        assert config_data.sample_fraction == 0.1
+        get_sample.assert_called_once_with(get_config_file_data.return_value, None, 0.1)
+
+    @pytest.mark.usefixtures("_setup_build_config_mocks")
+    def test_build_config_skip_equivalent(self, get_bool_from_config, get_config_file_data):
+        config_file_data = get_config_file_data.return_value
+        config_data = self.build_config_with()
+        assert config_data.skip_equivalent == get_bool_from_config.return_value
+        get_bool_from_config.assert_any_call("skip_equivalent", config_file_data, default=False)
+
+    @pytest.mark.usefixtures("_setup_build_config_mocks")
+    def test_build_config_early_stop(self, get_bool_from_config, get_config_file_data):
+        config_file_data = get_config_file_data.return_value
+        config_data = self.build_config_with(cmd_early_stop=True)
+        assert config_data.early_stop == get_bool_from_config.return_value
+        get_bool_from_config.assert_any_call("early_stop", config_file_data, default=False, command_line=True)
+
     @pytest.mark.usefixtures("_setup_build_config_mocks")
     def test_build_config_skip_delete_folder(self, get_bool_from_config, get_config_file_data):
         config_file_data = get_config_file_data.return_value
@@ -485,18 +664,35 @@ class TestBuildConfig:
             cmd_html=None,
             cmd_json=None,
             cmd_fail_under=None,
+            cmd_clear_cache=False,
+            cmd_diff_base=None,
+            cmd_shard=None,
+            cmd_resume=False,
+            cmd_sample=None,
+            cmd_sample_fraction=None,
+            cmd_early_stop=False,
         ) == config.PoodleConfig(
             project_name=None,
             project_version=None,
             config_file=Path("pyproject.toml"),
             source_folders=[Path("src")],
             only_files=[],
+            diff_base=None,
+            shard=None,
+            resume=False,
+            sample=None,
+            sample_fraction=None,
+            sample_seed=0,
+            skip_equivalent=False,
+            early_stop=False,
             file_flags=config.default_file_flags,
             file_filters=config.default_file_filters,
             file_copy_flags=config.default_file_copy_flags,
             file_copy_filters=config.default_file_copy_filters,
             work_folder=Path(".poodle-temp"),
+            workspace="zip",
             max_workers=config.default_max_workers(),
+            scheduler="process_pool",
             log_format=config.default_log_format,
             log_level=logging.WARNING,
             echo_enabled=True,
@@ -508,6 +704,11 @@ class TestBuildConfig:
             timeout_multiplier=10,
             runner="command_line",
             runner_opts={},
+            coverage_guided=False,
+            result_cache=False,
+            result_cache_files=config.default_result_cache_files,
+            clear_result_cache=False,
+            mutant_cache=False,
             reporters=["summary", "not_found"],
             reporter_opts={},
             fail_under=None,
@@ -515,6 +716,96 @@ class TestBuildConfig:
         )
 
 
+class TestGetWorkspace:
+    def test_get_workspace_default(self):
+        assert config.get_workspace({}) == "zip"
+
+    def test_get_workspace(self):
+        assert config.get_workspace({"workspace": "import_hook"}) == "import_hook"
+
+    def test_get_workspace_invalid(self):
+        msg = r"^workspace must be one of \['zip', 'pooled', 'hardlink', 'import_hook', 'schemata'\], found: 'copy'$"
+        with pytest.raises(PoodleInputError, match=msg):
+            config.get_workspace({"workspace": "copy"})
+
+
+class TestGetScheduler:
+    def test_get_scheduler_default(self):
+        assert config.get_scheduler({}) == "process_pool"
+
+    def test_get_scheduler(self):
+        assert config.get_scheduler({"scheduler": "asyncio"}) == "asyncio"
+
+    def test_get_scheduler_invalid(self):
+        msg = r"^scheduler must be one of \['process_pool', 'asyncio'\], found: 'threads'$"
+        with pytest.raises(PoodleInputError, match=msg):
+            config.get_scheduler({"scheduler": "threads"})
+
+    def test_get_scheduler_runner(self):
+        msg = r"^scheduler 'asyncio' requires runner 'command_line', found: 'pytest_forkserver'$"
+        with pytest.raises(PoodleInputError, match=msg):
+            config.get_scheduler({"scheduler": "asyncio", "runner": "pytest_forkserver"})
+
+    def test_get_scheduler_workspace(self):
+        msg = r"^scheduler 'asyncio' can't be used with workspace 'pooled'$"
+        with pytest.raises(PoodleInputError, match=msg):
+            config.get_scheduler({"scheduler": "asyncio", "workspace": "pooled"})
+
+
+class TestGetShard:
+    def test_get_shard_default(self):
+        assert config.get_shard({}, None) is None
+
+    @pytest.mark.parametrize(
+        ("config_file_data", "command_line", "expected"),
+        [
+            ({"shard": "1/8"}, None, (1, 8)),
+            ({"shard": "1/8"}, "8/8", (8, 8)),
+            ({}, " 3 / 4 ", (3, 4)),
+        ],
+    )
+    def test_get_shard(self, config_file_data, command_line, expected):
+        assert config.get_shard(config_file_data, command_line) == expected
+
+    @pytest.mark.parametrize("shard", ["0/8", "9/8", "1", "a/b", "1/8/2", "-1/8"])
+    def test_get_shard_invalid(self, shard):
+        msg = rf"^shard must be in the form 'i/n' with 1 <= i <= n, found: '{shard}'$"
+        with pytest.raises(PoodleInputError, match=msg):
+            config.get_shard({}, shard)
+
+
+class TestGetSample:
+    def test_get_sample_default(self):
+        assert config.get_sample({}, None, None) == (None, None)
+
+    @pytest.mark.parametrize(
+        ("config_file_data", "cmd_sample", "cmd_sample_fraction", "expected"),
+        [
+            ({"sample": 100}, None, None, (100, None)),
+            ({"sample": 100}, 50, None, (50, None)),
+            ({"sample_fraction": 0.5}, None, None, (None, 0.5)),
+            ({}, None, 1, (None, 1.0)),
+        ],
+    )
+    def test_get_sample(self, config_file_data, cmd_sample, cmd_sample_fraction, expected):
+        assert config.get_sample(config_file_data, cmd_sample, cmd_sample_fraction) == expected
+
+    def test_get_sample_both(self):
+        with pytest.raises(PoodleInputError, match=r"^Only one of sample and sample_fraction can be set$"):
+            config.get_sample({"sample": 100}, None, 0.5)
+
+    @pytest.mark.parametrize("sample", [0, -1])
+    def test_get_sample_invalid(self, sample):
+        with pytest.raises(PoodleInputError, match=rf"^sample must be at least 1, found: {sample}$"):
+            config.get_sample({"sample": sample}, None, None)
+
+    @pytest.mark.parametrize("sample_fraction", [0.0, -0.5, 1.5])
+    def test_get_sample_fraction_invalid(self, sample_fraction):
+        msg = rf"^sample_fraction must be greater than 0 and at most 1, found: {sample_fraction}$"
+        with pytest.raises(PoodleInputError, match=msg):
+            config.get_sample({"sample_fraction": sample_fraction}, None, None)
+
+
 class TestGetReporters:
     @pytest.fixture()
     def get_str_list_from_config(self):
@@ -794,6 +1085,19 @@ class TestGetSourceFolders:
         with pytest.raises(PoodleInputError, match="^No source folder found to mutate.$"):
             config.get_source_folders((), {})
 
+    @mock.patch("poodle.config.get_path_list_from_config")
+    def test_get_source_folders_not_required(self, get_path_list_from_config):
+        path_project = mock.MagicMock()
+        path_project.is_dir.return_value = True
+        path_missing = mock.MagicMock()
+        path_missing.is_dir.return_value = False
+
+        get_path_list_from_config.return_value = []
+        assert config.get_source_folders((), {}, required=False) == []
+
+        get_path_list_from_config.return_value = [path_project, path_missing]
+        assert config.get_source_folders((), {}, required=False) == [path_project]
+
     @mock.patch("poodle.config.get_path_list_from_config")
     def test_get_source_folders_not_folder(self, get_path_list_from_config):
         path_project = mock.MagicMock()
@@ -1,8 +1,10 @@
+import threading
+from pathlib import Path
 from unittest import mock
 
 import pytest
 
-from poodle import PoodleNoMutantsFoundError, PoodleTestingFailedError, core
+from poodle import PoodleNoMutantsFoundError, PoodleTestingFailedError, PoodleTrialRunError, core
 from poodle.data_types import MutantTrial, PoodleWork
 from tests.data_types.test_data import PoodleConfigStub
 
@@ -78,6 +80,11 @@ class TestMainProcess:
         with mock.patch("poodle.core.run_mutant_trails") as run_mutant_trails:
             yield run_mutant_trails
 
+    @pytest.fixture()
+    def checkpoint_class(self):
+        with mock.patch("poodle.core.Checkpoint") as checkpoint_class:
+            yield checkpoint_class
+
     @pytest.fixture()
     def create_unified_diff(self):
         with mock.patch("poodle.core.create_unified_diff") as create_unified_diff:
@@ -99,6 +106,7 @@ class TestMainProcess:
         calc_timeout: mock.MagicMock,
         run_mutant_trails: mock.MagicMock,
         create_unified_diff: mock.MagicMock,
+        checkpoint_class: mock.MagicMock,
         logger_mock: mock.MagicMock,
     ):
         poodle_work_class.reset_mock()
@@ -114,6 +122,7 @@ class TestMainProcess:
         calc_timeout.reset_mock()
         run_mutant_trails.reset_mock()
         create_unified_diff.reset_mock()
+        checkpoint_class.reset_mock()
         logger_mock.reset_mock()
 
     @pytest.mark.usefixtures("_setup_main_process")
@@ -143,6 +152,14 @@ class TestMainProcess:
 
         create_temp_zips.assert_called_once_with(work)
 
+    @pytest.mark.usefixtures("_setup_main_process")
+    def test_main_process_setup_import_hook(self, create_temp_zips: mock.MagicMock):
+        config = PoodleConfigStub(workspace="import_hook")
+
+        core.main_process(config)
+
+        create_temp_zips.assert_not_called()
+
     @pytest.mark.usefixtures("_setup_main_process")
     def test_main_process_init(
         self,
@@ -219,6 +236,294 @@ class TestMainProcess:
         timeout = calc_timeout.return_value
         run_mutant_trails.assert_called_once_with(work, mutants, timeout)
 
+    @pytest.mark.usefixtures("_setup_main_process")
+    @mock.patch("poodle.core.select_shard")
+    def test_main_process_shard(
+        self,
+        select_shard: mock.MagicMock,
+        poodle_work_class: mock.MagicMock,
+        create_mutants_for_all_mutators: mock.MagicMock,
+        run_mutant_trails: mock.MagicMock,
+        calc_timeout: mock.MagicMock,
+    ):
+        config = PoodleConfigStub(shard=(2, 8))
+        select_shard.return_value = ["mutant"]
+
+        core.main_process(config)
+
+        work = poodle_work_class.return_value
+        select_shard.assert_called_once_with(create_mutants_for_all_mutators.return_value, (2, 8))
+        work.echo.assert_any_call("Testing 1 mutants in shard 2/8")
+        run_mutant_trails.assert_called_once_with(work, ["mutant"], calc_timeout.return_value)
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    @mock.patch("poodle.core.estimate_score")
+    @mock.patch("poodle.core.select_sample")
+    def test_main_process_sample(
+        self,
+        select_sample: mock.MagicMock,
+        estimate_score: mock.MagicMock,
+        poodle_work_class: mock.MagicMock,
+        create_mutants_for_all_mutators: mock.MagicMock,
+        run_mutant_trails: mock.MagicMock,
+        calc_timeout: mock.MagicMock,
+    ):
+        config = PoodleConfigStub(sample=1)
+        create_mutants_for_all_mutators.return_value = ["mutant1", "mutant2"]
+        select_sample.return_value = ["mutant2"]
+
+        core.main_process(config)
+
+        work = poodle_work_class.return_value
+        results = run_mutant_trails.return_value
+        select_sample.assert_called_once_with(["mutant1", "mutant2"], config)
+        work.echo.assert_any_call("Testing a sample of 1 of 2 mutants")
+        run_mutant_trails.assert_called_once_with(work, ["mutant2"], calc_timeout.return_value)
+        estimate_score.assert_called_once_with(results.summary, ["mutant1", "mutant2"], results.mutant_trials)
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    @mock.patch("poodle.core.estimate_score")
+    @mock.patch("poodle.core.select_sample")
+    def test_main_process_sample_fraction(self, select_sample: mock.MagicMock, estimate_score: mock.MagicMock):
+        core.main_process(PoodleConfigStub(sample_fraction=0.5))
+
+        select_sample.assert_called_once()
+        estimate_score.assert_called_once()
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    @mock.patch("poodle.core.estimate_score")
+    @mock.patch("poodle.core.select_sample")
+    def test_main_process_no_sample(self, select_sample: mock.MagicMock, estimate_score: mock.MagicMock):
+        core.main_process(PoodleConfigStub())
+
+        select_sample.assert_not_called()
+        estimate_score.assert_not_called()
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    @mock.patch("poodle.core.filter_equivalent")
+    def test_main_process_skip_equivalent(
+        self,
+        filter_equivalent: mock.MagicMock,
+        poodle_work_class: mock.MagicMock,
+        create_mutants_for_all_mutators: mock.MagicMock,
+        run_mutant_trails: mock.MagicMock,
+        calc_timeout: mock.MagicMock,
+    ):
+        filter_equivalent.return_value = ["mutant"]
+
+        core.main_process(PoodleConfigStub(skip_equivalent=True))
+
+        work = poodle_work_class.return_value
+        filter_equivalent.assert_called_once_with(work, create_mutants_for_all_mutators.return_value)
+        run_mutant_trails.assert_called_once_with(work, ["mutant"], calc_timeout.return_value)
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    @mock.patch("poodle.core.filter_equivalent")
+    def test_main_process_no_skip_equivalent(self, filter_equivalent: mock.MagicMock):
+        core.main_process(PoodleConfigStub())
+
+        filter_equivalent.assert_not_called()
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    @mock.patch("poodle.core.select_shard")
+    def test_main_process_no_shard(self, select_shard: mock.MagicMock):
+        core.main_process(PoodleConfigStub())
+
+        select_shard.assert_not_called()
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    @mock.patch("poodle.core.ResultCache")
+    def test_main_process_result_cache(self, result_cache_class: mock.MagicMock, poodle_work_class: mock.MagicMock):
+        config = PoodleConfigStub(result_cache=True)
+
+        core.main_process(config)
+
+        work = poodle_work_class.return_value
+        result_cache_class.assert_called_once_with(config)
+        assert work.result_cache == result_cache_class.return_value
+        result_cache_class.return_value.close.assert_called_once_with()
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    @mock.patch("poodle.core.ResultCache")
+    def test_main_process_clean_run_failed(
+        self,
+        result_cache_class: mock.MagicMock,
+        clean_run_each_source_folder: mock.MagicMock,
+        checkpoint_class: mock.MagicMock,
+    ):
+        clean_run_each_source_folder.side_effect = PoodleTrialRunError("Clean Run Failed")
+
+        with pytest.raises(PoodleTrialRunError):
+            core.main_process(PoodleConfigStub(result_cache=True))
+
+        checkpoint_class.return_value.close.assert_called_once_with()
+        result_cache_class.return_value.close.assert_called_once_with()
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    @mock.patch("poodle.core.ResultCache")
+    def test_main_process_no_result_cache(self, result_cache_class: mock.MagicMock):
+        core.main_process(PoodleConfigStub())
+
+        result_cache_class.assert_not_called()
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    @mock.patch("poodle.core.MutantCache")
+    def test_main_process_mutant_cache(
+        self,
+        mutant_cache_class: mock.MagicMock,
+        create_mutants_for_all_mutators: mock.MagicMock,
+    ):
+        order = mock.MagicMock()
+        order.attach_mock(create_mutants_for_all_mutators, "create_mutants_for_all_mutators")
+        order.attach_mock(mutant_cache_class.return_value.close, "close")
+        config = PoodleConfigStub(mutant_cache=True)
+
+        core.main_process(config)
+
+        mutant_cache_class.assert_called_once_with(config)
+        work = create_mutants_for_all_mutators.call_args.args[0]
+        assert work.mutant_cache == mutant_cache_class.return_value
+        assert [name for name, _, _ in order.mock_calls if "." not in name] == [
+            "create_mutants_for_all_mutators",
+            "close",
+        ]
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    @mock.patch("poodle.core.MutantCache")
+    def test_main_process_no_mutant_cache(self, mutant_cache_class: mock.MagicMock):
+        core.main_process(PoodleConfigStub())
+
+        mutant_cache_class.assert_not_called()
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    def test_main_process_prepare_during_clean_run(
+        self,
+        poodle_work_class: mock.MagicMock,
+        create_mutants_for_all_mutators: mock.MagicMock,
+        clean_run_each_source_folder: mock.MagicMock,
+    ):
+        work = poodle_work_class.return_value
+        created = threading.Event()
+        threads = {}
+
+        def create_mutants(prepare_work):
+            threads["create"] = threading.current_thread()
+            prepare_work.echo("create message")
+            created.set()
+            return ["mutant"]
+
+        def clean_run(clean_work):
+            threads["clean_run"] = threading.current_thread()
+            assert created.wait(timeout=10)
+            clean_work.echo("clean run message")
+
+        create_mutants_for_all_mutators.side_effect = create_mutants
+        clean_run_each_source_folder.side_effect = clean_run
+
+        core.main_process(PoodleConfigStub())
+
+        assert threads["clean_run"] is threading.main_thread()
+        assert threads["create"] is not threading.main_thread()
+        clean_run_each_source_folder.assert_called_once_with(work)
+        assert work.echo.call_args_list == [
+            mock.call("clean run message"),
+            mock.call("create message"),
+            mock.call("Identified 1 mutants"),
+        ]
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    def test_main_process_prepare_during_clean_run_error(
+        self,
+        poodle_work_class: mock.MagicMock,
+        create_mutants_for_all_mutators: mock.MagicMock,
+    ):
+        def create_mutants(prepare_work):
+            prepare_work.echo("create message")
+            return []
+
+        create_mutants_for_all_mutators.side_effect = create_mutants
+
+        with pytest.raises(PoodleNoMutantsFoundError):
+            core.main_process(PoodleConfigStub())
+
+        poodle_work_class.return_value.echo.assert_called_once_with("create message")
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    def test_main_process_prepare_schemata(
+        self,
+        create_mutants_for_all_mutators: mock.MagicMock,
+        clean_run_each_source_folder: mock.MagicMock,
+    ):
+        order = mock.MagicMock()
+        order.attach_mock(create_mutants_for_all_mutators, "create_mutants_for_all_mutators")
+        order.attach_mock(clean_run_each_source_folder, "clean_run_each_source_folder")
+        threads = []
+
+        def create_mutants(_):
+            threads.append(threading.current_thread())
+            return ["mutant"]
+
+        create_mutants_for_all_mutators.side_effect = create_mutants
+
+        core.main_process(PoodleConfigStub(workspace="schemata"))
+
+        assert threads == [threading.main_thread()]
+        assert [name for name, _, _ in order.mock_calls if "." not in name] == [
+            "create_mutants_for_all_mutators",
+            "clean_run_each_source_folder",
+        ]
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    def test_main_process_checkpoint(
+        self,
+        poodle_work_class: mock.MagicMock,
+        delete_folder: mock.MagicMock,
+        run_mutant_trails: mock.MagicMock,
+        checkpoint_class: mock.MagicMock,
+    ):
+        order = mock.MagicMock()
+        order.attach_mock(delete_folder, "delete_folder")
+        order.attach_mock(checkpoint_class.return_value, "checkpoint")
+        order.attach_mock(run_mutant_trails, "run_mutant_trails")
+        config = PoodleConfigStub(resume=True)
+
+        core.main_process(config)
+
+        checkpoint_class.assert_called_once_with(config)
+        assert poodle_work_class.return_value.checkpoint == checkpoint_class.return_value
+        assert [name for name, _, _ in order.mock_calls][:5] == [
+            "checkpoint.load",
+            "delete_folder",
+            "checkpoint.open",
+            "run_mutant_trails",
+            "checkpoint.close",
+        ]
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    def test_main_process_checkpoint_no_resume(self, checkpoint_class: mock.MagicMock):
+        core.main_process(PoodleConfigStub())
+
+        checkpoint_class.return_value.load.assert_not_called()
+        checkpoint_class.return_value.open.assert_called_once_with()
+
+    @pytest.mark.usefixtures("_setup_main_process")
+    def test_main_process_checkpoint_interrupt(
+        self,
+        poodle_work_class: mock.MagicMock,
+        run_mutant_trails: mock.MagicMock,
+        checkpoint_class: mock.MagicMock,
+    ):
+        run_mutant_trails.side_effect = KeyboardInterrupt()
+        checkpoint_class.return_value.file = Path(".poodle-temp/checkpoint.jsonl")
+
+        with pytest.raises(KeyboardInterrupt):
+            core.main_process(PoodleConfigStub())
+
+        poodle_work_class.return_value.echo.assert_called_with(
+            f"Completed trials were saved to {Path('.poodle-temp/checkpoint.jsonl')}.  Use --resume to continue."
+        )
+        checkpoint_class.return_value.close.assert_called_once_with()
+
     @pytest.mark.usefixtures("_setup_main_process")
     def test_main_process_report(
         self,
@@ -278,6 +583,47 @@ class TestMainProcess:
             core.main_process(config)
 
 
+class TestMergeProcess:
+    @pytest.fixture()
+    def poodle_work_class(self):
+        with mock.patch("poodle.core.PoodleWork") as poodle_work_class:
+            yield poodle_work_class
+
+    @pytest.fixture()
+    def generate_reporters(self):
+        with mock.patch("poodle.core.generate_reporters") as generate_reporters:
+            yield generate_reporters
+
+    @pytest.fixture()
+    def merge_results(self):
+        with mock.patch("poodle.core.merge_results") as merge_results:
+            yield merge_results
+
+    def test_merge_process(self, poodle_work_class, generate_reporters, merge_results):
+        config = PoodleConfigStub()
+        reporter = mock.MagicMock()
+        generate_reporters.return_value = iter([reporter])
+        results = merge_results.return_value
+        results.mutant_trials = [mock.MagicMock(), mock.MagicMock()]
+
+        core.merge_process(config, [Path("shard-1.json"), Path("shard-2.json")])
+
+        work = poodle_work_class.return_value
+        poodle_work_class.assert_called_once_with(config)
+        merge_results.assert_called_once_with([Path("shard-1.json"), Path("shard-2.json")])
+        work.echo.assert_called_with("Merged 2 mutant trials from 2 result files")
+        reporter.assert_called_once_with(config=config, echo=work.echo, testing_results=results)
+
+    @pytest.mark.usefixtures("poodle_work_class", "generate_reporters")
+    def test_merge_process_fail_under(self, merge_results):
+        config = PoodleConfigStub(fail_under=80.0)
+        merge_results.return_value.summary.success_rate = 0.7999
+        merge_results.return_value.summary.coverage_display = "79.9%"
+
+        with pytest.raises(PoodleTestingFailedError, match=r"^Mutation score 79.9% is below goal of 80%$"):
+            core.merge_process(config, [Path("shard-1.json")])
+
+
 poodle_header_str = r"""
 |\/|\/|\/|\/|\/|\/|\/|\/|\/|\/|\/|\/|\/|\/|\/|\/|
     ____                  ____         ''',
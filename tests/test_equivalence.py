@@ -0,0 +1,162 @@
+import multiprocessing
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from poodle import equivalence
+from poodle.data_types import Mutant, PoodleWork
+from tests.data_types.test_data import PoodleConfigStub, create_mutant
+
+source = """def add(a, b):
+    return a + b
+
+
+TOTAL = 1 + 2
+FLAG = 1
+"""
+
+
+@pytest.fixture()
+def source_file(tmp_path):
+    file = tmp_path / "example.py"
+    file.write_text(source)
+    return file
+
+
+def test_logger():
+    assert equivalence.logger.name == "poodle.equivalence"
+
+
+class TestCompileFingerprint:
+    @pytest.mark.parametrize(
+        ("source_a", "source_b"),
+        [
+            ("x = 1 + 2", "x = 3"),
+            ("x=1", "x = 1"),
+            ("x = 'a' 'b'", "x = 'ab'"),
+            ("def f(a):\n    return a\n", "\n\ndef f(a):\n    return (a)\n"),
+        ],
+    )
+    def test_equal(self, source_a, source_b):
+        file = Path("example.py")
+        assert equivalence.compile_fingerprint(source_a, file) == equivalence.compile_fingerprint(source_b, file)
+
+    @pytest.mark.parametrize(
+        ("source_a", "source_b"),
+        [
+            ("x = 1", "x = True"),
+            ("x = 1", "x = 1.0"),
+            ("x = 0.0", "x = -0.0"),
+            ("x = (1, 2)", "x = (True, 2)"),
+            ("x = a in {1, 2}", "x = a in {1, 3}"),
+            ("def f(a):\n    return a\n", "def f(a):\n    return None\n"),
+            ("def f(a):\n    return a\n", "def g(a):\n    return a\n"),
+        ],
+    )
+    def test_not_equal(self, source_a, source_b):
+        file = Path("example.py")
+        assert equivalence.compile_fingerprint(source_a, file) != equivalence.compile_fingerprint(source_b, file)
+
+    def test_syntax_error(self):
+        assert equivalence.compile_fingerprint("x = = 1", Path("example.py")) is None
+
+    def test_no_warnings(self, recwarn):
+        assert equivalence.compile_fingerprint("x = a is 1", Path("example.py")) is not None
+        assert len(recwarn) == 0
+
+
+class TestFilterEquivalentInFile:
+    def test_filter(self, source_file):
+        mutants = [
+            create_mutant(
+                source_file, lineno=2, col_offset=11, end_col_offset=16, text="a - b", source_folder=source_file.parent
+            ),
+            create_mutant(
+                source_file, lineno=5, col_offset=8, end_col_offset=13, text="3", source_folder=source_file.parent
+            ),
+            create_mutant(
+                source_file, lineno=5, col_offset=8, end_col_offset=13, text="2 + 1", source_folder=source_file.parent
+            ),
+            create_mutant(
+                source_file, lineno=5, col_offset=8, end_col_offset=13, text="4", source_folder=source_file.parent
+            ),
+            create_mutant(
+                source_file, lineno=5, col_offset=8, end_col_offset=13, text="2 + 2", source_folder=source_file.parent
+            ),
+            create_mutant(
+                source_file, lineno=6, col_offset=7, end_col_offset=8, text="True", source_folder=source_file.parent
+            ),
+            create_mutant(
+                source_file, lineno=2, col_offset=11, end_col_offset=16, text="a -", source_folder=source_file.parent
+            ),
+            create_mutant(
+                source_file, lineno=2, col_offset=11, end_col_offset=16, text="a -", source_folder=source_file.parent
+            ),
+        ]
+
+        kept, equivalent, duplicate = equivalence.filter_equivalent_in_file(source_file, mutants)
+
+        assert kept == [mutants[0], mutants[3], mutants[5], mutants[6], mutants[7]]
+        assert equivalent == 2
+        assert duplicate == 1
+
+
+class TestFilterEquivalent:
+    def test_filter_equivalent(self, tmp_path, source_file):
+        other_file = tmp_path / "other.py"
+        other_file.write_text("VALUE = 5\n")
+        no_file = Mutant(
+            mutator_name="Test",
+            source_folder=tmp_path,
+            source_file=None,
+            lineno=1,
+            col_offset=0,
+            end_lineno=1,
+            end_col_offset=1,
+            text="x",
+        )
+        mutants = [
+            no_file,
+            create_mutant(
+                source_file, lineno=5, col_offset=8, end_col_offset=13, text="3", source_folder=source_file.parent
+            ),
+            create_mutant(
+                source_file, lineno=5, col_offset=8, end_col_offset=13, text="4", source_folder=source_file.parent
+            ),
+            create_mutant(
+                other_file, lineno=1, col_offset=8, end_col_offset=9, text="6", source_folder=other_file.parent
+            ),
+            create_mutant(
+                other_file, lineno=1, col_offset=8, end_col_offset=9, text="(6)", source_folder=other_file.parent
+            ),
+        ]
+        work = PoodleWork(PoodleConfigStub(max_workers=1))
+        work.echo = mock.MagicMock()
+
+        assert equivalence.filter_equivalent(work, mutants) == [mutants[2], mutants[3], no_file]
+        work.echo.assert_called_once_with(
+            "Skipping 1 mutant(s) equivalent to the original code, and 1 duplicate mutant(s)"
+        )
+
+    @mock.patch("poodle.equivalence.concurrent")
+    def test_filter_equivalent_parallel(self, concurrent, tmp_path):
+        files = [tmp_path / "a.py", tmp_path / "b.py"]
+        mutants = [
+            create_mutant(file, lineno=1, col_offset=0, end_col_offset=1, text="x", source_folder=file.parent)
+            for file in files
+        ]
+        executor = concurrent.futures.ProcessPoolExecutor.return_value.__enter__.return_value
+        executor.map.return_value = [([mutants[0]], 0, 0), ([mutants[1]], 0, 0)]
+        work = PoodleWork(PoodleConfigStub(max_workers=4))
+        work.echo = mock.MagicMock()
+
+        assert equivalence.filter_equivalent(work, mutants) == mutants
+
+        concurrent.futures.ProcessPoolExecutor.assert_called_once_with(
+            max_workers=2,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        executor.map.assert_called_once_with(equivalence.filter_equivalent_in_file, files, mock.ANY)
+        assert list(executor.map.call_args.args[2]) == [[mutants[0]], [mutants[1]]]
+        work.echo.assert_not_called()
@@ -0,0 +1,146 @@
+import subprocess
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from poodle import PoodleInputError, git_diff
+from poodle.data_types import FileMutation
+
+
+def file_mutation(lineno, end_lineno=None):
+    return FileMutation(
+        mutator_name="Test",
+        lineno=lineno,
+        col_offset=0,
+        end_lineno=end_lineno or lineno,
+        end_col_offset=1,
+        text="",
+    )
+
+
+def test_logger():
+    assert git_diff.logger.name == "poodle.git_diff"
+
+
+def test_parse_diff():
+    lines = [
+        "diff --git a/src/example.py b/src/example.py",
+        "index 1234567..89abcde 100644",
+        "--- a/src/example.py",
+        "+++ b/src/example.py",
+        "@@ -3 +3 @@ def f():",
+        "-    return 1",
+        "+    return 2",
+        "@@ -10,2 +9,0 @@ def g():",
+        "-    pass",
+        "-    pass",
+        "@@ -20,0 +21,3 @@ def h():",
+        "+    a = 1",
+        "+    b = 2",
+        "+    c = 3",
+        "diff --git a/src/removed.py b/src/removed.py",
+        "deleted file mode 100644",
+        "--- a/src/removed.py",
+        "+++ /dev/null",
+        "@@ -1,2 +0,0 @@",
+        "-a = 1",
+        "-b = 2",
+        "diff --git a/src/added.py b/src/added.py",
+        "new file mode 100644",
+        "--- /dev/null",
+        "+++ b/src/added.py",
+        "@@ -0,0 +1,2 @@",
+        "+a = 1",
+        "+b = 2",
+    ]
+    assert git_diff.parse_diff("\n".join(lines)) == {
+        Path("src/example.py"): [(3, 3), (21, 23)],
+        Path("src/added.py"): [(1, 2)],
+    }
+
+
+class TestChangedLines:
+    @pytest.fixture()
+    def changed_lines(self):
+        return git_diff.ChangedLines(
+            {
+                Path("src/example.py"): [(21, 23), (3, 3)],
+                Path("src/deleted_lines.py"): [],
+            },
+            {Path("src/new.py")},
+        )
+
+    def test_has_changes(self, changed_lines):
+        assert changed_lines.has_changes(Path("src/example.py")) is True
+        assert changed_lines.has_changes(Path("src/../src/example.py")) is True
+        assert changed_lines.has_changes(Path("src/new.py")) is True
+        assert changed_lines.has_changes(Path("src/deleted_lines.py")) is False
+        assert changed_lines.has_changes(Path("src/other.py")) is False
+
+    @pytest.mark.parametrize(
+        ("lineno", "end_lineno", "expected"),
+        [
+            (1, 2, False),
+            (2, 3, True),
+            (3, 3, True),
+            (3, 30, True),
+            (4, 20, False),
+            (4, 21, True),
+            (22, 22, True),
+            (23, 25, True),
+            (24, 25, False),
+        ],
+    )
+    def test_overlaps(self, changed_lines, lineno, end_lineno, expected):
+        assert changed_lines.overlaps(Path("src/example.py"), file_mutation(lineno, end_lineno)) is expected
+
+    def test_overlaps_untracked(self, changed_lines):
+        assert changed_lines.overlaps(Path("src/new.py"), file_mutation(100)) is True
+
+    def test_overlaps_unchanged(self, changed_lines):
+        assert changed_lines.overlaps(Path("src/other.py"), file_mutation(3)) is False
+
+    @mock.patch("poodle.git_diff.run_git")
+    def test_from_git(self, run_git):
+        run_git.side_effect = [
+            "--- a/src/example.py\n+++ b/src/example.py\n@@ -3 +3,2 @@\n",
+            "src/new.py\n",
+        ]
+
+        changed_lines = git_diff.ChangedLines.from_git("main")
+
+        run_git.assert_any_call(
+            "diff",
+            "-U0",
+            "--no-color",
+            "--no-ext-diff",
+            "--relative",
+            "--src-prefix=a/",
+            "--dst-prefix=b/",
+            "main",
+            "--",
+        )
+        run_git.assert_any_call("ls-files", "--others", "--exclude-standard")
+        assert changed_lines.file_ranges == {Path("src/example.py").resolve(): [(3, 4)]}
+        assert changed_lines.untracked == {Path("src/new.py").resolve()}
+
+
+class TestRunGit:
+    @mock.patch("poodle.git_diff.subprocess.run")
+    def test_run_git(self, run):
+        run.return_value = subprocess.CompletedProcess([], 0, stdout="output", stderr="")
+        assert git_diff.run_git("diff", "main") == "output"
+        run.assert_called_once_with(["git", "diff", "main"], capture_output=True, check=False, text=True)
+
+    @mock.patch("poodle.git_diff.subprocess.run")
+    def test_run_git_failed(self, run):
+        run.return_value = subprocess.CompletedProcess([], 128, stdout="", stderr="fatal: bad revision 'nope'\n")
+        with pytest.raises(PoodleInputError, match=r"^git diff failed: fatal: bad revision 'nope'$"):
+            git_diff.run_git("diff", "nope")
+
+    @mock.patch("poodle.git_diff.subprocess.run")
+    def test_run_git_not_found(self, run):
+        run.side_effect = FileNotFoundError
+        with pytest.raises(PoodleInputError, match=r"^diff_base requires git, but git was not found$"):
+            git_diff.run_git("diff", "main")
@@ -0,0 +1,178 @@
+import importlib
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from poodle import import_hook
+from poodle.data_types import FileMutation
+from poodle.schemata import schema_file
+
+
+@pytest.fixture()
+def package(tmp_path):
+    package = tmp_path / "hook_test_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "hook_test_module.py").write_text("value = 1\n")
+    sys.path.insert(0, str(tmp_path))
+    yield package
+    sys.path.remove(str(tmp_path))
+    sys.modules.pop("hook_test_package.hook_test_module", None)
+    sys.modules.pop("hook_test_package", None)
+
+
+@pytest.fixture()
+def meta_path():
+    with mock.patch.object(sys, "meta_path", list(sys.meta_path)) as meta_path:
+        yield meta_path
+
+
+def test_logger():
+    assert import_hook.logger.name == "poodle.import_hook"
+
+
+@pytest.mark.usefixtures("meta_path")
+class TestMutantFinder:
+    def test_import_mutated(self, package):
+        sys.meta_path.insert(0, import_hook.MutantFinder({package / "hook_test_module.py": "value = 2\n"}))
+        hook_test_module = importlib.import_module("hook_test_package.hook_test_module")
+
+        assert hook_test_module.value == 2
+        assert hook_test_module.__spec__.loader.get_source("hook_test_package.hook_test_module") == "value = 2\n"
+        assert not hasattr(hook_test_module, import_hook.ACTIVE_MUTANT)
+
+    def test_import_schema(self, package):
+        source = "value = 2 if __poodle_mutant__ == 1 else 1\n"
+        file = package / "hook_test_module.py"
+        sys.meta_path.insert(0, import_hook.MutantFinder({file: source}, {file: 1}))
+        hook_test_module = importlib.import_module("hook_test_package.hook_test_module")
+
+        assert hook_test_module.value == 2
+        assert hook_test_module.__poodle_mutant__ == 1
+
+    def test_other_module(self, package):
+        finder = import_hook.MutantFinder({package / "other.py": "value = 2\n"})
+        assert finder.find_spec("hook_test_package", None) is None
+        assert finder.find_spec("not_a_module", None) is None
+
+
+class TestMutantFromEnv:
+    def test_not_set(self):
+        with mock.patch.dict("os.environ", {}, clear=True):
+            assert import_hook.mutant_from_env() is None
+
+    def test_clean_run(self):
+        with mock.patch.dict("os.environ", {"MUT_SOURCE_FILE": "None"}, clear=True):
+            assert import_hook.mutant_from_env() is None
+
+    def test_mutant(self):
+        environ = {
+            "MUT_SOURCE_FILE": "src/target.py",
+            "MUT_LINENO": "1",
+            "MUT_COL_OFFSET": "2",
+            "MUT_END_LINENO": "3",
+            "MUT_END_COL_OFFSET": "4",
+            "MUT_TEXT": "Changed Line",
+        }
+        with mock.patch.dict("os.environ", environ, clear=True):
+            assert import_hook.mutant_from_env() == (
+                Path("src/target.py"),
+                FileMutation(
+                    mutator_name="",
+                    lineno=1,
+                    col_offset=2,
+                    end_lineno=3,
+                    end_col_offset=4,
+                    text="Changed Line",
+                ),
+            )
+
+
+def test_mutated_source(tmp_path):
+    (tmp_path / "target.py").write_text("x = 1\ny = 1\n")
+    mutation = FileMutation(mutator_name="", lineno=2, col_offset=4, end_lineno=2, end_col_offset=5, text="2")
+    assert import_hook.mutated_source(tmp_path / "target.py", mutation) == "x = 1\ny = 2\n"
+
+
+@pytest.mark.usefixtures("meta_path")
+class TestInstall:
+    def test_install(self, package):
+        finder = import_hook.install({package / "hook_test_module.py": "value = 2\n"})
+        assert sys.meta_path[0] is finder
+
+    def test_install_reload(self, package):
+        hook_test_module = importlib.import_module("hook_test_package.hook_test_module")
+
+        assert hook_test_module.value == 1
+        import_hook.install({package / "hook_test_module.py": "value = 2\n"})
+        assert hook_test_module.value == 2
+
+    @mock.patch("poodle.import_hook.install")
+    def test_install_from_env(self, install, tmp_path):
+        (tmp_path / "target.py").write_text("x = 1\n")
+        environ = {
+            "MUT_SOURCE_FILE": str(tmp_path / "target.py"),
+            "MUT_LINENO": "1",
+            "MUT_COL_OFFSET": "4",
+            "MUT_END_LINENO": "1",
+            "MUT_END_COL_OFFSET": "5",
+            "MUT_TEXT": "2",
+        }
+        with mock.patch.dict("os.environ", environ, clear=True):
+            assert import_hook.install_from_env() == install.return_value
+        install.assert_called_once_with({tmp_path / "target.py": "x = 2\n"}, {})
+
+    @pytest.mark.parametrize(
+        ("schema_id", "active_mutants"),
+        [
+            ("3", {"target.py": 3, "other.py": 0}),
+            ("None", {"other.py": 0}),
+        ],
+    )
+    @mock.patch("poodle.import_hook.install")
+    def test_install_from_env_schemata(self, install, tmp_path, schema_id, active_mutants):
+        (tmp_path / "target.py").write_text("x = 1\n")
+        schemata = tmp_path / "schemata"
+        schema_file(schemata, tmp_path / "target.py").parent.mkdir(parents=True)
+        schema_file(schemata, tmp_path / "target.py").write_text("schema target\n")
+        schema_file(schemata, tmp_path / "other.py").write_text("schema other\n")
+        environ = {
+            "POODLE_SCHEMATA": str(schemata),
+            "MUT_SOURCE_FILE": str(tmp_path / "target.py"),
+            "MUT_SCHEMA_ID": schema_id,
+            "MUT_LINENO": "1",
+            "MUT_COL_OFFSET": "4",
+            "MUT_END_LINENO": "1",
+            "MUT_END_COL_OFFSET": "5",
+            "MUT_TEXT": "2",
+        }
+        with mock.patch.dict("os.environ", environ, clear=True):
+            import_hook.install_from_env()
+
+        target_source = "schema target\n" if schema_id != "None" else "x = 2\n"
+        install.assert_called_once_with(
+            {tmp_path / "target.py": target_source, tmp_path / "other.py": "schema other\n"},
+            {tmp_path / name: mutant_id for name, mutant_id in active_mutants.items()},
+        )
+
+    @mock.patch("poodle.import_hook.install")
+    def test_install_from_env_schemata_clean_run(self, install, tmp_path):
+        schema_file(tmp_path, Path.cwd() / "target.py").parent.mkdir(parents=True)
+        schema_file(tmp_path, Path.cwd() / "target.py").write_text("schema target\n")
+        with mock.patch.dict("os.environ", {"POODLE_SCHEMATA": str(tmp_path), "MUT_SOURCE_FILE": "None"}, clear=True):
+            import_hook.install_from_env()
+        install.assert_called_once_with({Path.cwd() / "target.py": "schema target\n"}, {Path.cwd() / "target.py": 0})
+
+    @mock.patch("poodle.import_hook.install")
+    def test_install_from_env_clean_run(self, install):
+        with mock.patch.dict("os.environ", {"MUT_SOURCE_FILE": "None"}, clear=True):
+            assert import_hook.install_from_env() is None
+        install.assert_not_called()
+
+
+@mock.patch("poodle.import_hook.install_from_env")
+def test_pytest_load_initial_conftests(install_from_env):
+    import_hook.pytest_load_initial_conftests()
+    install_from_env.assert_called_once_with()
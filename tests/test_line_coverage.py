@@ -0,0 +1,202 @@
+import json
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from poodle import line_coverage
+from tests.data_types.test_data import create_mutant
+
+
+def test_logger():
+    assert line_coverage.logger.name == "poodle.line_coverage"
+
+
+@pytest.mark.skipif(not hasattr(sys, "monitoring"), reason="sys.monitoring requires Python 3.12+")
+def test_monitoring_collector(tmp_path):
+    source_file = tmp_path / "example.py"
+    source_file.write_text("def f(a):\n    return a + 1\n")
+    namespace: dict = {}
+    exec(compile(source_file.read_text(), str(source_file), "exec"), namespace)  # noqa: S102
+
+    collector = line_coverage.MonitoringCollector([str(tmp_path)])
+    collector.switch("test_1")
+    namespace["f"](1)
+    collector.switch("test_2")
+    namespace["f"](2)
+    namespace["f"](3)
+
+    assert collector.stop() == {str(source_file): {2: {"test_1", "test_2"}}}
+
+
+@pytest.mark.skipif(not hasattr(sys, "monitoring"), reason="sys.monitoring requires Python 3.12+")
+def test_monitoring_collector_coverage_id_in_use():
+    sys.monitoring.use_tool_id(sys.monitoring.COVERAGE_ID, "coverage")
+    try:
+        collector = line_coverage.MonitoringCollector(["src"])
+        assert collector.tool_id != sys.monitoring.COVERAGE_ID
+        assert sys.monitoring.get_tool(sys.monitoring.COVERAGE_ID) == "coverage"
+        collector.stop()
+    finally:
+        sys.monitoring.free_tool_id(sys.monitoring.COVERAGE_ID)
+
+
+def test_monitoring_collector_free_tool_id():
+    collector = line_coverage.MonitoringCollector.__new__(line_coverage.MonitoringCollector)
+    collector.monitoring = mock.MagicMock()
+    collector.monitoring.get_tool.side_effect = lambda tool_id: "other" if tool_id == 3 else None
+    assert collector.free_tool_id() == 4
+
+    collector.monitoring.get_tool.side_effect = lambda _: "other"
+    with pytest.raises(ValueError, match="No free sys.monitoring tool id"):
+        collector.free_tool_id()
+
+
+def test_coverage_py_collector(tmp_path):
+    source_file = tmp_path / "example.py"
+    source_file.write_text("def f(a):\n    return a + 1\n")
+    namespace: dict = {}
+    exec(compile(source_file.read_text(), str(source_file), "exec"), namespace)  # noqa: S102
+
+    collector = line_coverage.CoveragePyCollector([str(tmp_path)])
+    collector.switch("test_1")
+    namespace["f"](1)
+    collector.switch("test_2")
+    namespace["f"](2)
+
+    assert collector.stop() == {str(source_file): {2: {"test_1", "test_2"}}}
+
+
+class TestCreateCollector:
+    @mock.patch("poodle.line_coverage.MonitoringCollector")
+    def test_monitoring(self, monitoring_collector):
+        with mock.patch.object(sys, "monitoring", create=True):
+            assert line_coverage.create_collector(["src"]) == monitoring_collector.return_value
+        monitoring_collector.assert_called_once_with(["src"])
+
+    @mock.patch("poodle.line_coverage.CoveragePyCollector")
+    def test_coverage_py(self, coverage_py_collector):
+        with mock.patch("poodle.line_coverage.sys", spec=[]):
+            assert line_coverage.create_collector(["src"]) == coverage_py_collector.return_value
+        coverage_py_collector.assert_called_once_with(["src"])
+
+
+@mock.patch("poodle.line_coverage.create_collector")
+class TestCoveragePlugin:
+    def test_switch(self, create_collector):
+        plugin = line_coverage.CoveragePlugin(Path("coverage.json"), Path.cwd(), ["src"])
+        create_collector.assert_called_once_with(["src"])
+
+        plugin.pytest_runtest_logstart("tests/test_example.py::test_1")
+        create_collector.return_value.switch.assert_called_with("tests/test_example.py::test_1")
+
+        plugin.pytest_runtest_logfinish()
+        create_collector.return_value.switch.assert_called_with(line_coverage.IMPORT_TIME)
+
+    def test_sessionfinish(self, create_collector, tmp_path):
+        create_collector.return_value.stop.return_value = {str(tmp_path / "src" / "example.py"): {1: {"test_1"}}}
+        plugin = line_coverage.CoveragePlugin(tmp_path / "coverage.json", tmp_path, ["src"])
+
+        plugin.pytest_sessionfinish()
+
+        assert json.loads((tmp_path / "coverage.json").read_text()) == {
+            str(Path("src/example.py")): {"1": ["test_1"]},
+        }
+
+    def test_load_initial_conftests(self, create_collector):
+        early_config = mock.MagicMock()
+        env = {
+            "POODLE_COVERAGE_FILE": "coverage.json",
+            "POODLE_COVERAGE_ROOT": "run-1",
+            "POODLE_COVERAGE_INCLUDE": os.pathsep.join(["src", "lib"]),
+        }
+        with mock.patch.dict("os.environ", env, clear=True):
+            line_coverage.pytest_load_initial_conftests(early_config)
+
+        plugin = early_config.pluginmanager.register.call_args.args[0]
+        assert early_config.pluginmanager.register.call_args.args[1] == "poodle_line_coverage"
+        assert plugin.coverage_file == Path("coverage.json")
+        assert plugin.root == Path("run-1")
+        create_collector.assert_called_once_with(["src", "lib"])
+
+    def test_load_initial_conftests_no_tool_id(self, create_collector):
+        create_collector.side_effect = ValueError("No free sys.monitoring tool id")
+        early_config = mock.MagicMock()
+        env = {
+            "POODLE_COVERAGE_FILE": "coverage.json",
+            "POODLE_COVERAGE_ROOT": "run-1",
+            "POODLE_COVERAGE_INCLUDE": "src",
+        }
+        with mock.patch.dict("os.environ", env, clear=True):
+            line_coverage.pytest_load_initial_conftests(early_config)
+
+        early_config.pluginmanager.register.assert_not_called()
+
+    def test_load_initial_conftests_disabled(self, create_collector):
+        early_config = mock.MagicMock()
+        with mock.patch.dict("os.environ", {}, clear=True):
+            line_coverage.pytest_load_initial_conftests(early_config)
+
+        early_config.pluginmanager.register.assert_not_called()
+        create_collector.assert_not_called()
+
+
+def test_write_coverage_file(tmp_path):
+    line_coverage.write_coverage_file(
+        tmp_path / "work" / "coverage.json",
+        tmp_path,
+        {
+            str(tmp_path / "src" / "example.py"): {2: {"test_2", "test_1"}},
+            "/other/example.py": {5: {""}},
+        },
+    )
+    assert json.loads((tmp_path / "work" / "coverage.json").read_text()) == {
+        str(Path("src/example.py")): {"2": ["test_1", "test_2"]},
+        "/other/example.py": {"5": [""]},
+    }
+
+
+class TestCoverageIndex:
+    @pytest.fixture()
+    def index(self):
+        return line_coverage.CoverageIndex(
+            {
+                "src/example.py": {
+                    1: {""},
+                    3: {"test_1"},
+                    4: {"test_2", "test_1"},
+                },
+            },
+        )
+
+    def test_from_file(self, tmp_path):
+        coverage_file = tmp_path / "coverage.json"
+        coverage_file.write_text('{"src/example.py": {"3": ["test_1"]}}')
+        index = line_coverage.CoverageIndex.from_file(coverage_file)
+        assert index.line_tests == {Path("src/example.py").resolve(): {3: {"test_1"}}}
+
+    def test_merge_files(self):
+        index = line_coverage.CoverageIndex(
+            {"src/example.py": {3: {"test_1"}}, "src/../src/example.py": {3: {"test_2"}}}
+        )
+        assert index.line_tests == {Path("src/example.py").resolve(): {3: {"test_1", "test_2"}}}
+
+    def test_tests_for(self, index):
+        assert index.tests_for(create_mutant(lineno=3)) == ["test_1"]
+        assert index.tests_for(create_mutant(lineno=3, end_lineno=4)) == ["test_1", "test_2"]
+
+    def test_import_time(self, index):
+        assert index.tests_for(create_mutant(lineno=1)) is None
+
+    def test_clean_run(self, index):
+        assert index.tests_for(create_mutant(lineno=0, source_file=None)) is None
+
+    def test_test_count(self, index):
+        assert index.test_count == 2
+        assert line_coverage.CoverageIndex().test_count == 0
+
+    def test_not_covered(self, index):
+        assert index.tests_for(create_mutant(lineno=5)) == []
+        assert index.tests_for(create_mutant(lineno=3, source_file=Path("src/other.py"))) == []
@@ -0,0 +1,134 @@
+import pytest
+
+from poodle import line_filters
+from poodle.data_types import FileMutation
+from poodle.line_filters import LineFilters
+
+
+def file_mutation(mutator_name, lineno, end_lineno):
+    return FileMutation(
+        mutator_name=mutator_name,
+        lineno=lineno,
+        col_offset=0,
+        end_lineno=end_lineno,
+        end_col_offset=1,
+        text="",
+    )
+
+
+def test_logger():
+    assert line_filters.logger.name == "poodle.line_filters"
+
+
+def test_merge_ranges():
+    assert line_filters.merge_ranges([(8, 9), (2, 2), (3, 4), (4, 5), (11, 12), (12, 12)]) == [
+        (2, 5),
+        (8, 9),
+        (11, 12),
+    ]
+
+
+class TestFromSource:
+    def test_line_comments(self):
+        source = "\n".join(  # noqa: FLY002
+            [
+                "1",
+                "2 # pragma: no mutate",
+                "3 # pragma: no mutate # type: ignore",
+                "4 # nomut",
+                "5 # nomut: Example",
+                "6 # nomut: Example # type: ignore",
+                "7 # nomut Example",
+                "8 # nomut: Example1,Example2",
+                "9 # nomut: Example1, Example2 # pragma: no mutate",
+            ]
+        )
+        assert LineFilters.from_source(source).name_ranges == {
+            "all": [(2, 4), (9, 9)],
+            "example": [(5, 7)],
+            "example1": [(8, 9)],
+            "example2": [(8, 9)],
+        }
+
+    @pytest.mark.parametrize(("start", "end"), [("start", "end"), ("on", "off"), ("Start", "END")])
+    def test_start_end(self, start, end):
+        source = "\n".join(
+            [
+                "1",
+                f"2 # nomut: {start}",
+                "3 # nomut: Example",
+                f"4 # nomut: {end}",
+                "5 # nomut: Example",
+                "6",
+                "7",
+                f"8 # nomut: {start}",
+                "9 # nomut: Example1, Example2",
+                "10",
+            ]
+        )
+        assert LineFilters.from_source(source).name_ranges == {
+            "all": [(2, 4), (8, 11)],
+            "example": [(5, 5)],
+        }
+
+    def test_strings(self):
+        source = "\n".join(  # noqa: FLY002
+            [
+                'x = "# nomut"',
+                'y = """',
+                "# pragma: no mutate",
+                '"""  # nomut: Example',
+            ]
+        )
+        assert LineFilters.from_source(source).name_ranges == {"example": [(4, 4)]}
+
+    def test_no_filters(self):
+        filters = LineFilters.from_source("x = 1  # noqa: E501\n")
+        assert filters.name_ranges == {}
+        assert filters.covering(1, 1) == set()
+
+
+class TestLineFilters:
+    @pytest.fixture()
+    def filters(self):
+        return LineFilters({"all": [(3, 3), (10, 12)], "example": [(5, 6)]})
+
+    @pytest.mark.parametrize(
+        ("mutation_args", "expected"),
+        [
+            (("Example", 3, 3), True),
+            (("Other", 2, 3), True),
+            (("Other", 3, 4), True),
+            (("Other", 1, 2), False),
+            (("Other", 4, 9), False),
+            (("Other", 9, 13), True),
+            (("Example", 4, 4), False),
+            (("Example", 4, 5), True),
+            (("EXAMPLE", 6, 7), True),
+            (("Other", 5, 6), False),
+        ],
+    )
+    def test_overlaps(self, filters, mutation_args, expected):
+        assert filters.overlaps(file_mutation(*mutation_args)) is expected
+
+    @pytest.mark.parametrize(
+        ("lineno", "end_lineno", "expected"),
+        [
+            (3, 3, {"all"}),
+            (2, 3, set()),
+            (3, 4, set()),
+            (5, 6, {"example"}),
+            (4, 5, set()),
+            (6, 6, {"example"}),
+            (10, 12, {"all"}),
+            (11, 11, {"all"}),
+            (11, 13, set()),
+            (13, 13, set()),
+        ],
+    )
+    def test_covering(self, filters, lineno, end_lineno, expected):
+        assert filters.covering(lineno, end_lineno) == expected
+
+    def test_covering_adjoining(self):
+        filters = LineFilters({"all": [(3, 3)], "example": [(4, 4)]})
+        assert filters.covering(3, 4) == set()
@@ -0,0 +1,119 @@
+import sys
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from poodle import __version__, mutant_cache
+from poodle.data_types import FileMutation
+from poodle.mutators import BinaryOperationMutator, NumberMutator
+from tests.data_types.test_data import PoodleConfigStub
+
+
+@pytest.fixture()
+def config():
+    return PoodleConfigStub(mutator_opts={"operator_level": "min"})
+
+
+@pytest.fixture()
+def mutators(config):
+    return [
+        BinaryOperationMutator(config=config, echo=mock.MagicMock()),
+        NumberMutator(config=config, echo=mock.MagicMock()),
+    ]
+
+
+def file_mutation(mutator_name, text):
+    return FileMutation(
+        mutator_name=mutator_name,
+        lineno=1,
+        col_offset=4,
+        end_lineno=1,
+        end_col_offset=9,
+        text=text,
+    )
+
+
+def test_logger():
+    assert mutant_cache.logger.name == "poodle.mutant_cache"
+
+
+def test_file_hash():
+    assert mutant_cache.file_hash(b"a = 1\n") == mutant_cache.file_hash(b"a = 1\n")
+    assert mutant_cache.file_hash(b"a = 1\n") != mutant_cache.file_hash(b"a = 2\n")
+
+
+class TestMutantCache:
+    def test_init(self, config, tmp_path):
+        cache = mutant_cache.MutantCache(config, tmp_path / "cache")
+        assert cache.db_file == tmp_path / "cache" / "mutants.db"
+        assert cache.db_file.is_file()
+        cache.close()
+
+    def test_put_get(self, config, mutators, tmp_path):
+        mutations = {
+            id(mutators[0]): [file_mutation("BinOp", "1 * 2"), file_mutation("BinOp", "1 / 2")],
+            id(mutators[1]): [],
+        }
+        cache = mutant_cache.MutantCache(config, tmp_path)
+        cache.put("hash", mutators, mutations)
+        cache.close()
+
+        cache = mutant_cache.MutantCache(config, tmp_path)
+        assert cache.get("hash", mutators) == mutations
+        assert cache.get("other", mutators) == {}
+        cache.close()
+
+    def test_get_partial(self, config, mutators, tmp_path):
+        cache = mutant_cache.MutantCache(config, tmp_path)
+        cache.put("hash", mutators[:1], {id(mutators[0]): [file_mutation("BinOp", "1 * 2")]})
+
+        assert cache.get("hash", mutators) == {id(mutators[0]): [file_mutation("BinOp", "1 * 2")]}
+        cache.close()
+
+    def test_mutator_opts(self, config, mutators, tmp_path):
+        cache = mutant_cache.MutantCache(config, tmp_path)
+        cache.put("hash", mutators[:1], {id(mutators[0]): [file_mutation("BinOp", "1 * 2")]})
+        cache.close()
+
+        cache = mutant_cache.MutantCache(PoodleConfigStub(mutator_opts={"operator_level": "max"}), tmp_path)
+        assert cache.get("hash", mutators) == {}
+        cache.close()
+
+    def test_version(self, config, mutators, tmp_path):
+        cache = mutant_cache.MutantCache(config, tmp_path)
+        cache.put("hash", mutators[:1], {id(mutators[0]): [file_mutation("BinOp", "1 * 2")]})
+        cache.close()
+
+        with mock.patch("poodle.mutant_cache.__version__", f"{__version__}.post1"):
+            cache = mutant_cache.MutantCache(config, tmp_path)
+        assert cache.get("hash", mutators) == {}
+        cache.close()
+
+    @pytest.mark.parametrize(
+        ("implementation", "version_info"),
+        [(sys.implementation.name, (3, 99, 0)), ("other", sys.version_info)],
+    )
+    def test_python_version(self, config, mutators, tmp_path, implementation, version_info):
+        cache = mutant_cache.MutantCache(config, tmp_path)
+        cache.put("hash", mutators[:1], {id(mutators[0]): [file_mutation("BinOp", "1 * 2")]})
+        cache.close()
+
+        with (
+            mock.patch("sys.version_info", version_info),
+            mock.patch("sys.implementation", SimpleNamespace(name=implementation)),
+        ):
+            cache = mutant_cache.MutantCache(config, tmp_path)
+        assert cache.get("hash", mutators) == {}
+        cache.close()
+
+    def test_clear(self, config, mutators, tmp_path):
+        cache = mutant_cache.MutantCache(config, tmp_path)
+        cache.put("hash", mutators[:1], {id(mutators[0]): [file_mutation("BinOp", "1 * 2")]})
+        cache.close()
+
+        cache = mutant_cache.MutantCache(
+            PoodleConfigStub(mutator_opts=config.mutator_opts, clear_result_cache=True), tmp_path
+        )
+        assert cache.get("hash", mutators) == {}
+        cache.close()
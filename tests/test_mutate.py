@@ -1,10 +1,14 @@
+import ast
 import importlib
+import multiprocessing
 from unittest import mock
 
 import pytest
 
 from poodle import PoodleInputError, mutate
 from poodle.data_types import FileMutation, Mutant, Mutator, PoodleWork
+from poodle.mutant_cache import MutantCache
+from poodle.mutators import ComparisonMutator, NumberMutator
 from tests.data_types.test_data import PoodleConfigStub
 
 
@@ -152,7 +156,7 @@ class TestCreateMutants:
             "example_2": ["file_3.py", "file_4.py"],
         }
 
-        def mock_create_mutants_for_file(work, folder, file):  # noqa: ARG001
+        def mock_create_mutants_for_file(work, folder, file, changed_lines):  # noqa: ARG001
             return [mock.MagicMock(folder=folder, file=file)]
 
         create_mutants_for_file.side_effect = mock_create_mutants_for_file
@@ -162,7 +166,7 @@ class TestCreateMutants:
         get_target_files.assert_called_with(work)
         create_mutants_for_file.assert_has_calls(
             [
-                mock.call(work, "example_1", "file_1.py"),
+                mock.call(work, "example_1", "file_1.py", None),
             ]
         )
 
@@ -173,6 +177,23 @@ class TestCreateMutants:
             ("example_2", "file_4.py"),
         ]
 
+    @mock.patch("poodle.mutate.get_target_files")
+    @mock.patch("poodle.mutate.create_mutants_for_file")
+    @mock.patch("poodle.mutate.ChangedLines")
+    def test_create_mutants_for_all_mutators_diff_base(
+        self, changed_lines_class, create_mutants_for_file, get_target_files
+    ):
+        work = PoodleWork(PoodleConfigStub(diff_base="main"))
+        get_target_files.return_value = {"example_1": ["file_1.py", "file_2.py"]}
+        changed_lines = changed_lines_class.from_git.return_value
+        changed_lines.has_changes.side_effect = lambda file: file == "file_2.py"
+        create_mutants_for_file.return_value = ["mutant"]
+
+        assert mutate.create_mutants_for_all_mutators(work) == ["mutant"]
+
+        changed_lines_class.from_git.assert_called_once_with("main")
+        create_mutants_for_file.assert_called_once_with(work, "example_1", "file_2.py", changed_lines)
+
     @mock.patch("poodle.mutate.files_list_for_folder")
     def test_get_target_files_only(self, files_list_for_folder, logger_mock):
         files_list_for_folder.side_effect = [
@@ -249,7 +270,7 @@ class TestCreateMutants:
             "2",
         ]
 
-        file.read_text.return_value.splitlines.return_value = file_lines
+        file.read_text.return_value = "1 # nomut\n2\n"
 
         def deepcopy_mock(obj):
             if obj == parsed_ast:
@@ -302,110 +323,247 @@ class TestCreateMutants:
             ),
         ]
 
+    @mock.patch("poodle.mutate.write_schema")
+    @mock.patch("poodle.mutate.create_schema")
+    def test_create_mutants_for_file_schemata(self, create_schema, write_schema, tmp_path):
+        config = PoodleConfigStub(workspace="schemata")
+        work = PoodleWork(config)
+        work.mutators = [mock.MagicMock(return_value=[file_mutation("Example", 1, 1)])]
+        file = tmp_path / "target.py"
+        file.write_text("x = 1\n")
 
-class TestFilter:
-    def test_parse_filters(self):
-        file_lines = [
-            "1",
-            "2 # pragma: no mutate",
-            "3 # pragma: no mutate # type: ignore",
-            "4 # nomut",
-            "5 # nomut: Example",
-            "6 # nomut: Example # type: ignore",
-            "7 # nomut Example",
-            "8 # nomut: Example1,Example2",
-            "9 # nomut: Example1, Example2 # pragma: no mutate",
+        out_mutants = mutate.create_mutants_for_file(work, tmp_path, file)
+
+        create_schema.assert_called_once_with(mock.ANY, "x = 1\n", out_mutants)
+        write_schema.assert_called_once_with(config, file, create_schema.return_value)
+
+    def test_create_mutants_for_file_changed_lines(self, tmp_path):
+        work = PoodleWork(PoodleConfigStub())
+        work.mutators = [mock.MagicMock(return_value=[file_mutation("Example", 1, 1), file_mutation("Example", 2, 3)])]
+        file = tmp_path / "target.py"
+        file.write_text("x = 1\ny = (\n2)\n")
+        changed_lines = mock.MagicMock()
+        changed_lines.overlaps.side_effect = lambda _, mutation: mutation.lineno == 2
+
+        out_mutants = mutate.create_mutants_for_file(work, tmp_path, file, changed_lines)
+
+        assert [mutant.lineno for mutant in out_mutants] == [2]
+        changed_lines.overlaps.assert_any_call(file, file_mutation("Example", 1, 1))
+
+    @mock.patch("poodle.mutate.write_schema")
+    def test_create_mutants_for_file_no_schemata(self, write_schema, tmp_path):
+        work = PoodleWork(PoodleConfigStub(workspace="zip"))
+        file = tmp_path / "target.py"
+        file.write_text("x = 1\n")
+
+        mutate.create_mutants_for_file(work, tmp_path, file)
+
+        write_schema.assert_not_called()
+
+    def test_is_single_pass(self):
+        config = PoodleConfigStub(mutator_opts={})
+
+        class SubNumberMutator(NumberMutator):
+            pass
+
+        assert mutate.is_single_pass(NumberMutator(config=config, echo=mock.MagicMock())) is True
+        assert mutate.is_single_pass(SubNumberMutator(config=config, echo=mock.MagicMock())) is False
+        assert mutate.is_single_pass(FakeMutator(config=config, echo=mock.MagicMock())) is False
+
+    @mock.patch("poodle.mutate.create_mutations")
+    def test_create_mutants_for_file_single_pass(self, create_mutations, tmp_path):
+        work = PoodleWork(PoodleConfigStub(mutator_opts={}))
+        number = NumberMutator(config=work.config, echo=mock.MagicMock())
+        compare = ComparisonMutator(config=work.config, echo=mock.MagicMock())
+        other = mock.MagicMock(return_value=[file_mutation("Other", 1, 1)])
+        work.mutators = [number, other, compare]
+        create_mutations.return_value = [[file_mutation("Number", 1, 1)], [file_mutation("Compare", 2, 2)]]
+        file = tmp_path / "target.py"
+        file.write_text("x = 1\ny = x < 2\n")
+
+        out_mutants = mutate.create_mutants_for_file(work, tmp_path, file)
+
+        create_mutations.assert_called_once_with(mock.ANY, [number, compare], mock.ANY)
+        assert [mutant.mutator_name for mutant in out_mutants] == ["Number", "Other", "Compare"]
+        other.assert_called_once()
+
+    def test_create_mutants_for_file_line_filters(self, tmp_path):
+        work = PoodleWork(PoodleConfigStub(mutator_opts={}))
+        work.mutators = [NumberMutator(config=work.config, echo=mock.MagicMock())]
+        file = tmp_path / "target.py"
+        file.write_text('x = 1  # nomut\ny = "# nomut"; z = 2\nw = (3,  # nomut: Number\n  4)\n')
+
+        out_mutants = mutate.create_mutants_for_file(work, tmp_path, file)
+
+        assert [(mutant.lineno, mutant.text) for mutant in out_mutants] == [(2, "3"), (2, "1"), (4, "5"), (4, "3")]
+
+
+class TestParallel:
+    @pytest.fixture()
+    def target_files(self, tmp_path):
+        files = [tmp_path / "a.py", tmp_path / "b.py", tmp_path / "c.py"]
+        files[0].write_text("x = 1\n")
+        files[1].write_text("y = x < 2\n")
+        files[2].write_text("z = f(3)\n")
+        return files
+
+    def test_is_picklable(self):
+        assert mutate.is_picklable(fake_mutator) is True
+        assert mutate.is_picklable(lambda: None) is False
+        assert mutate.is_picklable(mock.MagicMock()) is False
+
+    def test_get_pool_mutators(self):
+        work = PoodleWork(PoodleConfigStub())
+        work.mutators = [fake_mutator, lambda *_, **__: [], FakeMutator(work.config, echo=print)]
+        assert mutate.get_pool_mutators(work) == [work.mutators[0], work.mutators[2]]
+
+    def test_get_pool_mutators_config(self):
+        work = PoodleWork(PoodleConfigStub(add_mutators=[lambda *_, **__: []]))
+        work.mutators = [fake_mutator]
+        assert mutate.get_pool_mutators(work) == []
+
+    def test_get_pool_mutators_schemata(self):
+        work = PoodleWork(PoodleConfigStub(workspace="schemata"))
+        work.mutators = [fake_mutator, lambda *_, **__: []]
+        assert mutate.get_pool_mutators(work) == []
+
+    @mock.patch("poodle.mutate.create_mutants_for_file")
+    def test_create_mutants_in_worker(self, create_mutants_for_file):
+        config = PoodleConfigStub()
+
+        out = mutate.create_mutants_in_worker(config, [fake_mutator], None, "folder", "file.py")
+
+        assert out == create_mutants_for_file.return_value
+        work = create_mutants_for_file.call_args.args[0]
+        assert work.config == config
+        assert work.mutators == [fake_mutator]
+        create_mutants_for_file.assert_called_once_with(work, "folder", "file.py", None)
+
+    @mock.patch("poodle.mutate.concurrent")
+    @mock.patch("poodle.mutate.create_mutants_for_file")
+    def test_create_mutants_in_pool(self, create_mutants_for_file, concurrent):
+        main_mutator = mock.MagicMock()
+        work = PoodleWork(PoodleConfigStub())
+        work.mutators = [main_mutator, fake_mutator]
+        executor = concurrent.futures.ProcessPoolExecutor.return_value.__enter__.return_value
+        executor.map.return_value = [["pool_a"], ["pool_b"]]
+        create_mutants_for_file.side_effect = lambda _, __, file, *___: [f"main_{file}"]
+
+        out = mutate.create_mutants_in_pool(work, [("src", "a"), ("src", "b")], [fake_mutator], None, 2)
+
+        assert out == ["pool_a", "main_a", "pool_b", "main_b"]
+        concurrent.futures.ProcessPoolExecutor.assert_called_once_with(
+            max_workers=2,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        worker = executor.map.call_args.args[0]
+        assert worker.func == mutate.create_mutants_in_worker
+        assert worker.args == (work.config, [fake_mutator], None)
+        assert executor.map.call_args.args[1:] == (("src", "src"), ("a", "b"))
+        create_mutants_for_file.assert_called_with(work, "src", "b", None, [main_mutator])
+
+    @mock.patch("poodle.mutate.concurrent")
+    def test_create_mutants_in_pool_no_main_mutators(self, concurrent):
+        work = PoodleWork(PoodleConfigStub())
+        work.mutators = [fake_mutator]
+        executor = concurrent.futures.ProcessPoolExecutor.return_value.__enter__.return_value
+        executor.map.return_value = [["pool_a"], ["pool_b"]]
+
+        out = mutate.create_mutants_in_pool(work, [("src", "a"), ("src", "b")], [fake_mutator], None, 2)
+
+        assert out == ["pool_a", "pool_b"]
+
+    @pytest.mark.parametrize("max_workers", [None, 1, 4])
+    def test_create_mutants_for_all_mutators_parallel(self, max_workers, target_files, tmp_path):
+        work = PoodleWork(PoodleConfigStub(max_workers=1, skip_mutators=[], add_mutators=[], mutator_opts={}))
+        work.mutators = mutate.initialize_mutators(work)
+        work.config.max_workers = max_workers
+
+        with mock.patch("poodle.mutate.get_target_files", return_value={tmp_path: target_files}):
+            out = mutate.create_mutants_for_all_mutators(work)
+
+        assert [(mutant.source_file.name, mutant.mutator_name, mutant.text) for mutant in out] == [
+            ("a.py", "Number", "2"),
+            ("a.py", "Number", "0"),
+            ("b.py", "Compare", "x >= 2"),
+            ("b.py", "Compare", "x <= 2"),
+            ("b.py", "Number", "3"),
+            ("b.py", "Number", "1"),
+            ("c.py", "Number", "4"),
+            ("c.py", "Number", "2"),
+            ("c.py", "FuncCall", "None"),
         ]
-        assert mutate.parse_filters(file_lines) == {
-            2: {"all"},
-            3: {"all"},
-            4: {"all"},
-            5: {"example"},
-            6: {"example"},
-            7: {"example"},
-            8: {"example1", "example2"},
-            9: {"example1", "example2", "all"},
-        }
 
-    def test_parse_filters_start_end(self):
-        file_lines = [
-            "1",
-            "2 # nomut: start",
-            "3",
-            "4 # nomut: end",
-            "5",
-            "6",
-            "7",
-            "8 # nomut: start",
-            "9 # nomut: Example1, Example2",
+
+class TestMutantCache:
+    @pytest.fixture()
+    def work(self, tmp_path):
+        work = PoodleWork(PoodleConfigStub(mutator_opts={}))
+        work.mutators = [
+            NumberMutator(config=work.config, echo=mock.MagicMock()),
+            ComparisonMutator(config=work.config, echo=mock.MagicMock()),
         ]
-        assert mutate.parse_filters(file_lines) == {
-            2: {"all"},
-            3: {"all"},
-            4: {"all"},
-            8: {"all"},
-            9: {"all"},
-        }
+        work.mutant_cache = MutantCache(work.config, tmp_path / "cache")
+        yield work
+        work.mutant_cache.close()
 
-    def test_parse_filters_on_off(self):
-        file_lines = [
-            "1",
-            "2 # nomut: on",
+    @pytest.fixture()
+    def target(self, tmp_path):
+        file = tmp_path / "target.py"
+        file.write_text("y = x < 2  # nomut: Number\n")
+        return file
+
+    def test_warm(self, work, target, tmp_path):
+        cold = mutate.create_mutants_for_file(work, tmp_path, target)
+
+        with mock.patch("poodle.mutate.ast.parse") as parse:
+            warm = mutate.create_mutants_for_file(work, tmp_path, target)
+
+        parse.assert_not_called()
+        assert warm == cold
+        assert [mutant.text for mutant in warm] == ["x >= 2", "x <= 2"]
+
+    def test_changed_file(self, work, target, tmp_path):
+        mutate.create_mutants_for_file(work, tmp_path, target)
+        target.write_text("y = x == 2\n")
+
+        assert [mutant.text for mutant in mutate.create_mutants_for_file(work, tmp_path, target)] == [
             "3",
-            "4 # nomut: off",
-            "5",
-            "6",
-            "7",
-            "8 # nomut: on",
-            "9 # nomut: Example1, Example2",
+            "1",
+            "x != 2",
         ]
-        assert mutate.parse_filters(file_lines) == {
-            2: {"all"},
-            3: {"all"},
-            4: {"all"},
-            8: {"all"},
-            9: {"all"},
-        }
 
-    def test_add_filter(self):
-        line_filters = {}
-        mutate.add_line_filter(line_filters, 3, "all")
-        assert line_filters == {3: {"all"}}
-        mutate.add_line_filter(line_filters, 3, "Example")
-        assert line_filters == {3: {"all", "example"}}
-        mutate.add_line_filter(line_filters, 4, "Example")
-        assert line_filters == {3: {"all", "example"}, 4: {"example"}}
-        mutate.add_line_filter(line_filters, 5, "")
-        assert line_filters == {3: {"all", "example"}, 4: {"example"}, 5: {"all"}}
-
-    @pytest.mark.parametrize(
-        ("mutation_args", "mutators", "expected"),
-        [
-            # all
-            (("Example", 3, 3), {"all", "other"}, True),
-            (("Example", 2, 3), {"all", "other"}, True),
-            (("Example", 3, 4), {"all", "other"}, True),
-            (("Example", 2, 4), {"all", "other"}, True),
-            (("Example", 4, 5), {"all", "other"}, False),
-            (("Example", 1, 2), {"all", "other"}, False),
-            # match
-            (("Example", 3, 3), {"example", "other"}, True),
-            (("Example", 2, 3), {"example", "other"}, True),
-            (("Example", 3, 4), {"example", "other"}, True),
-            (("Example", 2, 4), {"example", "other"}, True),
-            (("Example", 4, 5), {"example", "other"}, False),
-            (("Example", 1, 2), {"example", "other"}, False),
-            # no match
-            (("Example", 3, 3), {"other", "other2"}, False),
-            (("Example", 2, 3), {"other", "other2"}, False),
-            (("Example", 3, 4), {"other", "other2"}, False),
-            (("Example", 2, 4), {"other", "other2"}, False),
-            (("Example", 4, 5), {"other", "other2"}, False),
-            (("Example", 1, 2), {"other", "other2"}, False),
-        ],
-    )
-    def test_is_filtered(self, mutation_args, mutators, expected):
-        file_mutant = file_mutation(mutation_args[0], mutation_args[1], mutation_args[2])
-        line_filters = {3: mutators}
+    def test_other_mutators(self, work, target, tmp_path):
+        other = mock.MagicMock(return_value=[file_mutation("Other", 1, 1)])
+        work.mutators.append(other)
+        cold = mutate.create_mutants_for_file(work, tmp_path, target)
+
+        with mock.patch("poodle.mutate.create_mutations", wraps=mutate.create_mutations) as create_mutations:
+            warm = mutate.create_mutants_for_file(work, tmp_path, target)
+
+        create_mutations.assert_called_once_with(mock.ANY, [], mock.ANY)
+        assert other.call_count == 2
+        assert warm == cold
+
+    @mock.patch("poodle.mutate.write_schema")
+    @mock.patch("poodle.mutate.create_schema")
+    def test_schemata(self, create_schema, write_schema, work, target, tmp_path):
+        work.config.workspace = "schemata"
+        mutate.create_mutants_for_file(work, tmp_path, target)
+
+        warm = mutate.create_mutants_for_file(work, tmp_path, target)
+
+        assert isinstance(create_schema.call_args.args[0], ast.Module)
+        create_schema.assert_called_with(mock.ANY, target.read_text(), warm)
+        write_schema.assert_called_with(work.config, target, create_schema.return_value)
+
+    @mock.patch("poodle.mutate.create_mutants_for_file")
+    @mock.patch("poodle.mutate.MutantCache")
+    def test_create_mutants_in_worker(self, mutant_cache_class, create_mutants_for_file):
+        config = PoodleConfigStub(mutant_cache=True)
+
+        mutate.create_mutants_in_worker(config, [fake_mutator], None, "folder", "file.py")
 
-        assert mutate.is_filtered(line_filters, file_mutant) is expected
+        mutant_cache_class.assert_called_once_with(config)
+        assert create_mutants_for_file.call_args.args[0].mutant_cache == mutant_cache_class.return_value
+        mutant_cache_class.return_value.close.assert_called_once_with()
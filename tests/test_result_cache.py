@@ -0,0 +1,155 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from poodle import result_cache
+from poodle.data_types import MutantTrial, MutantTrialResult
+from tests.data_types.test_data import PoodleConfigStub, create_mutant
+
+
+@pytest.fixture()
+def source_file(tmp_path):
+    source_file = tmp_path / "example.py"
+    source_file.write_text("a = 1 + 2\n")
+    return source_file
+
+
+@pytest.fixture()
+def config():
+    return PoodleConfigStub(runner="command_line", runner_opts={}, result_cache_files=[])
+
+
+def test_logger():
+    assert result_cache.logger.name == "poodle.result_cache"
+
+
+class TestResultCache:
+    def test_init(self, config, tmp_path):
+        cache = result_cache.ResultCache(config, tmp_path / "cache")
+        assert cache.db_file == tmp_path / "cache" / "results.db"
+        assert cache.db_file.is_file()
+        assert cache.context_hash == result_cache.context_hash(config)
+        cache.close()
+
+    def test_put_get(self, config, source_file, tmp_path):
+        mutants = [create_mutant(source_file, text=text) for text in ("1 - 2", "1 * 2", "1 / 2")]
+        results = [
+            MutantTrialResult(True, MutantTrialResult.RC_FOUND, "found"),
+            MutantTrialResult(False, MutantTrialResult.RC_NOT_FOUND),
+            MutantTrialResult(True, MutantTrialResult.RC_TIMEOUT),
+        ]
+        cache = result_cache.ResultCache(config, tmp_path)
+        cache.put_all([MutantTrial(mutant, result, 1.0) for mutant, result in zip(mutants, results, strict=True)])
+        cache.close()
+
+        cache = result_cache.ResultCache(config, tmp_path)
+        assert cache.get(mutants[0]) == results[0]
+        assert cache.get(mutants[1]) == results[1]
+        assert cache.get(mutants[2]) is None
+        cache.close()
+
+    def test_clear(self, config, source_file, tmp_path):
+        mutant = create_mutant(source_file)
+        cache = result_cache.ResultCache(config, tmp_path)
+        cache.put_all([MutantTrial(mutant, MutantTrialResult(True, MutantTrialResult.RC_FOUND), 1.0)])
+        cache.close()
+
+        config.clear_result_cache = True
+        cache = result_cache.ResultCache(config, tmp_path)
+        assert cache.get(mutant) is None
+        assert cache.get_duration(mutant) is None
+        cache.close()
+
+    def test_key(self, config, source_file, tmp_path):
+        cache = result_cache.ResultCache(config, tmp_path)
+        key = cache.key(create_mutant(source_file))
+        assert key == cache.key(create_mutant(source_file))
+        assert key != cache.key(create_mutant(source_file, text="1 * 2"))
+
+        source_file.write_text("a = 1 + 2  # changed\n")
+        assert key == cache.key(create_mutant(source_file)), "file hashes are computed once per run"
+        assert key != result_cache.ResultCache(config, tmp_path).key(create_mutant(source_file))
+        cache.close()
+
+    def test_key_no_source_file(self, config, source_file, tmp_path):
+        mutant = create_mutant(source_file)
+        mutant.source_file = None
+        cache = result_cache.ResultCache(config, tmp_path)
+        assert cache.key(mutant) is None
+        assert cache.get(mutant) is None
+        cache.put_all([MutantTrial(mutant, MutantTrialResult(True, MutantTrialResult.RC_FOUND), 1.0)])
+        assert cache.connection.execute("SELECT COUNT(*) FROM results").fetchone() == (0,)
+        cache.close()
+
+    def test_stored_result(self, config, source_file, tmp_path):
+        mutant = create_mutant(source_file)
+        result = MutantTrialResult(False, MutantTrialResult.RC_NOT_FOUND, "desc")
+        cache = result_cache.ResultCache(config, tmp_path)
+        cache.put_all([MutantTrial(mutant, result, 1.0)])
+        row = cache.connection.execute("SELECT key, result FROM results").fetchone()
+        assert row[0] == cache.key(mutant)
+        assert json.loads(row[1]) == result.to_dict()
+        cache.close()
+
+    def test_durations(self, config, source_file, tmp_path):
+        mutants = [create_mutant(source_file, text=text) for text in ("1 - 2", "1 * 2", "1 / 2")]
+        results = [
+            MutantTrialResult(True, MutantTrialResult.RC_FOUND),
+            MutantTrialResult(False, MutantTrialResult.RC_TIMEOUT),
+            MutantTrialResult(False, MutantTrialResult.RC_INCOMPLETE),
+        ]
+        cache = result_cache.ResultCache(config, tmp_path)
+        cache.put_all([MutantTrial(mutant, result, 2.5) for mutant, result in zip(mutants, results, strict=True)])
+
+        assert cache.get_duration(mutants[0]) == 2.5
+        assert cache.get_duration(mutants[1]) == 2.5
+        assert cache.get_duration(mutants[2]) is None
+        cache.close()
+
+    def test_durations_file_changed(self, config, source_file, tmp_path):
+        mutant = create_mutant(source_file)
+        cache = result_cache.ResultCache(config, tmp_path)
+        cache.put_all([MutantTrial(mutant, MutantTrialResult(True, MutantTrialResult.RC_FOUND), 1.5)])
+        cache.close()
+
+        source_file.write_text("a = 1 + 2  # changed\n")
+        cache = result_cache.ResultCache(config, tmp_path)
+        assert cache.get(mutant) is None
+        assert cache.get_duration(mutant) == 1.5
+        cache.close()
+
+    def test_durations_no_source_file(self, config, source_file, tmp_path):
+        mutant = create_mutant(source_file)
+        mutant.source_file = None
+        cache = result_cache.ResultCache(config, tmp_path)
+        cache.put_all([MutantTrial(mutant, MutantTrialResult(True, MutantTrialResult.RC_FOUND), 1.5)])
+        assert cache.get_duration(mutant) is None
+        assert cache.connection.execute("SELECT COUNT(*) FROM durations").fetchone() == (0,)
+        cache.close()
+
+    def test_orphans_not_saved(self, config, source_file, tmp_path):
+        mutant = create_mutant(source_file)
+        cache = result_cache.ResultCache(config, tmp_path)
+        cache.put_all([MutantTrial(mutant, MutantTrialResult(True, MutantTrialResult.RC_FOUND, orphans=3), 1.0)])
+        assert cache.get(mutant) == MutantTrialResult(True, MutantTrialResult.RC_FOUND)
+        cache.close()
+
+
+class TestContextHash:
+    def test_runner_opts(self, config):
+        base = result_cache.context_hash(config)
+        config.runner_opts = {"command_line": "pytest -x"}
+        assert result_cache.context_hash(config) != base
+
+    def test_files(self, config, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        Path("tests").mkdir()
+        Path("tests/test_example.py").write_text("def test_1(): ...\n")
+        config.result_cache_files = ["tests/**/*.py"]
+
+        base = result_cache.context_hash(config)
+        assert base == result_cache.context_hash(config)
+
+        Path("tests/test_example.py").write_text("def test_1(): assert True\n")
+        assert result_cache.context_hash(config) != base
@@ -1,3 +1,4 @@
+import asyncio
 from concurrent.futures import Future
 from pathlib import Path
 from unittest import mock
@@ -5,8 +6,9 @@ from unittest import mock
 import click
 import pytest
 
-from poodle import run
+from poodle import PoodleInputError, run
 from poodle.data_types import Mutant, MutantTrial, MutantTrialResult, PoodleWork, TestingResults, TestingSummary
+from poodle.line_coverage import CoverageIndex
 from tests.data_types.test_data import PoodleConfigStub
 
 
@@ -34,6 +36,7 @@ def test_logger():
 def test_builtin_runners():
     assert run.builtin_runners == {
         "command_line": run.command_line.runner,
+        "pytest_forkserver": run.pytest_forkserver.runner,
     }
 
 
@@ -54,6 +57,16 @@ class TestGetRunner:
             run.get_runner(config)
         mock_logger.debug.assert_called_with("Runner: %s", config.runner)
 
+    def test_forkserver_runner(self):
+        config = PoodleConfigStub(runner="pytest_forkserver")
+        assert run.get_runner(config) is run.pytest_forkserver.runner
+
+    def test_forkserver_runner_no_fork(self, monkeypatch):
+        monkeypatch.delattr(run.os, "fork", raising=False)
+        config = PoodleConfigStub(runner="pytest_forkserver")
+        with pytest.raises(PoodleInputError, match=r"^Runner 'pytest_forkserver' requires os.fork"):
+            run.get_runner(config)
+
 
 class TestCleanRunTrial:
     @mock.patch("poodle.run.clean_run_trial")
@@ -107,6 +120,7 @@ class TestCleanRunTrial:
 
         mock_echo.assert_any_call(f"Testing clean run of folder '{folder}'...", nl=False)
         mock_echo.assert_any_call("PASSED")
+        assert work.clean_run_durations == {folder: 1}
 
         mock_logger.info.assert_called_with("Elapsed Time %.2f s", 2)
 
@@ -141,6 +155,200 @@ class TestCleanRunTrial:
         mock_echo.assert_any_call(f"Testing clean run of folder '{folder}'...", nl=False)
         mock_echo.assert_any_call(click.style("FAILED", fg="red"))
 
+    @mock.patch("poodle.run.run_mutant_trial")
+    def test_clean_run_trial_resource_limit(self, run_mutant_trial, mock_echo):
+        folder = Path("source_folder")
+
+        work = PoodleWork(config=PoodleConfigStub())
+        work.echo = mock_echo
+        work.folder_zips = {folder: Path("folder.zip")}
+
+        mutant = Mutant(
+            mutator_name="",
+            source_folder=folder,
+            source_file=None,
+            lineno=0,
+            col_offset=0,
+            end_lineno=0,
+            end_col_offset=0,
+            text="",
+        )
+        result = MutantTrialResult(False, MutantTrialResult.RC_RESOURCE_LIMIT, "Trial exceeded CPU limit of 5 seconds")
+        run_mutant_trial.return_value = MutantTrial(mutant, result, 1)
+
+        with pytest.raises(run.PoodleTrialRunError) as err:
+            run.clean_run_trial(work, folder)
+
+        assert err.value.args == ("Clean Run Exceeded Resource Limit", "Trial exceeded CPU limit of 5 seconds")
+        mock_echo.assert_any_call(click.style("FAILED", fg="red"))
+
+    @mock.patch("poodle.run.load_coverage")
+    @mock.patch("poodle.run.run_mutant_trial")
+    def test_clean_run_trial_coverage(self, run_mutant_trial, load_coverage, mock_echo):
+        folder = Path("source_folder")
+
+        work = PoodleWork(config=PoodleConfigStub(coverage_guided=True, work_folder=Path(".poodle-temp")))
+        work.echo = mock_echo
+
+        run_mutant_trial.return_value.result.found = False
+
+        run.clean_run_trial(work, folder)
+
+        coverage_file = Path(".poodle-temp/coverage-1.json")
+        assert run_mutant_trial.call_args.kwargs["coverage_file"] == coverage_file
+        load_coverage.assert_called_once_with(work, folder, coverage_file)
+
+    @mock.patch("poodle.run.load_coverage")
+    @mock.patch("poodle.run.run_mutant_trial")
+    def test_clean_run_trial_no_coverage(self, run_mutant_trial, load_coverage, mock_echo):
+        work = PoodleWork(config=PoodleConfigStub())
+        work.echo = mock_echo
+
+        run_mutant_trial.return_value.result.found = False
+
+        run.clean_run_trial(work, Path("source_folder"))
+
+        assert "coverage_file" not in run_mutant_trial.call_args.kwargs
+        load_coverage.assert_not_called()
+
+
+class TestLoadCoverage:
+    def test_load_coverage(self, mock_echo, tmp_path):
+        coverage_file = tmp_path / "coverage-1.json"
+        coverage_file.write_text('{"src/example.py": {"3": ["tests/test_example.py::test_1"]}}')
+
+        work = PoodleWork(config=PoodleConfigStub())
+        work.echo = mock_echo
+
+        run.load_coverage(work, Path("src"), coverage_file)
+
+        assert work.coverage[Path("src")].line_tests == {
+            Path("src/example.py").resolve(): {3: {"tests/test_example.py::test_1"}},
+        }
+        mock_echo.assert_not_called()
+
+    def test_load_coverage_not_found(self, mock_echo, tmp_path):
+        work = PoodleWork(config=PoodleConfigStub())
+        work.echo = mock_echo
+
+        run.load_coverage(work, Path("src"), tmp_path / "coverage-1.json")
+
+        assert work.coverage == {}
+        mock_echo.assert_called_once_with(
+            "Coverage was not collected for folder 'src', trials will run all tests.",
+            fg="yellow",
+        )
+
+
+class TestCoveringTests:
+    def create_mutant(self, lineno):
+        return Mutant(
+            mutator_name="",
+            source_folder=Path("src"),
+            source_file=Path("src/example.py"),
+            lineno=lineno,
+            col_offset=0,
+            end_lineno=lineno,
+            end_col_offset=1,
+            text="",
+        )
+
+    @pytest.fixture()
+    def work(self):
+        work = PoodleWork(config=PoodleConfigStub())
+        work.coverage[Path("src")] = CoverageIndex({"src/example.py": {3: {"test_1", "test_2"}, 4: {""}}})
+        return work
+
+    def test_no_coverage(self):
+        work = PoodleWork(config=PoodleConfigStub())
+        assert run.covering_tests(work, self.create_mutant(3)) is None
+
+    def test_tests(self, work):
+        assert run.covering_tests(work, self.create_mutant(3)) == ["test_1", "test_2"]
+
+    def test_all_tests(self, work):
+        assert run.covering_tests(work, self.create_mutant(4)) is None
+
+    def test_not_covered(self, work):
+        assert run.covering_tests(work, self.create_mutant(5)) == []
+
+
+@pytest.mark.parametrize(
+    ("tests", "expected"),
+    [
+        (None, {}),
+        ([], {}),
+        (["test_1"], {"tests": ["test_1"]}),
+    ],
+)
+def test_runner_kwargs_for(tests, expected):
+    assert run.runner_kwargs_for(tests) == expected
+
+
+def test_not_covered_trial():
+    mutant = Mutant(
+        mutator_name="",
+        source_folder=Path("src"),
+        source_file=Path("src/example.py"),
+        lineno=5,
+        col_offset=0,
+        end_lineno=5,
+        end_col_offset=1,
+        text="",
+    )
+    assert run.not_covered_trial(mutant) == MutantTrial(
+        mutant=mutant,
+        result=MutantTrialResult(
+            found=False,
+            reason_code=MutantTrialResult.RC_NOT_COVERED,
+            reason_desc="No test executed the mutated lines in the clean run",
+        ),
+        duration=0.0,
+    )
+
+
+def test_incomplete_trial():
+    mutant = Mutant(
+        mutator_name="",
+        source_folder=Path("folder"),
+        source_file=None,
+        lineno=0,
+        col_offset=0,
+        end_lineno=0,
+        end_col_offset=0,
+        text="",
+    )
+    assert run.incomplete_trial(mutant) == MutantTrial(
+        mutant=mutant,
+        result=MutantTrialResult(
+            found=False,
+            reason_code=MutantTrialResult.RC_INCOMPLETE,
+            reason_desc="Testing stopped when the fail_under result was decided",
+        ),
+        duration=0.0,
+    )
+
+
+@pytest.mark.parametrize(
+    ("early_stop", "fail_under", "summary", "expected"),
+    [
+        (False, 80, TestingSummary(trials=10, tested=9, found=9), False),
+        (True, None, TestingSummary(trials=10, tested=9, found=9), False),
+        (True, 80, TestingSummary(trials=0), False),
+        (True, 80, TestingSummary(trials=10, tested=7, found=7), False),
+        (True, 80, TestingSummary(trials=10, tested=8, found=8), True),
+        (True, 80, TestingSummary(trials=10, tested=2, found=0, not_found=2), False),
+        (True, 80, TestingSummary(trials=10, tested=3, found=0, not_found=3), True),
+    ],
+)
+def test_fail_under_decided(early_stop, fail_under, summary, expected):
+    config = PoodleConfigStub(early_stop=early_stop, fail_under=fail_under)
+    assert run.fail_under_decided(config, summary) is expected
+
+
+def all_done(futures, **_):
+    return set(futures), set()
+
 
 class TestMutantTrials:
     def create_mutant(self, folder, text):
@@ -157,7 +365,7 @@ class TestMutantTrials:
 
     @mock.patch("poodle.run.concurrent")
     def test_run_mutant_trails(self, concurrent, mock_logger, mock_echo, mock_time):
-        mock_time.time.side_effect = [1, 3]
+        mock_time.time.side_effect = [1, 1, 2, 3]
 
         folder = Path("source_folder")
 
@@ -179,7 +387,7 @@ class TestMutantTrials:
         for i, trial in enumerate(trials):
             futures[i].result.return_value = trial
             futures[i].cancelled.return_value = False
-        concurrent.futures.as_completed.return_value = futures
+        concurrent.futures.wait.side_effect = all_done
 
         executor = concurrent.futures.ProcessPoolExecutor.return_value.__enter__.return_value
         executor.submit.side_effect = futures
@@ -207,6 +415,7 @@ class TestMutantTrials:
 
         mock_echo.assert_any_call("COMPLETED    1/2   \tFOUND    0\tNOT FOUND    1\tTIMEOUT    0\tERRORS    0")
         mock_echo.assert_any_call("COMPLETED    2/2   \tFOUND    1\tNOT FOUND    1\tTIMEOUT    0\tERRORS    0")
+        mock_echo.assert_any_call("Trial makespan: 1.0s, predicted: 0.0s")
 
         mock_logger.info.assert_called_with("Elapsed Time %.2f s", 2)
 
@@ -214,7 +423,7 @@ class TestMutantTrials:
 
     @mock.patch("poodle.run.concurrent")
     def test_run_mutant_trails_cancelled(self, concurrent, mock_echo, mock_time):
-        mock_time.time.side_effect = [1, 3]
+        mock_time.time.side_effect = [1, 1, 2, 3]
 
         folder = Path("source_folder")
 
@@ -236,26 +445,292 @@ class TestMutantTrials:
         for i, trial in enumerate(trials):
             futures[i].result.return_value = trial
             futures[i].cancelled.return_value = True
-        concurrent.futures.as_completed.return_value = futures
+        concurrent.futures.wait.side_effect = all_done
 
         executor = concurrent.futures.ProcessPoolExecutor.return_value.__enter__.return_value
         executor.submit.side_effect = futures
 
-        summary = TestingSummary(trials=2, tested=0, found=0, not_found=0)
-        testing_results = TestingResults(mutant_trials=trials, summary=summary)
+        summary = TestingSummary(trials=2, tested=2, incomplete=2)
+        testing_results = TestingResults(
+            mutant_trials=[run.incomplete_trial(mutant) for mutant in mutants], summary=summary
+        )
 
         actual_results = run.run_mutant_trails(work, mutants, 10)
 
-        mock_echo.assert_has_calls(
-            [
-                mock.call("Testing mutants"),
-                mock.call("Canceled"),
-                mock.call("Canceled"),
-            ]
-        )
+        mock_echo.assert_any_call("Testing mutants")
+        for future in futures:
+            future.result.assert_not_called()
 
         assert actual_results == testing_results
 
+    @mock.patch("poodle.run.concurrent")
+    def test_run_mutant_trails_not_covered(self, concurrent, mock_echo, mock_time):
+        mock_time.time.side_effect = [1, 1, 2, 3]
+
+        folder = Path("source_folder")
+
+        work = PoodleWork(config=PoodleConfigStub())
+        work.echo = mock_echo
+        work.coverage[folder] = CoverageIndex({"source_folder/example.py": {1: {"test_1"}}})
+
+        mutants = [
+            self.create_mutant(folder, "mut1"),
+            self.create_mutant(folder, "mut2"),
+        ]
+        mutants[0].source_file = mutants[1].source_file = Path("source_folder/example.py")
+        mutants[0].lineno = mutants[0].end_lineno = 1
+        mutants[1].lineno = mutants[1].end_lineno = 2
+
+        trial = MutantTrial(mutants[0], MutantTrialResult(True, MutantTrialResult.RC_FOUND), 1)
+        future = mock.MagicMock(spec=Future)
+        future.result.return_value = trial
+        future.cancelled.return_value = False
+        concurrent.futures.wait.side_effect = all_done
+
+        executor = concurrent.futures.ProcessPoolExecutor.return_value.__enter__.return_value
+        executor.submit.side_effect = [future]
+
+        actual_results = run.run_mutant_trails(work, mutants, 10)
+
+        executor.submit.assert_called_once_with(
+            run.run_mutant_trial,
+            work.config,
+            mock_echo,
+            None,
+            mutants[0],
+            "1",
+            work.runner,
+            10,
+            tests=["test_1"],
+        )
+        mock_echo.assert_any_call("Skipping 1 mutant(s) not covered by any test")
+        mock_echo.assert_any_call(
+            "COMPLETED    2/2   \tFOUND    1\tNOT FOUND    0\tTIMEOUT    0\tERRORS    0",
+        )
+
+        assert actual_results == TestingResults(
+            mutant_trials=[run.not_covered_trial(mutants[1]), trial],
+            summary=TestingSummary(trials=2, tested=2, found=1, not_covered=1),
+        )
+
+    @mock.patch("poodle.run.concurrent")
+    def test_run_mutant_trails_cached(self, concurrent, mock_echo, mock_time):
+        mock_time.time.side_effect = [1, 1, 2, 3]
+
+        folder = Path("source_folder")
+
+        work = PoodleWork(config=PoodleConfigStub())
+        work.echo = mock_echo
+        work.result_cache = mock.MagicMock()
+
+        mutants = [
+            self.create_mutant(folder, "mut1"),
+            self.create_mutant(folder, "mut2"),
+        ]
+        cached_result = MutantTrialResult(True, MutantTrialResult.RC_FOUND)
+        work.result_cache.get.side_effect = [cached_result, None]
+        work.result_cache.get_duration.return_value = None
+
+        trial = MutantTrial(mutants[1], MutantTrialResult(False, MutantTrialResult.RC_NOT_FOUND), 1)
+        future = mock.MagicMock(spec=Future)
+        future.result.return_value = trial
+        future.cancelled.return_value = False
+        concurrent.futures.wait.side_effect = all_done
+
+        executor = concurrent.futures.ProcessPoolExecutor.return_value.__enter__.return_value
+        executor.submit.side_effect = [future]
+
+        actual_results = run.run_mutant_trails(work, mutants, 10)
+
+        executor.submit.assert_called_once_with(
+            run.run_mutant_trial,
+            work.config,
+            mock_echo,
+            None,
+            mutants[1],
+            "1",
+            work.runner,
+            10,
+        )
+        mock_echo.assert_any_call("Reusing 1 cached result(s)")
+        work.result_cache.put_all.assert_called_once_with([trial])
+
+        assert actual_results == TestingResults(
+            mutant_trials=[MutantTrial(mutants[0], cached_result, 0.0), trial],
+            summary=TestingSummary(trials=2, tested=2, found=1, not_found=1, cached=1),
+        )
+
+    @mock.patch("poodle.run.concurrent")
+    def test_run_mutant_trails_checkpoint(self, concurrent, mock_echo, mock_time):
+        mock_time.time.side_effect = [1, 1, 2, 3]
+
+        folder = Path("source_folder")
+
+        work = PoodleWork(config=PoodleConfigStub())
+        work.echo = mock_echo
+        work.checkpoint = mock.MagicMock()
+
+        mutants = [
+            self.create_mutant(folder, "mut1"),
+            self.create_mutant(folder, "mut2"),
+        ]
+        saved_trial = MutantTrial(mutants[0], MutantTrialResult(True, MutantTrialResult.RC_FOUND), 2.5)
+        work.checkpoint.trials = {mutants[0].mutant_id: saved_trial}
+
+        trial = MutantTrial(mutants[1], MutantTrialResult(False, MutantTrialResult.RC_NOT_FOUND), 1)
+        future = mock.MagicMock(spec=Future)
+        future.result.return_value = trial
+        future.cancelled.return_value = False
+        concurrent.futures.wait.side_effect = all_done
+
+        executor = concurrent.futures.ProcessPoolExecutor.return_value.__enter__.return_value
+        executor.submit.side_effect = [future]
+
+        actual_results = run.run_mutant_trails(work, mutants, 10)
+
+        executor.submit.assert_called_once_with(
+            run.run_mutant_trial,
+            work.config,
+            mock_echo,
+            None,
+            mutants[1],
+            "1",
+            work.runner,
+            10,
+        )
+        mock_echo.assert_any_call("Resuming with 1 result(s) from checkpoint")
+        work.checkpoint.write.assert_called_once_with(trial)
+
+        assert actual_results == TestingResults(
+            mutant_trials=[saved_trial, trial],
+            summary=TestingSummary(trials=2, tested=2, found=1, not_found=1),
+        )
+
+    @pytest.mark.parametrize("early_stop", [False, True])
+    @mock.patch("poodle.run.concurrent")
+    def test_run_mutant_trails_no_trials_run(self, concurrent, mock_echo, mock_time, early_stop):
+        mock_time.time.return_value = 1
+
+        folder = Path("source_folder")
+
+        work = PoodleWork(config=PoodleConfigStub(early_stop=early_stop, fail_under=30))
+        work.echo = mock_echo
+        work.checkpoint = mock.MagicMock()
+
+        mutants = [
+            self.create_mutant(folder, "mut1"),
+            self.create_mutant(folder, "mut2"),
+        ]
+        saved_trial = MutantTrial(mutants[0], MutantTrialResult(True, MutantTrialResult.RC_FOUND), 2.5)
+        work.checkpoint.trials = {saved_trial.mutant.mutant_id: saved_trial}
+        if not early_stop:
+            work.checkpoint.trials[mutants[1].mutant_id] = MutantTrial(
+                mutants[1], MutantTrialResult(True, MutantTrialResult.RC_FOUND), 1.5
+            )
+
+        run.run_mutant_trails(work, mutants, 10)
+
+        concurrent.futures.ProcessPoolExecutor.return_value.__enter__.return_value.submit.assert_not_called()
+        assert not [call for call in mock_echo.call_args_list if "makespan" in str(call)]
+
+    @mock.patch("poodle.run.concurrent")
+    def test_run_mutant_trails_early_stop(self, concurrent, mock_echo, mock_time):
+        mock_time.time.side_effect = [1, 1, 2, 3]
+
+        folder = Path("source_folder")
+
+        work = PoodleWork(config=PoodleConfigStub(max_workers=2, early_stop=True, fail_under=30))
+        work.echo = mock_echo
+        work.checkpoint = mock.MagicMock()
+        work.checkpoint.trials = {}
+
+        mutants = [
+            self.create_mutant(folder, "mut1"),
+            self.create_mutant(folder, "mut2"),
+            self.create_mutant(folder, "mut3"),
+        ]
+        trials = [
+            MutantTrial(mutants[0], MutantTrialResult(True, MutantTrialResult.RC_FOUND), 1),
+            MutantTrial(mutants[1], MutantTrialResult(False, MutantTrialResult.RC_NOT_FOUND), 1),
+            MutantTrial(mutants[2], MutantTrialResult(False, MutantTrialResult.RC_NOT_FOUND), 1),
+        ]
+
+        futures = [mock.MagicMock(spec=Future) for _ in trials]
+        for future, trial in zip(futures, trials, strict=True):
+            future.result.return_value = trial
+            future.cancelled.return_value = False
+        futures[1].cancelled.return_value = True
+        concurrent.futures.wait.side_effect = all_done
+
+        executor = concurrent.futures.ProcessPoolExecutor.return_value.__enter__.return_value
+        executor.submit.side_effect = futures
+
+        actual_results = run.run_mutant_trails(work, mutants, 10)
+
+        executor.shutdown.assert_called_once_with(wait=True, cancel_futures=True)
+        futures[1].result.assert_not_called()
+        mock_echo.assert_any_call("Mutation score goal is decided.  Skipping 1 remaining trial(s).")
+        work.checkpoint.write.assert_has_calls([mock.call(trials[0]), mock.call(trials[2])])
+        assert actual_results == TestingResults(
+            mutant_trials=[trials[0], trials[2], run.incomplete_trial(mutants[1])],
+            summary=TestingSummary(trials=3, tested=3, found=1, not_found=1, incomplete=1),
+        )
+
+    @mock.patch("poodle.run.concurrent")
+    def test_run_mutant_trails_decided(self, concurrent, mock_echo, mock_time):
+        mock_time.time.side_effect = [1, 1, 2, 3]
+
+        folder = Path("source_folder")
+
+        work = PoodleWork(config=PoodleConfigStub(early_stop=True, fail_under=50))
+        work.echo = mock_echo
+        work.checkpoint = mock.MagicMock()
+
+        mutants = [self.create_mutant(folder, "mut1"), self.create_mutant(folder, "mut2")]
+        saved_trial = MutantTrial(mutants[0], MutantTrialResult(True, MutantTrialResult.RC_FOUND), 2.5)
+        work.checkpoint.trials = {mutants[0].mutant_id: saved_trial}
+
+        actual_results = run.run_mutant_trails(work, mutants, 10)
+
+        concurrent.futures.ProcessPoolExecutor.assert_not_called()
+        mock_echo.assert_any_call("Mutation score goal is decided.  Skipping 1 remaining trial(s).")
+        assert actual_results == TestingResults(
+            mutant_trials=[saved_trial, run.incomplete_trial(mutants[1])],
+            summary=TestingSummary(trials=2, tested=2, found=1, incomplete=1),
+        )
+
+    @mock.patch("poodle.run.concurrent")
+    def test_run_mutant_trails_window(self, concurrent, mock_echo, mock_time):
+        mock_time.time.side_effect = [1, 1, 2, 3]
+
+        work = PoodleWork(config=PoodleConfigStub(max_workers=1))
+        work.echo = mock_echo
+
+        mutants = [self.create_mutant(Path("source_folder"), f"mut{i}") for i in range(5)]
+        trials = [MutantTrial(mutant, MutantTrialResult(True, MutantTrialResult.RC_FOUND), 1) for mutant in mutants]
+        futures = [mock.MagicMock(spec=Future) for _ in trials]
+        for future, trial in zip(futures, trials, strict=True):
+            future.result.return_value = trial
+            future.cancelled.return_value = False
+
+        executor = concurrent.futures.ProcessPoolExecutor.return_value.__enter__.return_value
+        executor.submit.side_effect = futures
+
+        in_flight_sizes = []
+
+        def first_done(in_flight, **_):
+            in_flight_sizes.append(len(in_flight))
+            return {next(iter(in_flight))}, set()
+
+        concurrent.futures.wait.side_effect = first_done
+
+        actual_results = run.run_mutant_trails(work, mutants, 10)
+
+        assert in_flight_sizes == [2, 2, 2, 2, 1]
+        concurrent.futures.wait.assert_called_with(mock.ANY, return_when=concurrent.futures.FIRST_COMPLETED)
+        assert actual_results.mutant_trials == trials
+        assert actual_results.summary == TestingSummary(trials=5, tested=5, found=5)
+
     @mock.patch("poodle.run.concurrent")
     def test_run_mutant_trails_interrupt(self, concurrent, mock_echo):
         folder = Path("source_folder")
@@ -299,30 +774,23 @@ class TestRunMutantTrial:
         )
 
     @mock.patch("poodle.run.logging")
-    @mock.patch("poodle.run.ZipFile")
-    @mock.patch("poodle.run.mutate_lines")
-    @mock.patch("poodle.run.delete_folder")
+    @mock.patch("poodle.run.builtin_workspaces")
     def test_run_mutant_trial(
         self,
-        delete_folder,
-        mutate_lines,
-        zip_file_cls,
+        builtin_workspaces,
         mock_logging,
         mock_logger,
         mock_echo,
         mock_time,
     ):
         mock_time.time.side_effect = [1, 3]
-        mock_work_folder = mock.MagicMock(spec=Path)
-        config = PoodleConfigStub(work_folder=mock_work_folder, log_format="log_format", log_level="DEBUG")
+        config = PoodleConfigStub(workspace="zip", log_format="log_format", log_level="DEBUG")
         runner = mock.MagicMock()
         folder = Path("folder")
         mutant = self.create_mutant(folder, Path("main.py"))
 
-        run_folder = config.work_folder.__truediv__.return_value
-        target_file = run_folder.__truediv__.return_value
-        file_lines_orig = target_file.read_text.return_value.splitlines.return_value
-        mutate_lines.return_value = ["line1\n", "line2\n"]
+        workspace = builtin_workspaces.__getitem__.return_value
+        run_folder = workspace.return_value.__enter__.return_value
 
         result = runner.return_value
 
@@ -339,17 +807,8 @@ class TestRunMutantTrial:
             "",
         )
 
-        config.work_folder.__truediv__.assert_called_with("run-1")
-        run_folder.mkdir.assert_called_with()
-
-        zip_file_cls.assert_called_with(Path("folder.zip"), "r")
-        zip_file = zip_file_cls.return_value.__enter__.return_value
-        zip_file.extractall.assert_called_with(run_folder)
-
-        target_file.read_text.assert_called_with("utf-8")
-        target_file.read_text.return_value.splitlines.assert_called_with(keepends=True)
-        mutate_lines.assert_called_with(mutant, file_lines_orig)
-        target_file.write_text.assert_called_with(data="line1\nline2\n", encoding="utf-8")
+        builtin_workspaces.__getitem__.assert_called_with("zip")
+        workspace.assert_called_with(config, Path("folder.zip"), mutant, "1")
 
         mock_logger.debug.assert_any_call("START: run_id=%s run_folder=%s", "1", run_folder)
 
@@ -361,75 +820,157 @@ class TestRunMutantTrial:
             timeout=10,
         )
 
-        delete_folder.assert_called_with(run_folder, config)
+        workspace.return_value.__exit__.assert_called_once()
 
         mock_logger.debug.assert_any_call("END: run_id=%s - Elapsed Time %.2f s", "1", 2)
 
         assert returned_trial == MutantTrial(mutant, result, 2)
 
-    @mock.patch("poodle.run.logging")
-    @mock.patch("poodle.run.ZipFile")
-    @mock.patch("poodle.run.mutate_lines")
-    @mock.patch("poodle.run.delete_folder")
-    def test_run_mutant_trial_no_source(
-        self,
-        delete_folder,
-        mutate_lines,
-        zip_file_cls,
-        mock_logging,
-        mock_logger,
-        mock_echo,
-        mock_time,
-    ):
+    @mock.patch("poodle.run.builtin_workspaces")
+    def test_run_mutant_trial_async(self, builtin_workspaces, mock_logger, mock_time):
         mock_time.time.side_effect = [1, 3]
-        mock_work_folder = mock.MagicMock(spec=Path)
-        config = PoodleConfigStub(work_folder=mock_work_folder, log_format="log_format", log_level="DEBUG")
-        runner = mock.MagicMock()
-        folder = Path("folder")
-        mutant = self.create_mutant(folder, None)
+        config = PoodleConfigStub(workspace="zip")
+        runner = mock.AsyncMock()
+        mutant = self.create_mutant(Path("folder"), Path("main.py"))
 
-        run_folder = config.work_folder.__truediv__.return_value
-        target_file = run_folder.__truediv__.return_value
+        workspace = builtin_workspaces.__getitem__.return_value
+        run_folder = workspace.return_value.__enter__.return_value
 
-        result = runner.return_value
+        returned_trial = asyncio.run(
+            run.run_mutant_trial_async(config, Path("folder.zip"), mutant, "1", runner, 10, tests=["test_1"])
+        )
 
-        returned_trial = run.run_mutant_trial(config, mock_echo, Path("folder.zip"), mutant, "1", runner, 10)
+        workspace.assert_called_with(config, Path("folder.zip"), mutant, "1")
+        runner.assert_awaited_once_with(
+            config=config,
+            run_folder=run_folder,
+            mutant=mutant,
+            timeout=10,
+            tests=["test_1"],
+        )
+        workspace.return_value.__exit__.assert_called_once_with(None, None, None)
+        mock_logger.debug.assert_any_call("END: run_id=%s - Elapsed Time %.2f s", "1", 2)
 
-        mock_logging.basicConfig.assert_called_with(format=config.log_format, level=config.log_level)
+        assert returned_trial == MutantTrial(mutant, runner.return_value, 2)
 
-        mock_logger.debug.assert_any_call(
-            "SETUP: run_id=%s folder_zip=%s file=%s:%s text='%s'",
-            "1",
+    @mock.patch("poodle.run.builtin_workspaces")
+    def test_run_mutant_trial_async_error(self, builtin_workspaces):
+        runner = mock.AsyncMock(side_effect=asyncio.CancelledError)
+        mutant = self.create_mutant(Path("folder"), Path("main.py"))
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(run.run_mutant_trial_async(PoodleConfigStub(), None, mutant, "1", runner, 10))
+
+        builtin_workspaces.__getitem__.return_value.return_value.__exit__.assert_called_once_with(None, None, None)
+
+
+class TestRunTrialsAsync:
+    def create_mutant(self, text):
+        return Mutant(
+            mutator_name="",
+            source_folder=Path("folder"),
+            source_file=None,
+            lineno=0,
+            col_offset=0,
+            end_lineno=0,
+            end_col_offset=0,
+            text=text,
+        )
+
+    def test_builtin_async_runners(self):
+        assert run.builtin_async_runners == {"command_line": run.command_line.async_runner}
+
+    @mock.patch("poodle.run.run_mutant_trial_async")
+    def test_run_trials_async(self, run_mutant_trial_async, mock_echo):
+        running = []
+        max_running = []
+
+        async def run_trial(*args, **kwargs):
+            mutant = args[2]
+            running.append(mutant)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(mutant)
+            found = mutant.text == "found"
+            return MutantTrial(
+                mutant, MutantTrialResult(found, MutantTrialResult.RC_FOUND if found else kwargs["rc"]), 1
+            )
+
+        run_mutant_trial_async.side_effect = run_trial
+
+        work = PoodleWork(config=PoodleConfigStub(max_workers=2, runner="command_line"))
+        work.echo = mock_echo
+        work.checkpoint = mock.MagicMock()
+        work.folder_zips = {Path("folder"): Path("folder.zip")}
+        mutants = [self.create_mutant("found"), self.create_mutant("other"), self.create_mutant("found")]
+        summary = TestingSummary(trials=3)
+
+        with mock.patch("poodle.run.runner_kwargs_for", return_value={"rc": MutantTrialResult.RC_NOT_FOUND}):
+            trials = asyncio.run(run.run_trials_async(work, [(mutant, None) for mutant in mutants], 10, summary))
+
+        assert [trial.mutant for trial in trials] == mutants
+        assert max(max_running) == 2
+        assert summary == TestingSummary(trials=3, tested=3, found=2, not_found=1)
+        work.checkpoint.write.assert_has_calls([mock.call(trial) for trial in trials], any_order=True)
+        mock_echo.assert_called_with("COMPLETED    3/3   \tFOUND    2\tNOT FOUND    1\tTIMEOUT    0\tERRORS    0")
+        run_mutant_trial_async.assert_any_call(
+            work.config,
             Path("folder.zip"),
-            None,
-            0,
-            "",
+            mutants[0],
+            mock.ANY,
+            run.command_line.async_runner,
+            10,
+            rc=MutantTrialResult.RC_NOT_FOUND,
         )
 
-        config.work_folder.__truediv__.assert_called_with("run-1")
-        run_folder.mkdir.assert_called_with()
+    @mock.patch("poodle.run.run_mutant_trial_async")
+    def test_run_trials_async_early_stop(self, run_mutant_trial_async, mock_echo):
+        async def run_trial(*args, **_):
+            mutant = args[2]
+            return MutantTrial(mutant, MutantTrialResult(True, MutantTrialResult.RC_FOUND), 1)
 
-        zip_file_cls.assert_called_with(Path("folder.zip"), "r")
-        zip_file = zip_file_cls.return_value.__enter__.return_value
-        zip_file.extractall.assert_called_with(run_folder)
+        run_mutant_trial_async.side_effect = run_trial
 
-        run_folder.__truediv__.assert_not_called()
-        target_file.read_text.assert_not_called()
-        mutate_lines.assert_not_called()
-        target_file.write_text.assert_not_called()
+        work = PoodleWork(config=PoodleConfigStub(max_workers=1, runner="command_line", early_stop=True, fail_under=30))
+        work.echo = mock_echo
+        mutants = [self.create_mutant("mut1"), self.create_mutant("mut2"), self.create_mutant("mut3")]
+        summary = TestingSummary(trials=3)
 
-        mock_logger.debug.assert_any_call("START: run_id=%s run_folder=%s", "1", run_folder)
+        trials = asyncio.run(run.run_trials_async(work, [(mutant, None) for mutant in mutants], 10, summary))
 
-        runner.assert_called_with(
-            config=config,
-            echo=mock_echo,
-            run_folder=run_folder,
-            mutant=mutant,
-            timeout=10,
-        )
+        run_mutant_trial_async.assert_called_once()
+        assert trials == [
+            MutantTrial(mutants[0], MutantTrialResult(True, MutantTrialResult.RC_FOUND), 1),
+            run.incomplete_trial(mutants[1]),
+            run.incomplete_trial(mutants[2]),
+        ]
+        assert summary == TestingSummary(trials=3, tested=3, found=1, incomplete=2)
+        mock_echo.assert_called_with("Mutation score goal is decided.  Skipping 2 remaining trial(s).")
 
-        delete_folder.assert_called_with(run_folder, config)
+    @mock.patch("poodle.run.run_trials_async", new_callable=mock.MagicMock)
+    @mock.patch("poodle.run.asyncio")
+    def test_run_mutant_trails_asyncio(self, mock_asyncio, run_trials_async, mock_echo):
+        mutants = [self.create_mutant("mut1")]
+        trials = [MutantTrial(mutants[0], MutantTrialResult(True, MutantTrialResult.RC_FOUND), 1)]
+        mock_asyncio.run.return_value = trials
 
-        mock_logger.debug.assert_any_call("END: run_id=%s - Elapsed Time %.2f s", "1", 2)
+        work = PoodleWork(config=PoodleConfigStub(scheduler="asyncio"))
+        work.echo = mock_echo
 
-        assert returned_trial == MutantTrial(mutant, result, 2)
+        results = run.run_mutant_trails(work, mutants, 10)
+
+        run_trials_async.assert_called_once_with(work, [(mutants[0], None)], 10, results.summary)
+        mock_asyncio.run.assert_called_once_with(run_trials_async.return_value)
+        assert results.mutant_trials == trials
+
+    @mock.patch("poodle.run.run_trials_async", new=mock.MagicMock())
+    @mock.patch("poodle.run.asyncio")
+    def test_run_mutant_trails_asyncio_interrupt(self, mock_asyncio, mock_echo):
+        mock_asyncio.run.side_effect = KeyboardInterrupt
+        work = PoodleWork(config=PoodleConfigStub(scheduler="asyncio"))
+        work.echo = mock_echo
+
+        with pytest.raises(KeyboardInterrupt):
+            run.run_mutant_trails(work, [self.create_mutant("mut1")], 10)
+
+        mock_echo.assert_called_with("Received Keyboard Interrupt.  Cancelling Remaining Trials.")
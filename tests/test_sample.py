@@ -0,0 +1,181 @@
+from pathlib import Path
+
+import pytest
+
+from poodle import sample
+from poodle.data_types import MutantTrial, MutantTrialResult, TestingSummary
+from tests.data_types.test_data import PoodleConfigStub, create_mutant
+
+
+def create_trial(mutant, found):
+    return MutantTrial(
+        mutant=mutant,
+        result=MutantTrialResult(
+            found=found,
+            reason_code=MutantTrialResult.RC_FOUND if found else MutantTrialResult.RC_NOT_FOUND,
+        ),
+        duration=1.0,
+    )
+
+
+@pytest.fixture()
+def mutants():
+    return (
+        [
+            create_mutant(Path("a.py"), lineno=lineno, mutator_name="BinOp", text=f"a.pyBinOp{lineno}")
+            for lineno in range(60)
+        ]
+        + [
+            create_mutant(Path("a.py"), lineno=lineno, mutator_name="Compare", text=f"a.pyCompare{lineno}")
+            for lineno in range(30)
+        ]
+        + [
+            create_mutant(Path("b.py"), lineno=lineno, mutator_name="BinOp", text=f"b.pyBinOp{lineno}")
+            for lineno in range(10)
+        ]
+    )
+
+
+def test_logger():
+    assert sample.logger.name == "poodle.sample"
+
+
+def test_group_strata(mutants):
+    strata = sample.group_strata(list(reversed(mutants)))
+    assert list(strata) == [("a.py", "BinOp"), ("a.py", "Compare"), ("b.py", "BinOp")]
+    assert [len(stratum) for stratum in strata.values()] == [60, 30, 10]
+    assert strata[("b.py", "BinOp")] == sorted(mutants[90:], key=lambda mutant: mutant.mutant_id)
+
+
+class TestSampleSize:
+    def test_sample(self):
+        assert sample.sample_size(PoodleConfigStub(sample=10), 100) == 10
+
+    def test_sample_over_population(self):
+        assert sample.sample_size(PoodleConfigStub(sample=200), 100) == 100
+
+    @pytest.mark.parametrize(
+        ("sample_fraction", "expected"),
+        [(0.1, 10), (0.001, 1), (1.0, 100), (0.125, 12)],
+    )
+    def test_sample_fraction(self, sample_fraction, expected):
+        assert sample.sample_size(PoodleConfigStub(sample_fraction=sample_fraction), 100) == expected
+
+    def test_not_sampled(self):
+        assert sample.sample_size(PoodleConfigStub(), 100) == 100
+
+
+class TestAllocate:
+    def test_proportional(self):
+        assert sample.allocate({"a": 60, "b": 30, "c": 10}, 10) == {"a": 6, "b": 3, "c": 1}
+
+    def test_largest_remainder(self):
+        assert sample.allocate({"a": 50, "b": 30, "c": 20}, 7) == {"a": 4, "b": 2, "c": 1}
+
+    def test_minimum_one(self):
+        assert sample.allocate({"a": 98, "b": 1, "c": 1}, 3) == {"a": 1, "b": 1, "c": 1}
+
+    def test_small_sample(self):
+        assert sample.allocate({"a": 50, "b": 30, "c": 20}, 1) == {"a": 1, "b": 0, "c": 0}
+
+    def test_all(self):
+        assert sample.allocate({"a": 5, "b": 3}, 8) == {"a": 5, "b": 3}
+
+
+class TestSelectSample:
+    def test_select_sample(self, mutants):
+        selected = sample.select_sample(mutants, PoodleConfigStub(sample=10))
+
+        assert len(selected) == 10
+        assert len({mutant.mutant_id for mutant in selected}) == 10
+        assert [sample.stratum_key(mutant) for mutant in selected].count(("a.py", "BinOp")) == 6
+        assert [sample.stratum_key(mutant) for mutant in selected].count(("a.py", "Compare")) == 3
+        assert [sample.stratum_key(mutant) for mutant in selected].count(("b.py", "BinOp")) == 1
+
+    def test_select_sample_repeatable(self, mutants):
+        config = PoodleConfigStub(sample_fraction=0.2, sample_seed=5)
+        selected = sample.select_sample(mutants, config)
+        assert sample.select_sample(list(reversed(mutants)), config) == selected
+
+    def test_select_sample_seed(self, mutants):
+        selected = sample.select_sample(mutants, PoodleConfigStub(sample=20, sample_seed=1))
+        assert sample.select_sample(mutants, PoodleConfigStub(sample=20, sample_seed=2)) != selected
+
+
+class TestEstimateScore:
+    def test_estimate_score(self, mutants):
+        # a.py BinOp: 6 of 6 found, a.py Compare: 0 of 3 found, b.py BinOp: 1 of 1 found
+        trials = (
+            [create_trial(mutant, found=True) for mutant in mutants[:6]]
+            + [create_trial(mutant, found=False) for mutant in mutants[60:63]]
+            + [create_trial(mutants[90], found=True)]
+        )
+        summary = TestingSummary(trials=10, found=7)
+
+        sample.estimate_score(summary, mutants, trials)
+
+        assert summary.sampled_from == 100
+        assert summary.estimated_rate == pytest.approx(0.7)
+        # only the b.py stratum, with one trial, uses the variance of all trials
+        variance = 0.1**2 * (1 - 1 / 10) * 0.7 * 0.3
+        margin = 1.959964 * variance**0.5
+        assert summary.estimate_low == pytest.approx(0.7 - margin)
+        assert summary.estimate_high == pytest.approx(0.7 + margin)
+
+    def test_estimate_score_weighted(self, mutants):
+        # a.py BinOp: 1 of 2 found, a.py Compare: 2 of 2 found
+        trials = [
+            create_trial(mutants[0], found=True),
+            create_trial(mutants[1], found=False),
+            create_trial(mutants[60], found=True),
+            create_trial(mutants[61], found=True),
+        ]
+        summary = TestingSummary(trials=4, found=3)
+
+        sample.estimate_score(summary, mutants, trials)
+
+        # b.py has no trials, so the weights of a.py strata are 60/90 and 30/90
+        assert summary.estimated_rate == pytest.approx(60 / 90 * 0.5 + 30 / 90 * 1.0)
+        variance = (60 / 90) ** 2 * (1 - 2 / 60) * 0.5 / 2
+        assert summary.estimate_low == pytest.approx(summary.estimated_rate - 1.959964 * variance**0.5)
+        assert summary.estimate_high == 1.0
+
+    def test_estimate_score_all(self, mutants):
+        trials = [create_trial(mutant, found=mutant.mutator_name == "BinOp") for mutant in mutants]
+        summary = TestingSummary()
+
+        sample.estimate_score(summary, mutants, trials)
+
+        assert summary.estimated_rate == pytest.approx(0.7)
+        assert summary.estimate_low == pytest.approx(0.7)
+        assert summary.estimate_high == pytest.approx(0.7)
+
+    def test_estimate_score_all_found(self, mutants):
+        trials = [create_trial(mutant, found=True) for mutant in mutants[::7]]
+        summary = TestingSummary()
+
+        sample.estimate_score(summary, mutants, trials)
+
+        assert summary.estimated_rate == 1.0
+        assert summary.estimate_display == "100% (100% - 100%)"
+
+    def test_estimate_score_incomplete(self, mutants):
+        trials = [create_trial(mutant, found=True) for mutant in mutants[:6]]
+        for mutant in mutants[6:12]:
+            trial = create_trial(mutant, found=False)
+            trial.result.reason_code = MutantTrialResult.RC_INCOMPLETE
+            trials.append(trial)
+        summary = TestingSummary()
+
+        sample.estimate_score(summary, mutants, trials)
+
+        # untested trials are left out, so only a.py BinOp is sampled: 6 of 6 found
+        assert summary.estimated_rate == 1.0
+        assert summary.estimate_low == 1.0
+
+    def test_estimate_score_no_trials(self, mutants):
+        summary = TestingSummary()
+
+        sample.estimate_score(summary, mutants, [])
+
+        assert summary == TestingSummary()
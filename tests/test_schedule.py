@@ -0,0 +1,95 @@
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from poodle import schedule
+from poodle.data_types import PoodleWork
+from poodle.line_coverage import CoverageIndex
+from tests.data_types.test_data import PoodleConfigStub, create_mutant
+
+
+@pytest.fixture()
+def work():
+    work = PoodleWork(PoodleConfigStub(max_workers=2))
+    work.clean_run_durations = {Path("src"): 8.0}
+    return work
+
+
+def test_logger():
+    assert schedule.logger.name == "poodle.schedule"
+
+
+class TestEstimateDuration:
+    def test_clean_run(self, work):
+        assert schedule.estimate_duration(work, create_mutant(text="a"), None, 30) == 8.0
+
+    def test_no_clean_run(self, work):
+        mutant = create_mutant(Path("other/example.py"), text="a", source_folder=Path("other"))
+        assert schedule.estimate_duration(work, mutant, None, 30) == 0.0
+
+    def test_covering_tests(self, work):
+        work.coverage[Path("src")] = CoverageIndex({"src/example.py": {1: {"t1", "t2", "t3", "t4"}}})
+        assert schedule.estimate_duration(work, create_mutant(text="a"), ["t1"], 30) == 2.0
+        assert schedule.estimate_duration(work, create_mutant(text="a"), None, 30) == 8.0
+
+    def test_previous(self, work):
+        work.result_cache = mock.MagicMock()
+        work.result_cache.get_duration.return_value = 3.5
+        mutant = create_mutant(text="a")
+
+        assert schedule.estimate_duration(work, mutant, None, 30) == 3.5
+        work.result_cache.get_duration.assert_called_once_with(mutant)
+
+    def test_no_previous(self, work):
+        work.result_cache = mock.MagicMock()
+        work.result_cache.get_duration.return_value = None
+        assert schedule.estimate_duration(work, create_mutant(text="a"), None, 30) == 8.0
+
+    def test_timeout(self, work):
+        work.result_cache = mock.MagicMock()
+        work.result_cache.get_duration.return_value = 50.0
+        assert schedule.estimate_duration(work, create_mutant(text="a"), None, 30) == 30
+        work.result_cache = None
+        assert schedule.estimate_duration(work, create_mutant(text="a"), None, 5) == 5
+
+
+@pytest.mark.parametrize(
+    ("durations", "workers", "expected"),
+    [
+        ([5, 4, 3, 3, 3], 2, 10),
+        ([3, 3, 3, 4, 5], 2, 11),
+        ([1, 2, 3], 1, 6),
+        ([1, 2, 3], 8, 3),
+        ([], 4, 0),
+    ],
+)
+def test_predict_makespan(durations, workers, expected):
+    assert schedule.predict_makespan(durations, workers) == expected
+
+
+class TestLongestFirst:
+    def test_longest_first(self, work):
+        work.result_cache = mock.MagicMock()
+        work.result_cache.get_duration.side_effect = [3.0, 5.0, None, 3.0, 4.0]
+        to_test = [(create_mutant(text=text), None) for text in "abcde"]
+
+        ordered, makespan = schedule.longest_first(work, to_test, 30)
+
+        assert [mutant.text for mutant, _ in ordered] == ["c", "b", "e", "a", "d"]
+        assert makespan == pytest.approx(12.0)
+
+    def test_keeps_tests(self, work):
+        to_test = [(create_mutant(text="a"), ["t1"]), (create_mutant(text="b"), None)]
+        ordered, _ = schedule.longest_first(work, to_test, 30)
+        assert ordered == to_test
+
+    @mock.patch("poodle.schedule.os.cpu_count", return_value=3)
+    def test_default_workers(self, cpu_count, work):
+        work.config.max_workers = None
+        _, makespan = schedule.longest_first(work, [(create_mutant(text=text), None) for text in "abc"], 30)
+        assert makespan == 8.0
+        cpu_count.assert_called_once_with()
+
+    def test_empty(self, work):
+        assert schedule.longest_first(work, [], 30) == ([], 0.0)
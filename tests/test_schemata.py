@@ -0,0 +1,128 @@
+import ast
+from pathlib import Path
+
+import pytest
+
+from poodle import schemata
+from tests.data_types.test_data import PoodleConfigStub, create_mutant
+
+SOURCE = '''"""Module docstring."""
+LIMIT = 1 + 2
+
+
+def calc(a, b=3):
+    """Function docstring."""
+    c = a + b * 2
+    return c if c > LIMIT else -c
+
+
+class Example:
+    size = 5 * 2
+
+    def items(self, v):
+        return [i * v for i in range(v)]
+'''
+
+
+def load(source, active_mutant):
+    namespace = {schemata.ACTIVE_MUTANT: active_mutant}
+    exec(compile(source, "<test>", "exec"), namespace)  # noqa: S102
+    return namespace
+
+
+def test_logger():
+    assert schemata.logger.name == "poodle.schemata"
+
+
+def test_schema_folder():
+    assert schemata.schema_folder(PoodleConfigStub(work_folder=Path(".poodle-temp"))) == Path(".poodle-temp/schemata")
+
+
+def test_schema_sources(tmp_path):
+    source_file = Path.cwd() / "src" / "example.py"
+    schemata.write_schema(PoodleConfigStub(work_folder=tmp_path), source_file, "schema\n")
+
+    assert schemata.schema_file(tmp_path / "schemata", source_file).read_text() == "schema\n"
+    assert schemata.schema_sources(tmp_path / "schemata") == {source_file: "schema\n"}
+
+
+class TestCreateSchema:
+    def test_switch_mutants(self):
+        mutants = [
+            create_mutant(lineno=7, col_offset=12, end_lineno=7, end_col_offset=17, text="b / 2"),
+            create_mutant(lineno=7, col_offset=8, end_lineno=7, end_col_offset=17, text="a - b * 2"),
+            create_mutant(lineno=8, col_offset=16, end_lineno=8, end_col_offset=25, text="c < LIMIT"),
+            create_mutant(lineno=15, col_offset=16, end_lineno=15, end_col_offset=21, text="i + v"),
+        ]
+        source = schemata.create_schema(ast.parse(SOURCE), SOURCE, mutants)
+
+        assert [mutant.schema_id for mutant in mutants] == [1, 2, 3, 4]
+        assert source.splitlines()[6] == (
+            "    c = ((a - b * 2) if __poodle_mutant__ == 2 else "
+            "(a + ((b / 2) if __poodle_mutant__ == 1 else (b * 2))))"
+        )
+
+        original = load(SOURCE, 0)
+        assert load(source, 0)["calc"](2) == original["calc"](2) == 8
+        assert load(source, 1)["calc"](2) == 3.5
+        assert load(source, 2)["calc"](2) == 4
+        assert load(source, 3)["calc"](2) == -8
+        assert load(source, 4)["Example"]().items(2) == [2, 3]
+        assert load(source, 0)["Example"]().items(2) == [0, 2]
+
+    @pytest.mark.parametrize(
+        "mutant",
+        [
+            create_mutant(lineno=2, col_offset=8, end_lineno=2, end_col_offset=13, text="1 - 2"),  # module level
+            create_mutant(lineno=5, col_offset=16, end_lineno=5, end_col_offset=17, text="4"),  # default value
+            create_mutant(lineno=6, col_offset=4, end_lineno=6, end_col_offset=29, text="None"),  # docstring
+            create_mutant(lineno=12, col_offset=11, end_lineno=12, end_col_offset=16, text="5 / 2"),  # class body
+            create_mutant(lineno=8, col_offset=4, end_lineno=8, end_col_offset=30, text="return None"),  # statement
+        ],
+    )
+    def test_not_in_schema(self, mutant):
+        assert schemata.create_schema(ast.parse(SOURCE), SOURCE, [mutant]) == SOURCE
+        assert mutant.schema_id is None
+
+    def test_invalid_branch(self):
+        mutants = [
+            create_mutant(lineno=7, col_offset=12, end_lineno=7, end_col_offset=17, text="b /"),
+            create_mutant(lineno=15, col_offset=16, end_lineno=15, end_col_offset=21, text="i + v"),
+        ]
+        source = schemata.create_schema(ast.parse(SOURCE), SOURCE, mutants)
+
+        assert mutants[0].schema_id is None
+        assert mutants[1].schema_id == 2
+        assert load(source, 1)["calc"](2) == 8
+        assert load(source, 2)["Example"]().items(2) == [2, 3]
+
+    def test_contained_in_expression(self):
+        mutant = create_mutant(lineno=7, col_offset=14, end_lineno=7, end_col_offset=15, text="+")
+        source = schemata.create_schema(ast.parse(SOURCE), SOURCE, [mutant])
+        assert mutant.schema_id == 1
+        assert "((b + 2) if __poodle_mutant__ == 1 else (b * 2))" in source
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        ("def f(a):\n    return a + 1\n", ["a + 1", "a", "1"]),
+        ("def f(a):\n    a.b = 1\n", ["a", "1"]),
+        ("def f(a):\n    return g(*a, **a)\n", ["g(*a, **a)", "g", "a", "a"]),
+        ("def f(a):\n    return a[1:2]\n", ["a[1:2]", "a", "1", "2"]),
+        ("def f(a):\n    return f'{a}'\n", ["f'{a}'"]),
+        ("def f(a):\n    match a:\n        case 1:\n            pass\n", ["a"]),
+        ("f = lambda a=1: a\n", ["a"]),
+        ("@d(1)\ndef f(a: int = 2) -> int:\n    pass\n", []),
+    ],
+)
+def test_runtime_expressions(source, expected):
+    assert [ast.unparse(node) for node in schemata.runtime_expressions(ast.parse(source))] == expected
+
+
+def test_nest_nodes():
+    outer = schemata.SchemaNode((1, 0), (1, 10))
+    inner = schemata.SchemaNode((1, 2), (1, 4))
+    after = schemata.SchemaNode((1, 10), (1, 12))
+    assert schemata.nest_nodes([after, inner, outer]) == [outer, after]
+    assert outer.children == [inner]
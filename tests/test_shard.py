@@ -0,0 +1,142 @@
+from pathlib import Path
+
+import pytest
+
+from poodle import PoodleInputError, shard
+from poodle.data_types import MutantTrial, MutantTrialResult, TestingResults, TestingSummary
+from poodle.util import to_json
+from tests.data_types.test_data import create_mutant
+
+
+def create_trial(lineno, reason_code=MutantTrialResult.RC_FOUND):
+    return MutantTrial(
+        mutant=create_mutant(lineno=lineno, text=str(lineno)),
+        result=MutantTrialResult(found=reason_code == MutantTrialResult.RC_FOUND, reason_code=reason_code),
+        duration=1.0,
+    )
+
+
+def test_logger():
+    assert shard.logger.name == "poodle.shard"
+
+
+class TestSelectShard:
+    def test_partition(self):
+        mutants = [create_mutant(lineno=lineno, text=str(lineno)) for lineno in range(1, 21)]
+        shards = [shard.select_shard(mutants, (index, 3)) for index in range(1, 4)]
+
+        assert sorted(len(selected) for selected in shards) == [6, 7, 7]
+        selected_ids = [mutant.mutant_id for selected in shards for mutant in selected]
+        assert sorted(selected_ids) == sorted(mutant.mutant_id for mutant in mutants)
+
+    def test_order_independent(self):
+        mutants = [create_mutant(lineno=lineno, text=str(lineno)) for lineno in range(1, 21)]
+        assert shard.select_shard(mutants, (2, 3)) == shard.select_shard(list(reversed(mutants)), (2, 3))
+
+    def test_single_shard(self):
+        mutants = [create_mutant(lineno=lineno, text=str(lineno)) for lineno in range(1, 4)]
+        assert sorted(shard.select_shard(mutants, (1, 1)), key=lambda mutant: mutant.lineno) == mutants
+
+
+class TestMergeResults:
+    def write_results(self, path: Path, results: TestingResults) -> Path:
+        path.write_text(to_json(results))
+        return path
+
+    def test_merge_results(self, tmp_path):
+        file_1 = self.write_results(
+            tmp_path / "shard-1.json",
+            TestingResults(
+                mutant_trials=[create_trial(1), create_trial(2, MutantTrialResult.RC_NOT_FOUND)],
+                summary=TestingSummary(trials=2, tested=2, found=1, not_found=1, cached=1),
+            ),
+        )
+        file_2 = self.write_results(
+            tmp_path / "shard-2.json",
+            TestingResults(
+                mutant_trials=[create_trial(3)],
+                summary=TestingSummary(trials=2, tested=2, found=2),
+            ),
+        )
+
+        results = shard.merge_results([file_1, file_2])
+
+        assert results.mutant_trials == [
+            create_trial(1),
+            create_trial(2, MutantTrialResult.RC_NOT_FOUND),
+            create_trial(3),
+        ]
+        assert results.summary == TestingSummary(trials=4, tested=4, found=3, not_found=1, cached=1)
+
+    def test_merge_results_no_summary(self, tmp_path):
+        result_file = tmp_path / "shard-1.json"
+        result_file.write_text(
+            to_json(
+                TestingResults(
+                    mutant_trials=[create_trial(1), create_trial(2, MutantTrialResult.RC_TIMEOUT)],
+                    summary=None,  # type: ignore [arg-type]
+                )
+            )
+        )
+
+        results = shard.merge_results([result_file])
+
+        assert results.summary == TestingSummary(trials=2, tested=2, found=1, timeout=1)
+
+    def test_merge_results_duplicate(self, tmp_path):
+        results = TestingResults(mutant_trials=[create_trial(1)], summary=TestingSummary(trials=1))
+        file_1 = self.write_results(tmp_path / "shard-1.json", results)
+        file_2 = self.write_results(tmp_path / "shard-2.json", results)
+
+        with pytest.raises(
+            PoodleInputError, match=r"was found in more than one result file, last in '.*shard-2.json'$"
+        ):
+            shard.merge_results([file_1, file_2])
+
+    def test_merge_results_same_file(self, tmp_path):
+        result_file = self.write_results(tmp_path / "shard-1.json", TestingResults([], TestingSummary(trials=1)))
+
+        with pytest.raises(PoodleInputError, match=r"^Each result file can only be merged once.$"):
+            shard.merge_results([result_file, tmp_path / "." / "shard-1.json"])
+
+    def test_merge_results_invalid(self, tmp_path):
+        result_file = tmp_path / "shard-1.json"
+        result_file.write_text("not json")
+
+        with pytest.raises(PoodleInputError, match=r"^Unable to read results from '.*shard-1.json': "):
+            shard.merge_results([result_file])
+
+
+def test_summary_for_trials():
+    trials = [create_trial(1), create_trial(2, MutantTrialResult.RC_NOT_COVERED)]
+    assert shard.summary_for_trials(trials) == TestingSummary(trials=2, tested=2, found=1, not_covered=1)
+
+
+def test_add_summary():
+    summary = TestingSummary(
+        trials=1,
+        tested=2,
+        found=3,
+        not_found=4,
+        not_covered=5,
+        timeout=6,
+        resource_limit=10,
+        errors=7,
+        incomplete=9,
+        cached=8,
+        orphans=11,
+    )
+    shard.add_summary(summary, summary)
+    assert summary == TestingSummary(
+        trials=2,
+        tested=4,
+        found=6,
+        not_found=8,
+        not_covered=10,
+        timeout=12,
+        resource_limit=20,
+        errors=14,
+        incomplete=18,
+        cached=16,
+        orphans=22,
+    )
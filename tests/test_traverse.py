@@ -0,0 +1,143 @@
+import ast
+from copy import deepcopy
+from unittest import mock
+
+import pytest
+
+from poodle import traverse
+from poodle.data_types import Mutator
+from poodle.line_filters import LineFilters
+from poodle.mutate import builtin_mutators
+from poodle.mutators import ComparisonMutator, NumberMutator
+from tests.data_types.test_data import PoodleConfigStub
+
+SOURCE = '''
+"""Module docstring."""
+import functools
+
+
+@functools.cache
+@staticmethod
+def outer(a: list[int] = None, b: int | None = 2) -> dict[str, int] | None:
+    """Function docstring."""
+
+    @functools.wraps(outer)
+    def inner(x):
+        return lambda y: x + y * 2 - (not y)
+
+    total = 0
+    for i in range(-a[0], len(a)):
+        if i == 3 or (i < 4 and i is not None):
+            break
+        if 1 < i <= 2:
+            continue
+        total += a[i] ** 2 / 1.5
+    f = lambda: None
+    return {"key": inner(f(), "text" + u"other")} if total else None
+
+
+if __name__ == "__main__":
+    outer([1, 2, 3j], b=~1)
+'''
+
+
+@pytest.fixture()
+def mutators():
+    config = PoodleConfigStub(mutator_opts={})
+    return [mutator(config=config, echo=mock.MagicMock()) for mutator in builtin_mutators.values()]
+
+
+def test_logger():
+    assert traverse.logger.name == "poodle.traverse"
+
+
+def test_visit_methods():
+    mutator = ComparisonMutator(config=PoodleConfigStub(mutator_opts={}), echo=mock.MagicMock())
+    methods = traverse.visit_methods(mutator)
+    assert methods == {"Compare": mutator.visit_Compare, "BoolOp": mutator.visit_BoolOp}
+
+
+def test_build_dispatch(mutators):
+    dispatch = traverse.build_dispatch(mutators)
+    assert [index for index, _ in dispatch["Constant"]] == [4, 5, 6]
+    assert "AST" not in dispatch
+    assert "Module" not in dispatch
+
+
+class TestCreateMutations:
+    def test_same_as_each_mutator(self, mutators):
+        parsed_ast = ast.parse(SOURCE)
+        expected = [mutator.create_mutations(deepcopy(parsed_ast), SOURCE.splitlines()) for mutator in mutators]
+        assert all(expected)
+
+        assert traverse.create_mutations(parsed_ast, mutators) == expected
+
+    def test_tree_not_modified(self, mutators):
+        parsed_ast = ast.parse(SOURCE)
+        original = ast.dump(parsed_ast, include_attributes=True)
+
+        traverse.create_mutations(parsed_ast, mutators)
+
+        assert ast.dump(parsed_ast, include_attributes=True) == original
+
+    def test_parents(self, mutators):
+        parsed_ast = ast.parse(SOURCE)
+
+        traverse.create_mutations(parsed_ast, mutators)
+
+        for node in ast.walk(parsed_ast):
+            for child in ast.iter_child_nodes(node):
+                # contexts and operators are shared by all nodes that use them
+                if hasattr(child, "lineno"):
+                    assert child.parent is node
+
+    def test_handled_node_children(self):
+        class CallNumberMutator(NumberMutator):
+            def visit_Call(self, node):  # noqa: N802
+                self.mutants.append(self.create_file_mutation(node, "None"))
+
+        mutator = CallNumberMutator(config=PoodleConfigStub(), echo=mock.MagicMock())
+
+        mutations = traverse.create_mutations(ast.parse("print(1)\nx = 2"), [mutator])
+
+        assert [mutation.text for mutation in mutations[0]] == ["None", "3", "1"]
+
+    def test_resets_mutants(self, mutators):
+        traverse.create_mutations(ast.parse(SOURCE), mutators)
+        assert traverse.create_mutations(ast.parse("pass"), mutators) == [[]] * len(mutators)
+
+    def test_no_mutators(self):
+        assert traverse.create_mutations(ast.parse(SOURCE), []) == []
+
+    def test_line_filters(self, mutators):
+        source = "\n".join(  # noqa: FLY002
+            [
+                "x = 1 + 2  # nomut",
+                "def f(a=3):  # nomut: start",
+                "    return a < 4",
+                "# nomut: end",
+                "y = [5, 6 > x]  # nomut: Number",
+                "z = (7,",
+                "     8)  # nomut",
+            ]
+        )
+        parsed_ast = ast.parse(source)
+        Mutator.add_extent_attr(parsed_ast)
+        filters = LineFilters.from_source(source)
+
+        mutations = traverse.create_mutations(parsed_ast, mutators, filters)
+
+        lines = {
+            (mutation.mutator_name, mutation.lineno)
+            for mutator_mutations in mutations
+            for mutation in mutator_mutations
+        }
+        assert lines == {("Compare", 5), ("Number", 6)}
+
+    def test_line_filters_no_extent(self, mutators):
+        parsed_ast = ast.parse("x = 1  # nomut")
+        filters = LineFilters.from_source("x = 1  # nomut")
+
+        mutations = traverse.create_mutations(parsed_ast, mutators, filters)
+
+        assert traverse.create_mutations(ast.parse("x = 1"), mutators) == mutations
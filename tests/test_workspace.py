@@ -0,0 +1,214 @@
+import os
+from pathlib import Path
+from unittest import mock
+from zipfile import ZipFile
+
+import pytest
+
+from poodle import workspace
+from tests.data_types.test_data import PoodleConfigStub, create_mutant
+
+
+def test_logger():
+    assert workspace.logger.name == "poodle.workspace"
+
+
+def test_builtin_workspaces():
+    assert workspace.builtin_workspaces == {
+        "zip": workspace.zip_workspace,
+        "pooled": workspace.pooled_workspace,
+        "hardlink": workspace.hardlink_workspace,
+        "import_hook": workspace.import_hook_workspace,
+        "schemata": workspace.import_hook_workspace,
+    }
+
+
+@pytest.fixture()
+def folder_zip(tmp_path):
+    folder_zip = tmp_path / "src.zip"
+    with ZipFile(folder_zip, "w") as zip_file:
+        zip_file.writestr("src/main.py", "x = 1\n")
+        zip_file.writestr("src/other.py", "y = 1\n")
+    return folder_zip
+
+
+class TestZipWorkspace:
+    @mock.patch("poodle.workspace.delete_folder")
+    def test_zip_workspace(self, delete_folder, tmp_path, folder_zip):
+        config = PoodleConfigStub(work_folder=tmp_path)
+        mutant = create_mutant(Path("src/main.py"), col_offset=4, end_col_offset=5, text="2")
+
+        with workspace.zip_workspace(config, folder_zip, mutant, "1") as run_folder:
+            assert run_folder == tmp_path / "run-1"
+            assert (run_folder / "src/main.py").read_text() == "x = 2\n"
+            assert (run_folder / "src/other.py").read_text() == "y = 1\n"
+            delete_folder.assert_not_called()
+
+        delete_folder.assert_called_once_with(tmp_path / "run-1", config)
+
+    @mock.patch("poodle.workspace.delete_folder")
+    def test_zip_workspace_no_source(self, delete_folder, tmp_path, folder_zip):
+        config = PoodleConfigStub(work_folder=tmp_path)
+
+        with workspace.zip_workspace(
+            config, folder_zip, create_mutant(None, col_offset=4, end_col_offset=5, text="2"), "1"
+        ) as run_folder:
+            assert (run_folder / "src/main.py").read_text() == "x = 1\n"
+
+        delete_folder.assert_called_once_with(tmp_path / "run-1", config)
+
+    @mock.patch("poodle.workspace.delete_folder")
+    def test_zip_workspace_error(self, delete_folder, tmp_path, folder_zip):
+        config = PoodleConfigStub(work_folder=tmp_path)
+
+        with (
+            pytest.raises(RuntimeError),
+            workspace.zip_workspace(
+                config, folder_zip, create_mutant(None, col_offset=4, end_col_offset=5, text="2"), "1"
+            ),
+        ):
+            raise RuntimeError
+
+        delete_folder.assert_called_once_with(tmp_path / "run-1", config)
+
+
+def test_required_zip(folder_zip):
+    assert workspace.required_zip(folder_zip) == folder_zip
+    with pytest.raises(ValueError, match="^Workspace requires a zip file of the source folder$"):
+        workspace.required_zip(None)
+
+
+class TestHardlinkWorkspace:
+    @pytest.fixture()
+    def source_zip(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        Path("src").mkdir()
+        Path("src/main.py").write_text("x = 1\n")
+        Path("src/other.py").write_text("y = 1\n")
+        with ZipFile("src.zip", "w") as zip_file:
+            zip_file.write("src/main.py")
+            zip_file.write("src/other.py")
+        return Path("src.zip")
+
+    @mock.patch("poodle.workspace.delete_folder")
+    def test_hardlink_workspace(self, delete_folder, source_zip):
+        config = PoodleConfigStub(work_folder=Path("work"))
+        Path("work").mkdir()
+        mutant = create_mutant(Path("src/main.py"), col_offset=4, end_col_offset=5, text="2")
+
+        with workspace.hardlink_workspace(config, source_zip, mutant, "1") as run_folder:
+            assert run_folder == Path("work/run-1")
+            assert (run_folder / "src/main.py").read_text() == "x = 2\n"
+            assert not (run_folder / "src/main.py").samefile("src/main.py")
+            assert (run_folder / "src/other.py").samefile("src/other.py")
+            delete_folder.assert_not_called()
+
+        assert Path("src/main.py").read_text() == "x = 1\n"
+        delete_folder.assert_called_once_with(Path("work/run-1"), config)
+
+    @mock.patch("poodle.workspace.delete_folder")
+    def test_hardlink_workspace_error(self, delete_folder, source_zip):
+        config = PoodleConfigStub(work_folder=Path("work"))
+        Path("work").mkdir()
+
+        with (
+            pytest.raises(RuntimeError),
+            workspace.hardlink_workspace(
+                config, source_zip, create_mutant(None, col_offset=4, end_col_offset=5, text="2"), "1"
+            ),
+        ):
+            raise RuntimeError
+
+        delete_folder.assert_called_once_with(Path("work/run-1"), config)
+
+    def test_link_file_copy(self, tmp_path):
+        (tmp_path / "main.py").write_text("x = 1\n")
+        with mock.patch.object(Path, "hardlink_to", side_effect=OSError("Invalid cross-device link")):
+            workspace.link_file(tmp_path / "main.py", tmp_path / "run" / "main.py")
+
+        assert (tmp_path / "run" / "main.py").read_text() == "x = 1\n"
+        assert not (tmp_path / "run" / "main.py").samefile(tmp_path / "main.py")
+
+
+class TestPooledWorkspace:
+    @pytest.fixture(autouse=True)
+    def _clear_pool_folders(self):
+        workspace.pool_folders.clear()
+        yield
+        workspace.pool_folders.clear()
+
+    def test_pooled_workspace(self, tmp_path, folder_zip):
+        config = PoodleConfigStub(work_folder=tmp_path / "work")
+        pool_folder = tmp_path / "work" / f"pool-{os.getpid()}-src"
+
+        with workspace.pooled_workspace(
+            config, folder_zip, create_mutant(Path("src/main.py"), col_offset=4, end_col_offset=5, text="2"), "1"
+        ) as run_folder:
+            assert run_folder == pool_folder
+            assert (run_folder / "src/main.py").read_text() == "x = 2\n"
+            assert (run_folder / "src/other.py").read_text() == "y = 1\n"
+
+        assert (pool_folder / "src/main.py").read_text() == "x = 1\n"
+
+        with workspace.pooled_workspace(
+            config, folder_zip, create_mutant(Path("src/other.py"), col_offset=4, end_col_offset=5, text="2"), "2"
+        ) as run_folder:
+            assert run_folder == pool_folder
+            assert (run_folder / "src/main.py").read_text() == "x = 1\n"
+            assert (run_folder / "src/other.py").read_text() == "y = 2\n"
+
+        assert (pool_folder / "src/other.py").read_text() == "y = 1\n"
+
+    def test_pooled_workspace_no_source(self, tmp_path, folder_zip):
+        config = PoodleConfigStub(work_folder=tmp_path)
+
+        with workspace.pooled_workspace(
+            config, folder_zip, create_mutant(None, col_offset=4, end_col_offset=5, text="2"), "1"
+        ) as run_folder:
+            assert (run_folder / "src/main.py").read_text() == "x = 1\n"
+
+    def test_pooled_workspace_error(self, tmp_path, folder_zip):
+        config = PoodleConfigStub(work_folder=tmp_path)
+        mutant = create_mutant(Path("src/main.py"), col_offset=4, end_col_offset=5, text="2")
+
+        with pytest.raises(RuntimeError), workspace.pooled_workspace(config, folder_zip, mutant, "1") as run_folder:
+            raise RuntimeError
+
+        assert (run_folder / "src/main.py").read_text() == "x = 1\n"
+
+    @mock.patch("poodle.workspace.ZipFile")
+    def test_get_pool_folder_extract_once(self, zip_file, tmp_path):
+        config = PoodleConfigStub(work_folder=tmp_path)
+        folder_zip = Path("src-1.zip")
+
+        assert workspace.get_pool_folder(config, folder_zip) == tmp_path / f"pool-{os.getpid()}-src-1"
+        assert workspace.get_pool_folder(config, folder_zip) == tmp_path / f"pool-{os.getpid()}-src-1"
+
+        zip_file.assert_called_once_with(folder_zip, "r")
+
+    def test_remove_bytecode(self, tmp_path):
+        source_file = tmp_path / "main.py"
+        cache_folder = tmp_path / "__pycache__"
+        cache_folder.mkdir()
+        (cache_folder / "main.cpython-311.pyc").touch()
+        (cache_folder / "other.cpython-311.pyc").touch()
+
+        workspace.remove_bytecode(source_file)
+
+        assert [file.name for file in cache_folder.iterdir()] == ["other.cpython-311.pyc"]
+
+
+def test_import_hook_workspace():
+    config = PoodleConfigStub()
+    with workspace.import_hook_workspace(
+        config, None, create_mutant(Path("src/main.py"), col_offset=4, end_col_offset=5, text="2"), "1"
+    ) as run_folder:
+        assert run_folder == Path.cwd()
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [("zip", True), ("pooled", True), ("hardlink", True), ("import_hook", False), ("schemata", False)],
+)
+def test_uses_zip(name, expected):
+    assert workspace.uses_zip(PoodleConfigStub(workspace=name)) is expected